@@ -0,0 +1,101 @@
+"""加密前压缩的基准测试
+
+生成与实际数据结构相同的密码/书签条目，比较不同压缩算法和级别下
+加密文件的大小以及保存、加载耗时。
+
+用法：
+    python benchmarks/vault_compression.py [--items 5000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.crypto_utils import CryptoAesUtils, SecurePasswordManager  # noqa: E402
+
+
+SETTINGS = ["none", "zlib:1", "zlib:6", "zlib:9", "lzma:0", "lzma:6"]
+
+SOURCES = ["微信", "QQ", "支付宝", "GitHub", "Google", "淘宝", "京东", "网易邮箱"]
+CATEGORIES = ["默认分类", "工作学习", "娱乐休闲", "工具软件", "技术开发"]
+
+
+def make_items(count: int) -> list:
+    """生成测试数据（密码和书签各一半）"""
+    rng = random.Random(42)
+    base = datetime(2024, 1, 1)
+    items = []
+    for i in range(count):
+        created = (base + timedelta(minutes=rng.randint(0, 500000))).isoformat()
+        if i % 2:
+            items.append({
+                'id': str(1700000000000 + i),
+                'title': f"{rng.choice(SOURCES)}账号{i}",
+                'source': rng.choice(SOURCES),
+                'description': "常用账号" if rng.random() < 0.3 else "",
+                'account': f"user{rng.randint(1000, 99999)}@example.com",
+                'password': "".join(rng.choice("abcdefghijkmnpqrstuvwxyz23456789!@#") for _ in range(16)),
+                'created_time': created,
+                'updated_time': created
+            })
+        else:
+            items.append({
+                'id': str(1700000000000 + i),
+                'title': f"书签{i}",
+                'url': f"https://www.example{rng.randint(1, 300)}.com/path/{i}",
+                'description': "",
+                'category': rng.choice(CATEGORIES),
+                'created_time': created,
+                'updated_time': created
+            })
+    return items
+
+
+def run(items: list, repeat: int):
+    key = CryptoAesUtils.generate_key_from_password("benchmark")
+    CryptoAesUtils.warm_up()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for setting in SETTINGS:
+            encrypted_file = os.path.join(tmp, f"{setting.replace(':', '_')}.enc")
+            manager = SecurePasswordManager(encrypted_file=encrypted_file)
+            manager.set_encryption_key(key, use_simple_key=True)
+            manager.set_compression(setting)
+
+            save_times, load_times = [], []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                manager.save_encrypted_data(items)
+                save_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                loaded = manager.load_encrypted_data()
+                load_times.append(time.perf_counter() - start)
+                assert loaded == items
+
+            results.append((setting, os.path.getsize(encrypted_file), min(save_times), min(load_times)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="加密前压缩基准测试")
+    parser.add_argument("--items", type=int, default=5000, help="条目数量")
+    parser.add_argument("--repeat", type=int, default=3, help="每种设置重复次数（取最快一次）")
+    args = parser.parse_args()
+
+    results = run(make_items(args.items), args.repeat)
+    baseline = results[0][1]
+    print(f"{'设置':<10}{'文件大小':>12}{'压缩比':>8}{'保存(ms)':>10}{'加载(ms)':>10}")
+    for setting, size, save_time, load_time in results:
+        print(f"{setting:<10}{size / 1024:>10.1f}KB{size / baseline:>8.2f}"
+              f"{save_time * 1000:>10.1f}{load_time * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,83 +1,273 @@
 """应用程序入口文件"""
-import base64
 import sys
 import os
+import threading
 
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from ui import NavBar
+from utils.app_icon import load_app_icon
 from utils.verification_dialog import VerificationDialog
 from utils.theme_manager import ThemeManager
+from utils.log_utils import LogManager, get_logger
+from utils.startup_profile import StartupProfiler
+from utils.vault_prefetch import VAULT_FILES
+
+
+logger = get_logger("startup")
+
+# 旧版（无密钥文件）数据中预先解密、留给迁移使用的数据文件
+PASSWORDS_FILE = "config/passwords.enc"
+# 书签分片存储的清单文件
+BOOKMARK_SHARDS_MANIFEST = "config/bookmarks/manifest.enc"
+# SQLite 后端中各管理器的数据表
+SQLITE_TABLES = ("passwords", "bookmarks", "bookmark_categories")
+
+
+def decrypts(encrypted_file: str, access_key: str) -> bool:
+    """加密文件能否用访问码派生的密钥解密"""
+    from utils.crypto_utils import SecurePasswordManager
+    manager = SecurePasswordManager(encrypted_file=encrypted_file)
+    manager.set_encryption_key(access_key, use_simple_key=True)
+    try:
+        mtime = SecurePasswordManager.file_mtime(encrypted_file)
+        data = manager.load_encrypted_data()
+    except Exception:
+        return False
+    if encrypted_file == PASSWORDS_FILE:
+        # 验证时解密出的数据留给迁移时的密码管理器使用，避免再解密一次
+        SecurePasswordManager.preload(encrypted_file, access_key, data, mtime)
+    return True
+
+
+def probe_legacy_vault(access_key: str) -> tuple:
+    """检查旧版数据（直接用访问码派生的密钥加密）的各个存储，返回 (能解密的, 不能解密的)
+
+    每个存储为一组文件：主数据文件及其智能文件夹、使用记录和历史版本，
+    书签分片目录，或 SQLite 数据库文件。只有能用访问码解密的存储才算作旧版数据。
+    """
+    from model.sqlite_store import SqliteItemStore, StorageSettings
+    from model.smart_folders import searches_file_for
+    from model.usage import usage_file_for
+    from model.versions import versions_dir_for
+    readable, unreadable = [], []
+    for encrypted_file in VAULT_FILES:
+        if os.path.exists(encrypted_file):
+            files = [encrypted_file, searches_file_for(encrypted_file, ".enc"),
+                     usage_file_for(encrypted_file), versions_dir_for(encrypted_file)]
+            (readable if decrypts(encrypted_file, access_key) else unreadable).append(files)
+    if os.path.exists(BOOKMARK_SHARDS_MANIFEST):
+        files = [os.path.dirname(BOOKMARK_SHARDS_MANIFEST)]
+        (readable if decrypts(BOOKMARK_SHARDS_MANIFEST, access_key) else unreadable).append(files)
+    db_file = StorageSettings.db_file()
+    if os.path.exists(db_file):
+        result = SqliteItemStore.probe_key(access_key, SQLITE_TABLES, db_file)
+        files = [db_file, db_file + "-wal", db_file + "-shm"]
+        if result is True:
+            readable.append(files)
+        elif result is False:
+            unreadable.append(files)
+    return readable, unreadable
+
+
+def set_aside(stores: list) -> str:
+    """把不能解密的存储移到 config/unreadable-<时间> 目录保留，返回该目录"""
+    import shutil
+    from datetime import datetime
+    target = os.path.join("config", datetime.now().strftime("unreadable-%Y%m%d-%H%M%S"))
+    os.makedirs(target, exist_ok=True)
+    for files in stores:
+        for path in files:
+            if os.path.exists(path):
+                shutil.move(path, os.path.join(target, os.path.basename(path)))
+                logger.warning("无法用访问码解密，已移至 %s: %s", target, path)
+    return target
+
+
+def load_with_keys(manager, keys):
+    """依次尝试用各个密钥加载管理器的数据，全部失败时抛出最后一个异常"""
+    for i, key in enumerate(keys):
+        manager.set_encryption_key(key)
+        try:
+            manager.load_data()
+            return
+        except Exception:
+            if i == len(keys) - 1:
+                raise
+
+
+def migrate_legacy_vault(access_key: str, key_manager) -> str:
+    """把旧版数据改用随机生成的数据密钥重新加密，返回数据密钥
+
+    先用访问码加载全部数据（同时验证访问码），再把新数据密钥写入临时密钥文件，
+    重新加密密码、书签、分类及其智能文件夹、使用记录和历史版本，最后替换为正式的密钥文件。
+    迁移中断时下次启动沿用临时密钥文件中的数据密钥，已重新加密的数据按新密钥读取。
+    """
+    from model import PasswordManager, BookmarkManager, BookmarkCategoryManager
+    data_key = key_manager.migrating_key(access_key) if key_manager.migrating() else None
+    keys = (data_key, access_key) if data_key else (access_key,)
+    category_manager = BookmarkCategoryManager()
+    bookmark_manager = BookmarkManager()
+    bookmark_manager.set_category_manager(category_manager)
+    # 书签管理器应排在分类管理器之后
+    managers = (PasswordManager(), category_manager, bookmark_manager)
+    for manager in managers:
+        load_with_keys(manager, keys)
+    if data_key is None:
+        data_key = key_manager.begin_migration(access_key)
+    for manager in managers:
+        manager.reencrypt(data_key, access_key)
+    key_manager.finish_migration()
+    return data_key
+
+
+def warm_up_imports(profiler: StartupProfiler):
+    """后台预先导入加密库、数据模型和常用页面模块
+
+    在用户输入访问码期间执行，验证通过后这些导入已经完成。
+    """
+    try:
+        from utils.crypto_utils import CryptoAesUtils
+        CryptoAesUtils.warm_up()
+        profiler.mark("导入加密库")
+        import model  # noqa: F401
+        from ui.pages import load_page_class
+        for class_name in ("HomePage", "PasswordManagerPage", "BookmarkManagerPage"):
+            load_page_class(class_name)
+        profiler.mark("导入页面模块")
+    except Exception as e:
+        logger.warning("后台预导入失败: %s", e)
+
+
+def prefetch_stores(encryption_key: str, profiler: StartupProfiler):
+    """后台解密数据文件，页面首次打开时直接使用
+
+    文件已在访问码对话框显示期间预读并解析，这里只剩解密。
+    """
+    from utils.crypto_utils import SecurePasswordManager
+    for encrypted_file in VAULT_FILES:
+        if not os.path.exists(encrypted_file):
+            continue
+        if SecurePasswordManager.has_preloaded(encrypted_file, encryption_key):
+            # 旧版数据验证访问码时已解密
+            continue
+        manager = SecurePasswordManager(encrypted_file=encrypted_file)
+        manager.set_encryption_key(encryption_key, use_simple_key=True)
+        try:
+            mtime = SecurePasswordManager.file_mtime(encrypted_file)
+            data = manager.load_encrypted_data()
+            SecurePasswordManager.preload(encrypted_file, encryption_key, data, mtime)
+        except Exception as e:
+            logger.warning("预解密 %s 失败: %s", encrypted_file, e)
+    profiler.mark("预解密其余数据")
 
 
 def main():
     """应用程序主函数"""
+    profiler = StartupProfiler("--profile-startup" in sys.argv)
+    # 初始化日志（级别和输出位置见 config/log_settings.json）
+    LogManager.configure()
     app = QApplication(sys.argv)
-    # 配置应用icon
-    base64_image = 'iVBORw0KGgoAAAANSUhEUgAAAlgAAAJYCAYAAAHJYahKAAAACXBIWXMAAC4jAAAuIwF4pT92AAAL2GlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxNDIgNzkuMTYwOTI0LCAyMDE3LzA3LzEzLTAxOjA2OjM5ICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iIHhtbG5zOmRjPSJodHRwOi8vcHVybC5vcmcvZGMvZWxlbWVudHMvMS4xLyIgeG1sbnM6eG1wTU09Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9tbS8iIHhtbG5zOnN0RXZ0PSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVzb3VyY2VFdmVudCMiIHhtbG5zOnN0UmVmPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVzb3VyY2VSZWYjIiB4bWxuczpwaG90b3Nob3A9Imh0dHA6Ly9ucy5hZG9iZS5jb20vcGhvdG9zaG9wLzEuMC8iIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vdGlmZi8xLjAvIiB4bWxuczpleGlmPSJodHRwOi8vbnMuYWRvYmUuY29tL2V4aWYvMS4wLyIgeG1wOkNyZWF0b3JUb29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgKFdpbmRvd3MpIiB4bXA6Q3JlYXRlRGF0ZT0iMjAyNC0wNi0yMFQxNDozMzoxOCswODowMCIgeG1wOk1ldGFkYXRhRGF0ZT0iMjAyNC0wNy0yNVQxNjoyMzo1MyswODowMCIgeG1wOk1vZGlmeURhdGU9IjIwMjQtMDctMjVUMTY6MjM6NTMrMDg6MDAiIGRjOmZvcm1hdD0iaW1hZ2UvcG5nIiB4bXBNTTpJbnN0YW5jZUlEPSJ4bXAuaWlkOjIxMjRmMjIwLThlYzQtYjg0Ni04NzkyLWVhYjNmZjdjNWE0YyIgeG1wTU06RG9jdW1lbnRJRD0iYWRvYmU6ZG9jaWQ6cGhvdG9zaG9wOmVlY2FiMzZjLWY2MTItYTA0MC1iMWNlLTBjNjk4ZWJlNGE2YyIgeG1wTU06T3JpZ2luYWxEb2N1bWVudElEPSJ4bXAuZGlkOmQ5Y2IwZGE3LTJhNmMtZDg0OC1hNjA4LTJjZjIyYmY0N2ZkYyIgcGhvdG9zaG9wOkNvbG9yTW9kZT0iMyIgcGhvdG9zaG9wOklDQ1Byb2ZpbGU9InNSR0IgSUVDNjE5NjYtMi4xIiB0aWZmOk9yaWVudGF0aW9uPSIxIiB0aWZmOlhSZXNvbHV0aW9uPSIzMDAwMDAwLzEwMDAwIiB0aWZmOllSZXNvbHV0aW9uPSIzMDAwMDAwLzEwMDAwIiB0aWZmOlJlc29sdXRpb25Vbml0PSIyIiBleGlmOkNvbG9yU3BhY2U9IjEiIGV4aWY6UGl4ZWxYRGltZW5zaW9uPSI2MDAiIGV4aWY6UGl4ZWxZRGltZW5zaW9uPSI2MDAiPiA8eG1wTU06SGlzdG9yeT4gPHJkZjpTZXE+IDxyZGY6bGkgc3RFdnQ6YWN0aW9uPSJjcmVhdGVkIiBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOmQ5Y2IwZGE3LTJhNmMtZDg0OC1hNjA4LTJjZjIyYmY0N2ZkYyIgc3RFdnQ6d2hlbj0iMjAyNC0wNi0yMFQxNDozMzoxOCswODowMCIgc3RFdnQ6c29mdHdhcmVBZ2VudD0iQWRvYmUgUGhvdG9zaG9wIENDIChXaW5kb3dzKSIvPiA8cmRmOmxpIHN0RXZ0OmFjdGlvbj0ic2F2ZWQiIHN0RXZ0Omluc3RhbmNlSUQ9InhtcC5paWQ6ODdiOWMzNTMtOGM2OC1mOTQ0LWFhOTYtYmY2MWJkOWUxYWFjIiBzdEV2dDp3aGVuPSIyMDI0LTA2LTIwVDE0OjM2OjMxKzA4OjAwIiBzdEV2dDpzb2Z0d2FyZUFnZW50PSJBZG9iZSBQaG90b3Nob3AgQ0MgKFdpbmRvd3MpIiBzdEV2dDpjaGFuZ2VkPSIvIi8+IDxyZGY6bGkgc3RFdnQ6YWN0aW9uPSJzYXZlZCIgc3RFdnQ6aW5zdGFuY2VJRD0ieG1wLmlpZDoyYTBkZWI5MS1jNWRkLWNkNDItYTgyMi04YTU0NDdjNWU0YWUiIHN0RXZ0OndoZW49IjIwMjQtMDctMjVUMTY6MjM6NTMrMDg6MDAiIHN0RXZ0OnNvZnR3YXJlQWdlbnQ9IkFkb2JlIFBob3Rvc2hvcCBDQyAoV2luZG93cykiIHN0RXZ0OmNoYW5nZWQ9Ii8iLz4gPHJkZjpsaSBzdEV2dDphY3Rpb249ImNvbnZlcnRlZCIgc3RFdnQ6cGFyYW1ldGVycz0iZnJvbSBhcHBsaWNhdGlvbi92bmQuYWRvYmUucGhvdG9zaG9wIHRvIGltYWdlL3BuZyIvPiA8cmRmOmxpIHN0RXZ0OmFjdGlvbj0iZGVyaXZlZCIgc3RFdnQ6cGFyYW1ldGVycz0iY29udmVydGVkIGZyb20gYXBwbGljYXRpb24vdm5kLmFkb2JlLnBob3Rvc2hvcCB0byBpbWFnZS9wbmciLz4gPHJkZjpsaSBzdEV2dDphY3Rpb249InNhdmVkIiBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOjIxMjRmMjIwLThlYzQtYjg0Ni04NzkyLWVhYjNmZjdjNWE0YyIgc3RFdnQ6d2hlbj0iMjAyNC0wNy0yNVQxNjoyMzo1MyswODowMCIgc3RFdnQ6c29mdHdhcmVBZ2VudD0iQWRvYmUgUGhvdG9zaG9wIENDIChXaW5kb3dzKSIgc3RFdnQ6Y2hhbmdlZD0iLyIvPiA8L3JkZjpTZXE+IDwveG1wTU06SGlzdG9yeT4gPHhtcE1NOkRlcml2ZWRGcm9tIHN0UmVmOmluc3RhbmNlSUQ9InhtcC5paWQ6MmEwZGViOTEtYzVkZC1jZDQyLWE4MjItOGE1NDQ3YzVlNGFlIiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOmQ5Y2IwZGE3LTJhNmMtZDg0OC1hNjA4LTJjZjIyYmY0N2ZkYyIgc3RSZWY6b3JpZ2luYWxEb2N1bWVudElEPSJ4bXAuZGlkOmQ5Y2IwZGE3LTJhNmMtZDg0OC1hNjA4LTJjZjIyYmY0N2ZkYyIvPiA8cGhvdG9zaG9wOlRleHRMYXllcnM+IDxyZGY6QmFnPiA8cmRmOmxpIHBob3Rvc2hvcDpMYXllck5hbWU9IkciIHBob3Rvc2hvcDpMYXllclRleHQ9IkciLz4gPHJkZjpsaSBwaG90b3Nob3A6TGF5ZXJOYW1lPSJDIiBwaG90b3Nob3A6TGF5ZXJUZXh0PSJDIi8+IDwvcmRmOkJhZz4gPC9waG90b3Nob3A6VGV4dExheWVycz4gPHBob3Rvc2hvcDpEb2N1bWVudEFuY2VzdG9ycz4gPHJkZjpCYWc+IDxyZGY6bGk+YWRvYmU6ZG9jaWQ6cGhvdG9zaG9wOjE5Y2UzNzRjLTRlNDQtZDk0My05M2JjLTZmMzQ5OGE3ZmJkZTwvcmRmOmxpPiA8L3JkZjpCYWc+IDwvcGhvdG9zaG9wOkRvY3VtZW50QW5jZXN0b3JzPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4gPD94cGFja2V0IGVuZD0iciI/PlLVI0IAAEbOSURBVHic7d17lBXlne//T+3dP8ItCnHU7sEJovYRZYVb+I2XoR1iHIIMZDgYPGISEzGs+ak/LxwzcjCNvzVCdOkvHryMyZwfETMagwcj8USChmgkNgfjHIYGXIgu1LYjTrd6CK1yi6v3rt8fxZaLfdlVu5566ql6v9ZioUDvevZT3/rWt5566inP932hOgXbDXAJnRUCnRUCnRUCnRVCXV9/2dTcfeT/bpE0zmRjLBsiaX/lf1qWfrprqomsjZJ8ZbujJGmfgu/Zq/46a6Sk82Jrjht67bD+OuuteNvhjB47jAQfAp0VAp0VAp0VAp0VAp0VAp0VAp0VAp0VAp0VAp0VAp0VQp/jWXHraYyoL03N3aF/5trlJW1rN3PHyuvrVlhTc3fNWx04QPrNrYnuk08cM3gZSsvSOu/YPzN6GLYsrbPWUZXtTzr9U985MmOdFfbwMWXZlcXY2mKks9LSUUeKI8Ji/1bVdNTG13wtfKTU4981neXp9q8XP/XnT7f6uv2Jnn9m/kUFXTGl7/2+7MpiTTlMMpDg++qsMI0deaKn9vfDn1/621nVtsF4go+royRF6qgo2wkjkaLU5BcIu701t0TPPLF11uxz0nUx0FuHHT84+mfG9g0XzOz5o5KOKpPSFQ4pl+nOeui35R7/fMKoaDVXpjtrRS+ddd9Vn67jqpHpzoqb0euS1rZotVKYy6UkTyBGI2tLxM4KY96FyR0cRrdUyNhBbvTrjB0Z31hSGhjtrKin6DB++kLPZzwT0jfw1AfbVwMZyypHqx/ec2Rv2BHtxJPpznr8pp6Lz0WP9jyI2J9Md1bcjHfWU4ucSot9iq2zeku+w4bEtYVwTNw0SeQwTNPdnlrOqInlrKQ67LODzG0r1k/tb25C5e+uf7DU60V21C9azc8te6q2Ajb2W2GnnOBp5YJo40WmhTkEE5nrsGt3Op+5jqP6N5Kzmpq71bEnPZ0W12WSsQR/6d0l69dyu3b7sbbB+Cmq0tiVC4o65YTqRyGamrt14nHS6pvDN9HUTjI+mc1ViU9myxo6KwQ6KwQ6KwQ6KwQ6KwQ6KwQ6KwQ6KwQ6q2ftPf1hf52Vrfvv1Tu1pz+sJrIGxtuO1Os1QKrprD8d+gBPwUpAWfSsDn/HXvU56oCjkeBDoLNCoLNCoLNCIMGHQGSFQGeFQGeFQGeFQGeF0Ovt3h7u6mb5tOnrmMDpaQpTNffGs9xJFZ4Of8/Iow556KhjfdDbX/TVWV8x0BAXHNfbX/TVWc8YaIjTOBuGQGeFQGeFQGeFQGeFQGeFQGeFQGeFQGeFQGeFQGeFkNhTk2Gflph9V7fmnF/Q3Mnh9qfJR2B6vRUW19MVtp5ivfTuUi0PW3lRB/8iuWxyQddOs3eUrzq0TEGckWZsBVybHXWkOCM79m+04tr0PcUaV4fFfhg2NvQ/s7KvQ6O3L3bx0m7tPRjuZ479N7UekrF2VhxL9Vb+TZjlgo/8XJMnlEQSy6JHwz/VamK54Fo7MrbO6qshUVcVispUrWU8smw/Jx2ndJzfDbh2ec/LPtVyKMbSWUN7mSm/fru9e7Qm3pASS2c93dzz3lq8MtqiXmmV2cPQBDorhPQsbHWEXC4XHMX9EVfUTkLqOivN6KwQ6KwQUpnge5KGyyYiK4RYOqull1GFagYCXRJLZ93Sy1rFaRxirkVmD8PeCts7n4y+/Kbxzlo4K137Y82mFHRWb8MxMyYl31mmxuFj+yZ9DcckeVe6r20tf7a2FXAT+xZHfoneaqaLJxY0vpf3XjQ2eNrZ0XP01g/3el0o/0gPrze0XHDUuQ5pWqH7SCGL2h7nOsSeUNJQaZtibLngtFi7uRxbe4wdM03N3XpqUZ21Nw1U2hAnowlm5h3Rbqt37Qt+Nkr++2C/NON2M5GdWDaOspfTdDhLGb7cMYHOCoHOCoHOCoHOCoHOCoHOCoHOCoHOCqGvzsrW3YYY9NVZyb0ZNl2u6O0vWFv5aP8k6ZHe/rKanFVZRveBuFqUQicp+I7X9fWPWE0yBM6GIdBZIdBZIdBZIZDgYQRHIYwgsGAEgQUjCCwYQWDBiEiTjXqZBMTlZbbMlfTYsX9Y7Wy5WjPWTgUBRVBlz0rVsG9rmR5JMOWHr5C3Q6NmLIIqf0Ltc4p3GEFgwQgCC0YQWDCCwIIRBBaMILBgBIEFIwgsGEFgwQgCC0akc8U0Ay6eWND10wu9vlqjJzs7fP3wmbI2vVH9bbJ5FxZ05YXRjtctbb5ufKikUgYeF470lE5cbzmMW1pXFoxLChbD6nHVw544vSeyHkjHOvb7piDQeuXcnslbMPWl0hc7O3zNeyBdL35yZi8RUL1rbPDUsrQuVQHmxFUhQVWdSoClQTpa0Yvn/7FOdTWsPlVZLjcuPe20qbd168DHsW2iz22F+dkbVpS0+U1711ipvSqM2rEPPlfWT57PwPX6EaL2hYHgqvqqMJWnwmumhW9Wxx5fTc3dmQsqKbj6i3IFeO88e4sNpjKw5k4O16ym5m5denc6ilaTogSXrZordYEVtiOWPZW9DNWXKME1dVzyC1mmLrDCWv1SvgJLCh9ci+ckf0pMVWA9MD9cB6R55DnvUhVYY0fmbe3h6MIeVEm/qjxVgQVzenvPoSmpHiBNk4bhnlZV8TLJMC69u6SOPamcKFIzZzNWa1tyO+T+q4qxB5UkrbqpqHkR526lnbPfakuCgYXwnA2spGsGhONsYE0gsFLN2cDKihW/zeYAL1eFBjBwS8ZyVtgBzzkJ36RPVWCFPdLTMlvShrAXL50Jj5elKrBQnYWz0r/bUtfCsNNg8pi1ZkwKP18taakLrCjTYPISXGl6WKI/qWxlU3N36A6s/PusXpFFDShb/ZHKwJKiBZd09A5wPchqzU42v39qn9KpcCX1p42hoHL7KZ0jNTV3a/dHtlvhjgefK6ciUzuRDmbdGXQU2atvaQioCqf2VKXjBg2Q1t3qVNONSVMwHcnJvXPg46M7dPnVRY0ekY/ZDuu3+1q8Mv3PUDoZWMea/6PeO/riiQXdMjt8Kbn3oLR4ZSnUan5DB0rfu6SoyWfVFuQP/bbs/KyH1F8VIlWyc1UINxFYMILAghEEFowgsGAEgQUjCCwYQWDBCAILRkQNrHzcmMORQu3zWjKWJ6mxhp+HG95RhERS603o14/Y6PuS/qzGz0N61HRWinQTGugPxTuMILBgBIEFIwgsGEFgwQiuCmEEGQtGEFgwgsCCEQQWjCCwYASBBSMILBhBYMEIAgtGEFgwgsCCEaGnJvezgtxMSb+M3BrYdo+kBb39ZZilOuPKWO2SfBFUrrtRwX6seWZCHCv6MT0im3xJJ0t6L8oP15qxCKpse1fSiVF+sJbAIqjyIdGMdXPEn4ObQieRqIF1Z8SfQ04wjoVq/XOYfxwlsP5LhJ+B+/4+zD+OEli9DqABFVEC66TYW4HMocaCEQQWjCCwYASBBSMILBhBYMEIAgtGEFgwgsCCEQQWjCCwYASBBSMILBhBYMEIAgtGEFgwgsCCEQQWjCCwYASBBSPiWBQk9YoFacncoprOCvfS0FUby7p/bbnqf9/Y4On66QWNHxXt5aS3ry7r6c3Vby/NQr9Lp6m5O/VrNiycVdCMSWaS8frtvhavLGnQAGndrWaPy1ff8TX/RyWj2wijZWld1UdMZgJrydyipoyp6TXGqbbpDV8LHrIbZGECy/lTYZhV5lw26XTvk+/az6qKqeBs8X7jjEJugupYLUvrjJ3q45Lu1vWiZWmdLjnXyabHZuGsdB9Yzu2dNHemDWntD6cCK62daFsa+8WZwEpj56VJ2vrHicBKW6elVZr6KfWBlabOckFa+isdrejFNdPii/sFD5W06Y3wY7v3XVXUhBC3aG55tKSWHeG209jg6f6rihoyMGzr0ivVI++1Hn1/c1u3Dn4cU2P06fZUbu/EbdmVRU06vba7CCYGUTMx8l5LUM24vVsf7I+xMYc0NXfrlkuKuv0Js7dWKrdu1txSp+MHR/uMC8729MIr9u6+pb7GCqup2UxQVZgOqiPNuL07cub5/uXFmFsTTioD66lF0bKVC/fQooj6vTyL9+RTGVjDhoT/mawGVUWUmQ0vLLFX6aQysMJK05wlU6Jc0dqUusCKUrS/+o5bnR5VlKw8dqSd82HqAiusv7kt26fAWj0w304R73xgxTlO5QJXaslUBdbf/Z/hmtO1z1BDULNUBdZ3/y5cc2be4cbRa9voEcnXWakKLFRnyq3hDqjlVydfZxFYDio58OghgQUjnA2sh37rwGGbY6kJrEvPD9eUFQRWqqUmsCaHXFcB6ZaawAozSxPS063pvo2V2ol+afPPf1/UmL+IL/i3v+3r//pv0W+et7b5unhC9e1pbPC0syO5YExNxkqzlqV1sQaVJI35C6+mWbKde8IFydCE59MTWI7a8la4wEq61CCwYASBBSMILBhBYMEIAstRZ9SHK8aTHGqQCCxnhR0+2HvQTDt6Q2A5KuzwQdjhiVoRWBZd8v9GnwEbNrBCLtFRs9Tc0nl6c1kXT3Q/zpN62CHqSwqSkpo9Gfamaq2rscCs1ARWa1u4wIpz7SzEz9m909hAxkozZwML6UZgOeicxnDZurPLTDv64nRgnXic7RbY8YNvhXtO8LoHk1+NJ1WBdfvqcA9IrL45NaMlqRZ2UmAcUhVYWXkJpEk2V+kLI1WBFcXCWc5/hVBsrtIXhvN7Je2vV7Nt4SN2VjtM3V6ZfVf4WyJpeRuDaVG+58bX7DwmlrrAev/DaD9XPyzWZqTO2u+5dfCkLrCievy7dZkNru9fXtRnB4X/uXkP2Fv0N5WBFXWGwOPfrbOyFpRJLUvrdMHZ0S4Fk541eqRUBlYtRo8IHgSdfY7bX23J3GJNtePKDXaHbjL9kqaKVRvLun9tuI4uFoKd2xRysZKH15e1/NloO3X+RQVdMSWeA8L2S5pSHVjLry5aWT/TdfMeKBk5DYYJrFSfL/LwxgkTbNZWFakOLMmddc3TIi39lfrAktLTWWmXpn5yIrCkdHVaGqWtf5wJLCl9nZcWaewXpwJLSmcn2pTW/nDrBtQhlc7My83nnqQ1oCqc3jN5DLC0B1RFJvZIpbPPO9PTXd80d69wyeMlrdsajBHd9NWCZv1lMpXEkdt1RapH3msV9baMFEyTDjsH/+KJBd0wvaAhNSwk+3qnr9ufKKdikPNYmbmlg3TJzC0duIvAghEEFowgsGAEgQUjCCwYQWDBCAILRhBYMILAghEEFowgsGAEgQUjCCwYQWDBCAILRkQJrJdjbwUyJ0pg3Rx7K5A5UQLrmdhbARf8xzD/mBoL1XoyzD+OGlhDIv4c3PSHsD8QNbD2R/w5uGlk2B+o5VTIUnv5EGk/11pjEVzZFnn/xlG8e5IGx/A5SI//ohqTRlxXhQcONcST9BVJO2L6XCTjPUnX6fA+vLPWDwz9iD1QDcaxYASBBSMILBhBYMEIAgtGEFgwgsCCEQQWjCCwYASBBSO4pQPAGZwJATiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwSFgBnkLAAOIOEBcAZdUlspKm5O4nNAEiRlqXxp5dEElZIQxW8/OlUy+0AcNgCSffYbkRaLgm/Ick/9OsjkayAtFmmw8foB7YaYbvCekfSn1tuA4BwjlOQuCTpbCX4JgdbFdaPFXxhkhXgtld0OHkZZ6PCYgEuIHt8SZdLWmlyI0lXWCQrILt+puClccYkmbD2JrgtAHbcJ2mIqQ9PKmGdJINfAkCqGCtOkkpYRq9rAeRDUgnrwoS2AyDD0jJxFAD6RcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM0hYAJxBwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADjDxpufkSITRnlH/X9rmzvvuvU86eRhnhqGSfXDg98lqViQxo70PvXvj/xu29p9lcrSlrd8+e585dwjYTnqc0Olr19Q0KXnp69I/ukLZT22oawP9lf/MxdPLGjmFz19oYdEE5fxo2r77O1v+3psQ1nrt5PhbPH8BE4vTc3d7OEIRp3k6favF3TKCeYOYsSjVJZuebSkja8R6od4LUvjr4eosFLixOOk1TezO1xVLEh3frP4qT+/9O6SOvaQxOLCEWLR8/9Yp7pPxzgyZNVNh3fwrt2+5i4rWWyN+0hYCTNRJsMNp5zgHbX/m5q7LbbGTRw9CVh1U1ENwxmHwtEqyWvVxrLuX1u23Bo3kLAMoppCNS49//DdXqquvnFEGUCiQlSV2CFx9YwjK0YkKsSlZWkdl4o9SN+sQwfN+GKBZIXYXXo+cXUseqNGrgRUa5uvbe2+yuXDj6hUHk85VmODp6EDg/+eMMpT4dCjLsc+xpMWWw59n70HpZ0dvc95qnyvoYOkM+rT+V160rK0Tj9+tqx/WU+1xUz3GqQlWS1/tqyHUxLMAwdIC2YUNH1iuOL9wMfSYxvK+ukLZX2couGbK6YUNP+idFyIHPhYmnpbijqnb0ZmupOwIjh+sLTmFjvJqmufNPOO9AdtsSCtv+3TffTav/v6zg/dnjy5ZG5RU8bYq9AcGZAnYaXBqJM8PXx9stPTN7/p64YVbh/kWTV1vKfFX0v+cQUHkhYJy7aBA6Tf3JpcZbXo0ZI27MhE1+VC0kMEKU9aRhJWOi7OHZFUslq1saym5m6SlWOamrsTTSIrF+TvQVQSVpWSOns2NXcz98ZxTc3dejGBZWZOOcHrcaHCLCNhVWHJ3GTOZCkv8RHCzY+U9L2fmR93fGB+vqosElYVTN8R6tpHssqiF15J5mbJ8qvzk7RIWP14apH5S0EXpikgms1v+lr2lNlL/NEj8nNZSMLqx7AhZj+fyir7Vr8Ubn37KPIyAE/C6sPjN5kNgiWPM7cqL2bcbvbElJd1/0lYfag3vOjeuq1MW8iT5c+avTS8/m+zfzhn/xtGNO9Cs11z/YNUV3lj+nnPOedl/3DO/jeM6ErDCculF5YiPq93mt3vXsavDElYFmxrJ1nl1e1PmK2yrvxStg/pbH+7iEyv+/Rjw2MZSK++1uuKg+krA9uy/e0imnyW2YTF5SAQDQmrB5U3mAAmbOGEFRlHJpAw0xV2lgfe07HGLzJh0ezwSyPbtOTnJa3bkny109rm60qDnz/+VC+zww7uRFdGZDWQ5k52K1lJ0uKvFTXAwil7y1tmYyCtLwuJg1sRhtQ6/0w3D5JvXMAh4BL2VsIYcAWiI2EBcAYJK2HjMzy+AJhGwgLgDBJWwrJ8BwfVGX8qT1JERcICEmb6pNXRZfTjrSJhIddW/Db5B9FNJ6zOPdmtsJjp3oPWNp9Ltwx79IWy/nmdvRUzuPESHQmrB1sMJ6xiQSqxwkzVeFEHKrgk7IHpy4Ssr1kEezq7bLfALI4cC741hW7PK9NLFz2+MdulO0cOkKDrpps95FaRsPLplkfNvtXmxhl0PRAWR00vWnaYvTV8ybl0fd4sv9rsi3lNv0YsDThq+mD6hQHLrszH68URGD3C7HQG0y9qTQMSVh/mPWD2snDS6Z5OPM7oJpASLUvNziBqfz+7k0WPRMLqR9c+s5+/+mamwmXdygXmK+lv3JuPN4mTsPox8w7zkxZNn31hz5K5RZ1ygtlLwV2781FdSSSsqqzfbj4gSFrZs3JBUVPGmH8MZ+6yfFRXEgmrKotXJhMQLUvr9J2L2CVZ0LK0znhlJUnLnsr+QPuRODqqlNTzbN+aUlDL0jrVD0tkc4jZimuLiVXLpbK0+iUSFnpxzfLkSu/Hv1unlqV1mjqOJ/tdsOqmIFE1NiS3v6bcmr+Hwhk4CeHldl/Lniprwczk8vziOUUtnhP897Knyrk7o6bZXd8s6jxLrzfL6woWJKyQVr9U1t6DvhbPSX7S54KZhaOS5a7dvm55tKy29/Jzl8iWsSM93XdVUcUUXJPkNVlJkuf75oO9qbk7c0fUwAHSb251J9+3tvnq3OMftfzIkWt/1w/31DDs8N9VFplL80KGr3f62nsg+B7b2n2VytK2dl/lfqLt5GHBd6185wmjPGcW1XMoWXkmxvJIWDViOgKS8OJrvm5+xKnpC0YSVgoKXLc1NXdr7WbGlWDO9O93u5asjCFhxeCO1WWXSnU4YvObvpqau/XRAdstSQ+uZ2JUSVpcJqJWnAB7xpFlAIkLUbz5rq9v3c+lX184ogyqJK7vXFRgHXf0auEjJW18LbP3pWJFwkrAj58t68eHFle7cUaB1UahO58sa80mbtaERcJK2D1ryrpnzeFAfWpRnYYNsdggJGLXbj9XqyqYQsKy7Nj1tqaO87RodlF1rJ7srFJZuv2JktZt5TIvbiSslFm31de6rT3fIbp4YkFzzvMSfcC2Wtvf9rVyQ1m/i7B2WNNZni49v+DMbHNJ2ndQ+ukLZf30BS7rksRM94wbOlCfJLhqHrPp6JI69/jae9D8Szhq4XmHH7FpbPA0dKA0dJDUWH/0dzw2CW5pO/o7VR5P2tkRfOctb/lK4JDIAyMz3amwMm7vwcMHZWtbdo5E3w8Sa+eebH0v9I3bVQCcQcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM0hYAJxBwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcEZSCWt3QtsBkGFJJawnE9oOgAxLKmF9J6HtALBvp6kPTnIM678nuC0A9vwHUx+cZMK6TIxlAVn3WZMfnvRdwj+T9OuEtwkgGZ6kvSY3YGNawzRJAy1sF4AZLylIVsbZmof1JwVf8POWtg+gdq8oOI7PTWqDtieOvq3gC3viUhFwxSgFx+yYpDdsO2EdaZoOJ6+ipMfsNgeApH06+tj0JL1lqzGJvKoeAOKQpgoLAPpEwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ/AsIQBnUGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM0hYAJxBwgLgDBIWAGeQsAA4o870Bpqau01vAkDKtCw1k1rSXGENlrRMUlmSzy9+8SvRX1skzVTKpDFh3aigw/Yd+m/PZmOAnBon6ZcKjsU2SUPtNieQpoR1mYLOWWa7IQCOcqqkjyS1W25HahLWB5JW2m4EgD59XkFR8Q1bDbCdsE5S0AHHWW4HgOo9ImmjjQ3bTFhnSXrX4vYBRHeepHeS3qithHWipFcsbRtAPP5c0s4kN2grYb1nabsA4nWGpB8ntTEbCesDC9sEYM5VkkYmsaGkE9ZlYoAdyKK3kthI0gmLqQtAdt1segNJJqzrEtwWgOTdaXoDSSas+xLcFgA7ppn88KQS1uCEtgPArp+b/PCkEtZ/TWg7AOwaYvLDk0pYf5/QdgDYd5KpD7b9LCGA7Jln6oNJWADiNtXUB5OwAMRtjKkPJmEBiBtjWABAwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM0hYAJxBwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcUWe7AbCnscHT0IGH/7+jS+rc41trT1ieJ40/1ZMkTRjlffLnR/53xbHfrbXN196D0uudvnx3vnLukbAyZMIoTxNGeRp/6HeTWtt8bWnz1bLD186O+I94z5O+eJqn80cH3+WM+tq+z/jgUz/5/yv7+Levd/ra+KqvTW/4am0jm6WJ5xs+vTQ1d0sSez1mfz3G06XnFzR2pNnEFNa2dl+PbSirZUf1u7yxwdPFEz3NOS/dIxSPv1jWT39X1h/32m5J+rUsrTMSmCQsR0wd5+m66UUNG2K7JeF07ZMe+m1Zq18qf/Jn55/p6coLCxo9Il3JNqyVG8r64TPl/v9hDpGwcuiKKQXNvyjdVQcC67f7WryyZLsZqWEqYTGGlTJTx3laPKdouxkIacoYTy1Lg8NpyeMlrdvKOdoEKqyUuGZaQXMnU01lSZ4vGamwMmrhrIJmTCJRZdHcycFJKM+JK24cKZbMPqeglqV1JKscmDs52NcXnO32TYY0oMKyoDLWgXz5/uVFlcrSlFu7bTfFWZzeE3TTVwskq5wrFoIT1iXncuhFQa8lpGVpnWb9Jd2NwI0zClq5gLvBYXEEGVY/jEtA9OyUEzxiIyQSlkHf/lJBj3+XgETfWpbWafBnbLfCDSQsQ+6dV9RVX6Z7UZ1fL65L3XOhacQRZcC984qaeBrBh3AemF8kafWDhBUzkhVqQdLqGwkrRtdNL5CsULMH5hdV5MjsEd0Sk8lnBetTAXFYfxs3a3rCERaTO77OnBrEiykPn0bCigGBBVMWzeYQPRK9UaN751FZwZzpEwtqbGBctILSoAZTx3lODLJ37vHV0SVtaQteGLH3YPDnvb1gofICi/rhnhqGSeNHBW/XSeOB09l1+G04/b0wovK9xht+QUfcVlxbrKwrl3skrBqkbWXQ7pL0yO/KWrWx/ElSiuKTA7+fBNDY4Omvx3i65NzCUa8Li8vL7YffXLPlLbOv4/I8afLo4MZJGhPaXd8s6uZHWIKZhBXR8qvTkax27fZ1y6Nltb2X/KKuOzuCiu3Hzx5enC7qEs8v7QzetrPpDTuL0/q+1LLDV8uOw0lh7EhPi2YXdMoJ9hPYeWd6ahjuqcOh90aaQMKKyPYbX5Y9dfSbaNJi3VZfdcVyv4PFHx2Q7lmT7rXPt7X7mrssSGBpWGt/1U1cGpKwIrB5VzCtiepIazeX9YXPq8fVVH/4TEkrN6Q3SfVm3VZf67Z2a+JpntUbLRec7emFV9zrv7jwEoqQRp3k6eHrkw9YV18jVUlaazalO8mGNWWMpyVz7SQuF6osXkKREjaS1ZwfdKuzK/HNxiJriapi/XZfTc3d+t2SOhUSHh3Ic5XFPKwQRp2U/LhVU7O7ySoP/npxt9ZuTjYpf//ydNzwsYGEFUKS1dVHB9wo/SHdsbqsB59LNmmddrL9O5c2kLBSavr3SVYu+cnzZT22Ibmkdd9V+ayySFhVWnZlcgFCZeWmB54pJza2dPzgRDaTOiSsKk06PZkSfOptJCuXfe9nyd3JvWZa/g7f/H3jCL6Q0AqQ/7K+rAMfJ7IpGJRUhTx3cv4O3/x94wjuS2ii4JGPuMBtP3yGfWkCCasKdQnkq7/hUjBTViY0AL9wVr4O4Xx92wiSuBzs2icd5FIwc25YYX48q6fHn7IsX982glsSWPFx5h1UV1m0+c18zkY3iYTVjzQsLQJ3JXHXcOq4/MQoCcuyK+5z74FmVC+JeVlXXpifwzg/3zSCK6aY7x4bC+8hWeu3m93HeboKIGH14RsXmO0e04GMdHBxWaC0ImH1YdAAs59PICMuU8bko8oiYQEJML0uWF7eOp6PbxlB01lmz1i2XrYAO+5bazZhJfX4mG0krF7MMXzGuu9XPLqRJzwjGg8SVi8mGH43HXcHETcvB0UWCQtIyOMvmq2qJ4/OfsYiYVmws4PqKo+e3mx2v0+fmP3DOfvfMIL64WbPVBt2kLDyyPSJarLhG0VpQMLqwQWGd/zaVhIWEAUJqwemz1Sde0hYQBQkrB6YvkOI/OIdk7UhYQEJam0zW11nfWoDCQtIkOmENf7UbGcsElbCTAcs0s30+GXWhzNIWAljDla+bXnL7P4fOsjox1tHwkrYvoO2WwCbfMPnq8Z6KqxcKRruES4JYVJjAwkrV8YaXqajo8voxyPnhgy03QKz6mw3IG+yPmn0mmmF1L9CfeWGMm9mdlS6I8uCrN9lMallaV3qk5UkzZ1cUMtSztUuSn90wQnrb3MvAVwzjfB3DXsMsTB9s8IEF6pBHI09dozxXBICqUXCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwS1jG2sF4VkFokLADOIGEBcAYJ6ximlzB2cVUDIC04fBJmeglmIMtIWMfY1m74NUwZX3PbJXeszt4yyVl/KxMJ6xglwzGc9beauOKjA9LazdlLWFl/76V769o6jgUC7Xq53ddPXyhr42t2DmzP8O7f2UnCQowahtlugVsuWNxt/OWjSRp/qtmMtfeA0Y+3jkvChNUPp8LKM9P7P+sv6iVhAQlqbDD7+aZvGtlGwgISZPq9l6ZvGtlGwupB1stq2HNGPUMCtSBh9cB0Wc04FhANCasH//aG2YQ1fQIJC4iChNUD05eEXzydhJVHpp9y6Owy+/lpQMKygOcJ82n6RLOH27otGR9xFwkLSMzfftHsiWqT4aGMNCBhWTJwgO0WIGmnncyk0VqRsHrxtOEHY+ddSNcDYXHU9OLpVrNnq7mT6fo8mTqOccs4cNT0Ig/lNZJz/d8WjX5+Xl6eQsKyaPY5dH9eHD/Y7Oev2pj9O4QSCatPf9xr9vMXzKT782DiaeYvB1t2UGHl3r88n4+zFsz6r982ezmYJySsPqx+yXzCWjKXYM46029K+mC/2c9PExKWZVPGcPcoy5I4Ia14Lj9XAiSsfuzabX5s4Jpp7IasSuKElMSVQFpwpPTjvrXmg4E5WdnE5X78OFL68WJCb1dZfjXBnTVJVFfrt+fj7mAFCSslRo/wjM/VQXJalibzQqr7flVKZDtpQcKqwpLHkwmKNbfw1rUs+PaXkjus3v8wsU2lAgmrCuu2Jld2r/0eSctlJx0vXfXlZA6rvF0OSiSsqnXtS2Y7nx0krbqJ8SxXPfEPyZ1wFq/M1+WgRMKq2rwHuhPbVsNwj6TlmGIhuXGrPCNhVSnpsYKG4R6Xh44YO9LT+tuS3VdJjaumDQkrhKSD5LODgrP26BHMhk+rBTMLemB+8tVwkuOqaULCCsFWkCy/uqjn/5FqK00mnuapZWmdlSWCVm7Iz8z2Y5GwQlr2lJ1gqSsG1dZTi+pYD96iSqK6d569McYfPpPfhMVpO6TVL5WtrmM1bIj0m1uD3bb82bIeXp/f4E3SwlkFzZhk//ye5+pKkjzfN3uZ09TcLUmZuuCeOs7T4jnpuou3/W1f/+N/+Vq3payS4ZieMMrThFGeLp7gqX642fG1LW2+1rb6eqa1LMOhepSmszxden5B40ela/zw0PGUei1L64x0HAkrIpduYW9r91UqH73u984OX3sPHv43E444MIcMlBobPA099HtabWnzP/lulTX4t7zVf6iNPzX4ThNGeRo6SBr9556+4MDLbb/3s5JeeMWNQ4mElUIuJS24z5XqSjKXsOxflDvsXxg/QkJcSlYmkbBq8ONny+rO5/w9JOieNZwYK0hYNfrS/8OZD+a8/6H0xO9JWBUkrBjM+QFJC2bMvovYOhIJKwadXdJ9v+IsiHgxbvVpJKyYPP5i2Zlbzki/a5czONoTElaMvvezkja/SdJCba5dXtK2duKoJySsmN2wgqSF6EhWfSNhGXDDipJWbWRMC+GQrPpHwjLk/rVlXfcg4xCoTlNzN8mqCiQsg7a0+dzpQZ/e/5C7gWGQsBLQ1NytdVs4e+Jo96wpM88qJBJWQpb8vMSZFJKkUjk4iTGDPTwSVsKamrutrVoK+xY8VNKUWzlxRcX6KBasfqms1S+VdcWUguZfxDkjD+5YXdbazZyoakXCsujh9cESx2lcwRTxWPhISRtfY/wyLiSsFFi31de6rcFlwpK5RU0Zk/7VL8PoLgUv0ciL9dv9XL6VOQkkrJQ5MtDT8uKDKNZsKmvFb8ufegHt1HGevn5BQaednK2kTJJKBkskO+KUEzx97TxPl5ybzgS2amNZj75Q1h/3hvu5+uGeZn4x+F5DBpppmwkvvubrpy+UmezZC9Z0x6dU3l7zxdM9jU3oJQqtbf4nb7Lp3GNut1a+24RRnvU312zY4Wvt5rI2vOon+uYel5GwEEnlbTj1wz01DOv/31fePtPalu5d5nlHv/3myN8rGhu8o6q2fQeDtwVV7D3i/1vbfHV0Se92kZTiYCphMYaVcZ8knpQnoLB8353kivikc0AEAHpAwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM0hYAJxBwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgA4rbX1AeTsADEbZepDyZhAYjb/zT1wSQsAHFbbeqDk0pYrye0HQD2rTX1wUklrH9IaDsAMiyphPVkQtsBYNd/N/nhSY5hvZXgtgDYcbnJD08yYX0hwW0BSN5uSWWTG0gyYe2V9IcEtwcgWZ83vYGkpzWMTHh7AJKxTtJ+0xuxMQ/rCgvbBGDWV5LYiI2E9YiklyxsF4AZg5LakK2Z7udKesfStgHEp1HSwaQ2ZvPRnFMkvWJx+wBq83kl/BSL7WcJx0j6J8ttABDeQElvJ71R2wlLkq6TdKrtRgCoyq8leZL+ZGPjaUhYktSuoBMW2m4IgB79b0mDJU2z2Yi0JKyKuxQkrmmS9lluCwDpMUlFSSdKOmC5Laqz3YBe/FrS0EP/faKk/yTp7ySNlXSSrUYBGbZPwZMov5X0SwUTQVPH833fdhsAoCppuyQEgF6RsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM3jNFwAAQMy4IgQAAIgZBRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFgAQAAxIwCCwAAIGYUWAAAADGjwAIAAIgZBRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFgAQAAxIwCCwAAIGYUWAAAADGjwAIAAIgZBRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFgAQAAxKzOdgPi0NTcbbsJfyZpgqQzJY0+9PsISSdIGixpqL2mAQBQlY8l7ZXUdej39yS9JunVQ7+3SvrfthonSS1L3Slb3GmpfQVJfyPp25JmShpitTUAAMRrgKTPHfpVcVEf/36fpKck/UTSbySVjbXMQdwi7N0gSf8g6X1JvqSSpGckXSaKKwAAhig4Jz6j4BzpKzhn3qzgHJprFFhHGynpaQVBsl/SXQpu/wEAgP79maQ7FZxDfQXF10irLbKEAksaKOlBBYHwlqRpVlsDAEB2fEXBudWXtELBOTcX8lxgjZL0uqQDkuZZbgsAAFl3pYJz7usKzsGZlscC6wxJb0t6U9LpltsCAEDenK7gHPy2gnNyJuWpwBog6feSdko6xXJbAADIu1MUnJN/L+kzltsSu7wUWN+Q9CdJ59huCAAAOMo5kg4qOFdnRh4KrGckPWK7EQAAoE+PKDhnZ0KWC6zBktoVPMEAAADS7ysKzt2DbTekVlktsIYq2EGft90QAAAQyucl/UGOv2YuiwVWQdI2sUAoAACuOkHSy3K4TnG24X14VDlYXwMAgIw7VdLPbDciqqwVWLMUvBcJAAC47z8pOLc7J2sF1l22GwAAAGLl5Lk9SwXWNEmNthsBAABi1SjpYtuNCCtLBdbXbDcAAAAYcYntBoSVpQLrr2w3AAAAGOHcOT5LBdYI2w0AAABGOPcO4SwVWJ+13QAAAGCEc4uOZqnAAgAASAUKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAELM62w0AEF79cE8Nw6RiQRo70pMkFY74b+novzOhc4+vjq6j/2xbu69yOfjvnR2+9h6U9h4M/jsPPE8a8hmpscE7qv8r+0sK/m7IQHtt7Mm+I/bRzk5few9IHV2H9/G7Xb78fOxCIDYUWIBljQ2ezmjwNOJzwQm5scHT0JSdgHtSP9xT/fCj/2zCqOgFXeVkvq3d12vv+OrssluYeZ50Rr2n+mHBPmpsCL7vGfXmilZbhgyUxh/ad+ND7sPXO33t7JBe7/C1s8PXtnZfpbKJVgJuocACDBp1kqexIyu/gqIEPasUbP0VaZ17fG1rDwqxbe2+2t4LX4QNGqAj9ounM0d4GjQgasvz7Yx6T2fUS5rQ+37btdvXljZfrYd+vf9hcu0DbPH8DIz7NjV3S5L7XwROGnWSp6azPTWd5Wn0CAoo2yon8y1vSScPCwq2SaezX9Lqg/1Sa5uvllfKWreVNI4+eS1L3RkXosACqnTicdLFEwu6eIKnU07ghA2Y9MF+ae3msp5p9fXmu6R3SHKswHKnpUCCBg6Qpk8o6MoLCxo2xHZrgPw5frA0d3JBcycf/rMP9ksrnivr6dayDnxsr21ANRjBAhTc5pv35YKmjGFkCnDJyg1l/eIlXx17OAXkACNYgAuumVbQ3MksBQe47MhRrgMfS//867J+8a9llpWAdYxgITdGj/B001cLTEQHcmLdVl8/frbM6FZ2MIIFpMXUcZ6uvLDApHQgh6aO8zR1XFGS9OJrvpY/W87NorewjwILmTN6hKebZxXU2EBRBSBw3pmezjszKLZWv1TWPWu4jQizKLCQCYMGSM1fK+qCsymqAPRt9jkFzT4nmH/54HNl/eR5lp5H/Ciw4LTJZ3m6ZXZRnx1kuyUAXHTVlwu66ssFrd1c1l1PlnnND2JDgQUnXTe9oEvP5wlAAPGYPrGg6RML6tjja+nPy9rWzv1D1IYCC065d15RE0/jNiAAMxqGe3pgfjBX69rlJQotREaBBSdQWAFIGoUWakGBhVT7/uVMXAdg1wPzi+rY4+vb/1TS/j/Zbg1cQYGFVJpzXkHX/y1zrACkQ8NwT79eXKcXXvH1vZ+VbDcHDuAMhlSpHyY9ubCO4gpAKl1wtqeWpXX69pfIUegbEYLUWDS7oMe/W6cTPmu7JQDQt6u+XNDKBUV5zGBALyiwYN0pJ3h6/h/rNH0i4QjAHaec4OmFJXW65FxyFz6NqIBVN301uAqsK9puCQBEc+OMwidPHAIVTHKHNSsXFHkJc0ide3x1dEnb2n19uF/a2RH8f+ee9D1CXixIY0d6n/xeOPT70IHK/HsiX+/0tfeAjto329p9lcrS3oPB31ck9T68yq2sghfsB0mqH+6pYZg0dJDUWO+pfrin+mHJtCdrxo4M5mbdsKKkzW+m73hE8jw/A2+7bGruliT3v0hOjB7hafnVXO31ZNduXy07gl8v53DdnfrhnhrrpS+M9DRhlKfRI+wXYq93+urcExSz29p97fqj9G6Xn7sXBdcP9zT289KEUZ6azi7o+MG2W5Red6wua+1m3rljgNey1J1xIQosJGr2OQUtmMmdaUlav93Xqo3lXBZSUSy/umik4Nr0hq/WNl9b2nwWk4zotJM9TZvgafpECq+KlRvK+uEzFFkxo8BKGgWWG66ZVtDcyfksrl59x9fTm32tfomEW4uFswqaMSlaDL32jq/71vKOuaRMPM3TfzynoClj7I9C2rJ+u6/FK1kzK0YUWEmjwEq/JXOLuUu0y58t6+H1FFQmTJ9Y0DXTeh4t+WC/tOK5slp2lPX+h8m3DT2beJqny/6qoPPOzFce2LXb19xlFFkxocBKGgVWuuWluOouSXf/sqw1/0ZRBfTls4Okb3+poEvPz8eINkVWbCiwkkaBlV55KK7Wbi7rjtUUVUAUp53sqflrhcw/WUqRFQsKrKRRYKVTlourjw5It68uacMOwg6Iy6LZhUwvOMycrJo5VWBlN5Jh1RVTsjm59aMD0qJHS5r+/W6KKyBmd6wuq6m5Ww8+l80R4SljPF0zjdNuXrCnEbup4zzNvyh7oXXfr8oUVkACfvJ8UGhlcS2puZMLmn1O9vIjPo29jFiNOsnT4jnZWkR085u+mpq79fiL2Uv2QJrdsbqsryzpVkcK31RQiwUzCzrt5OyN8ONoFFiI1X1XZau4mv+jkm5YwZwJwJb9f5IuvbuUuduGWcuV+DQKLMRm4ayChg2x3Yp4vPpOMGr16jvZunIGXPWT58ua90B2LnaOHxzkTGQXexexmDrOi7zCdto88fuy5v8oO4kcyIqdHcGFz67d2bjwmTGp8MmLt5E92TgjwrrrpmdjuHv5s2XdsyZbtyKArJm7rKQXX8tGkXX717ORO/FpFFioWVZuDS57ilfbAK64+ZGS1m93v8g6fnCwrA2yh72Kmow6KRu3Bpc/W+ZFzIBjFq8sadMb7hdZ8y8q6MTjbLcCcXP/zAir5n3Z/RBas4mRK8BVCx4q6YP9tltRu3kXup9LcTT2KCL7wkjP+dXaN73h684nKa4Al835QbftJtRsxiRGsbKGAguRfcvxeQPdpeDqF4DbDnwsLXzE/WOZUaxsYW8iksYGT+c0uj16dT0LiAKZsfE1X2s2uT0aPWNSQZ8barsViAsFFiK57K/cDp01m8p6ud39ybEADrvzybLz87G+8ddu51Ycxp5EaMcPlqaOd3f0qrsk5l0BGXXfr9wemZ5zXkGeu+kVR6DAQmhzznc7bO5fS3EFZNW6rb7zSzfMOc/tHIsAexGhXXKuu2HTtU+sdwVknOvLrrj+dDYC7p4pYcWk0z0NHWi7FdE98ju3Ey+A/rW2+dr+trujWF8Y6amxgSLLdRRYCGXqOLcP+id+T4EF5MH/+F/uFliS1HSW27kWFFgI6eKJ7obM05vLKlFfAbnwTKvbB3vT2RRYrnP3bInETRjl9gG/bqvbV7QAquf70tOt7h7zZ9R7qh/uds7NOwosVO2Lp7t9sLv+ZBGAcFpecXsU6wJuEzqNAgtVc3kEq2UHxRWQNxtedfu4dznnggILVSoWpLEj3T3YKbCA/PF9aUubu8c+BZbbKLBQFZeLKyl4bBtA/rh87A8ZKOZhOYwCC1Vx+Upq70Gpc4+7SRZAdC4XWJJ0yudstwBRUWChKuMdLrB2dridYAFEt83xl7q7fvcgzyiwUBWXV293eQ4GgNqUylJnl+1WROfy3YO8o8BCVVx+bYPrV7AAasMUAdhAgYV+uX4FxertQL65PA9r/ChPntspOLfqbDcAMM3l5IrDXF8qxJZt7T4XGYAFFFjol8u3B+GuGZMK+u5XCyoyzh6bAx9LP/hlSeu25Ouio7XN15W2G1GD8ad6XCg6iNSFfrk8wZ0nCN0zY1JBLUvrtHAWxVXcBg2QFn+tqHW31qmB9ZUAo0hfyLS9B223AGGM+QtPC2eRlkwbNEC67bL89LPrecDli9w8y88RhsjO4BYhEvKNC0hJSRk9wtMkx1/gXq3XO90eyWaahpvIZugXV09ICrGWLB4aAMyhwEKmsf4NAMAGCixkmssrOAMA3EWBBQAAEDMKLAAAgJhRYAEAAMSMAguZNt7x9ygCANxEgQUAABAzCiwAAICYUWChX9vaWUsKAIAwKLDQr3LZdgui42XBAMaf6vZczNY2LnJdxOkHmcarQAAANlBgoV8dXbZbAADRMZINGwg79Mv19/lNYKkGoEd5mV/p+kj2lrfysZ+yhgILAHLo1Xd8bXojHyduRrBgA2GHfrk+wZIRLOBoL77ma/6PSrabkRiXR7C2tPny3U7BuVVnuwFwQ+ceX/XD3UxSQwbabgGQDi++5usHvyzpvQ9styRZjQ1u5i64jQILVenokuqH225FNCRXmHTB4m7bTehT3kc/igW3L7Jcv4OQZ9wiRFW2OHyQc4sQpvl+en/lncu3ByWe4nYZBRaqsrPD7UxNkQXkk+vHvutPcecZBRaq0tlluwW1cT3JAojG9WOfJRrcRYGFquzs8LX3oO1WRDfe8SQLIDzPc/vY5wlCt1FgoWou3yZ0/SoWQHi8gxA2UWChaht2uH2wTzrd7WQLIBzXj3kKLLdRYKFqLzheYE0d53ayBRDO1PFun+KYf+U2t6MPierc4zt9m/DiiYQ7kBcTRnmqH2a7FdEx/8p9nHEQiuu3CSmygHxw/VhvcTzXggILIbl+0M85j9uEQNYNHShdPMHtY33t5rLtJqBGFFgIZWeH27cJGxs8nXem24kXQN/mTnb71Lalze1lcRBwOwphxTOt7hZYknT9dMIeyKpBA6Qrprh9jK/ayOhVFrgdhbDiid+7ffCfcoKn2ecQ+kAWuX4Bte+g+1MxEHA7EmFFqex+kbVgZkEnHme7FQDiNHakpxmT3D6tuZ5bcZjbkQhrfv6i+1dYt1xStN0EADG6/evuH9PcHswOCixEsmu3r/Xb3S6yJp3uOT9XA0Bgydyijh9suxW1ebrV1wf7bbcCceHsgshWPOf+ldb8iwqs8A44bvY5BU0Z4/5x/OgL7udUHEaBhcja3nN/FEuSFs8patRJ7idnII8mnuZpwUz3T2Xrt/tqf9/9fIrD3I9KWJWFUSxJevj6ogYOsN0KAGFMPM3TvfPcn3clSff9qmS7CYgZBRZq0vaerzWbslFk/ebWOooswBFZKq7WbCrr/Q9ttwJxo8BCze58sqzujFx8/ebWOo0ewe1CIM0uODs7xVWpHORQZA8FFmJxx+qMVFiSll9d1GWOv2oDyKpLzi3o+5dno7iSpPt+RXGVVZxFEIt1W31teiM7EzSvnVbIzBUykBV3fbOoG2dk57S16Q1fq1+iwMqq7EQqrFvwUCkztwqlYI5Hy9I6TT6LW4aATeefGRyLWXtR++1PZChh4lMosBCrLN0qrLjj60Wtuqmo+mG2WwLkS7Egrbi2qDu/mb3R5CWPl5jYnnF1thuAbFm31Vf98LLmX5St2r1huKfHv1unjj2+rn+wpM4u2y0Csm3R7IKmT8xWHqlYs6msdVuzM6UCPaPAQuweXl9WY4OXiZWVj3VkoXXLo2W93kmSBOIy+DPSP32nqMaG7OWOil27fZ4azAkKLBixeGVJy68uZnbJg4bhnh76v4PbFk/+a1l3/5KECUR1ybmFTE1e780H+6W5y7I3jQI9o8CCMfN/VNJTi+o0bIjtlpg16y8LmvWXwclh5YayfvgMxRbQnyljPH3379x/QXMYc5d1224CEkSBBaNm3tGdiyKrYu7kguYeWkOra5/00G/LPIYNKBj1vWyyp9nnZH+kqieX3l3SRwdstwJJosCCcXkrsiqGDZEWzCwc9SLa9dt9rdpY1svtzN1Ctk0d5+niiQVNOj2b0wTCuPTukjr2cMznDQUWEjHzju5Mz8mq1pQxnqaMOfqR8127fW1p8/XCDl//utNXKUcDXsWCNHakp8YGT2fUK/fx4ZpBA6QJozw1neWp6exCrm73VaNUDuZcUVzlk+f77u/4puZuSXL/i+TAwlkFzZiUz1sEtejc46ujS9rZ4WvfQWlbe1CI7ezwtfeg7dZJ9cM9NQw7XDBJ0hkNnoYOlBoP/Z4nnV3BPtvZ6WvvgcP7a1u7r7IvpTXteofq2zPqPR0/ONiXQwdJjfVBETwkZ/uxFrt2+7r8nlJq97WjvJal7owLUWAhcZdNLujaaRRZALJp3VZfSx7naUEDnCqwOMshcY9tKGv+j0g+ALLnnjVliitIosCCJa++46upuVub32TgEUA2zHugpCd+n6NJlOgTBRasumFFSXf+goQEwF3rtgYXjDs7uGDEYRRYsG7Nv5VJTgCctPCRErcE0SMKLKTGvAdKWvQoiQpA+q3dHFwYbnyNC0P0zJ3p+MiFDTuCofbrphd06fnU/wDS5c13fc17oJSr9eoQDWcwpNL9a8tMggeQKtcuL+lb91NcoTqMYCHVblgR3DK8d15RE09jlW8Aybt2eUnbeL0VQqLAghMqhdai2QVNn8jAKwDzKKxQC1Zyh5MunuDppq8W9Zn/w3ZLAGTJ5jd9/eefcBswpZxayd2dlgJHeLrV19Ot3RoyULr9cm4fAqjNg8+V9ZPnqaoQHwosOG3fwcO3D794uqeFswpqGE6xBaB/67b6umdNSR8dsN0SZBEFFjLj397wdendQbE1dZyn66YXNWyI5UYBSJUXX/O1/NkyCxvDOAosZNK6rb7Wbe2WJI0e4emmrxY0egQjW0AerX6prMc2+OrYQ1GF5FBgIfNefcfX/B8dXiF+9jkFXTe9oLqixUYBMGbXbl8/+nVZL7xCQQV7KLCQO6tfKmv1S4cns84+p6ArLyxwOxFwFAUV0ogCC7l3bME16iRPl57vafJZFF1A2nywP3gP4DOtvt58l4IK6cU6WECVpo7z1HR2QZNHe9xeTIlX3/HVssNXyyu+2t7zdeJx0oRRniaM8jR+lKdTTmDenatKZam1Ldi3v/jXsjJwqkLtnFoHiwILqNGJx0lNZxU04TRPY0d6+txQ2y3Kjs49vra1S9vafW1rD4qoWgwdKI35i2A/jR3pqbHB05CBMTUWoVWKqNY2Xxt2MCKFflFgJY0CC2k2oE6fnNDPaPBUP0xqbGBkZVu7r1ff8fVul7SzIyig0rJ69tCBwT5qbAj2WcMwUYxF8HK7r1f/3dfOjuC/d+0mTaMmThVY7rQUcNTH3dKmN3xteqO6k0uxEBRkld8lqX6YVH9oAdXGBk9DU3KirxRFnXt8dXZJew/qk/WF0lQwhbX34OGRlWp5nnRGfbBv6ocHRdnQQVJj/aF9ODworl308qF92dEV7Osjf3+3y+f2HdADCiwgZSq3TSRVXZTBPt8/XFwqRGFWC6+PgVCKHsAuCiwAcBRFFJBeBdsNAAAAyBoKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzLJUYH1suwEAAABStgqsf7fdAAAAYMR7thsQVpYKrDdtNwAAABjxiu0GhJWlAus3thsAAACM+LXtBoSVpQJrhe0GAAAAI5w7x2epwHpP0v9nuxEAACBW/03MwbLuP0vaZ7sRAAAgFvsk3WS7EVFkrcDaJ+lrthsBAABi8TU5OnCStQJLkp6RdL3tRgAAgJrcqOCc7qQsFliSdL+khbYbAQAAIlko6V7bjahFVgssSbpL0uW2GwEAAEL5uoJzuNOyXGBJ0kpJoyR9aLshAACgTx9KOk3Sz2w3JA5ZL7Ak6S1Jx0t60HI7AABAz1YoOFe32W5IXPJQYFV8R9JJkl633RAAACApOCefJOkq2w2JW54KLEl6X1KjpLMlvW25LQAA5NXbCs7FjQrOzZmTtwKrYoekz0s6QdJGy20BACAvNio4935ewbk4s/JaYFX8UdJfSfIkzZbUZbU1AABkT5ekSxSca/9Kwbk38/JeYB3pF5KGKwiAyyX9wW5zAABw1h8UnEs9BefW1XabkzwKrJ6tlDRSQWAcJ2mBgqcRAQDAp72l4Fx5nIJz50gF59LcqrPdAAd8JOmeQ78qBkv68qFfX5L0BQUBBQBAVvmSXpb0vKTnDv3ab7VFKUaBFc1+SU8d+gUAAHAUz/d9220AAADIFOZgAQAAxIwCCwAAIGYUWAAAADGjwAIAAIgZBRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFgAQAAxIwCCwAAIGYUWAAAADGjwAIAAIgZBRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFgAQAAxIwCCwAAIGYUWAAAADGjwAIAAIgZBRYAAEDMKLAAAABi9v8DGqe0pykglvsAAAAASUVORK5CYII='
-    image_data = base64.b64decode(base64_image)
-    icon_pixmap = QPixmap()
-    icon_pixmap.loadFromData(image_data)
-    app.setWindowIcon(QIcon(icon_pixmap))
+    profiler.mark("创建QApplication")
+    # 配置应用icon（优先使用Qt资源或缓存文件）
+    app.setWindowIcon(load_app_icon())
+    profiler.mark("加载图标")
     # 初始化主题管理器
     theme_manager = ThemeManager()
     
     # 应用当前主题样式
     app.setStyleSheet(theme_manager.generate_main_window_style())
+    profiler.mark("生成主题样式")
+
+    # 用户输入访问码期间在后台完成耗时的模块导入
+    threading.Thread(target=warm_up_imports, args=(profiler,), name="warm-up", daemon=True).start()
 
     # 显示验证码对话框，支持重试
-    encryption_key = None
+    data_key = None
     max_attempts = 3
     attempt = 0
     
     while attempt < max_attempts:
-        verification_dialog = VerificationDialog()
+        verification_dialog = VerificationDialog(prefetch_files=VAULT_FILES)
+        profiler.mark("显示访问码对话框")
         if verification_dialog.exec_() != VerificationDialog.Accepted:
             # 用户取消或关闭对话框，退出程序
             return
+        profiler.mark("输入访问码")
 
-        # 获取加密密钥
-        encryption_key = verification_dialog.get_encryption_key()
-        if not encryption_key:
+        # 获取访问码派生的密钥
+        access_key = verification_dialog.get_encryption_key()
+        if not access_key:
             QMessageBox.critical(None, "错误", "获取加密密钥失败！")
             return
         
-        # 验证访问密码是否正确（如果存在加密文件）
-        if os.path.exists("config/passwords.enc"):
-            from utils.crypto_utils import SecurePasswordManager
-            test_manager = SecurePasswordManager()
-            test_manager.set_encryption_key(encryption_key, use_simple_key=True)
-            try:
-                test_manager.load_encrypted_data()
-                # 密码正确，跳出循环
-                break
-            except Exception:
-                attempt += 1
-                remaining_attempts = max_attempts - attempt
-                if remaining_attempts > 0:
-                    # 还有重试机会
-                    QMessageBox.warning(None, "访问密码错误", 
-                                       f"输入的访问密码无法解密现有数据！\n\n"
-                                       f"请确认访问密码是否正确。\n"
-                                       f"剩余尝试次数：{remaining_attempts}")
+        from utils.crypto_utils import VaultKeyManager
+        key_manager = VaultKeyManager()
+        try:
+            if key_manager.exists():
+                # 能解开数据密钥即说明访问码正确
+                data_key = key_manager.unwrap(access_key)
+            elif key_manager.migrating():
+                # 继续上次中断的迁移
+                data_key = migrate_legacy_vault(access_key, key_manager)
+            else:
+                readable, unreadable = probe_legacy_vault(access_key)
+                if unreadable and not readable:
+                    reply = QMessageBox.question(
+                        None, "无法解密现有数据",
+                        "输入的访问密码无法解密现有的数据文件。\n\n"
+                        "如果访问密码输入有误，请选择“否”重新输入。\n"
+                        "选择“是”将把这些文件移到 config 下的 unreadable 目录保留，并以此访问密码开始使用新的数据。",
+                        QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+                    if reply != QMessageBox.Yes:
+                        raise Exception("访问密码错误")
+                if unreadable:
+                    target = set_aside(unreadable)
+                    if readable:
+                        QMessageBox.warning(None, "部分数据无法解密",
+                                            f"部分数据文件无法用该访问密码解密，已移到 {target} 保留。")
+                if readable:
+                    # 旧版数据直接用访问码派生的密钥加密，改用随机数据密钥重新加密
+                    data_key = migrate_legacy_vault(access_key, key_manager)
                 else:
-                    # 没有重试机会了
-                    QMessageBox.critical(None, "访问失败", 
-                                       "多次输入错误的访问密码！\n\n"
-                                       "程序将退出，请确认正确的访问密码后重新启动。")
-                    return
-        else:
-            # 没有加密文件，直接通过
+                    data_key = key_manager.create(access_key)
+            profiler.mark("验证访问码")
+            # 密码正确，跳出循环
             break
+        except Exception:
+            attempt += 1
+            remaining_attempts = max_attempts - attempt
+            if remaining_attempts > 0:
+                # 还有重试机会
+                QMessageBox.warning(None, "访问密码错误", 
+                                   f"输入的访问密码无法解密现有数据！\n\n"
+                                   f"请确认访问密码是否正确。\n"
+                                   f"剩余尝试次数：{remaining_attempts}")
+            else:
+                # 没有重试机会了
+                QMessageBox.critical(None, "访问失败", 
+                                   "多次输入错误的访问密码！\n\n"
+                                   "程序将退出，请确认正确的访问密码后重新启动。")
+                return
 
     # 设置应用程序属性
     app.setApplicationName("nuoqin管理器")
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("Nuoqin Software")
 
-    # 创建主窗口，并传递加密密钥和主题管理器
-    main_window = NavBar(encryption_key=encryption_key, theme_manager=theme_manager)
+    # 验证通过后在后台解密其余数据文件
+    threading.Thread(target=prefetch_stores, args=(data_key, profiler),
+                     name="prefetch", daemon=True).start()
+
+    # 创建主窗口，并传递数据密钥和主题管理器
+    from ui import NavBar
+    main_window = NavBar(encryption_key=data_key, theme_manager=theme_manager)
     main_window.show()
+    profiler.mark("创建主窗口")
+
+    def on_first_frame():
+        profiler.mark("首帧")
+        profiler.print_report()
+    QTimer.singleShot(0, on_first_frame)
 
     # 启动事件循环
     sys.exit(app.exec_())
@@ -1,5 +1,7 @@
 """模型包 - 包含所有数据模型"""
 
 from .models import PasswordItem, PasswordManager, BookmarkItem, BookmarkManager, BookmarkCategory, BookmarkCategoryManager
+from .registry import ManagerRegistry
 
-__all__ = ['PasswordItem', 'PasswordManager', 'BookmarkItem', 'BookmarkManager', 'BookmarkCategory', 'BookmarkCategoryManager']
+__all__ = ['PasswordItem', 'PasswordManager', 'BookmarkItem', 'BookmarkManager', 'BookmarkCategory', 'BookmarkCategoryManager',
+           'ManagerRegistry']
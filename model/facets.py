@@ -0,0 +1,94 @@
+"""分面统计
+
+按来源、分类、域名等维度统计条目数，随增删改增量维护，
+筛选下拉框显示数量时不需要重新遍历全部条目。
+"""
+
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+
+def url_domain(url: str) -> str:
+    """网址的域名（小写，去掉 www. 前缀），无法解析时返回空字符串"""
+    url = (url or '').strip()
+    if not url:
+        return ''
+    if '://' not in url:
+        url = 'https://' + url
+    try:
+        host = urlsplit(url).hostname or ''
+    except ValueError:
+        return ''
+    return host[4:] if host.startswith('www.') else host
+
+
+class FacetCounts:
+    """条目的分面计数
+
+    facets 为 维度名称 -> 取值函数。第一次查询时统计，之后随增删改增量更新。
+    """
+
+    def __init__(self, items_getter: Callable[[], list], facets: Dict[str, Callable]):
+        self.items_getter = items_getter
+        self.facets = facets
+        # 维度 -> {条目ID: 取值}，用于条目修改或删除时找到原来的取值
+        self._values: Optional[Dict[str, Dict[str, str]]] = None
+        self._counts: Dict[str, Counter] = {}
+
+    def _build(self):
+        self._values = {name: {} for name in self.facets}
+        self._counts = {name: Counter() for name in self.facets}
+        for item in self.items_getter():
+            self._add(item)
+        logger.debug("已统计分面: %s", ", ".join(self.facets))
+
+    def _add(self, item):
+        for name, key_func in self.facets.items():
+            value = key_func(item)
+            self._values[name][item.id] = value
+            self._counts[name][value] += 1
+
+    def reset(self):
+        """数据整体变化后丢弃统计，下次查询时重新统计"""
+        self._values = None
+        self._counts = {}
+
+    def added(self, item):
+        if self._values is not None:
+            self._add(item)
+
+    def updated(self, item):
+        if self._values is not None:
+            self.removed(item.id)
+            self._add(item)
+
+    def removed(self, item_id: str):
+        if self._values is None:
+            return
+        for name, values in self._values.items():
+            if item_id not in values:
+                continue
+            value = values.pop(item_id)
+            counts = self._counts[name]
+            counts[value] -= 1
+            if counts[value] <= 0:
+                del counts[value]
+
+    def counts(self, facet: str) -> Dict[str, int]:
+        """某个维度各取值的条目数"""
+        if facet not in self.facets:
+            raise ValueError(f"不支持的统计维度: {facet}")
+        if self._values is None:
+            self._build()
+        return dict(self._counts[facet])
+
+    def most_common(self, facet: str, limit: int = None) -> List[Tuple[str, int]]:
+        """按数量从多到少排列的取值和条目数"""
+        self.counts(facet)
+        return self._counts[facet].most_common(limit)
@@ -0,0 +1,73 @@
+"""全局搜索
+
+同时在密码、书签和书签分类中搜索，合并各自搜索索引的排序结果。
+只使用管理器已维护的索引（结果同样被各索引缓存），不需要打开任何页面。
+"""
+
+import heapq
+from typing import List, NamedTuple, Optional
+
+from utils.log_utils import get_logger
+from .models import PasswordManager, BookmarkManager, BookmarkCategoryManager
+
+
+logger = get_logger("model")
+
+# 结果类型
+KIND_PASSWORD = 'password'
+KIND_BOOKMARK = 'bookmark'
+KIND_CATEGORY = 'category'
+
+# 默认返回的结果数
+GLOBAL_SEARCH_LIMIT = 20
+
+
+class SearchHit(NamedTuple):
+    """一条全局搜索结果"""
+    kind: str
+    score: float
+    item: object
+    # 显示用的标题和说明
+    title: str
+    detail: str
+
+
+class GlobalSearch:
+    """在多个管理器中搜索并合并结果，未传入的管理器不参与搜索"""
+
+    def __init__(self, password_manager: Optional[PasswordManager] = None,
+                 bookmark_manager: Optional[BookmarkManager] = None,
+                 category_manager: Optional[BookmarkCategoryManager] = None):
+        self.password_manager = password_manager
+        self.bookmark_manager = bookmark_manager
+        self.category_manager = category_manager
+
+    def search(self, query: str, limit: int = GLOBAL_SEARCH_LIMIT) -> List[SearchHit]:
+        """按得分从高到低返回最多 limit 条结果，同分时依次为密码、书签、分类"""
+        query = (query or '').strip()
+        if not query:
+            return []
+        # 每个来源最多只需要 limit 条，合并后再取前 limit 条
+        groups = []
+        if self.password_manager is not None:
+            hits, _ = self.password_manager.search_index.rank_with_scores(query, limit=limit)
+            groups.append([SearchHit(KIND_PASSWORD, score, item, item.title,
+                                     " · ".join(part for part in (item.source, item.account) if part))
+                           for score, item in hits])
+        if self.bookmark_manager is not None:
+            hits, _ = self.bookmark_manager.search_index.rank_with_scores(query, limit=limit)
+            groups.append([SearchHit(KIND_BOOKMARK, score, item, item.title, item.url)
+                           for score, item in hits])
+        if self.category_manager is not None:
+            hits, _ = self.category_manager.search_index.rank_with_scores(query, limit=limit)
+            counts = self.bookmark_manager.facet_counts('category') if self.bookmark_manager is not None else {}
+            groups.append([SearchHit(KIND_CATEGORY, score, item, item.name,
+                                     f"{counts.get(item.name, 0)} 个书签")
+                           for score, item in hits])
+
+        # 各组内已按得分降序排列，按 (得分降序, 组序号, 组内位置) 归并
+        ordered = [[(-hit.score, group_index, position, hit) for position, hit in enumerate(group)]
+                   for group_index, group in enumerate(groups)]
+        merged = [entry[-1] for entry in heapq.merge(*ordered)]
+        logger.debug("全局搜索: %d 条结果", len(merged))
+        return merged[:limit]
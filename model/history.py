@@ -0,0 +1,151 @@
+"""撤销 / 重做
+
+管理器的每次修改记录为一个命令，命令只保存变化的部分：
+新增和删除保存条目本身（删除的条目对象仍在命令中并在回收站中，撤销时直接放回），
+修改只保存变化字段的前后值，移动只保存前后的排序键。
+
+撤销和重做直接修改内存中的数据并只保存受影响的条目，
+SQLite 后端只写入这些行，批量删除的撤销也只是一次事务。
+
+命令通过管理器的 restore_items / remove_items / set_fields / set_order 执行。
+"""
+
+import copy
+from typing import Dict, Iterable, List, Optional
+
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+# 最多保留的撤销步数
+HISTORY_LIMIT = 100
+
+
+def field_values(item, fields: Iterable[str]) -> Dict:
+    """条目指定字段的当前值（列表等可变值复制一份）"""
+    return {field: copy.copy(getattr(item, field)) for field in fields}
+
+
+class Command:
+    """可撤销的修改"""
+
+    label = ""
+
+    def undo(self, target):
+        raise NotImplementedError
+
+    def redo(self, target):
+        raise NotImplementedError
+
+
+class AddItems(Command):
+    """新增条目"""
+
+    def __init__(self, items: list, label: str):
+        self.items = list(items)
+        self.label = label
+
+    def undo(self, target):
+        # 撤销新增不进入回收站
+        target.remove_items([item.id for item in self.items], permanent=True)
+
+    def redo(self, target):
+        target.restore_items(self.items)
+
+
+class RemoveItems(Command):
+    """删除条目（可以是批量删除）"""
+
+    def __init__(self, items: list, label: str):
+        self.items = list(items)
+        self.label = label
+
+    def undo(self, target):
+        target.restore_items(self.items)
+
+    def redo(self, target):
+        target.remove_items([item.id for item in self.items])
+
+
+class UpdateItem(Command):
+    """修改条目，只保存变化字段的前后值"""
+
+    def __init__(self, item_id: str, before: Dict, after: Dict, label: str):
+        changed = [field for field in after if before.get(field) != after[field]]
+        self.item_id = item_id
+        self.before = {field: before[field] for field in changed}
+        self.after = {field: after[field] for field in changed}
+        self.label = label
+
+    def undo(self, target):
+        target.set_fields(self.item_id, self.before)
+
+    def redo(self, target):
+        target.set_fields(self.item_id, self.after)
+
+
+class MoveItem(Command):
+    """调整手动排序，只保存前后的排序键"""
+
+    def __init__(self, item_id: str, before: str, after: str, label: str):
+        self.item_id = item_id
+        self.before = before
+        self.after = after
+        self.label = label
+
+    def undo(self, target):
+        target.set_order(self.item_id, self.before)
+
+    def redo(self, target):
+        target.set_order(self.item_id, self.after)
+
+
+class CommandHistory:
+    """管理器的撤销 / 重做栈"""
+
+    def __init__(self, target, limit: int = HISTORY_LIMIT):
+        self.target = target
+        self.limit = limit
+        self._undo: List[Command] = []
+        self._redo: List[Command] = []
+
+    def push(self, command: Command):
+        """记录一次新的修改（清空重做栈）"""
+        self._undo.append(command)
+        if len(self._undo) > self.limit:
+            del self._undo[0]
+        self._redo.clear()
+
+    def clear(self):
+        """数据整体变化后清空历史（旧命令可能已不适用）"""
+        self._undo.clear()
+        self._redo.clear()
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo(self) -> Optional[str]:
+        """撤销最近一次修改，返回其说明；没有可撤销的修改时返回 None"""
+        return self._step(self._undo, self._redo, 'undo')
+
+    def redo(self) -> Optional[str]:
+        """重做最近一次撤销的修改，返回其说明；没有可重做的修改时返回 None"""
+        return self._step(self._redo, self._undo, 'redo')
+
+    def _step(self, source: List[Command], destination: List[Command], action: str) -> Optional[str]:
+        if not source:
+            return None
+        command = source.pop()
+        try:
+            getattr(command, action)(self.target)
+        except Exception:
+            # 保存失败时命令留在原处，可以再次尝试
+            source.append(command)
+            raise
+        destination.append(command)
+        logger.debug("%s: %s", "撤销" if action == 'undo' else "重做", command.label)
+        return command.label
@@ -1,22 +1,108 @@
 """数据模型模块"""
 
+import copy
 import json
 import os
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from utils.crypto_utils import SecurePasswordManager
+from utils.log_utils import get_logger
+from utils.pinyin_utils import PinyinUtils
+from .facets import FacetCounts, url_domain
+from .history import AddItems, CommandHistory, MoveItem, RemoveItems, UpdateItem, field_values
+from .ordering import OrderedItems
+from .query_language import QueryPlan, Term, TIME_FIELDS, parse_query, time_bounds
+from .search_index import SearchIndex
+from .shard_store import ShardedFileStore
+from .sorted_index import QueryPage, SortedViews
+from .usage import UsageStats, usage_file_for
+from .sqlite_store import SqliteItemStore, StorageSettings
+from .smart_folders import SmartFolders, searches_file_for
+from .trash import Trash
+from .versions import VersionHistory, versions_dir_for
+from .tag_index import TagIndex, normalize_tags
+
+
+logger = get_logger("model")
+
+_id_lock = threading.Lock()
+_last_id = 0
+
+
+def new_item_id() -> str:
+    """生成条目ID（毫秒时间戳，同一毫秒内创建的条目依次加一，保证不重复）"""
+    global _last_id
+    with _id_lock:
+        _last_id = max(int(datetime.now().timestamp() * 1000), _last_id + 1)
+        return str(_last_id)
+
+
+# 可排序字段 -> 排序键（标题按拼音/不区分大小写，时间为ISO字符串可直接比较，order 为手动排序）
+SORT_KEY_FUNCS = {
+    'order': lambda item: item.order,
+    'title': lambda item: PinyinUtils.collation_key(item.title),
+    'created_time': lambda item: item.created_time,
+    'updated_time': lambda item: item.updated_time,
+}
+
+# 排序搜索的字段权重：标题 > 来源/网址/账号 > 分类 > 描述
+PASSWORD_SEARCH_WEIGHTS = {'title': 3.0, 'source': 2.0, 'account': 2.0, 'tag_text': 1.5, 'description': 1.0}
+BOOKMARK_SEARCH_WEIGHTS = {'title': 3.0, 'url': 2.0, 'category': 1.5, 'tag_text': 1.5, 'description': 1.0}
+CATEGORY_SEARCH_WEIGHTS = {'name': 3.0, 'description': 1.0}
+
+# 撤销修改时记录的字段
+PASSWORD_HISTORY_FIELDS = ('title', 'source', 'description', 'account', 'password', 'tags', 'updated_time')
+BOOKMARK_HISTORY_FIELDS = ('title', 'url', 'description', 'category', 'category_id', 'tags', 'updated_time')
+# 密码条目历史版本记录的字段
+PASSWORD_VERSION_FIELDS = ('title', 'source', 'description', 'account', 'password', 'tags')
+
+# 查询语法支持的字段 -> 条目属性
+PASSWORD_QUERY_FIELDS = {'id': 'id', 'title': 'title', 'source': 'source', 'account': 'account', 'tag': 'tag_text',
+                         'description': 'description', 'created': 'created_time', 'updated': 'updated_time'}
+BOOKMARK_QUERY_FIELDS = {'id': 'id', 'title': 'title', 'url': 'url', 'domain': 'domain', 'category': 'category',
+                         'tag': 'tag_text', 'description': 'description', 'created': 'created_time',
+                         'updated': 'updated_time'}
+
+
+def make_predicate(filter, search: Callable[[str], list]) -> Optional[Callable]:
+    """把查询条件转换为判断函数：字符串按关键词搜索，函数原样使用"""
+    if filter is None or filter == "":
+        return None
+    if isinstance(filter, str):
+        ids = {item.id for item in search(filter)}
+        return lambda item: item.id in ids
+    return filter
+
+
+def ensure_unique_ids(items: List) -> int:
+    """为ID重复的条目重新分配ID（旧版本同一毫秒内创建的条目ID相同），返回修改的条数"""
+    seen = set()
+    fixed = 0
+    for item in items:
+        if item.id in seen:
+            item.id = new_item_id()
+            fixed += 1
+        seen.add(item.id)
+    return fixed
 
 
 class PasswordItem:
     """密码条目数据模型"""
     
-    def __init__(self, title: str = "", description: str = "", account: str = "", password: str = "", source: str = "", item_id: str = None):
-        self.id = item_id or str(int(datetime.now().timestamp() * 1000))  # 使用时间戳作为ID
+    def __init__(self, title: str = "", description: str = "", account: str = "", password: str = "", source: str = "", item_id: str = None,
+                 tags: List[str] = None):
+        self.id = item_id or new_item_id()  # 使用时间戳作为ID
         self.title = title
         self.source = source
         self.description = description
         self.account = account
         self.password = password
+        self.tags = normalize_tags(tags)
+        # 手动排序键（见 model.ordering），由管理器分配
+        self.order = ""
+        # 移入回收站的时间，为空表示未删除
+        self.deleted_time = ""
         self.created_time = datetime.now().isoformat()
         self.updated_time = datetime.now().isoformat()
     
@@ -29,6 +115,9 @@ class PasswordItem:
             'description': self.description,
             'account': self.account,
             'password': self.password,
+            'tags': self.tags,
+            'order': self.order,
+            'deleted_time': self.deleted_time,
             'created_time': self.created_time,
             'updated_time': self.updated_time
         }
@@ -42,13 +131,17 @@ class PasswordItem:
             description=data.get('description', ''),
             account=data.get('account', ''),
             password=data.get('password', ''),
-            item_id=data.get('id')
+            item_id=data.get('id'),
+            tags=data.get('tags')
         )
+        item.order = data.get('order', '')
+        item.deleted_time = data.get('deleted_time', '')
         item.created_time = data.get('created_time', item.created_time)
         item.updated_time = data.get('updated_time', item.updated_time)
         return item
     
-    def update(self, title: str = None, source: str = None, description: str = None, account: str = None, password: str = None):
+    def update(self, title: str = None, source: str = None, description: str = None, account: str = None, password: str = None,
+               tags: List[str] = None):
         """更新数据"""
         if title is not None:
             self.title = title
@@ -60,18 +153,33 @@ class PasswordItem:
             self.account = account
         if password is not None:
             self.password = password
+        if tags is not None:
+            self.tags = normalize_tags(tags)
         self.updated_time = datetime.now().isoformat()
 
+    @property
+    def tag_text(self) -> str:
+        """标签文本（空格分隔），用于搜索"""
+        return " ".join(self.tags)
+
 
 class BookmarkItem:
     """书签条目数据模型"""
     
-    def __init__(self, title: str = "", description: str = "", url: str = "", category: str = "默认分类", item_id: str = None):
-        self.id = item_id or str(int(datetime.now().timestamp() * 1000))  # 使用时间戳作为ID
+    def __init__(self, title: str = "", description: str = "", url: str = "", category: str = "默认分类", item_id: str = None,
+                 category_id: str = "", tags: List[str] = None):
+        self.id = item_id or new_item_id()  # 使用时间戳作为ID
         self.title = title
         self.url = url
         self.description = description
+        # 所属分类ID，分类名称只作为显示用的冗余字段，分类改名时随之更新
+        self.category_id = category_id
         self.category = category
+        self.tags = normalize_tags(tags)
+        # 手动排序键（见 model.ordering），由管理器分配
+        self.order = ""
+        # 移入回收站的时间，为空表示未删除
+        self.deleted_time = ""
         self.created_time = datetime.now().isoformat()
         self.updated_time = datetime.now().isoformat()
     
@@ -82,7 +190,11 @@ class BookmarkItem:
             'title': self.title,
             'url': self.url,
             'description': self.description,
+            'category_id': self.category_id,
             'category': self.category,
+            'tags': self.tags,
+            'order': self.order,
+            'deleted_time': self.deleted_time,
             'created_time': self.created_time,
             'updated_time': self.updated_time
         }
@@ -95,13 +207,18 @@ class BookmarkItem:
             url=data.get('url', ''),
             description=data.get('description', ''),
             category=data.get('category', '默认分类'),
-            item_id=data.get('id')
+            item_id=data.get('id'),
+            category_id=data.get('category_id', ''),
+            tags=data.get('tags')
         )
+        item.order = data.get('order', '')
+        item.deleted_time = data.get('deleted_time', '')
         item.created_time = data.get('created_time', item.created_time)
         item.updated_time = data.get('updated_time', item.updated_time)
         return item
     
-    def update(self, title: str = None, url: str = None, description: str = None, category: str = None):
+    def update(self, title: str = None, url: str = None, description: str = None, category: str = None,
+               category_id: str = None, tags: List[str] = None):
         """更新数据"""
         if title is not None:
             self.title = title
@@ -111,26 +228,202 @@ class BookmarkItem:
             self.description = description
         if category is not None:
             self.category = category
+        if category_id is not None:
+            self.category_id = category_id
+        if tags is not None:
+            self.tags = normalize_tags(tags)
         self.updated_time = datetime.now().isoformat()
 
+    @property
+    def tag_text(self) -> str:
+        """标签文本（空格分隔），用于搜索"""
+        return " ".join(self.tags)
+
+    @property
+    def domain(self) -> str:
+        """网址的域名"""
+        return url_domain(self.url)
+
+    @property
+    def category_key(self) -> str:
+        """分类索引键：有分类ID时使用ID，否则使用分类名称"""
+        return self.category_id or self.category
+
 
 class PasswordManager:
     """密码管理器"""
     def __init__(self, data_file: str = "config/passwords.json", encrypted_file: str = "config/passwords.enc"):
         self.data_file = data_file
         self.encrypted_file = encrypted_file
-        self.passwords: List[PasswordItem] = []
+        # 全部密码，按手动排序键排列（新密码在最前面）
+        self.passwords = OrderedItems()
         self.secure_manager = SecurePasswordManager(data_file, encrypted_file)
+        self.secure_manager.set_compression(StorageSettings.compression_for(encrypted_file))
         self.encryption_key = None
         self.use_encryption = False
+        # 是否已加载过数据（共享实例据此判断是否需要加载）
+        self.loaded = False
+        # 使用记录（复制密码），常用度决定默认顺序并参与搜索排序
+        self.usage = UsageStats(usage_file_for(data_file))
+        # 排序视图（第一次按某字段查询时建立索引）
+        self.views = SortedViews(lambda: self.passwords, SORT_KEY_FUNCS, self.usage.ranked)
+        # 搜索索引（预先计算的小写文本和拼音，以及排序搜索用的片段索引）
+        self.search_index = SearchIndex(lambda: self.passwords, PASSWORD_SEARCH_WEIGHTS)
+        self.search_index.boost = self.usage.search_boost
+        # 来源索引：小写来源 -> 条目ID集合
+        self._source_index: Dict[str, set] = {}
+        # 分面计数（各来源的条目数）
+        self.facets = FacetCounts(lambda: self.passwords, {'source': lambda item: item.source})
+        # 标签位图索引
+        self.tags = TagIndex(lambda: self.passwords)
+        # 智能文件夹（保存的搜索），成员随增删改增量维护
+        self.smart_folders = SmartFolders(self.plan_query, self.search_passwords, self.search_index.item_matches,
+                                          lambda: self.passwords, searches_file_for(data_file),
+                                          searches_file_for(encrypted_file, ".enc"))
+        # 撤销 / 重做
+        self.history = CommandHistory(self)
+        # 回收站：删除标记和彻底清除在后台批量写入
+        self.trash = Trash(self._write_trash)
+        # 保存操作互斥（回收站在后台线程写入）
+        self._storage_lock = threading.RLock()
+        # 每个密码的历史版本（单独的文件，查看时才读取）
+        self.versions = VersionHistory(versions_dir_for(data_file), PASSWORD_VERSION_FIELDS)
+        # 可选的 SQLite 后端
+        self.store = SqliteItemStore("passwords", ('title', 'source', 'description', 'account', 'tags')) \
+            if StorageSettings.use_sqlite() else None
     
     def set_encryption_key(self, key: str):
         """设置加密密钥"""
         self.encryption_key = key
         self.secure_manager.set_encryption_key(key, use_simple_key=True)  # 使用简单密钥派生
         self.use_encryption = True
+        self.smart_folders.set_encryption_key(key)
+        self.versions.set_encryption_key(key)
+        self.usage.set_encryption_key(key)
+        if self.store is not None:
+            self.store.set_encryption_key(key)
+
+    @property
+    def use_sqlite(self) -> bool:
+        """是否使用 SQLite 后端（需要加密密钥）"""
+        return self.store is not None and self.use_encryption
+
+    def _notify_indexes(self, event: str, *args):
+        """把条目变化通知智能文件夹、排序视图、搜索索引、分面计数和标签索引（reset / added / updated / removed）
+
+        智能文件夹排在搜索索引之前：搜索缓存修正结果时用到的筛选条件可能依赖文件夹成员。
+        """
+        for index in (self.smart_folders, self.views, self.search_index, self.facets, self.tags):
+            getattr(index, event)(*args)
 
     def load_data(self):
+        """加载数据"""
+        # 先写入回收站尚未写入的删除标记，再重新加载
+        self.trash.flush(None)
+        with self._storage_lock:
+            self.trash.reset([])
+            if self.use_sqlite:
+                self._load_from_store()
+            else:
+                self._load_from_file()
+            self.trash.reset([item for item in self.passwords if item.deleted_time])
+            self.passwords = OrderedItems(item for item in self.passwords if not item.deleted_time)
+            if self.passwords.rekeyed:
+                # 旧数据没有排序键，保存一次分配的排序键
+                self._persist(changed=self.passwords.rekeyed)
+        self._rebuild_source_index()
+        self._notify_indexes('reset')
+        self.history.clear()
+        self.loaded = True
+
+    def _rebuild_source_index(self):
+        """重建来源索引"""
+        self._source_index = {}
+        for item in self.passwords:
+            self._source_index.setdefault(item.source.lower(), set()).add(item.id)
+
+    def _source_index_remove(self, item_id: str, source: str):
+        ids = self._source_index.get(source.lower())
+        if ids is not None:
+            ids.discard(item_id)
+            if not ids:
+                del self._source_index[source.lower()]
+
+    def _stored_items(self) -> List[PasswordItem]:
+        """需要保存的全部条目（包括回收站中的条目）"""
+        return list(self.passwords) + self.trash.items()
+
+    def save_data(self):
+        """整体保存数据"""
+        with self._storage_lock:
+            if not self.use_sqlite:
+                self._save_to_file()
+                return
+            try:
+                items = self._stored_items()
+                if ensure_unique_ids(items):
+                    logger.warning("发现重复的条目ID，已重新分配")
+                self.store.replace_all([item.to_dict() for item in items])
+                logger.info("已保存 %d 个密码条目到数据库", len(items))
+            except Exception as e:
+                logger.exception("保存密码数据失败: %s", e)
+                raise Exception(f"保存密码数据失败: {e}")
+
+    def reencrypt(self, new_key: str, old_key: str):
+        """改用新密钥重新加密全部数据（旧版数据迁移使用，须已加载数据）
+
+        各文件按新密钥或原密钥读取，已是新密钥加密的不再重写，迁移中断后可以重新执行。
+        """
+        with self._storage_lock:
+            # 加密文件（SQLite 后端时为导入前的原数据）、智能文件夹、使用记录和历史版本
+            self.secure_manager.reencrypt_file(new_key, old_key)
+            self.smart_folders.reencrypt(new_key, old_key)
+            self.usage.reencrypt(new_key, old_key)
+            self.versions.reencrypt(new_key, old_key)
+            self.set_encryption_key(new_key)
+            if self.use_sqlite:
+                self.save_data()
+                self.store.compact()
+
+    def _load_from_store(self):
+        """从数据库加载数据，首次使用时从原有文件导入"""
+        if not self.store.is_initialized():
+            self._load_from_file()
+            self.save_data()
+            logger.info("已将 %d 个密码条目导入数据库", len(self.passwords))
+            return
+        try:
+            self.passwords = [PasswordItem.from_dict(data) for data in self.store.load_all()]
+            logger.info("从数据库加载了 %d 个密码条目", len(self.passwords))
+        except Exception as decrypt_error:
+            logger.warning("解密失败，可能是访问密码错误: %s", decrypt_error)
+            raise Exception("访问密码错误，无法解密数据！请确认输入的访问密码是否正确。")
+
+    def _persist(self, changed: List[PasswordItem] = (), deleted: List[str] = ()):
+        """持久化修改：SQLite 后端只在一个事务内写入变化的行，文件后端整体保存"""
+        with self._storage_lock:
+            if not self.use_sqlite:
+                self._save_to_file()
+                return
+            try:
+                self.store.write([item.to_dict() for item in changed], deleted)
+            except Exception as e:
+                logger.exception("保存密码数据失败: %s", e)
+                raise Exception(f"保存密码数据失败: {e}")
+
+    def _write_trash(self, changed: List[PasswordItem], deleted: List[str]):
+        """写入回收站的删除标记并彻底清除条目（在后台线程调用）
+
+        所有写入存储的路径（save_data、_persist 及其调用的 _save_to_file）都持有 _storage_lock，
+        条目在写入时才按当前内容序列化：界面线程此后的修改由它自己的 _persist 在这次写入之后保存。
+        """
+        with self._storage_lock:
+            self._persist(changed=changed, deleted=deleted)
+            for item_id in deleted:
+                self.usage.forget(item_id)
+            self.versions.forget(deleted)
+
+    def _load_from_file(self):
         """从文件加载数据"""
         try:
             if self.use_encryption and os.path.exists(self.encrypted_file):
@@ -138,10 +431,10 @@ class PasswordManager:
                 try:
                     data = self.secure_manager.load_encrypted_data()
                     self.passwords = [PasswordItem.from_dict(item) for item in data]
-                    print(f"从加密文件加载了 {len(self.passwords)} 个密码条目")
+                    logger.info("从加密文件加载了 %d 个密码条目", len(self.passwords))
                 except Exception as decrypt_error:
                     # 解密失败，可能是密码错误
-                    print(f"解密失败，可能是访问密码错误: {decrypt_error}")
+                    logger.warning("解密失败，可能是访问密码错误: %s", decrypt_error)
                     raise Exception("访问密码错误，无法解密数据！请确认输入的访问密码是否正确。")
             elif os.path.exists(self.data_file):
                 # 加载明文数据
@@ -151,100 +444,251 @@ class PasswordManager:
 
                 # 如果启用了加密，自动迁移到加密存储
                 if self.use_encryption and data:
-                    print(f"检测到明文数据，自动迁移到加密存储...")
+                    logger.info("检测到明文数据，自动迁移到加密存储")
                     self.secure_manager.migrate_to_encrypted(data)
-                    print("数据迁移完成")
+                    logger.info("数据迁移完成")
 
-                print(f"从明文文件加载了 {len(self.passwords)} 个密码条目")
+                logger.info("从明文文件加载了 %d 个密码条目", len(self.passwords))
             else:
                 self.passwords = []
-                print("未找到密码数据文件")
+                logger.info("未找到密码数据文件")
         except Exception as e:
             if "访问密码错误" in str(e):
                 # 重新抛出密码错误，不要设置为空列表
                 raise e
             else:
-                print(f"加载密码数据失败: {e}")
+                logger.error("加载密码数据失败: %s", e)
                 self.passwords = []
     
-    def save_data(self):
+    def _save_to_file(self):
         """保存数据到文件"""
         try:
-            print(f"开始保存密码数据，共 {len(self.passwords)} 个条目")
-            data = [password.to_dict() for password in self.passwords]
+            data = [password.to_dict() for password in self._stored_items()]
+            logger.debug("开始保存密码数据，共 %d 个条目", len(data))
 
             if self.use_encryption:
                 # 保存为加密数据
-                print("使用加密模式保存数据...")
                 self.secure_manager.save_encrypted_data(data)
-                print(f"已加密保存 {len(self.passwords)} 个密码条目")
+                logger.info("已加密保存 %d 个密码条目", len(data))
             else:
                 # 保存为明文数据
-                print("使用明文模式保存数据...")
                 # 确保config目录存在
                 os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
 
                 with open(self.data_file, 'w', encoding='utf-8') as f:
                     json.dump(data, f, ensure_ascii=False, indent=2)
-                print(f"已明文保存 {len(self.passwords)} 个密码条目")
-            print("密码数据保存完成")
+                logger.info("已明文保存 %d 个密码条目", len(data))
         except Exception as e:
-            print(f"保存密码数据失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("保存密码数据失败: %s", e)
             raise Exception(f"保存密码数据失败: {e}")
     
-    def add_password(self, title: str, source: str, description: str, account: str, password: str) -> PasswordItem:
+    def add_password(self, title: str, source: str, description: str, account: str, password: str,
+                     tags: List[str] = None) -> PasswordItem:
         """添加新密码"""
-        item = PasswordItem(title, description, account, password, source)
-        self.passwords.insert(0,item)
-        self.save_data()
+        item = PasswordItem(title, description, account, password, source, tags=tags)
+        self.passwords.prepend(item)
+        self._source_index.setdefault(item.source.lower(), set()).add(item.id)
+        self._notify_indexes('added', item)
+        self._persist(changed=[item])
+        self.history.push(AddItems([item], "添加密码"))
         return item
     
     def update_password(self, item_id: str, title: str = None, source: str = None, description: str = None, 
-                       account: str = None, password: str = None) -> bool:
+                       account: str = None, password: str = None, tags: List[str] = None) -> bool:
         """更新密码"""
-        for item in self.passwords:
-            if item.id == item_id:
-                item.update(title, source, description, account, password)
-                self.save_data()
-                return True
-        return False
+        item = self.passwords.get(item_id)
+        if item is None:
+            return False
+        before = field_values(item, PASSWORD_HISTORY_FIELDS)
+        self._source_index_remove(item.id, item.source)
+        item.update(title, source, description, account, password, tags)
+        self._source_index.setdefault(item.source.lower(), set()).add(item.id)
+        self._notify_indexes('updated', item)
+        self._persist(changed=[item])
+        after = field_values(item, PASSWORD_HISTORY_FIELDS)
+        self.versions.record(item.id, before, after)
+        self.history.push(UpdateItem(item.id, before, after, "修改密码"))
+        return True
     
     def delete_password(self, item_id: str) -> bool:
-        """删除密码"""
-        for i, item in enumerate(self.passwords):
-            if item.id == item_id:
-                del self.passwords[i]
-                self.save_data()
-                return True
-        return False
+        """删除密码（可撤销）"""
+        return self.delete_passwords([item_id]) == 1
+
+    def delete_passwords(self, item_ids: List[str]) -> int:
+        """批量删除密码，作为一步撤销，返回删除的条数"""
+        items = self.remove_items(item_ids)
+        if items:
+            self.history.push(RemoveItems(items, "删除密码"))
+        return len(items)
+
+    def move_password(self, item_id: str, target_id: str, after: bool = False) -> bool:
+        """手动排序：把密码移动到 target_id 之前（after 为 True 时为之后），只保存被移动的密码"""
+        item = self.passwords.get(item_id)
+        before = item.order if item is not None else None
+        item = self.passwords.move(item_id, target_id, after)
+        if item is None:
+            return False
+        self._notify_indexes('updated', item)
+        self._persist(changed=[item])
+        self.history.push(MoveItem(item.id, before, item.order, "调整顺序"))
+        return True
+
+    def remove_items(self, item_ids: List[str], permanent: bool = False) -> List[PasswordItem]:
+        """移除条目，返回移除的条目（删除和撤销/重做使用）
+
+        默认移入回收站，删除标记稍后在后台批量写入；permanent 为 True 时立即彻底删除。
+        """
+        items = []
+        for item_id in item_ids:
+            item = self.passwords.remove(item_id)
+            if item is not None:
+                self._source_index_remove(item_id, item.source)
+                self._notify_indexes('removed', item_id)
+                items.append(item)
+        if not items:
+            return items
+        if not permanent:
+            self.trash.put(items)
+            return items
+        for item in items:
+            self.usage.forget(item.id)
+        self._persist(deleted=[item.id for item in items])
+        self.versions.forget([item.id for item in items])
+        return items
+
+    def restore_items(self, items: List[PasswordItem]):
+        """放回移除的条目（保留原ID和排序键），只保存这些条目（撤销/重做和从回收站恢复使用）"""
+        self.trash.take([item.id for item in items])
+        items = [item for item in items if self.passwords.get(item.id) is None]
+        for item in items:
+            self.passwords.restore(item)
+            self._source_index.setdefault(item.source.lower(), set()).add(item.id)
+            self._notify_indexes('added', item)
+        if items:
+            self._persist(changed=items)
+
+    def password_versions(self, item_id: str) -> List[Dict]:
+        """密码的历史版本（第一个为当前内容），查看历史时才读取，条目不存在时返回空列表"""
+        item = self.passwords.get(item_id) or self.trash.get(item_id)
+        if item is None:
+            return []
+        return self.versions.versions(item)
+
+    def trash_items(self) -> List[PasswordItem]:
+        """回收站中的密码，最近删除的在前"""
+        return self.trash.items()
+
+    def restore_from_trash(self, item_ids: List[str]) -> int:
+        """从回收站恢复密码（回到原来的位置），返回恢复的条数"""
+        items = [item for item in map(self.trash.get, item_ids) if item is not None]
+        self.restore_items(items)
+        return len(items)
+
+    def purge_trash(self, item_ids: List[str]) -> int:
+        """彻底删除回收站中的密码（后台分批清除），返回条数"""
+        count = self.trash.discard(item_ids)
+        if count:
+            # 已彻底删除的条目不能再撤销
+            self.history.clear()
+        return count
+
+    def empty_trash(self) -> int:
+        """清空回收站，返回彻底删除的条数"""
+        return self.purge_trash([item.id for item in self.trash.items()])
+
+    def set_fields(self, item_id: str, values: Dict) -> bool:
+        """把条目的字段设为给定值并只保存该条目（撤销/重做使用）"""
+        item = self.passwords.get(item_id)
+        if item is None:
+            return False
+        before = field_values(item, PASSWORD_HISTORY_FIELDS)
+        self._source_index_remove(item.id, item.source)
+        for field, value in values.items():
+            setattr(item, field, copy.copy(value))
+        self._source_index.setdefault(item.source.lower(), set()).add(item.id)
+        self._notify_indexes('updated', item)
+        self._persist(changed=[item])
+        # 撤销/重做的修改也记录为历史版本，版本链保持连续
+        self.versions.record(item.id, before, field_values(item, PASSWORD_HISTORY_FIELDS))
+        return True
+
+    def set_order(self, item_id: str, order: str) -> bool:
+        """把条目的排序键设为给定值并只保存该条目（撤销/重做使用）"""
+        item = self.passwords.remove(item_id)
+        if item is None:
+            return False
+        item.order = order
+        self.passwords.restore(item)
+        self._notify_indexes('updated', item)
+        self._persist(changed=[item])
+        return True
+
+    def record_use(self, item_id: str):
+        """记录一次使用（复制密码），稍后批量写入使用记录文件"""
+        self.usage.record(item_id)
     
-    def search_passwords(self, query: str) -> List[PasswordItem]:
-        """搜索密码"""
+    def search_passwords(self, query: str, pinyin: bool = True) -> List[PasswordItem]:
+        """搜索密码（pinyin 为 True 时可用全拼或首字母匹配中文，如 wx -> 微信）"""
         if not query:
-            return self.passwords
-        
-        query = query.lower()
-        results = []
-        for item in self.passwords:
-            if (query in item.title.lower() or 
-                query in item.source.lower() or
-                query in item.description.lower() or 
-                query in item.account.lower()):
-                results.append(item)
-        return results
+            return list(self.passwords)
+
+        prefilter = None
+        if self.use_sqlite and len(query) > 1 and \
+                not (pinyin and PinyinUtils.available() and PinyinUtils.is_pinyin_query(query)):
+            # 先用盲索引缩小范围，再对明文确认（盲索引不含拼音和单字，拼音查询和单字查询不经过这一步）
+            prefilter = lambda: self.store.search_ids(query.lower())
+        return self.search_index.search(query, pinyin, prefilter)
+
+    def rank_passwords(self, query: str, filter: Callable = None, limit: int = 50, filter_key=None) -> QueryPage:
+        """按相关度搜索密码，允许少量输入错误，返回最相关的 limit 条（total 为命中总数）
+
+        filter_key 为 filter 的可比较标识（如 ("source", "微信")），给出时结果会被缓存。
+        """
+        return self.search_index.rank(query, filter, limit, filter_key=filter_key)
     
+    def facet_counts(self, facet: str = 'source') -> Dict[str, int]:
+        """各来源的密码数（随增删改增量维护）"""
+        return self.facets.counts(facet)
+
+    def tag_counts(self) -> Dict[str, int]:
+        """各标签的密码数"""
+        return self.tags.counts()
+
+    def filter_by_tags(self, all_of: List = (), none_of: List[str] = ()) -> List[PasswordItem]:
+        """按标签筛选密码（all_of 的每项为一个标签或一组任一包含的标签），保持默认顺序"""
+        ids = self.tags.select(all_of, none_of)
+        return [item for item in self.passwords if item.id in ids]
+
+    def plan_query(self, text: str) -> QueryPlan:
+        """把搜索框内容编译为执行计划（语法见 model.query_language），语法错误时抛出 ValueError"""
+        return QueryPlan(parse_query(text, PASSWORD_QUERY_FIELDS), PASSWORD_QUERY_FIELDS, self._term_ids,
+                         lambda: self.passwords, self.views.items_by_id, self.tags.select)
+
+    def _term_ids(self, term: Term) -> Optional[set]:
+        """用索引查找满足条件的条目ID，没有对应索引时返回 None"""
+        if term.field == 'id':
+            return {term.value} if term.value in self.views.items_by_id() else set()
+        if term.field == 'source':
+            return self._source_index.get(term.value.lower(), set())
+        if term.field in TIME_FIELDS:
+            return set(self.views.range_ids(TIME_FIELDS[term.field], *time_bounds(term.op, term.value)))
+        return None
+
+    def query(self, filter=None, sort: str = None, cursor: str = None, limit: Optional[int] = 50) -> QueryPage:
+        """分页查询密码
+
+        filter 为搜索关键词或判断函数；sort 为 title / created_time / updated_time，
+        前缀 "-" 表示降序，None 为默认顺序（常用的在前）；cursor 为上一页返回的 next_cursor。
+        """
+        return self.views.query(make_predicate(filter, self.search_passwords), sort, cursor, limit)
+
     def get_all_passwords(self) -> List[PasswordItem]:
         """获取所有密码"""
-        return self.passwords
+        return list(self.passwords)
     
     def get_password_by_id(self, item_id: str) -> Optional[PasswordItem]:
         """根据ID获取密码"""
-        for item in self.passwords:
-            if item.id == item_id:
-                return item
-        return None
+        return self.passwords.get(item_id)
 
 
 class BookmarkManager:
@@ -253,18 +697,279 @@ class BookmarkManager:
     def __init__(self, data_file: str = "config/bookmarks.json", encrypted_file: str = "config/bookmarks.enc"):
         self.data_file = data_file
         self.encrypted_file = encrypted_file
-        self.bookmarks: List[BookmarkItem] = []
+        # 全部书签，按手动排序键排列（新书签在最前面）
+        self.bookmarks = OrderedItems()
         self.secure_manager = SecurePasswordManager(data_file, encrypted_file)
+        self.secure_manager.set_compression(StorageSettings.compression_for(encrypted_file))
         self.encryption_key = None
         self.use_encryption = False
+        # 是否已加载过数据（共享实例据此判断是否需要加载）
+        self.loaded = False
+        # 使用记录（打开书签），常用度决定默认顺序并参与搜索排序
+        self.usage = UsageStats(usage_file_for(data_file))
+        # 排序视图（第一次按某字段查询时建立索引）
+        self.views = SortedViews(lambda: self.bookmarks, SORT_KEY_FUNCS, self.usage.ranked)
+        # 搜索索引（预先计算的小写文本和拼音，以及排序搜索用的片段索引）
+        self.search_index = SearchIndex(lambda: self.bookmarks, BOOKMARK_SEARCH_WEIGHTS)
+        self.search_index.boost = self.usage.search_boost
+        # 分面计数（各分类、各域名的书签数）
+        self.facets = FacetCounts(lambda: self.bookmarks, {'category': lambda item: item.category,
+                                                           'domain': lambda item: item.domain})
+        # 标签位图索引
+        self.tags = TagIndex(lambda: self.bookmarks)
+        # 智能文件夹（保存的搜索），成员随增删改增量维护
+        self.smart_folders = SmartFolders(self.plan_query, self.search_bookmarks, self.search_index.item_matches,
+                                          lambda: self.bookmarks, searches_file_for(data_file),
+                                          searches_file_for(encrypted_file, ".enc"))
+        # 可选的 SQLite 后端
+        self.store = SqliteItemStore("bookmarks", ('title', 'url', 'description', 'category', 'tags')) \
+            if StorageSettings.use_sqlite() else None
+        # 可选的分片文件存储（按分类或按ID哈希），保存时只重写有变化的分片
+        sharding = StorageSettings.bookmark_sharding()
+        self.shards = ShardedFileStore(os.path.splitext(encrypted_file)[0], sharding,
+                                       compression=StorageSettings.compression_for(encrypted_file)) \
+            if sharding else None
+        # 撤销 / 重做（分类改名、删除会清空历史）
+        self.history = CommandHistory(self)
+        # 回收站：删除标记和彻底清除在后台批量写入
+        self.trash = Trash(self._write_trash)
+        # 保存操作互斥（回收站在后台线程写入）
+        self._storage_lock = threading.RLock()
+        # 关联的分类管理器，用于分类名称与ID的对应
+        self.category_manager = None
+        # 分类索引：分类键 -> {书签ID: 书签}（取出时按排序键排列）
+        self._category_index: Dict[str, Dict[str, BookmarkItem]] = {}
 
     def set_encryption_key(self, key: str):
         """设置加密密钥"""
         self.encryption_key = key
         self.secure_manager.set_encryption_key(key, use_simple_key=True)  # 使用简单密钥派生
         self.use_encryption = True
+        self.smart_folders.set_encryption_key(key)
+        self.usage.set_encryption_key(key)
+        if self.store is not None:
+            self.store.set_encryption_key(key)
+        if self.shards is not None:
+            self.shards.set_encryption_key(key)
+
+    @property
+    def use_sqlite(self) -> bool:
+        """是否使用 SQLite 后端（需要加密密钥）"""
+        return self.store is not None and self.use_encryption
+
+    @property
+    def use_shards(self) -> bool:
+        """是否使用分片文件存储（需要加密密钥，SQLite 后端优先）"""
+        return self.shards is not None and self.use_encryption and not self.use_sqlite
+
+    def _notify_indexes(self, event: str, *args):
+        """把条目变化通知智能文件夹、排序视图、搜索索引、分面计数和标签索引（reset / added / updated / removed）
+
+        智能文件夹排在搜索索引之前：搜索缓存修正结果时用到的筛选条件可能依赖文件夹成员。
+        """
+        for index in (self.smart_folders, self.views, self.search_index, self.facets, self.tags):
+            getattr(index, event)(*args)
 
     def load_data(self):
+        """加载数据"""
+        # 先写入回收站尚未写入的删除标记，再重新加载
+        self.trash.flush(None)
+        with self._storage_lock:
+            self.trash.reset([])
+            if self.use_sqlite:
+                self._load_from_store()
+            elif self.use_shards:
+                self._load_from_shards()
+            else:
+                self._load_from_file()
+            self.trash.reset([item for item in self.bookmarks if item.deleted_time])
+            self.bookmarks = OrderedItems(item for item in self.bookmarks if not item.deleted_time)
+            if self.bookmarks.rekeyed:
+                # 旧数据没有排序键，保存一次分配的排序键
+                self._persist(changed=self.bookmarks.rekeyed)
+        self._rebuild_category_index()
+        self._resolve_category_ids()
+        self._notify_indexes('reset')
+        self.history.clear()
+        self.loaded = True
+
+    def set_category_manager(self, category_manager: 'BookmarkCategoryManager'):
+        """关联分类管理器
+
+        关联后书签按分类ID引用分类，分类改名、删除时分类管理器会通过本管理器
+        只更新受影响的书签。
+        """
+        self.category_manager = category_manager
+        category_manager.bookmark_manager = self
+        self._resolve_category_ids()
+
+    def _rebuild_category_index(self):
+        """重建分类索引"""
+        self._category_index = {}
+        for item in self.bookmarks:
+            self._category_index.setdefault(item.category_key, {})[item.id] = item
+
+    def _index_add(self, item: BookmarkItem):
+        self._category_index.setdefault(item.category_key, {})[item.id] = item
+
+    def _index_remove(self, item: BookmarkItem, key: str = None):
+        key = item.category_key if key is None else key
+        bucket = self._category_index.get(key)
+        if bucket is not None:
+            bucket.pop(item.id, None)
+            if not bucket:
+                del self._category_index[key]
+
+    def _resolve_category(self, category: str) -> str:
+        """分类名称 -> 分类ID（未关联分类管理器或分类不存在时返回空）"""
+        if self.category_manager is None:
+            return ""
+        found = self.category_manager.get_category_by_name(category)
+        return found.id if found else ""
+
+    def _resolve_category_ids(self):
+        """补全缺少的分类ID，并按分类ID同步分类名称（兼容旧数据）"""
+        if self.category_manager is None or not self.bookmarks:
+            return
+        names = {category.id: category.name for category in self.category_manager.get_all_categories()}
+        ids = {name: category_id for category_id, name in names.items()}
+        changed = []
+        for key in list(self._category_index):
+            bucket = self._category_index[key]
+            first = next(iter(bucket.values()))
+            if first.category_id in names:
+                category_id, name = first.category_id, names[first.category_id]
+            elif first.category in ids:
+                category_id, name = ids[first.category], first.category
+            else:
+                continue
+            if key == category_id and first.category == name:
+                continue
+            for item in bucket.values():
+                if item.category_id != category_id or item.category != name:
+                    item.category_id = category_id
+                    item.category = name
+                    changed.append(item)
+        if changed:
+            self._rebuild_category_index()
+            self._notify_indexes('reset')
+            self._persist(changed=changed)
+            logger.info("已为 %d 个书签补全分类引用", len(changed))
+
+    def _category_key_by_name(self, category: str) -> Optional[str]:
+        category_id = self._resolve_category(category)
+        if category_id:
+            return category_id
+        for key, bucket in self._category_index.items():
+            if next(iter(bucket.values())).category == category:
+                return key
+        return None
+
+    def _stored_items(self) -> List[BookmarkItem]:
+        """需要保存的全部条目（包括回收站中的条目）"""
+        return list(self.bookmarks) + self.trash.items()
+
+    def _stored_dict(self, item_id: str) -> Optional[Dict]:
+        """按ID取需要保存的条目（包括回收站中的条目）"""
+        item = self.bookmarks.get(item_id) or self.trash.get(item_id)
+        return item.to_dict() if item is not None else None
+
+    def save_data(self):
+        """整体保存数据"""
+        with self._storage_lock:
+            if self.use_sqlite:
+                try:
+                    items = self._stored_items()
+                    if ensure_unique_ids(items):
+                        logger.warning("发现重复的条目ID，已重新分配")
+                    self.store.replace_all([item.to_dict() for item in items])
+                    logger.info("已保存 %d 个书签条目到数据库", len(items))
+                except Exception as e:
+                    logger.exception("保存书签数据失败: %s", e)
+                    raise Exception(f"保存书签数据失败: {e}")
+            elif self.use_shards:
+                try:
+                    items = self._stored_items()
+                    self.shards.replace_all([item.to_dict() for item in items])
+                    logger.info("已分片保存 %d 个书签条目", len(items))
+                except Exception as e:
+                    logger.exception("保存书签数据失败: %s", e)
+                    raise Exception(f"保存书签数据失败: {e}")
+            else:
+                self._save_to_file()
+
+    def reencrypt(self, new_key: str, old_key: str):
+        """改用新密钥重新加密全部数据（旧版数据迁移使用，须已加载数据）
+
+        各文件按新密钥或原密钥读取，已是新密钥加密的不再重写，迁移中断后可以重新执行。
+        """
+        with self._storage_lock:
+            # 加密文件（SQLite 或分片存储时为导入前的原数据）、智能文件夹和使用记录
+            self.secure_manager.reencrypt_file(new_key, old_key)
+            self.smart_folders.reencrypt(new_key, old_key)
+            self.usage.reencrypt(new_key, old_key)
+            self.set_encryption_key(new_key)
+            if self.use_sqlite or self.use_shards:
+                self.save_data()
+            if self.use_sqlite:
+                self.store.compact()
+
+    def _load_from_store(self):
+        """从数据库加载数据，首次使用时从原有文件导入"""
+        if not self.store.is_initialized():
+            self._load_from_file()
+            self.save_data()
+            logger.info("已将 %d 个书签条目导入数据库", len(self.bookmarks))
+            return
+        try:
+            self.bookmarks = [BookmarkItem.from_dict(data) for data in self.store.load_all()]
+            logger.info("从数据库加载了 %d 个书签条目", len(self.bookmarks))
+        except Exception as decrypt_error:
+            logger.warning("解密失败，可能是访问密码错误: %s", decrypt_error)
+            raise Exception("访问密码错误，无法解密数据！请确认输入的访问密码是否正确。")
+
+    def _load_from_shards(self):
+        """从分片文件加载数据，首次使用时从原有文件导入"""
+        if not self.shards.exists():
+            self._load_from_file()
+            self.save_data()
+            logger.info("已将 %d 个书签条目导入分片存储", len(self.bookmarks))
+            return
+        try:
+            self.bookmarks = [BookmarkItem.from_dict(data) for data in self.shards.load_all()]
+        except Exception as decrypt_error:
+            logger.warning("解密失败，可能是访问密码错误: %s", decrypt_error)
+            raise Exception("访问密码错误，无法解密数据！请确认输入的访问密码是否正确。")
+        # 分片之间没有全局顺序，由排序键恢复；没有排序键的旧数据按创建时间新条目在前
+        self.bookmarks.sort(key=lambda item: (item.created_time, item.id), reverse=True)
+
+    def _persist(self, changed: List[BookmarkItem] = (), deleted: List[str] = ()):
+        """持久化修改：SQLite 后端只在一个事务内写入变化的行，分片存储只重写受影响的分片，文件后端整体保存"""
+        with self._storage_lock:
+            if self.use_shards:
+                try:
+                    self.shards.write([item.to_dict() for item in changed], deleted, self._stored_dict)
+                except Exception as e:
+                    logger.exception("保存书签数据失败: %s", e)
+                    raise Exception(f"保存书签数据失败: {e}")
+                return
+            if not self.use_sqlite:
+                self._save_to_file()
+                return
+            try:
+                self.store.write([item.to_dict() for item in changed], deleted)
+            except Exception as e:
+                logger.exception("保存书签数据失败: %s", e)
+                raise Exception(f"保存书签数据失败: {e}")
+
+    def _write_trash(self, changed: List[BookmarkItem], deleted: List[str]):
+        """写入回收站的删除标记并彻底清除条目（在后台线程调用，与密码管理器相同，由 _storage_lock 保证互斥）"""
+        with self._storage_lock:
+            self._persist(changed=changed, deleted=deleted)
+            for item_id in deleted:
+                self.usage.forget(item_id)
+
+    def _load_from_file(self):
         """从文件加载数据"""
         try:
             if self.use_encryption and os.path.exists(self.encrypted_file):
@@ -272,10 +977,10 @@ class BookmarkManager:
                 try:
                     data = self.secure_manager.load_encrypted_data()
                     self.bookmarks = [BookmarkItem.from_dict(item) for item in data]
-                    print(f"从加密文件加载了 {len(self.bookmarks)} 个书签条目")
+                    logger.info("从加密文件加载了 %d 个书签条目", len(self.bookmarks))
                 except Exception as decrypt_error:
                     # 解密失败，可能是密码错误
-                    print(f"解密失败，可能是访问密码错误: {decrypt_error}")
+                    logger.warning("解密失败，可能是访问密码错误: %s", decrypt_error)
                     raise Exception("访问密码错误，无法解密数据！请确认输入的访问密码是否正确。")
             elif os.path.exists(self.data_file):
                 # 加载明文数据
@@ -285,129 +990,325 @@ class BookmarkManager:
 
                 # 如果启用了加密，自动迁移到加密存储
                 if self.use_encryption and data:
-                    print(f"检测到明文数据，自动迁移到加密存储...")
+                    logger.info("检测到明文数据，自动迁移到加密存储")
                     self.secure_manager.migrate_to_encrypted(data)
-                    print("数据迁移完成")
+                    logger.info("数据迁移完成")
 
-                print(f"从明文文件加载了 {len(self.bookmarks)} 个书签条目")
+                logger.info("从明文文件加载了 %d 个书签条目", len(self.bookmarks))
             else:
                 self.bookmarks = []
-                print("未找到书签数据文件")
+                logger.info("未找到书签数据文件")
         except Exception as e:
             if "访问密码错误" in str(e):
                 # 重新抛出密码错误，不要设置为空列表
                 raise e
             else:
-                print(f"加载书签数据失败: {e}")
+                logger.error("加载书签数据失败: %s", e)
                 self.bookmarks = []
 
-    def save_data(self):
+    def _save_to_file(self):
         """保存数据到文件"""
         try:
-            print(f"开始保存书签数据，共 {len(self.bookmarks)} 个条目")
-            data = [bookmark.to_dict() for bookmark in self.bookmarks]
+            data = [bookmark.to_dict() for bookmark in self._stored_items()]
+            logger.debug("开始保存书签数据，共 %d 个条目", len(data))
 
             if self.use_encryption:
                 # 保存为加密数据
-                print("使用加密模式保存数据...")
                 self.secure_manager.save_encrypted_data(data)
-                print(f"已加密保存 {len(self.bookmarks)} 个书签条目")
+                logger.info("已加密保存 %d 个书签条目", len(data))
             else:
                 # 保存为明文数据
-                print("使用明文模式保存数据...")
                 # 确保config目录存在
                 os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
 
                 with open(self.data_file, 'w', encoding='utf-8') as f:
                     json.dump(data, f, ensure_ascii=False, indent=2)
-                print(f"已明文保存 {len(self.bookmarks)} 个书签条目")
-            print("书签数据保存完成")
+                logger.info("已明文保存 %d 个书签条目", len(data))
         except Exception as e:
-            print(f"保存书签数据失败: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("保存书签数据失败: %s", e)
             raise Exception(f"保存书签数据失败: {e}")
 
-    def add_bookmark(self, title: str, url: str, description: str, category: str = "默认分类") -> BookmarkItem:
+    def add_bookmark(self, title: str, url: str, description: str, category: str = "默认分类",
+                     tags: List[str] = None) -> BookmarkItem:
         """添加新书签"""
-        item = BookmarkItem(title, description, url, category)
-        self.bookmarks.insert(0,item)
-        self.save_data()
+        item = BookmarkItem(title, description, url, category, category_id=self._resolve_category(category), tags=tags)
+        self.bookmarks.prepend(item)
+        self._index_add(item)
+        self._notify_indexes('added', item)
+        self._persist(changed=[item])
+        self.history.push(AddItems([item], "添加书签"))
         return item
 
-    def update_bookmark(self, item_id: str, title: str = None, url: str = None, description: str = None, category: str = None) -> bool:
+    def update_bookmark(self, item_id: str, title: str = None, url: str = None, description: str = None, category: str = None,
+                        tags: List[str] = None) -> bool:
         """更新书签"""
-        for item in self.bookmarks:
-            if item.id == item_id:
-                item.update(title, url, description, category)
-                self.save_data()
-                return True
-        return False
+        item = self.bookmarks.get(item_id)
+        if item is None:
+            return False
+        before = field_values(item, BOOKMARK_HISTORY_FIELDS)
+        old_key = item.category_key
+        category_id = self._resolve_category(category) if category is not None else None
+        item.update(title, url, description, category, category_id, tags)
+        if item.category_key != old_key:
+            self._index_remove(item, old_key)
+            self._index_add(item)
+        self._notify_indexes('updated', item)
+        self._persist(changed=[item])
+        self.history.push(UpdateItem(item.id, before, field_values(item, BOOKMARK_HISTORY_FIELDS), "修改书签"))
+        return True
 
     def delete_bookmark(self, item_id: str) -> bool:
-        """删除书签"""
-        for i, item in enumerate(self.bookmarks):
-            if item.id == item_id:
-                del self.bookmarks[i]
-                self.save_data()
-                return True
-        return False
+        """删除书签（可撤销）"""
+        return self.delete_bookmarks([item_id]) == 1
+
+    def delete_bookmarks(self, item_ids: List[str]) -> int:
+        """批量删除书签，作为一步撤销，返回删除的条数"""
+        items = self.remove_items(item_ids)
+        if items:
+            self.history.push(RemoveItems(items, "删除书签"))
+        return len(items)
+
+    def move_bookmark(self, item_id: str, target_id: str, after: bool = False) -> bool:
+        """手动排序：把书签移动到 target_id 之前（after 为 True 时为之后），只保存被移动的书签"""
+        item = self.bookmarks.get(item_id)
+        before = item.order if item is not None else None
+        item = self.bookmarks.move(item_id, target_id, after)
+        if item is None:
+            return False
+        self._notify_indexes('updated', item)
+        self._persist(changed=[item])
+        self.history.push(MoveItem(item.id, before, item.order, "调整顺序"))
+        return True
+
+    def remove_items(self, item_ids: List[str], permanent: bool = False) -> List[BookmarkItem]:
+        """移除条目，返回移除的条目（删除和撤销/重做使用）
+
+        默认移入回收站，删除标记稍后在后台批量写入；permanent 为 True 时立即彻底删除。
+        """
+        items = []
+        for item_id in item_ids:
+            item = self.bookmarks.remove(item_id)
+            if item is not None:
+                self._index_remove(item)
+                self._notify_indexes('removed', item_id)
+                items.append(item)
+        if not items:
+            return items
+        if not permanent:
+            self.trash.put(items)
+            return items
+        for item in items:
+            self.usage.forget(item.id)
+        self._persist(deleted=[item.id for item in items])
+        return items
+
+    def restore_items(self, items: List[BookmarkItem]):
+        """放回移除的条目（保留原ID和排序键），只保存这些条目（撤销/重做和从回收站恢复使用）
+
+        所属分类已被删除的书签放回默认分类。
+        """
+        self.trash.take([item.id for item in items])
+        items = [item for item in items if self.bookmarks.get(item.id) is None]
+        for item in items:
+            if item.category_id and self.category_manager is not None \
+                    and self.category_manager.get_category_by_id(item.category_id) is None:
+                item.category = "默认分类"
+                item.category_id = self._resolve_category(item.category)
+            self.bookmarks.restore(item)
+            self._index_add(item)
+            self._notify_indexes('added', item)
+        if items:
+            self._persist(changed=items)
+
+    def set_fields(self, item_id: str, values: Dict) -> bool:
+        """把条目的字段设为给定值并只保存该条目（撤销/重做使用）"""
+        item = self.bookmarks.get(item_id)
+        if item is None:
+            return False
+        old_key = item.category_key
+        for field, value in values.items():
+            setattr(item, field, copy.copy(value))
+        if item.category_key != old_key:
+            self._index_remove(item, old_key)
+            self._index_add(item)
+        self._notify_indexes('updated', item)
+        self._persist(changed=[item])
+        return True
+
+    def set_order(self, item_id: str, order: str) -> bool:
+        """把条目的排序键设为给定值并只保存该条目（撤销/重做使用）"""
+        item = self.bookmarks.remove(item_id)
+        if item is None:
+            return False
+        item.order = order
+        self.bookmarks.restore(item)
+        self._notify_indexes('updated', item)
+        self._persist(changed=[item])
+        return True
+
+    def trash_items(self) -> List[BookmarkItem]:
+        """回收站中的书签，最近删除的在前"""
+        return self.trash.items()
+
+    def restore_from_trash(self, item_ids: List[str]) -> int:
+        """从回收站恢复书签（回到原来的位置），返回恢复的条数"""
+        items = [item for item in map(self.trash.get, item_ids) if item is not None]
+        self.restore_items(items)
+        return len(items)
+
+    def purge_trash(self, item_ids: List[str]) -> int:
+        """彻底删除回收站中的书签（后台分批清除），返回条数"""
+        count = self.trash.discard(item_ids)
+        if count:
+            # 已彻底删除的条目不能再撤销
+            self.history.clear()
+        return count
+
+    def empty_trash(self) -> int:
+        """清空回收站，返回彻底删除的条数"""
+        return self.purge_trash([item.id for item in self.trash.items()])
+
+    def record_use(self, item_id: str):
+        """记录一次使用（打开书签），稍后批量写入使用记录文件"""
+        self.usage.record(item_id)
+
+    def rename_category(self, category_id: str, name: str) -> int:
+        """分类改名：只更新该分类下书签的冗余名称，返回更新的书签数"""
+        self.history.clear()
+        bucket = self._category_index.get(category_id, {})
+        items = [item for item in bucket.values() if item.category != name]
+        for item in items:
+            item.category = name
+            self._notify_indexes('updated', item)
+        if items:
+            self._persist(changed=items)
+        return len(items)
+
+    def reassign_category(self, category_id: str, target_id: str, target_name: str) -> int:
+        """把某分类下的书签移动到另一个分类，返回移动的书签数"""
+        self.history.clear()
+        bucket = self._category_index.pop(category_id, {})
+        items = list(bucket.values())
+        for item in items:
+            item.category_id = target_id
+            item.category = target_name
+            self._index_add(item)
+            self._notify_indexes('updated', item)
+        if items:
+            self._persist(changed=items)
+        return len(items)
 
-    def search_bookmarks(self, query: str) -> List[BookmarkItem]:
-        """搜索书签"""
+    def delete_bookmarks_in_category(self, category_id: str) -> int:
+        """把某分类下的全部书签移入回收站，返回删除的书签数（恢复时放回默认分类）"""
+        self.history.clear()
+        return len(self.remove_items(list(self._category_index.get(category_id, {}))))
+
+    def category_counts(self) -> Dict[str, int]:
+        """各分类的书签数（分类键 -> 数量）"""
+        return {key: len(bucket) for key, bucket in self._category_index.items()}
+
+    def search_bookmarks(self, query: str, pinyin: bool = True) -> List[BookmarkItem]:
+        """搜索书签（pinyin 为 True 时可用全拼或首字母匹配中文，如 gzxx -> 工作学习）"""
         if not query:
-            return self.bookmarks
+            return list(self.bookmarks)
 
-        query = query.lower()
-        results = []
-        for item in self.bookmarks:
-            if (query in item.title.lower() or 
-                query in item.url.lower() or
-                query in item.description.lower() or
-                query in item.category.lower()):
-                results.append(item)
-        return results
+        prefilter = None
+        if self.use_sqlite and len(query) > 1 and \
+                not (pinyin and PinyinUtils.available() and PinyinUtils.is_pinyin_query(query)):
+            # 先用盲索引缩小范围，再对明文确认（盲索引不含拼音和单字，拼音查询和单字查询不经过这一步）
+            prefilter = lambda: self.store.search_ids(query.lower())
+        return self.search_index.search(query, pinyin, prefilter)
+
+    def rank_bookmarks(self, query: str, filter: Callable = None, limit: int = 50, filter_key=None) -> QueryPage:
+        """按相关度搜索书签，允许少量输入错误，返回最相关的 limit 条（total 为命中总数）
+
+        filter_key 为 filter 的可比较标识（如 ("source", "微信")），给出时结果会被缓存。
+        """
+        return self.search_index.rank(query, filter, limit, filter_key=filter_key)
+
+    def facet_counts(self, facet: str = 'category') -> Dict[str, int]:
+        """各分类（category）或各域名（domain）的书签数（随增删改增量维护）"""
+        return self.facets.counts(facet)
+
+    def tag_counts(self) -> Dict[str, int]:
+        """各标签的书签数"""
+        return self.tags.counts()
+
+    def filter_by_tags(self, all_of: List = (), none_of: List[str] = ()) -> List[BookmarkItem]:
+        """按标签筛选书签（all_of 的每项为一个标签或一组任一包含的标签），保持默认顺序"""
+        ids = self.tags.select(all_of, none_of)
+        return [item for item in self.bookmarks if item.id in ids]
+
+    def plan_query(self, text: str) -> QueryPlan:
+        """把搜索框内容编译为执行计划（语法见 model.query_language），语法错误时抛出 ValueError"""
+        return QueryPlan(parse_query(text, BOOKMARK_QUERY_FIELDS), BOOKMARK_QUERY_FIELDS, self._term_ids,
+                         lambda: self.bookmarks, self.views.items_by_id, self.tags.select)
+
+    def _term_ids(self, term: Term) -> Optional[set]:
+        """用索引查找满足条件的条目ID，没有对应索引时返回 None"""
+        if term.field == 'id':
+            return {term.value} if term.value in self.views.items_by_id() else set()
+        if term.field == 'category':
+            name = term.value.lower()
+            ids = set()
+            for bucket in self._category_index.values():
+                if next(iter(bucket.values())).category.lower() == name:
+                    ids.update(bucket)
+            return ids
+        if term.field in TIME_FIELDS:
+            return set(self.views.range_ids(TIME_FIELDS[term.field], *time_bounds(term.op, term.value)))
+        return None
+
+    def query(self, filter=None, sort: str = None, cursor: str = None, limit: Optional[int] = 50) -> QueryPage:
+        """分页查询书签
+
+        filter 为搜索关键词或判断函数；sort 为 title / created_time / updated_time，
+        前缀 "-" 表示降序，None 为默认顺序（常用的在前）；cursor 为上一页返回的 next_cursor。
+        """
+        return self.views.query(make_predicate(filter, self.search_bookmarks), sort, cursor, limit)
 
     def get_all_bookmarks(self) -> List[BookmarkItem]:
         """获取所有书签"""
-        return self.bookmarks
+        return list(self.bookmarks)
 
     def get_bookmark_by_id(self, item_id: str) -> Optional[BookmarkItem]:
         """根据ID获取书签"""
-        for item in self.bookmarks:
-            if item.id == item_id:
-                return item
-        return None
+        return self.bookmarks.get(item_id)
+
+    @staticmethod
+    def _ordered(bucket: Dict[str, BookmarkItem]) -> List[BookmarkItem]:
+        """分类内的书签，按手动排序键排列"""
+        return sorted(bucket.values(), key=SORT_KEY_FUNCS['order'])
 
     def get_bookmarks_by_category(self, category: str) -> List[BookmarkItem]:
-        """根据分类获取书签"""
-        return [item for item in self.bookmarks if item.category == category]
+        """根据分类名称获取书签"""
+        key = self._category_key_by_name(category)
+        return self._ordered(self._category_index.get(key, {})) if key is not None else []
+
+    def get_bookmarks_by_category_id(self, category_id: str) -> List[BookmarkItem]:
+        """根据分类ID获取书签"""
+        return self._ordered(self._category_index.get(category_id, {}))
 
     def get_all_categories(self) -> List[str]:
         """获取所有分类"""
-        categories = set()
-        for item in self.bookmarks:
-            categories.add(item.category)
-        return sorted(list(categories))
+        return sorted(next(iter(bucket.values())).category for bucket in self._category_index.values())
 
     def get_bookmarks_grouped_by_category(self) -> Dict[str, List[BookmarkItem]]:
         """获取按分类分组的书签"""
-        grouped = {}
-        for item in self.bookmarks:
-            if item.category not in grouped:
-                grouped[item.category] = []
-            grouped[item.category].append(item)
-        return grouped
+        return {next(iter(bucket.values())).category: self._ordered(bucket)
+                for bucket in self._category_index.values()}
 
 
 class BookmarkCategory:
     """书签分类数据模型"""
     
     def __init__(self, name: str = "", description: str = "", color: str = "#007acc", item_id: str = None):
-        self.id = item_id or str(int(datetime.now().timestamp() * 1000))
+        self.id = item_id or new_item_id()
         self.name = name
         self.description = description
         self.color = color
+        # 手动排序键（见 model.ordering），由管理器分配
+        self.order = ""
         self.created_time = datetime.now().isoformat()
         self.updated_time = datetime.now().isoformat()
     
@@ -418,6 +1319,7 @@ class BookmarkCategory:
             'name': self.name,
             'description': self.description,
             'color': self.color,
+            'order': self.order,
             'created_time': self.created_time,
             'updated_time': self.updated_time
         }
@@ -431,6 +1333,7 @@ class BookmarkCategory:
             color=data.get('color', '#007acc'),
             item_id=data.get('id')
         )
+        item.order = data.get('order', '')
         item.created_time = data.get('created_time', item.created_time)
         item.updated_time = data.get('updated_time', item.updated_time)
         return item
@@ -452,10 +1355,21 @@ class BookmarkCategoryManager:
     def __init__(self, data_file: str = "config/bookmark_categories.json", encrypted_file: str = "config/bookmark_categories.enc"):
         self.data_file = data_file
         self.encrypted_file = encrypted_file
-        self.categories: List[BookmarkCategory] = []
+        # 全部分类，按手动排序键排列（新分类在最前面）
+        self.categories = OrderedItems()
         self.secure_manager = SecurePasswordManager(data_file, encrypted_file)
+        self.secure_manager.set_compression(StorageSettings.compression_for(encrypted_file))
         self.encryption_key = None
         self.use_encryption = False
+        # 是否已加载过数据（共享实例据此判断是否需要加载）
+        self.loaded = False
+        # 关联的书签管理器（由 BookmarkManager.set_category_manager 设置），改名和删除时级联更新书签
+        self.bookmark_manager = None
+        # 搜索索引（全局搜索按名称和描述查找分类）
+        self.search_index = SearchIndex(lambda: self.categories, CATEGORY_SEARCH_WEIGHTS)
+        # 可选的 SQLite 后端
+        self.store = SqliteItemStore("bookmark_categories", ('name', 'description')) \
+            if StorageSettings.use_sqlite() else None
         
         # 初始化默认分类
         self.init_default_categories()
@@ -483,8 +1397,77 @@ class BookmarkCategoryManager:
         self.encryption_key = key
         self.secure_manager.set_encryption_key(key, use_simple_key=True)
         self.use_encryption = True
+        if self.store is not None:
+            self.store.set_encryption_key(key)
+
+    @property
+    def use_sqlite(self) -> bool:
+        """是否使用 SQLite 后端（需要加密密钥）"""
+        return self.store is not None and self.use_encryption
 
     def load_data(self):
+        """加载数据"""
+        if self.use_sqlite:
+            self._load_from_store()
+        else:
+            self._load_from_file()
+        self.categories = OrderedItems(self.categories)
+        if self.categories.rekeyed:
+            # 旧数据没有排序键，保存一次分配的排序键
+            self._persist(changed=self.categories.rekeyed)
+        self.search_index.reset()
+        self.loaded = True
+
+    def save_data(self):
+        """整体保存数据"""
+        if self.use_sqlite:
+            try:
+                if ensure_unique_ids(self.categories):
+                    logger.warning("发现重复的条目ID，已重新分配")
+                self.store.replace_all([item.to_dict() for item in self.categories])
+                logger.info("已保存 %d 个分类到数据库", len(self.categories))
+            except Exception as e:
+                logger.exception("保存分类数据失败: %s", e)
+        else:
+            self._save_to_file()
+
+    def reencrypt(self, new_key: str, old_key: str):
+        """改用新密钥重新加密全部数据（旧版数据迁移使用，须已加载数据）
+
+        各文件按新密钥或原密钥读取，已是新密钥加密的不再重写，迁移中断后可以重新执行。
+        """
+        # 加密文件（SQLite 后端时为导入前的原数据）
+        self.secure_manager.reencrypt_file(new_key, old_key)
+        self.set_encryption_key(new_key)
+        if self.use_sqlite:
+            self.store.replace_all([item.to_dict() for item in self.categories])
+            self.store.compact()
+
+    def _load_from_store(self):
+        """从数据库加载数据，首次使用时从原有文件导入"""
+        if not self.store.is_initialized():
+            self._load_from_file()
+            self.save_data()
+            logger.info("已将 %d 个分类导入数据库", len(self.categories))
+            return
+        try:
+            self.categories = [BookmarkCategory.from_dict(data) for data in self.store.load_all()]
+            logger.info("从数据库加载了 %d 个分类", len(self.categories))
+        except Exception as decrypt_error:
+            logger.warning("解密失败，可能是访问密码错误: %s", decrypt_error)
+            raise Exception("访问密码错误，无法解密数据！请确认输入的访问密码是否正确。")
+
+    def _persist(self, changed: List[BookmarkCategory] = (), deleted: List[str] = ()):
+        """持久化修改：SQLite 后端只在一个事务内写入变化的行，文件后端整体保存"""
+        if not self.use_sqlite:
+            self._save_to_file()
+            return
+        try:
+            self.store.write([item.to_dict() for item in changed], deleted)
+        except Exception as e:
+            logger.exception("保存分类数据失败: %s", e)
+
+    def _load_from_file(self):
         """从文件加载数据"""
         try:
             if self.use_encryption and os.path.exists(self.encrypted_file):
@@ -492,9 +1475,9 @@ class BookmarkCategoryManager:
                 try:
                     data = self.secure_manager.load_encrypted_data()
                     self.categories = [BookmarkCategory.from_dict(item) for item in data]
-                    print(f"从加密文件加载了 {len(self.categories)} 个分类")
+                    logger.info("从加密文件加载了 %d 个分类", len(self.categories))
                 except Exception as decrypt_error:
-                    print(f"解密失败，可能是访问密码错误: {decrypt_error}")
+                    logger.warning("解密失败，可能是访问密码错误: %s", decrypt_error)
                     raise Exception("访问密码错误，无法解密数据！请确认输入的访问密码是否正确。")
             elif os.path.exists(self.data_file):
                 # 加载明文数据
@@ -504,24 +1487,24 @@ class BookmarkCategoryManager:
 
                 # 如果启用了加密，自动迁移到加密存储
                 if self.use_encryption and data:
-                    print(f"检测到明文数据，自动迁移到加密存储...")
+                    logger.info("检测到明文数据，自动迁移到加密存储")
                     self.secure_manager.migrate_to_encrypted(data)
-                    print("数据迁移完成")
+                    logger.info("数据迁移完成")
 
-                print(f"从明文文件加载了 {len(self.categories)} 个分类")
+                logger.info("从明文文件加载了 %d 个分类", len(self.categories))
             else:
                 # 如果没有数据文件，保存默认分类
                 self.save_data()
-                print("创建了默认分类")
+                logger.info("创建了默认分类")
         except Exception as e:
             if "访问密码错误" in str(e):
                 raise e
             else:
-                print(f"加载分类数据失败: {e}")
+                logger.error("加载分类数据失败: %s", e)
                 # 保持默认分类
                 self.init_default_categories()
 
-    def save_data(self):
+    def _save_to_file(self):
         """保存数据到文件"""
         try:
             data = [category.to_dict() for category in self.categories]
@@ -529,15 +1512,15 @@ class BookmarkCategoryManager:
             if self.use_encryption:
                 # 保存为加密数据
                 self.secure_manager.save_encrypted_data(data)
-                print(f"已加密保存 {len(self.categories)} 个分类")
+                logger.info("已加密保存 %d 个分类", len(self.categories))
             else:
                 # 保存为明文数据
                 os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
                 with open(self.data_file, 'w', encoding='utf-8') as f:
                     json.dump(data, f, ensure_ascii=False, indent=2)
-                print(f"已明文保存 {len(self.categories)} 个分类")
+                logger.info("已明文保存 %d 个分类", len(self.categories))
         except Exception as e:
-            print(f"保存分类数据失败: {e}")
+            logger.exception("保存分类数据失败: %s", e)
 
     def add_category(self, name: str, description: str = "", color: str = "#007acc") -> BookmarkCategory:
         """添加新分类"""
@@ -547,8 +1530,9 @@ class BookmarkCategoryManager:
                 raise ValueError(f"分类 '{name}' 已存在")
         
         item = BookmarkCategory(name, description, color)
-        self.categories.insert(0,item)
-        self.save_data()
+        self.categories.prepend(item)
+        self.search_index.added(item)
+        self._persist(changed=[item])
         return item
 
     def update_category(self, item_id: str, name: str = None, description: str = None, color: str = None) -> bool:
@@ -559,45 +1543,50 @@ class BookmarkCategoryManager:
                 if category.id != item_id and category.name == name:
                     raise ValueError(f"分类 '{name}' 已存在")
         
-        for item in self.categories:
-            if item.id == item_id:
-                item.update(name, description, color)
-                self.save_data()
-                return True
-        return False
+        item = self.categories.get(item_id)
+        if item is None:
+            return False
+        renamed = name is not None and name != item.name
+        item.update(name, description, color)
+        self.search_index.updated(item)
+        self._persist(changed=[item])
+        if renamed and self.bookmark_manager is not None:
+            self.bookmark_manager.rename_category(item_id, name)
+        return True
+
+    def delete_category(self, item_id: str, delete_bookmarks: bool = False) -> bool:
+        """删除分类
 
-    def delete_category(self, item_id: str) -> bool:
-        """删除分类"""
+        关联了书签管理器时，该分类下的书签默认移动到默认分类，
+        delete_bookmarks 为 True 时一并删除。
+        """
         # 不允许删除默认分类
-        category_to_delete = None
-        for item in self.categories:
-            if item.id == item_id:
-                if item.name == "默认分类":
-                    raise ValueError("不能删除默认分类")
-                category_to_delete = item
-                break
-        
+        category_to_delete = self.categories.get(item_id)
         if not category_to_delete:
             return False
+        if category_to_delete.name == "默认分类":
+            raise ValueError("不能删除默认分类")
         
         # 删除分类
-        for i, item in enumerate(self.categories):
-            if item.id == item_id:
-                del self.categories[i]
-                self.save_data()
-                return True
-        return False
+        self.categories.remove(item_id)
+        self.search_index.removed(item_id)
+        self._persist(deleted=[item_id])
+        if self.bookmark_manager is not None:
+            if delete_bookmarks:
+                self.bookmark_manager.delete_bookmarks_in_category(item_id)
+            else:
+                default = self.get_category_by_name("默认分类")
+                self.bookmark_manager.reassign_category(
+                    item_id, default.id if default else "", "默认分类")
+        return True
 
     def get_all_categories(self) -> List[BookmarkCategory]:
         """获取所有分类"""
-        return self.categories
+        return list(self.categories)
 
     def get_category_by_id(self, item_id: str) -> Optional[BookmarkCategory]:
         """根据ID获取分类"""
-        for item in self.categories:
-            if item.id == item_id:
-                return item
-        return None
+        return self.categories.get(item_id)
 
     def get_category_by_name(self, name: str) -> Optional[BookmarkCategory]:
         """根据名称获取分类"""
@@ -609,3 +1598,7 @@ class BookmarkCategoryManager:
     def get_category_names(self) -> List[str]:
         """获取所有分类名称"""
         return [category.name for category in self.categories]
+
+    def rank_categories(self, query: str, limit: int = 50) -> QueryPage:
+        """按相关度搜索分类（名称和描述，支持拼音和少量输入错误）"""
+        return self.search_index.rank(query, limit=limit)
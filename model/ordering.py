@@ -0,0 +1,317 @@
+"""手动排序
+
+每个条目保存一个排序键（order 字段），排序键是可以直接按字符串比较的分数索引：
+在两个条目之间插入或拖动条目时，只为该条目生成一个介于前后两个键之间的新键，
+其他条目的键不变，保存时只需写入被移动的条目。
+
+排序键由整数部分和小数部分组成（62 进制，字符顺序与 ASCII 一致）。
+新条目排在最前面时只把第一个键的整数部分减一，键长随条目数按对数增长；
+反复插入到同一位置时才会加长小数部分。
+
+OrderedItems 按排序键维护条目顺序（分块有序列表），插入、删除和移动只改动一个小块，
+按ID查找为字典查找。
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+# 第一个排序键
+INTEGER_ZERO = "a0"
+# 最小的整数部分，不能作为排序键使用（其前面无法再插入）
+SMALLEST_INTEGER = "A" + "0" * 26
+# 分块有序列表每块的目标长度，超过两倍时拆分
+BLOCK_SIZE = 256
+
+
+def _integer_length(head: str) -> int:
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    if "A" <= head <= "Z":
+        return ord("Z") - ord(head) + 2
+    raise ValueError(f"无效的排序键: {head}")
+
+
+def _integer_part(key: str) -> str:
+    length = _integer_length(key[0])
+    if length > len(key):
+        raise ValueError(f"无效的排序键: {key}")
+    return key[:length]
+
+
+def validate_key(key: str):
+    """检查排序键格式，无效时抛出 ValueError"""
+    if not key or key == SMALLEST_INTEGER:
+        raise ValueError(f"无效的排序键: {key}")
+    integer = _integer_part(key)
+    if any(digit not in DIGITS for digit in key[1:]) or key[len(integer):].endswith("0"):
+        raise ValueError(f"无效的排序键: {key}")
+
+
+def _increment_integer(integer: str) -> Optional[str]:
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        value = DIGITS.index(digits[i]) + 1
+        if value < len(DIGITS):
+            digits[i] = DIGITS[value]
+            return head + "".join(digits)
+        digits[i] = DIGITS[0]
+    # 进位到整数部分的长度
+    if head == "Z":
+        return "a" + DIGITS[0]
+    if head == "z":
+        return None
+    head = chr(ord(head) + 1)
+    if head > "a":
+        digits.append(DIGITS[0])
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def _decrement_integer(integer: str) -> Optional[str]:
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        value = DIGITS.index(digits[i]) - 1
+        if value >= 0:
+            digits[i] = DIGITS[value]
+            return head + "".join(digits)
+        digits[i] = DIGITS[-1]
+    # 借位到整数部分的长度
+    if head == "a":
+        return "Z" + DIGITS[-1]
+    if head == "A":
+        return None
+    head = chr(ord(head) - 1)
+    if head < "Z":
+        digits.append(DIGITS[-1])
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """两个小数部分之间的小数部分（high 为 None 表示 1）"""
+    if high is not None:
+        # 跳过公共前缀（low 不足的位按 0 计）
+        n = 0
+        while (low[n] if n < len(low) else DIGITS[0]) == high[n]:
+            n += 1
+        if n > 0:
+            return high[:n] + _midpoint(low[n:], high[n:])
+    digit_low = DIGITS.index(low[0]) if low else 0
+    digit_high = DIGITS.index(high[0]) if high is not None else len(DIGITS)
+    if digit_high - digit_low > 1:
+        return DIGITS[(digit_low + digit_high + 1) // 2]
+    if high is not None and len(high) > 1:
+        return high[:1]
+    return DIGITS[digit_low] + _midpoint(low[1:], None)
+
+
+def key_between(low: Optional[str], high: Optional[str]) -> str:
+    """生成介于 low 和 high 之间的排序键，None 表示不限（最前或最后）"""
+    if low is not None:
+        validate_key(low)
+    if high is not None:
+        validate_key(high)
+    if low is not None and high is not None and low >= high:
+        raise ValueError(f"排序键顺序错误: {low} >= {high}")
+    if low is None:
+        if high is None:
+            return INTEGER_ZERO
+        integer = _integer_part(high)
+        if integer == SMALLEST_INTEGER:
+            return integer + _midpoint("", high[len(integer):])
+        if integer < high:
+            return integer
+        result = _decrement_integer(integer)
+        if result is None:
+            raise ValueError("排序键已无法再减小")
+        return result
+    integer = _integer_part(low)
+    if high is None:
+        result = _increment_integer(integer)
+        return result if result is not None else integer + _midpoint(low[len(integer):], None)
+    if integer == _integer_part(high):
+        return integer + _midpoint(low[len(integer):], high[len(integer):])
+    result = _increment_integer(integer)
+    if result is None:
+        raise ValueError("排序键已无法再增大")
+    return result if result < high else integer + _midpoint(low[len(integer):], None)
+
+
+class OrderedItems:
+    """按排序键（item.order）排列的条目集合
+
+    可以像列表一样遍历和取长度；创建时排序键缺失或重复（旧数据）的条目
+    按给定顺序重新分配排序键，rekeyed 为这些条目，需要保存一次。
+    后台保存时会在其他线程遍历，修改和遍历都在锁内进行（遍历的是当时的快照）。
+    """
+
+    def __init__(self, items: Iterable = ()):
+        self._lock = threading.RLock()
+        self._blocks: List[List[str]] = []
+        # 每块最大的排序键，用于二分查找所在的块
+        self._maxes: List[str] = []
+        self._by_key: Dict[str, object] = {}
+        self._by_id: Dict[str, object] = {}
+        self.rekeyed: List = []
+        self.reset(items)
+
+    def reset(self, items: Iterable):
+        """用给定条目重建"""
+        with self._lock:
+            items = list(items)
+            keys = [item.order for item in items]
+            try:
+                for key in keys:
+                    validate_key(key)
+                valid = len(set(keys)) == len(keys)
+            except ValueError:
+                valid = False
+            if valid:
+                items.sort(key=lambda item: item.order)
+                self.rekeyed = []
+            else:
+                # 没有排序键的旧数据按原有顺序依次分配
+                key = None
+                for item in items:
+                    key = item.order = key_between(key, None)
+                self.rekeyed = items
+                if items:
+                    logger.info("已为 %d 个条目分配排序键", len(items))
+            self._by_key = {item.order: item for item in items}
+            self._by_id = {item.id: item for item in items}
+            self._blocks = [[item.order for item in items[i:i + BLOCK_SIZE]]
+                            for i in range(0, len(items), BLOCK_SIZE)]
+            self._maxes = [block[-1] for block in self._blocks]
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            by_key = self._by_key
+            items = [by_key[key] for block in self._blocks for key in block]
+        return iter(items)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def iter_after(self, key: Optional[str] = None) -> Iterator:
+        """按顺序遍历排序键大于 key 的条目（None 时从头开始），逐块取快照，不复制全部条目"""
+        while True:
+            with self._lock:
+                index = 0 if key is None else bisect_right(self._maxes, key)
+                if index >= len(self._blocks):
+                    return
+                block = self._blocks[index]
+                start = 0 if key is None else bisect_right(block, key)
+                items = [self._by_key[block_key] for block_key in block[start:]]
+                key = block[-1]
+            yield from items
+
+    def get(self, item_id: str):
+        """按ID查找条目，不存在时返回 None"""
+        return self._by_id.get(item_id)
+
+    def _locate(self, key: str) -> tuple:
+        index = bisect_left(self._maxes, key)
+        return index, bisect_left(self._blocks[index], key)
+
+    def _neighbor(self, key: str, step: int) -> Optional[str]:
+        """key 的前一个（step=-1）或后一个（step=1）排序键"""
+        index, position = self._locate(key)
+        position += step
+        if 0 <= position < len(self._blocks[index]):
+            return self._blocks[index][position]
+        index += step
+        if 0 <= index < len(self._blocks):
+            return self._blocks[index][-1 if step < 0 else 0]
+        return None
+
+    def _insert(self, item):
+        key = item.order
+        self._by_key[key] = item
+        self._by_id[item.id] = item
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            return
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            index -= 1
+            self._blocks[index].append(key)
+            self._maxes[index] = key
+        else:
+            insort(self._blocks[index], key)
+        block = self._blocks[index]
+        if len(block) > 2 * BLOCK_SIZE:
+            self._blocks[index:index + 1] = [block[:BLOCK_SIZE], block[BLOCK_SIZE:]]
+            self._maxes[index:index + 1] = [block[BLOCK_SIZE - 1], block[-1]]
+
+    def _discard(self, item):
+        index, position = self._locate(item.order)
+        block = self._blocks[index]
+        del block[position]
+        if block:
+            self._maxes[index] = block[-1]
+        else:
+            del self._blocks[index]
+            del self._maxes[index]
+        del self._by_key[item.order]
+        del self._by_id[item.id]
+
+    def prepend(self, item):
+        """添加到最前面"""
+        with self._lock:
+            item.order = key_between(None, self._blocks[0][0] if self._blocks else None)
+            self._insert(item)
+
+    def append(self, item):
+        """添加到最后面"""
+        with self._lock:
+            item.order = key_between(self._blocks[-1][-1] if self._blocks else None, None)
+            self._insert(item)
+
+    def restore(self, item):
+        """放回条目并保留原排序键（撤销删除时），排序键已被占用时紧跟在占用者之后"""
+        with self._lock:
+            try:
+                validate_key(item.order)
+            except ValueError:
+                self.prepend(item)
+                return
+            if item.order in self._by_key:
+                item.order = key_between(item.order, self._neighbor(item.order, 1))
+            self._insert(item)
+
+    def remove(self, item_id: str):
+        """移除条目，返回被移除的条目（不存在时返回 None）"""
+        with self._lock:
+            item = self._by_id.get(item_id)
+            if item is not None:
+                self._discard(item)
+            return item
+
+    def move(self, item_id: str, target_id: str, after: bool = False):
+        """把条目移动到 target_id 之前（after 为 True 时为之后），只修改该条目的排序键
+
+        返回被移动的条目，条目或目标不存在时返回 None。
+        """
+        with self._lock:
+            item = self._by_id.get(item_id)
+            target = self._by_id.get(target_id)
+            if item is None or target is None or item is target:
+                return None
+            self._discard(item)
+            if after:
+                low, high = target.order, self._neighbor(target.order, 1)
+            else:
+                low, high = self._neighbor(target.order, -1), target.order
+            item.order = key_between(low, high)
+            self._insert(item)
+            return item
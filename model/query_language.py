@@ -0,0 +1,264 @@
+"""搜索框查询语法
+
+支持的写法（空格分隔，可任意组合）：
+    微信                   关键词，按标题、来源、账号等搜索
+    source:微信            字段条件：来源、分类、域名、ID 为完全匹配（不区分大小写），其余字段为包含
+    title:"工作 邮箱"       值中有空格时加引号
+    updated:>2025-01-01    时间比较：> >= < <=；updated:2025-01 表示该月内
+    created:<30d           相对时间：30d 为30天前，12h 为12小时前
+    tag:工作,个人          标签：逗号分隔表示任一标签，多个 tag: 条件须同时满足
+    -category:娱乐休闲      以 - 开头表示排除，-测试 表示排除包含“测试”的条目
+字段名也可以用中文：标题 来源 账号 描述 网址 域名 分类 标签 创建 更新。
+不认识的字段名按普通关键词处理（如网址中的 "https:"）。
+
+查询只解析一次并编译为执行计划：有索引的条件（ID、来源、分类、时间）先用索引
+得到候选集合，从最小的集合开始求交集，其余条件只在候选上判断；
+标签条件（包括排除）合并为一次位图运算；所有条件都没有索引可用时才逐条扫描。
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+# 中文字段名
+FIELD_ALIASES = {
+    '标题': 'title', '来源': 'source', '账号': 'account', '描述': 'description',
+    '网址': 'url', '域名': 'domain', '分类': 'category', '标签': 'tag', '创建': 'created', '更新': 'updated',
+}
+
+# 完全匹配的字段，其余文本字段为包含匹配
+EXACT_FIELDS = {'id', 'source', 'category', 'domain'}
+
+# 时间字段 -> 条目属性
+TIME_FIELDS = {'created': 'created_time', 'updated': 'updated_time'}
+
+# 标签字段，值中逗号分隔的标签任一包含即可
+TAG_FIELD = 'tag'
+
+# 排除关键词时使用的字段名
+ANY_FIELD = ''
+
+_TERM = re.compile(
+    r'(?P<neg>-?)(?:(?P<field>[^\s:"\-][^\s:"]*):(?P<op>>=|<=|>|<|=)?)?'
+    r'(?:"(?P<quoted>[^"]*)"?|(?P<value>\S+))')
+_RELATIVE_TIME = re.compile(r'^(\d+)([dh])$')
+_TIME_VALUE = re.compile(r'^\d{4}[\d\-T:. ]*$')
+
+# 前缀匹配的上界（比任何以该前缀开头的时间字符串都大）
+_PREFIX_END = '\uffff'
+
+
+class Term(NamedTuple):
+    """一个查询条件"""
+    field: str
+    op: str
+    value: str
+    negate: bool
+
+    def __str__(self):
+        value = f'"{self.value}"' if ' ' in self.value else self.value
+        if self.field == ANY_FIELD:
+            return f"-{value}"
+        op = '' if self.op == ':' else self.op
+        return f"{'-' if self.negate else ''}{self.field}:{op}{value}"
+
+
+class ParsedQuery(NamedTuple):
+    """解析后的查询"""
+    terms: tuple
+    # 关键词部分（按普通搜索处理）
+    text: str
+
+    @property
+    def key(self) -> str:
+        """条件部分的规范形式，可用作缓存键"""
+        return " ".join(sorted(str(term) for term in self.terms))
+
+
+def is_relative_time(value: str) -> bool:
+    """是否为相对时间（如 30d、12h）"""
+    return bool(_RELATIVE_TIME.match(value))
+
+
+def time_bounds(op: str, value: str) -> tuple:
+    """时间条件对应的 (下界, 上界)，下界包含、上界不包含，None 表示不限
+
+    时间按 ISO 字符串比较，2025-01 这样的前缀表示整个月。
+    """
+    relative = _RELATIVE_TIME.match(value)
+    if relative:
+        amount, unit = int(relative.group(1)), relative.group(2)
+        delta = timedelta(days=amount) if unit == 'd' else timedelta(hours=amount)
+        value = (datetime.now() - delta).isoformat()
+    elif not _TIME_VALUE.match(value):
+        raise ValueError(f"无效的时间: {value}（应为 2025-01-01 或 30d 这样的格式）")
+    value = value.replace(' ', 'T')
+
+    if op in (':', '='):
+        return value, value + _PREFIX_END
+    if op == '>':
+        return value + _PREFIX_END, None
+    if op == '>=':
+        return value, None
+    if op == '<':
+        return None, value
+    return None, value + _PREFIX_END
+
+
+def tag_values(term: Term) -> List[str]:
+    """标签条件中的标签（小写）"""
+    return [tag.strip().casefold() for tag in term.value.split(',') if tag.strip()]
+
+
+def parse_query(text: str, fields: Iterable[str]) -> ParsedQuery:
+    """解析查询，fields 为支持的字段名"""
+    fields = set(fields)
+    terms = []
+    words = []
+    for match in _TERM.finditer(text or ''):
+        negate = bool(match.group('neg'))
+        field = match.group('field')
+        op = match.group('op') or ':'
+        value = match.group('quoted') if match.group('quoted') is not None else match.group('value') or ''
+        if field is not None:
+            field = FIELD_ALIASES.get(field, field.lower())
+            if field not in fields:
+                # 不是字段条件，整体作为关键词
+                words.append(match.group(0))
+                continue
+            if not value:
+                # 还没输入值（如正在输入 "source:"）
+                continue
+            if field in TIME_FIELDS:
+                time_bounds(op, value)
+            elif op != ':':
+                raise ValueError(f"字段 {field} 不支持比较运算")
+            terms.append(Term(field, op, value, negate))
+        elif value.endswith(':') and FIELD_ALIASES.get(value[:-1], value[:-1].lower()) in fields:
+            # 还没输入值（如正在输入 "source:"）
+            continue
+        elif negate and value:
+            terms.append(Term(ANY_FIELD, ':', value, True))
+        elif value:
+            words.append(value)
+    return ParsedQuery(tuple(terms), " ".join(words))
+
+
+class QueryPlan:
+    """编译后的查询执行计划
+
+    fields 为 字段名 -> 条目属性；index_lookup(term) 返回满足条件的条目ID集合，
+    该条件没有索引时返回 None。tag_lookup(all_of, none_of) 按标签筛选
+    （all_of 每项为一组任一包含的标签），提供时全部标签条件合并为一次查找。
+    """
+
+    def __init__(self, parsed: ParsedQuery, fields: Dict[str, str],
+                 index_lookup: Callable[[Term], Optional[Set[str]]],
+                 items_getter: Callable[[], list], items_by_id: Callable[[], Dict[str, object]],
+                 tag_lookup: Callable[[list, list], Set[str]] = None):
+        self.parsed = parsed
+        self.fields = fields
+        self.index_lookup = index_lookup
+        self.items_getter = items_getter
+        self.items_by_id = items_by_id
+        self.tag_lookup = tag_lookup
+        self.checks = [(term, self._compile_term(term)) for term in parsed.terms]
+        # 最近一次执行的步骤说明
+        self.steps: List[str] = []
+
+    @property
+    def terms(self) -> tuple:
+        return self.parsed.terms
+
+    @property
+    def text(self) -> str:
+        return self.parsed.text
+
+    @property
+    def key(self) -> str:
+        return self.parsed.key
+
+    def _compile_term(self, term: Term) -> Callable:
+        """把单个条件编译为判断函数"""
+        value = term.value.lower()
+        if term.field == ANY_FIELD:
+            attrs = [attr for field, attr in self.fields.items()
+                     if field not in TIME_FIELDS and field != 'id']
+            check = lambda item: any(value in str(getattr(item, attr, '') or '').lower() for attr in attrs)
+        elif term.field in TIME_FIELDS:
+            attr = TIME_FIELDS[term.field]
+            low, high = time_bounds(term.op, term.value)
+            check = lambda item: (low is None or getattr(item, attr) >= low) and \
+                (high is None or getattr(item, attr) < high)
+        elif term.field == 'id':
+            check = lambda item: item.id == term.value
+        elif term.field == TAG_FIELD:
+            tags = set(tag_values(term))
+            check = lambda item: any(tag.casefold() in tags for tag in item.tags)
+        else:
+            attr = self.fields[term.field]
+            if term.field in EXACT_FIELDS:
+                check = lambda item: str(getattr(item, attr, '') or '').lower() == value
+            else:
+                check = lambda item: value in str(getattr(item, attr, '') or '').lower()
+        if term.negate:
+            return lambda item: not check(item)
+        return check
+
+    def matches(self, item) -> bool:
+        """条目是否满足全部字段条件（不含关键词部分），按条目当前内容判断"""
+        return all(check(item) for _, check in self.checks)
+
+    def execute(self, search: Callable[[str], list] = None) -> Optional[Set[str]]:
+        """执行计划，返回满足全部条件的条目ID集合；没有任何条件时返回 None
+
+        search 用于关键词部分（通常为管理器的搜索方法）。
+        """
+        self.steps = []
+        # (说明, 条目ID集合)
+        indexed = []
+        residual = []
+        tag_terms = []
+        for term, check in self.checks:
+            if term.field == TAG_FIELD and self.tag_lookup is not None:
+                tag_terms.append(term)
+                continue
+            ids = None if term.negate else self.index_lookup(term)
+            if ids is None:
+                residual.append((term, check))
+            else:
+                indexed.append((str(term), ids))
+        if tag_terms:
+            all_of = [tag_values(term) for term in tag_terms if not term.negate]
+            none_of = [tag for term in tag_terms if term.negate for tag in tag_values(term)]
+            indexed.append((" ".join(str(term) for term in tag_terms), self.tag_lookup(all_of, none_of)))
+        if self.text and search is not None:
+            indexed.append((f"关键词 {self.text}", {item.id for item in search(self.text)}))
+        if not indexed and not residual:
+            return None
+
+        candidates = None
+        for label, ids in sorted(indexed, key=lambda entry: len(entry[1])):
+            candidates = set(ids) if candidates is None else candidates & ids
+            self.steps.append(f"索引 {label}: 剩余 {len(candidates)} 条")
+            if not candidates:
+                break
+
+        if not residual or candidates == set():
+            logger.debug("查询计划: %s", "；".join(self.steps))
+            return candidates
+        if candidates is None:
+            items = self.items_getter()
+            self.steps.append(f"逐条扫描 {len(items)} 条")
+        else:
+            by_id = self.items_by_id()
+            items = [by_id[item_id] for item_id in candidates if item_id in by_id]
+        result = {item.id for item in items if all(check(item) for _, check in residual)}
+        self.steps.append(f"筛选 {' '.join(str(term) for term, _ in residual)}: 剩余 {len(result)} 条")
+        logger.debug("查询计划: %s", "；".join(self.steps))
+        return result
@@ -0,0 +1,74 @@
+"""共享的管理器实例
+
+各页面和全局搜索使用同一组管理器：数据只解密、加载一次，索引只建立一次，
+一个页面的修改其他页面立即可见，不需要重新从磁盘加载。
+管理器在第一次使用时创建，按加密密钥区分。
+"""
+
+import threading
+from typing import Dict, Optional
+
+from utils.log_utils import get_logger
+from .models import PasswordManager, BookmarkManager, BookmarkCategoryManager
+
+
+logger = get_logger("model")
+
+
+class ManagerRegistry:
+    """管理器注册表"""
+
+    _lock = threading.RLock()
+    _encryption_key: Optional[str] = None
+    # 名称 -> 管理器实例
+    _managers: Dict[str, object] = {}
+
+    @classmethod
+    def _get(cls, name: str, factory, encryption_key: Optional[str]):
+        with cls._lock:
+            if encryption_key != cls._encryption_key:
+                # 密钥变化后原有实例不再可用
+                cls._managers = {}
+                cls._encryption_key = encryption_key
+            manager = cls._managers.get(name)
+            if manager is None:
+                manager = factory()
+                if encryption_key:
+                    manager.set_encryption_key(encryption_key)
+                cls._managers[name] = manager
+                logger.debug("已创建共享管理器: %s", name)
+            return manager
+
+    @classmethod
+    def password_manager(cls, encryption_key: str = None) -> PasswordManager:
+        """共享的密码管理器（不自动加载数据）"""
+        return cls._get('passwords', PasswordManager, encryption_key)
+
+    @classmethod
+    def category_manager(cls, encryption_key: str = None) -> BookmarkCategoryManager:
+        """共享的书签分类管理器（不自动加载数据）"""
+        return cls._get('categories', BookmarkCategoryManager, encryption_key)
+
+    @classmethod
+    def bookmark_manager(cls, encryption_key: str = None) -> BookmarkManager:
+        """共享的书签管理器（已关联共享的分类管理器，不自动加载数据）"""
+        with cls._lock:
+            category_manager = cls.category_manager(encryption_key)
+            bookmark_manager = cls._get('bookmarks', BookmarkManager, encryption_key)
+            if bookmark_manager.category_manager is not category_manager:
+                bookmark_manager.set_category_manager(category_manager)
+            return bookmark_manager
+
+    @staticmethod
+    def ensure_loaded(*managers):
+        """加载尚未加载过数据的管理器（书签管理器应排在分类管理器之后）"""
+        for manager in managers:
+            if not manager.loaded:
+                manager.load_data()
+
+    @classmethod
+    def clear(cls):
+        """丢弃全部共享实例"""
+        with cls._lock:
+            cls._managers = {}
+            cls._encryption_key = None
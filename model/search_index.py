@@ -0,0 +1,420 @@
+"""搜索索引
+
+为每个条目预先计算搜索键：各字段的小写文本，以及含中文字段的
+全拼和拼音首字母（如 "微信" -> "weixin"、"wx"）。
+搜索时只在这些键上做子串匹配，输入过程中不再重复转换拼音。
+
+排序搜索（rank）按字段权重打分，允许少量输入错误：
+先用双字片段倒排表筛出候选，再计算编辑距离，最后用堆取得分最高的前 N 条
+（可按常用度等加权）。
+索引在第一次搜索时建立，之后随增删改增量维护。
+
+最近的搜索结果按 (查询, 筛选条件, 数据版本) 缓存。输入逐字增加时
+（"git" -> "gith"），新查询包含旧查询，命中的条目只会更少，
+因此直接在旧结果中筛选；条目增删改时逐条修正缓存中的结果。
+"""
+
+import heapq
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from utils.log_utils import get_logger
+from utils.pinyin_utils import PinyinUtils
+from .sorted_index import QueryPage
+
+
+logger = get_logger("model")
+
+# 匹配方式的得分（乘以字段权重）
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.9
+WORD_PREFIX_SCORE = 0.8
+SUBSTRING_SCORE = 0.7
+# 拼音匹配相对于原文匹配的比例
+PINYIN_FACTOR = 0.9
+# 模糊匹配的最高得分（按编辑距离递减）
+FUZZY_SCORE = 0.5
+# 其他字段也命中时的附加分比例
+EXTRA_FIELD_FACTOR = 0.1
+# 缓存的搜索结果数
+CACHE_SIZE = 32
+
+
+class SearchKeys(NamedTuple):
+    """单个条目的搜索键"""
+    # 各字段的小写文本
+    texts: tuple
+    # 各字段的 (全拼, 首字母)，不含中文的字段为空元组
+    pinyin: tuple
+
+
+def grams(text: str) -> Set[str]:
+    """文本的双字片段（单字文本为其本身）"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+@lru_cache(maxsize=256)
+def query_grams(query: str) -> tuple:
+    return tuple(grams(query))
+
+
+def shares_grams(query: str, text: str, typos: int) -> bool:
+    """text 是否包含足够多的查询片段，用于在计算编辑距离前快速排除"""
+    parts = query_grams(query)
+    return sum(1 for part in parts if part in text) >= len(parts) - 3 * typos
+
+
+def max_typos(query: str) -> int:
+    """按查询长度允许的输入错误数：3个字符以内必须精确匹配"""
+    if len(query) < 4:
+        return 0
+    return 1 if len(query) < 8 else 2
+
+
+def substring_distance(pattern: str, text: str, limit: int) -> int:
+    """pattern 与 text 中最接近的子串之间的编辑距离（相邻字符颠倒算一处），
+    超过 limit 时返回 limit + 1"""
+    before = None
+    previous = [0] * (len(text) + 1)
+    for i, pattern_char in enumerate(pattern, 1):
+        current = [i] + [0] * len(text)
+        for j, text_char in enumerate(text, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                             previous[j - 1] + (pattern_char != text_char))
+            if before is not None and j > 1 and pattern_char == text[j - 2] and pattern[i - 2] == text_char:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(previous)
+
+
+def match_score(query: str, text: str, typos: int) -> float:
+    """单个字段的匹配得分，不匹配时为 0"""
+    if not text:
+        return 0.0
+    if text == query:
+        return EXACT_SCORE
+    if text.startswith(query):
+        return PREFIX_SCORE
+    index = text.find(query)
+    if index > 0:
+        return WORD_PREFIX_SCORE if not text[index - 1].isalnum() else SUBSTRING_SCORE
+    if typos and len(text) >= len(query) - typos and shares_grams(query, text, typos):
+        distance = substring_distance(query, text, typos)
+        if distance <= typos:
+            return FUZZY_SCORE * (1 - distance / (len(query) + 1))
+    return 0.0
+
+
+def items_by_ids(items, ids) -> list:
+    """按ID取出条目并保持存储顺序
+
+    条目集合支持按ID查找（OrderedItems）时只查找这些ID，再按排序键排列，不遍历全部条目。
+    """
+    get = getattr(items, 'get', None)
+    if get is None:
+        return [item for item in items if item.id in ids]
+    found = [item for item in map(get, ids) if item is not None]
+    found.sort(key=lambda item: item.order)
+    return found
+
+
+class CachedResult:
+    """缓存的一次搜索结果（全部命中条目，不限于前 N 条）"""
+
+    def __init__(self, mode: str, query: str, pinyin_query: Optional[str], typos: int,
+                 predicate: Optional[Callable], version: int):
+        self.mode = mode
+        self.query = query
+        self.pinyin_query = pinyin_query
+        self.typos = typos
+        self.predicate = predicate
+        self.version = version
+        # 条目ID -> 得分（布尔搜索均为 1）
+        self.scores: Dict[str, float] = {}
+        # 命中条目，ordered 为 True 时与存储顺序一致
+        self.items: list = []
+        self.ordered = True
+
+    def refines(self, other: 'CachedResult') -> bool:
+        """本次查询能否在 other 的结果中筛选：包含其查询内容，且允许的错误数不多于它"""
+        if other.query not in self.query or self.typos > other.typos:
+            return False
+        if self.pinyin_query and not (other.pinyin_query and other.pinyin_query in self.pinyin_query):
+            return False
+        return True
+
+    def ordered_items(self, items_getter: Callable[[], list]) -> list:
+        """命中条目（按存储顺序）"""
+        if not self.ordered:
+            # 条目有增删改后按当前存储顺序重新排列（只做ID查找，不重新匹配）
+            self.items = items_by_ids(items_getter(), self.scores)
+            self.ordered = True
+        return self.items
+
+
+class SearchIndex:
+    """管理器的搜索索引
+
+    fields 为 字段名 -> 权重，权重越大的字段命中时排名越靠前。
+    """
+
+    def __init__(self, items_getter: Callable[[], list], fields: Dict[str, float]):
+        self.items_getter = items_getter
+        self.fields = tuple(fields)
+        self.weights = tuple(fields.values())
+        self._keys: Optional[Dict[str, SearchKeys]] = None
+        # 双字片段 -> 条目ID集合（第一次排序搜索时建立）
+        self._grams: Optional[Dict[str, Set[str]]] = None
+        # 数据版本，每次增删改加一
+        self.version = 0
+        # (模式, 查询, 拼音开关, 筛选键) -> 缓存结果，按最近使用排列
+        self._cache: "OrderedDict[tuple, CachedResult]" = OrderedDict()
+        # 可选的排序加权：条目ID -> 系数（如按常用度加分）
+        self.boost: Optional[Callable[[str], float]] = None
+
+    def item_keys(self, item) -> SearchKeys:
+        """计算条目的搜索键"""
+        values = [str(getattr(item, field, '') or '') for field in self.fields]
+        return SearchKeys(tuple(value.lower() for value in values),
+                          tuple(PinyinUtils.search_keys(value) for value in values))
+
+    @staticmethod
+    def key_grams(entry: SearchKeys) -> Set[str]:
+        result = set()
+        for text in entry.texts:
+            result |= grams(text)
+        for keys in entry.pinyin:
+            for key in keys:
+                result |= grams(key)
+        return result
+
+    def reset(self):
+        """数据整体变化后丢弃索引和缓存，下次搜索时重建"""
+        self._keys = None
+        self._grams = None
+        self._cache.clear()
+        self.version += 1
+
+    def added(self, item):
+        self.version += 1
+        if self._keys is not None:
+            entry = self._keys[item.id] = self.item_keys(item)
+            self._add_grams(item.id, entry)
+            self._patch_cache(item, entry)
+
+    def updated(self, item):
+        self.removed(item.id)
+        self.added(item)
+
+    def removed(self, item_id: str):
+        self.version += 1
+        if self._keys is not None:
+            entry = self._keys.pop(item_id, None)
+            if entry is not None and self._grams is not None:
+                for gram in self.key_grams(entry):
+                    ids = self._grams.get(gram)
+                    if ids is not None:
+                        ids.discard(item_id)
+                        if not ids:
+                            del self._grams[gram]
+            self._patch_cache(None, None, item_id)
+
+    def _patch_cache(self, item, entry: Optional[SearchKeys], removed_id: str = None):
+        """逐条修正缓存结果，使其与当前数据版本一致"""
+        for cached in self._cache.values():
+            if removed_id is not None:
+                if cached.scores.pop(removed_id, None) is not None:
+                    cached.ordered = False
+            else:
+                score = self._match(cached, item, entry)
+                if score:
+                    cached.scores[item.id] = score
+                    cached.ordered = False
+            cached.version = self.version
+
+    def _add_grams(self, item_id: str, entry: SearchKeys):
+        if self._grams is not None:
+            for gram in self.key_grams(entry):
+                self._grams.setdefault(gram, set()).add(item_id)
+
+    def keys(self) -> Dict[str, SearchKeys]:
+        """条目ID -> 搜索键（首次调用时建立）"""
+        if self._keys is None:
+            self._keys = {item.id: self.item_keys(item) for item in self.items_getter()}
+            logger.debug("已建立搜索索引: %d 个条目", len(self._keys))
+        return self._keys
+
+    def gram_index(self) -> Dict[str, Set[str]]:
+        """双字片段倒排表（首次调用时建立）"""
+        if self._grams is None:
+            keys = self.keys()
+            self._grams = {}
+            for item_id, entry in keys.items():
+                self._add_grams(item_id, entry)
+            logger.debug("已建立片段索引: %d 个片段", len(self._grams))
+        return self._grams
+
+    @staticmethod
+    def contains(entry: SearchKeys, query: str, pinyin_query: Optional[str]) -> bool:
+        """条目是否包含查询内容（原文或拼音）"""
+        return any(query in text for text in entry.texts) or \
+            bool(pinyin_query and any(pinyin_query in key for keys in entry.pinyin for key in keys))
+
+    def _match(self, cached: CachedResult, item, entry: SearchKeys) -> float:
+        """条目在某次搜索中的得分，不命中时为 0"""
+        if cached.predicate is not None and not cached.predicate(item):
+            return 0.0
+        if cached.mode == 'rank':
+            return self.score(entry, cached.query, cached.pinyin_query, cached.typos)
+        return 1.0 if self.contains(entry, cached.query, cached.pinyin_query) else 0.0
+
+    def _lookup(self, key: tuple, probe: CachedResult) -> tuple:
+        """查找缓存：返回 (完全相同的结果, 可用于筛选的更宽结果)"""
+        cached = self._cache.get(key)
+        if cached is not None and cached.version == self.version:
+            self._cache.move_to_end(key)
+            return cached, None
+        parent = None
+        mode, _, pinyin, filter_key = key
+        for (other_mode, _, other_pinyin, other_filter), other in self._cache.items():
+            if (other_mode, other_pinyin, other_filter) != (mode, pinyin, filter_key) or \
+                    other.version != self.version or not probe.refines(other):
+                continue
+            if parent is None or len(other.scores) < len(parent.scores):
+                parent = other
+        return None, parent
+
+    def _run(self, mode: str, query: str, pinyin: bool, predicate: Optional[Callable], filter_key,
+             candidates: Callable[[], list]) -> CachedResult:
+        """执行搜索：优先使用缓存，其次在更宽的缓存结果中筛选，最后才扫描候选条目
+
+        筛选条件 predicate 需要同时给出可比较的 filter_key 才会缓存。
+        """
+        pinyin_query = PinyinUtils.normalize_query(query) \
+            if pinyin and PinyinUtils.is_pinyin_query(query) else None
+        typos = max_typos(query) if mode == 'rank' else 0
+        result = CachedResult(mode, query, pinyin_query, typos, predicate, self.version)
+        cacheable = predicate is None or filter_key is not None
+        key = (mode, query, pinyin, filter_key)
+
+        parent = None
+        if cacheable:
+            cached, parent = self._lookup(key, result)
+            if cached is not None:
+                return cached
+
+        keys = self.keys()
+        source = parent.ordered_items(self.items_getter) if parent is not None else candidates()
+        for item in source:
+            entry = keys.get(item.id)
+            if entry is None:
+                entry = keys[item.id] = self.item_keys(item)
+            score = self._match(result, item, entry)
+            if score:
+                result.scores[item.id] = score
+                result.items.append(item)
+
+        if cacheable:
+            self._cache[key] = result
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def search(self, query: str, pinyin: bool = True,
+               prefilter: Optional[Callable[[], Set[str]]] = None) -> List:
+        """搜索条目，结果保持存储顺序
+
+        pinyin 为 True 且查询只含字母数字时，同时匹配全拼和首字母。
+        prefilter 返回候选条目ID集合（如数据库盲索引），只在没有可用缓存时调用。
+        """
+        def candidates():
+            items = self.items_getter()
+            if prefilter is None:
+                return items
+            return items_by_ids(items, prefilter())
+
+        return list(self._run('search', query.lower(), pinyin, None, None, candidates)
+                    .ordered_items(self.items_getter))
+
+    def item_matches(self, item, query: str, pinyin: bool = True) -> bool:
+        """单个条目是否包含查询内容（与 search 的判断相同，按条目当前内容计算，不依赖索引状态）"""
+        query = query.lower()
+        pinyin_query = PinyinUtils.normalize_query(query) \
+            if pinyin and PinyinUtils.is_pinyin_query(query) else None
+        return self.contains(self.item_keys(item), query, pinyin_query)
+
+    def _candidate_ids(self, queries: List[str], typos: int) -> Set[str]:
+        """用片段倒排表筛选候选条目
+
+        每处修改最多破坏 3 个双字片段（相邻字符颠倒时），
+        与查询相差不超过 typos 处修改的文本至少包含查询中 片段数 - 3 * typos 个片段。
+        """
+        index = self.gram_index()
+        result: Set[str] = set()
+        for query in queries:
+            parts = query_grams(query)
+            threshold = max(1, len(parts) - 3 * typos)
+            counts: Dict[str, int] = {}
+            for gram in parts:
+                for item_id in index.get(gram, ()):
+                    counts[item_id] = counts.get(item_id, 0) + 1
+            result.update(item_id for item_id, count in counts.items() if count >= threshold)
+        return result
+
+    def score(self, entry: SearchKeys, query: str, pinyin_query: Optional[str], typos: int) -> float:
+        """条目得分：最佳字段得分加上其他命中字段的少量附加分"""
+        field_scores = []
+        for weight, text, keys in zip(self.weights, entry.texts, entry.pinyin):
+            best = match_score(query, text, typos)
+            if pinyin_query and keys and best < EXACT_SCORE:
+                for key in keys:
+                    best = max(best, PINYIN_FACTOR * match_score(pinyin_query, key, typos))
+            if best:
+                field_scores.append(weight * best)
+        if not field_scores:
+            return 0.0
+        top = max(field_scores)
+        return top + EXTRA_FIELD_FACTOR * (sum(field_scores) - top)
+
+    def rank(self, query: str, predicate: Callable = None, limit: int = 50, pinyin: bool = True,
+             filter_key=None) -> QueryPage:
+        """按相关度排序搜索，返回得分最高的 limit 条和命中总数
+
+        predicate 用于附加筛选（如来源、分类），filter_key 为其可比较的标识（用于缓存），
+        predicate 需按条目当前内容判断，缓存会用它重新判断修改过的条目。同分时保持原有顺序。
+        """
+        hits, total = self.rank_with_scores(query, predicate, limit, pinyin, filter_key)
+        return QueryPage([item for _, item in hits], None, total)
+
+    def rank_with_scores(self, query: str, predicate: Callable = None, limit: int = 50, pinyin: bool = True,
+                         filter_key=None) -> Tuple[List[Tuple[float, object]], int]:
+        """与 rank 相同，但返回 ([(得分, 条目)], 命中总数)，用于合并多个索引的结果"""
+        query = query.strip().lower()
+        if not query:
+            return [], 0
+
+        def candidates():
+            pinyin_query = PinyinUtils.normalize_query(query) \
+                if pinyin and PinyinUtils.is_pinyin_query(query) else None
+            queries = [q for q in (query, pinyin_query) if q]
+            if any(len(q) < 2 for q in queries):
+                # 单字查询无法用双字片段筛选
+                return self.items_getter()
+            return items_by_ids(self.items_getter(), self._candidate_ids(queries, max_typos(query)))
+
+        result = self._run('rank', query, pinyin, predicate, filter_key, candidates)
+        items = result.ordered_items(self.items_getter)
+        scores = result.scores
+        boost = self.boost
+        if boost is not None:
+            # 加权只影响排序，缓存中保存的仍是匹配得分
+            final = {item.id: scores[item.id] * boost(item.id) for item in items}
+        else:
+            final = scores
+        top = heapq.nlargest(limit, range(len(items)), key=lambda i: (final[items[i].id], -i))
+        return [(final[items[i].id], items[i]) for i in top], len(items)
@@ -0,0 +1,213 @@
+"""分片文件存储
+
+书签较多时可以按分类或按ID哈希分桶保存到多个加密文件：
+- config/bookmarks/manifest.enc 为加密的清单，记录分片方式和各分片文件
+- 分片文件名由分片键经 HMAC 得到（加随机后缀），不暴露分类名称
+- 加载时并行解密各分片，保存时只序列化和重写有变化的分片
+- 重写的分片写入新文件，清单原子替换后才删除旧文件：清单是提交点，
+  中途崩溃时旧清单和它引用的分片都完好，条目不会重复或丢失
+
+通过 config/storage_settings.json 的 "bookmark_shards" 启用：
+"category" 按分类分片，"hash:16" 按ID哈希分为16个分片。
+"""
+
+import hashlib
+import hmac
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from utils.crypto_utils import SecurePasswordManager
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+
+class ShardedFileStore:
+    """按分片保存的加密文件存储"""
+
+    MANIFEST_VERSION = 1
+
+    def __init__(self, directory: str, mode: str, category_field: str = 'category',
+                 compression: str = None, max_workers: int = 4):
+        self.directory = directory
+        self.mode, _, buckets = mode.partition(':')
+        self.buckets = int(buckets) if buckets else 16
+        if self.mode not in ('category', 'hash'):
+            raise ValueError(f"不支持的分片方式: {mode}")
+        self.category_field = category_field
+        self.compression = compression
+        self.max_workers = max_workers
+        self.encryption_key = None
+        self.manifest_file = os.path.join(directory, "manifest.enc")
+        # 分片键 -> 分片文件名
+        self.shards: Dict[str, str] = {}
+        # 分片键 -> 条目数
+        self.counts: Dict[str, int] = {}
+        # 清单中记录的分片方式
+        self.manifest_layout = (self.mode, self.buckets)
+        # 条目ID -> 所在分片键，用于确定删除和移动涉及的分片
+        self.item_shard: Dict[str, str] = {}
+        # 分片键 -> 该分片的条目ID（按写入顺序），保存时只取这些条目
+        self.members: Dict[str, Dict[str, None]] = {}
+
+    def set_encryption_key(self, key: str):
+        """设置加密密钥"""
+        self.encryption_key = key
+
+    def exists(self) -> bool:
+        """清单是否存在"""
+        return os.path.exists(self.manifest_file)
+
+    def shard_key(self, item: Dict) -> str:
+        """条目所属的分片键"""
+        if self.mode == 'category':
+            return str(item.get(self.category_field, ''))
+        return str(zlib.crc32(str(item['id']).encode('utf-8')) % self.buckets)
+
+    def shard_file(self, shard_key: str) -> str:
+        """清单中记录的分片文件路径"""
+        return os.path.join(self.directory, self.shards[shard_key])
+
+    def _new_shard_name(self, shard_key: str) -> str:
+        """分片的新文件名（不含分类明文，随机后缀保证不覆盖清单正在引用的文件）"""
+        digest = hmac.new(self.encryption_key.encode('utf-8'), shard_key.encode('utf-8'), hashlib.sha256)
+        return f"{digest.hexdigest()[:16]}-{os.urandom(4).hex()}.enc"
+
+    def _secure(self, encrypted_file: str) -> SecurePasswordManager:
+        manager = SecurePasswordManager(encrypted_file=encrypted_file)
+        manager.set_encryption_key(self.encryption_key, use_simple_key=True)
+        manager.set_compression(self.compression)
+        return manager
+
+    def load_manifest(self):
+        """读取清单（只含分片列表和条目数，可用于只加载部分分片）"""
+        manifest = self._secure(self.manifest_file).load_encrypted_data()
+        shards = manifest.get('shards', {})
+        self.manifest_layout = (manifest.get('mode'), manifest.get('buckets'))
+        self.shards = {key: info['file'] for key, info in shards.items()}
+        self.counts = {key: info.get('count', 0) for key, info in shards.items()}
+
+    def _save_manifest(self):
+        manifest = {
+            'version': self.MANIFEST_VERSION,
+            'mode': self.mode,
+            'buckets': self.buckets,
+            'shards': {key: {'file': self.shards[key], 'count': self.counts[key]} for key in self.shards}
+        }
+        self._secure(self.manifest_file).save_encrypted_data(manifest)
+
+    def load_all(self) -> List[Dict]:
+        """并行加载全部分片"""
+        self.load_manifest()
+        keys = list(self.shards)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="shard-load") as pool:
+            loaded = list(pool.map(self.load_shard, keys))
+
+        self.item_shard = {}
+        self.members = {}
+        items = []
+        for key, shard_items in zip(keys, loaded):
+            for item in shard_items:
+                self.item_shard[item['id']] = key
+            self.members[key] = {item['id']: None for item in shard_items}
+            items.extend(shard_items)
+        logger.info("从 %d 个分片加载了 %d 个条目", len(keys), len(items))
+        self._remove_orphans()
+
+        if self.manifest_layout != (self.mode, self.buckets):
+            # 分片方式已修改，按新方式重新分片
+            logger.info("分片方式已变更，重新分片")
+            self.replace_all(items)
+        return items
+
+    def load_shard(self, shard_key: str) -> List[Dict]:
+        """加载单个分片"""
+        return self._secure(self.shard_file(shard_key)).load_encrypted_data()
+
+    def replace_all(self, items: List[Dict]):
+        """按当前分片方式重写全部分片（用于迁移和整体保存）"""
+        stale = list(self.shards.values())
+        self.shards = {}
+        self.item_shard = {}
+        self.members = {}
+        self.counts = {}
+        groups: Dict[str, List[Dict]] = {}
+        for item in items:
+            groups.setdefault(self.shard_key(item), []).append(item)
+        self._write_shards(groups, stale)
+
+    def write(self, changed: Iterable[Dict], deleted: Iterable[str], lookup: Callable[[str], Optional[Dict]]):
+        """只重写受影响的分片
+
+        受影响的分片为：新增和修改的条目所在分片，修改前所在分片（移动分类时），以及删除条目所在分片。
+        lookup(条目ID) 返回条目的当前内容，只对受影响分片的条目调用。
+        """
+        changed = {item['id']: item for item in changed}
+        dirty: Set[str] = set()
+        for item_id in deleted:
+            key = self.item_shard.pop(item_id, None)
+            if key is not None:
+                self.members.get(key, {}).pop(item_id, None)
+                dirty.add(key)
+        for item_id, item in changed.items():
+            key = self.shard_key(item)
+            old_key = self.item_shard.get(item_id)
+            if old_key is not None and old_key != key:
+                self.members.get(old_key, {}).pop(item_id, None)
+                dirty.add(old_key)
+            self.item_shard[item_id] = key
+            self.members.setdefault(key, {})[item_id] = None
+            dirty.add(key)
+        if not dirty:
+            return
+        groups = {}
+        for key in dirty:
+            members = (changed.get(item_id) or lookup(item_id) for item_id in self.members.get(key, {}))
+            groups[key] = [item for item in members if item is not None]
+        self._write_shards(groups)
+
+    def _write_shards(self, groups: Dict[str, List[Dict]], stale: Iterable[str] = ()):
+        """把各分片写入新文件，再替换清单，最后删除不再引用的旧文件"""
+        os.makedirs(self.directory, exist_ok=True)
+        superseded = list(stale)
+        for key, shard_items in groups.items():
+            old_name = self.shards.get(key)
+            if old_name:
+                superseded.append(old_name)
+            if shard_items:
+                name = self._new_shard_name(key)
+                self._secure(os.path.join(self.directory, name)).save_encrypted_data(shard_items)
+                self.shards[key] = name
+                self.counts[key] = len(shard_items)
+                self.members[key] = {item['id']: None for item in shard_items}
+                for item in shard_items:
+                    self.item_shard[item['id']] = key
+            else:
+                # 分片已空
+                self.shards.pop(key, None)
+                self.counts.pop(key, None)
+                self.members.pop(key, None)
+        self._save_manifest()
+        for name in superseded:
+            self._remove(name)
+        logger.debug("已重写 %d 个分片", len(groups))
+
+    def _remove(self, name: str):
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("删除旧分片文件失败: %s", e)
+
+    def _remove_orphans(self):
+        """删除清单没有引用的分片文件（保存中途崩溃留下的）"""
+        referenced = set(self.shards.values())
+        referenced.add(os.path.basename(self.manifest_file))
+        for name in os.listdir(self.directory):
+            if (name.endswith(".enc") or name.endswith(".tmp")) and name not in referenced:
+                logger.info("删除未被清单引用的分片文件: %s", name)
+                self._remove(name)
@@ -0,0 +1,204 @@
+"""保存的搜索（智能文件夹）
+
+把常用的筛选条件（查询语法，见 model.query_language）保存为智能文件夹。
+每个文件夹的成员（条目ID集合）在第一次打开时计算一次，之后随条目增删改
+只判断变化的那一个条目，打开文件夹时直接使用已有的集合，不重新扫描。
+含相对时间（如 created:<30d）的文件夹成员会随时间变化，每次打开时重新计算。
+
+文件夹定义保存在单独的文件中（如 config/passwords_searches.enc），
+设置了加密密钥时加密保存。
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set
+
+from utils.crypto_utils import SecurePasswordManager
+from utils.log_utils import get_logger
+from .query_language import QueryPlan, TIME_FIELDS, is_relative_time
+
+
+logger = get_logger("model")
+
+
+def searches_file_for(data_file: str, extension: str = ".json") -> str:
+    """数据文件对应的智能文件夹文件：config/passwords.json -> config/passwords_searches.json"""
+    return os.path.splitext(data_file)[0] + "_searches" + extension
+
+
+class SavedSearch:
+    """保存的搜索"""
+
+    def __init__(self, name: str, query: str, item_id: str = None):
+        self.id = item_id or str(int(datetime.now().timestamp() * 1000))
+        self.name = name
+        self.query = query
+        self.created_time = datetime.now().isoformat()
+
+    def to_dict(self) -> Dict:
+        return {'id': self.id, 'name': self.name, 'query': self.query, 'created_time': self.created_time}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SavedSearch':
+        item = cls(data.get('name', ''), data.get('query', ''), data.get('id'))
+        item.created_time = data.get('created_time', item.created_time)
+        return item
+
+
+class SmartFolders:
+    """智能文件夹及其成员集合
+
+    plan_query 把查询编译为执行计划，search 为管理器的关键词搜索，
+    item_matches(item, text) 判断单个条目是否包含关键词。
+    """
+
+    def __init__(self, plan_query: Callable[[str], QueryPlan], search: Callable[[str], list],
+                 item_matches: Callable[[object, str], bool], items_getter: Callable[[], list],
+                 data_file: str, encrypted_file: str):
+        self.plan_query = plan_query
+        self.search = search
+        self.item_matches = item_matches
+        self.items_getter = items_getter
+        self.data_file = data_file
+        self.secure_manager = SecurePasswordManager(data_file, encrypted_file)
+        self.use_encryption = False
+        self._folders: Optional[List[SavedSearch]] = None
+        # 文件夹ID -> 执行计划 / 成员集合（尚未计算的不在其中）
+        self._plans: Dict[str, QueryPlan] = {}
+        self._members: Dict[str, Set[str]] = {}
+
+    def set_encryption_key(self, key: str):
+        """设置加密密钥"""
+        self.secure_manager.set_encryption_key(key, use_simple_key=True)
+        self.use_encryption = True
+        self._folders = None
+
+    def reencrypt(self, new_key: str, old_key: str):
+        """改用新密钥重新加密保存（旧版数据迁移使用），文件已是新密钥加密时不变"""
+        self.secure_manager.reencrypt_file(new_key, old_key)
+        self.set_encryption_key(new_key)
+
+    def _load(self) -> List[SavedSearch]:
+        if self._folders is None:
+            self._folders = []
+            try:
+                if self.use_encryption and os.path.exists(self.secure_manager.encrypted_file):
+                    data = self.secure_manager.load_encrypted_data()
+                elif os.path.exists(self.data_file):
+                    with open(self.data_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                else:
+                    data = []
+                self._folders = [SavedSearch.from_dict(item) for item in data]
+            except Exception as e:
+                logger.warning("加载智能文件夹失败: %s", e)
+        return self._folders
+
+    def _save(self):
+        data = [folder.to_dict() for folder in self._load()]
+        try:
+            if self.use_encryption:
+                self.secure_manager.save_encrypted_data(data)
+            else:
+                os.makedirs(os.path.dirname(self.data_file) or '.', exist_ok=True)
+                with open(self.data_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.exception("保存智能文件夹失败: %s", e)
+
+    def all(self) -> List[SavedSearch]:
+        """全部智能文件夹"""
+        return list(self._load())
+
+    def get(self, folder_id: str) -> Optional[SavedSearch]:
+        return next((folder for folder in self._load() if folder.id == folder_id), None)
+
+    def add(self, name: str, query: str) -> SavedSearch:
+        """保存搜索，名称为空、重名或查询语法有误时抛出 ValueError"""
+        name = name.strip()
+        if not name:
+            raise ValueError("智能文件夹名称不能为空")
+        if any(folder.name == name for folder in self._load()):
+            raise ValueError(f"智能文件夹 '{name}' 已存在")
+        self.plan_query(query)
+        # 毫秒时间戳，同一毫秒内保存的文件夹依次加一
+        item_id = max([int(datetime.now().timestamp() * 1000)] + [int(folder.id) + 1 for folder in self._folders
+                                                                  if folder.id.isdigit()])
+        folder = SavedSearch(name, query.strip(), str(item_id))
+        self._folders.append(folder)
+        self._save()
+        return folder
+
+    def delete(self, folder_id: str) -> bool:
+        """删除智能文件夹"""
+        folders = self._load()
+        for i, folder in enumerate(folders):
+            if folder.id == folder_id:
+                del folders[i]
+                self._plans.pop(folder_id, None)
+                self._members.pop(folder_id, None)
+                self._save()
+                return True
+        return False
+
+    def _plan(self, folder: SavedSearch) -> QueryPlan:
+        plan = self._plans.get(folder.id)
+        if plan is None:
+            plan = self._plans[folder.id] = self.plan_query(folder.query)
+        return plan
+
+    @staticmethod
+    def _volatile(plan: QueryPlan) -> bool:
+        """成员是否随时间变化（含相对时间条件）"""
+        return any(term.field in TIME_FIELDS and is_relative_time(term.value) for term in plan.terms)
+
+    def _matches(self, folder: SavedSearch, item) -> bool:
+        plan = self._plan(folder)
+        return plan.matches(item) and (not plan.text or self.item_matches(item, plan.text))
+
+    def members(self, folder_id: str) -> Set[str]:
+        """智能文件夹的成员（条目ID集合），文件夹不存在时抛出 ValueError"""
+        folder = self.get(folder_id)
+        if folder is None:
+            raise ValueError("智能文件夹不存在")
+        members = self._members.get(folder_id)
+        if members is None:
+            plan = self._plan(folder)
+            ids = plan.execute(self.search)
+            members = ids if ids is not None else {item.id for item in self.items_getter()}
+            if self._volatile(plan):
+                # 不缓存，下次打开时按当时的时间重新编译和计算
+                self._plans.pop(folder_id, None)
+                return members
+            self._members[folder_id] = members
+            logger.debug("已计算智能文件夹成员: %s，%d 个", folder.name, len(members))
+        return members
+
+    def is_live(self, folder_id: str) -> bool:
+        """成员集合是否已计算并随增删改自动维护（含相对时间的文件夹始终为 False）"""
+        return folder_id in self._members
+
+    def counts(self) -> Dict[str, int]:
+        """各智能文件夹的成员数"""
+        return {folder.id: len(self.members(folder.id)) for folder in self._load()}
+
+    def reset(self):
+        """数据整体变化后丢弃成员集合，下次打开时重新计算"""
+        self._members = {}
+
+    def added(self, item):
+        for folder_id, members in self._members.items():
+            if self._matches(self.get(folder_id), item):
+                members.add(item.id)
+
+    def updated(self, item):
+        for folder_id, members in self._members.items():
+            if self._matches(self.get(folder_id), item):
+                members.add(item.id)
+            else:
+                members.discard(item.id)
+
+    def removed(self, item_id: str):
+        for members in self._members.values():
+            members.discard(item_id)
@@ -0,0 +1,204 @@
+"""有序索引与分页查询
+
+管理器按标题、创建时间、更新时间维护有序索引（bisect），
+query 按游标分页返回结果，界面和脚本只取需要显示的部分。
+索引在第一次查询时建立，之后随增删改增量维护。
+"""
+
+import base64
+import itertools
+import json
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+
+class QueryPage(NamedTuple):
+    """一页查询结果"""
+    items: list
+    # 下一页的游标，没有更多结果时为 None
+    next_cursor: Optional[str]
+    # 符合条件的总数（第一页统计，翻页时由游标带回）
+    total: int
+
+
+class SortedIndex:
+    """按排序键维护的有序索引"""
+
+    def __init__(self, key_func: Callable):
+        self.key_func = key_func
+        # (排序键, 条目ID) 升序列表，ID 保证同键时顺序稳定
+        self.entries: List[tuple] = []
+        # 条目ID -> 当前排序键
+        self.keys: Dict[str, object] = {}
+
+    def build(self, items: list):
+        """根据全部条目建立索引"""
+        self.keys = {item.id: self.key_func(item) for item in items}
+        self.entries = sorted((key, item_id) for item_id, key in self.keys.items())
+
+    def add(self, item):
+        key = self.key_func(item)
+        self.keys[item.id] = key
+        insort(self.entries, (key, item.id))
+
+    def remove(self, item_id: str):
+        key = self.keys.pop(item_id, None)
+        if key is None:
+            return
+        index = bisect_left(self.entries, (key, item_id))
+        if index < len(self.entries) and self.entries[index] == (key, item_id):
+            del self.entries[index]
+
+    def update(self, item):
+        """条目修改后更新位置（排序键未变时不做任何操作）"""
+        if self.keys.get(item.id) != self.key_func(item):
+            self.remove(item.id)
+            self.add(item)
+
+    def range_ids(self, low=None, high=None) -> List[str]:
+        """排序键在 [low, high) 范围内的条目ID，None 表示不限"""
+        start = 0 if low is None else bisect_left(self.entries, (low,))
+        end = len(self.entries) if high is None else bisect_left(self.entries, (high,))
+        return [item_id for _, item_id in self.entries[start:end]]
+
+    def iter_ids(self, after: Optional[tuple] = None, reverse: bool = False) -> Iterator[str]:
+        """按顺序遍历条目ID，after 为上一页最后一项的 (排序键, ID)"""
+        entries = self.entries
+        if reverse:
+            end = len(entries) if after is None else bisect_left(entries, after)
+            for index in range(end - 1, -1, -1):
+                yield entries[index][1]
+        else:
+            start = 0 if after is None else bisect_right(entries, after)
+            for index in range(start, len(entries)):
+                yield entries[index][1]
+
+
+class SortedViews:
+    """管理器的排序视图集合
+
+    sort 为字段名，前缀 "-" 表示降序；为 None 时为默认顺序：ranked(条目集合) 给出的条目
+    （如按常用度排列的常用条目）在前，其余按管理器原有顺序（排序键）。
+
+    游标记录上一页最后一项的位置（排序键和ID，或默认顺序中的ID / 排序键）和命中总数，
+    翻页时从该位置继续，不重新统计总数，也不从头查找。
+    """
+
+    def __init__(self, items_getter: Callable[[], list], key_funcs: Dict[str, Callable],
+                 ranked: Callable[[object], list] = None):
+        self.items_getter = items_getter
+        self.key_funcs = key_funcs
+        self.ranked = ranked
+        self.indexes: Dict[str, SortedIndex] = {}
+        self._by_id: Optional[Dict[str, object]] = None
+
+    def reset(self):
+        """数据整体变化后丢弃索引，下次查询时重建"""
+        self.indexes = {}
+        self._by_id = None
+
+    def added(self, item):
+        if self._by_id is not None:
+            self._by_id[item.id] = item
+        for index in self.indexes.values():
+            index.add(item)
+
+    def updated(self, item):
+        for index in self.indexes.values():
+            index.update(item)
+
+    def removed(self, item_id: str):
+        if self._by_id is not None:
+            self._by_id.pop(item_id, None)
+        for index in self.indexes.values():
+            index.remove(item_id)
+
+    def _index(self, field: str) -> SortedIndex:
+        index = self.indexes.get(field)
+        if index is None:
+            if field not in self.key_funcs:
+                raise ValueError(f"不支持的排序字段: {field}")
+            index = SortedIndex(self.key_funcs[field])
+            index.build(self.items_getter())
+            self.indexes[field] = index
+            logger.debug("已建立排序索引: %s", field)
+        return index
+
+    def range_ids(self, field: str, low=None, high=None) -> List[str]:
+        """按排序字段的范围查找条目ID（用于时间条件）"""
+        return self._index(field).range_ids(low, high)
+
+    def items_by_id(self) -> Dict[str, object]:
+        """条目ID -> 条目"""
+        if self._by_id is None:
+            self._by_id = {item.id: item for item in self.items_getter()}
+        return self._by_id
+
+    @staticmethod
+    def encode_cursor(position) -> str:
+        return base64.urlsafe_b64encode(json.dumps(position, ensure_ascii=False).encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def decode_cursor(cursor: str):
+        try:
+            return json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        except Exception:
+            raise ValueError("无效的分页游标")
+
+    def query(self, predicate: Optional[Callable] = None, sort: Optional[str] = None,
+              cursor: Optional[str] = None, limit: Optional[int] = 50) -> QueryPage:
+        """分页查询，limit 为 None 时返回全部（命中总数只在第一页统计）"""
+        after, total = None, None
+        if cursor:
+            decoded = self.decode_cursor(cursor)
+            after, total = decoded[:-1], decoded[-1]
+
+        if sort:
+            reverse = sort.startswith('-')
+            field = sort.lstrip('-')
+            index = self._index(field)
+            by_id = self.items_by_id()
+            ordered = (by_id[item_id] for item_id in index.iter_ids(tuple(after) if after else None, reverse))
+            position = lambda item: [index.keys[item.id], item.id]
+        else:
+            items = self.items_getter()
+            ranked = self.ranked(items) if self.ranked is not None else []
+            ranked_ids = {item.id for item in ranked}
+            order_key = None
+            if after and after[0] == 'order':
+                # 排在前面的条目已经取完，从上一页最后一项的排序键之后继续
+                ranked, order_key = [], after[1]
+            elif after:
+                start = next((i + 1 for i, item in enumerate(ranked) if item.id == after[1]), len(ranked))
+                ranked = ranked[start:]
+            if hasattr(items, 'iter_after'):
+                rest = items.iter_after(order_key)
+            else:
+                rest = (item for item in items if order_key is None or item.order > order_key)
+            ordered = itertools.chain(ranked, (item for item in rest if item.id not in ranked_ids))
+            position = lambda item: ['ranked', item.id] if item.id in ranked_ids else ['order', item.order]
+
+        page = []
+        for item in ordered:
+            if predicate is not None and not predicate(item):
+                continue
+            page.append(item)
+            if limit is not None and len(page) > limit:
+                break
+
+        if total is None:
+            if predicate is None:
+                total = len(self.items_getter())
+            else:
+                total = sum(1 for item in self.items_getter() if predicate(item))
+
+        next_cursor = None
+        if limit is not None and len(page) > limit:
+            page.pop()
+            next_cursor = self.encode_cursor(position(page[-1]) + [total])
+        return QueryPage(page, next_cursor, total)
@@ -0,0 +1,284 @@
+"""SQLite 存储后端
+
+可选的存储方式，数据保存在 config/vault.db：
+- 每个条目一行，条目内容（包括分类、创建和修改时间）整体加密后存入 payload 列，
+  明文列只有条目ID和存储顺序
+- 搜索使用盲索引表：字段内容的双字片段经 HMAC 处理后入库，
+  数据库中不出现明文，查询时按同样方式计算后走索引。
+  不索引单字，避免按单字出现频率推测内容，少于两个字的查询不经过盲索引
+- 开启 WAL，每次修改只在一个事务内写入变化的行
+
+通过 config/storage_settings.json 的 {"backend": "sqlite"}
+或环境变量 NUOQIN_STORAGE=sqlite 启用。
+同一设置文件中的 compression 用于文件存储的加密前压缩。
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from utils.crypto_utils import CryptoAesUtils, parse_compression
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+class StorageSettings:
+    """存储后端设置"""
+
+    settings_file = "config/storage_settings.json"
+    default_db_file = "config/vault.db"
+
+    @staticmethod
+    def load_settings() -> Dict:
+        """加载存储设置"""
+        try:
+            if os.path.exists(StorageSettings.settings_file):
+                with open(StorageSettings.settings_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning("加载存储设置失败: %s", e)
+        return {}
+
+    @staticmethod
+    def backend() -> str:
+        """当前存储后端：json 或 sqlite"""
+        backend = os.environ.get("NUOQIN_STORAGE") or StorageSettings.load_settings().get("backend", "json")
+        return str(backend).lower()
+
+    @staticmethod
+    def use_sqlite() -> bool:
+        """是否使用 SQLite 后端"""
+        return StorageSettings.backend() == "sqlite"
+
+    @staticmethod
+    def compression_for(encrypted_file: str) -> Optional[str]:
+        """加密文件保存时使用的压缩算法
+
+        compression 可以是统一的设置（如 "zlib"、"lzma:9"），也可以按文件配置：
+        {"default": "zlib", "config/passwords.enc": "none"}。默认不压缩。
+        """
+        compression = StorageSettings.load_settings().get("compression")
+        if isinstance(compression, dict):
+            compression = compression.get(encrypted_file, compression.get("default"))
+        try:
+            parse_compression(compression)
+        except ValueError as e:
+            logger.warning("压缩设置无效，按不压缩处理: %s", e)
+            return None
+        return compression
+
+    @staticmethod
+    def bookmark_sharding() -> Optional[str]:
+        """书签分片方式："category"、"hash:N"，未设置时不分片"""
+        sharding = StorageSettings.load_settings().get("bookmark_shards")
+        if not sharding or str(sharding).lower() == "none":
+            return None
+        sharding = str(sharding).lower()
+        mode, _, buckets = sharding.partition(':')
+        if mode not in ("category", "hash") or (buckets and not buckets.isdigit()) or buckets == "0":
+            logger.warning("书签分片设置无效，按不分片处理: %s", sharding)
+            return None
+        return sharding
+
+    @staticmethod
+    def db_file() -> str:
+        """数据库文件路径"""
+        return StorageSettings.load_settings().get("db_file", StorageSettings.default_db_file)
+
+
+class SqliteItemStore:
+    """单张数据表的加密存储"""
+
+    # 同一数据库文件的各张表共用一个连接
+    _connections: Dict[str, sqlite3.Connection] = {}
+    _locks: Dict[str, threading.RLock] = {}
+    _connections_lock = threading.Lock()
+
+    def __init__(self, table: str, search_fields: Iterable[str] = (), db_file: str = None):
+        self.table = table
+        self.search_fields = tuple(search_fields)
+        self.db_file = db_file or StorageSettings.db_file()
+        self.encryption_key = None
+        self.index_key = None
+        self._conn = None
+        self._lock = None
+
+    def set_encryption_key(self, key: str):
+        """设置加密密钥，盲索引使用由其派生的独立密钥"""
+        self.encryption_key = key
+        self.index_key = hashlib.sha256(("nuoqin-index:" + key).encode('utf-8')).digest()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """数据库连接（首次使用时打开并建表）"""
+        if self._conn is None:
+            self._open()
+        return self._conn
+
+    def _open(self):
+        path = os.path.abspath(self.db_file)
+        with SqliteItemStore._connections_lock:
+            conn = SqliteItemStore._connections.get(path)
+            if conn is None:
+                db_dir = os.path.dirname(path)
+                if db_dir:
+                    os.makedirs(db_dir, exist_ok=True)
+                # 连接在线程间共享，由 _locks 中的锁保证串行访问
+                conn = sqlite3.connect(path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA foreign_keys=ON")
+                SqliteItemStore._connections[path] = conn
+                SqliteItemStore._locks[path] = threading.RLock()
+            self._conn = conn
+            self._lock = SqliteItemStore._locks[path]
+
+        t = self.table
+        with self._lock, conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {t} (
+                    id TEXT PRIMARY KEY,
+                    position INTEGER NOT NULL DEFAULT 0,
+                    payload TEXT NOT NULL
+                )""")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{t}_position ON {t}(position)")
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {t}_tokens (
+                    token BLOB NOT NULL,
+                    item_id TEXT NOT NULL REFERENCES {t}(id) ON DELETE CASCADE,
+                    PRIMARY KEY (token, item_id)
+                ) WITHOUT ROWID""")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{t}_tokens_item ON {t}_tokens(item_id)")
+            # 记录已完成初始导入的表，表被清空后不会再次从旧文件导入
+            conn.execute("CREATE TABLE IF NOT EXISTS store_meta (name TEXT PRIMARY KEY)")
+
+    def blind(self, text: str) -> bytes:
+        """计算盲索引值"""
+        return hmac.new(self.index_key, text.encode('utf-8'), hashlib.sha256).digest()[:12]
+
+    @staticmethod
+    def grams(text: str) -> Set[str]:
+        """文本的双字片段（不含单字）"""
+        text = text.lower()
+        return {text[i:i + 2] for i in range(len(text) - 1)}
+
+    def _tokens(self, data: Dict) -> Set[bytes]:
+        grams = set()
+        for field in self.search_fields:
+            value = data.get(field, '') or ''
+            if isinstance(value, list):
+                # 标签等列表字段按空格连接，与内存搜索使用的文本一致
+                value = " ".join(map(str, value))
+            grams |= self.grams(str(value))
+        return {self.blind(gram) for gram in grams}
+
+    def _row(self, data: Dict) -> tuple:
+        payload = json.dumps(CryptoAesUtils.encrypt_json_data(data, self.encryption_key, use_simple_key=True))
+        return data['id'], payload
+
+    @staticmethod
+    def probe_key(key: str, tables: Iterable[str], db_file: str = None) -> Optional[bool]:
+        """用密钥解密各表的第一个条目（验证旧版数据的访问码，不使用共享连接）
+
+        全部能解密时返回 True，有无法解密的返回 False，各表都没有条目时返回 None。
+        """
+        conn = sqlite3.connect(db_file or StorageSettings.db_file())
+        try:
+            result = None
+            for table in tables:
+                try:
+                    row = conn.execute(f"SELECT payload FROM {table} LIMIT 1").fetchone()
+                except sqlite3.OperationalError:
+                    # 数据表不存在
+                    continue
+                if row is None:
+                    continue
+                try:
+                    CryptoAesUtils.decrypt_json_data(json.loads(row[0]), key)
+                    result = True
+                except Exception:
+                    return False
+            return result
+        finally:
+            conn.close()
+
+    def is_initialized(self) -> bool:
+        """是否已完成初始导入"""
+        with self._locked():
+            row = self.conn.execute("SELECT 1 FROM store_meta WHERE name = ?", (self.table,)).fetchone()
+        return row is not None
+
+    def load_all(self) -> List[Dict]:
+        """按顺序解密全部条目"""
+        with self._locked():
+            rows = self.conn.execute(f"SELECT payload FROM {self.table} ORDER BY position").fetchall()
+        return [CryptoAesUtils.decrypt_json_data(json.loads(payload), self.encryption_key)
+                for (payload,) in rows]
+
+    def replace_all(self, data: List[Dict]):
+        """整表替换为给定列表（用于迁移和整体保存）"""
+        with self._locked(), self.conn as conn:
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.execute("INSERT OR IGNORE INTO store_meta (name) VALUES (?)", (self.table,))
+            for position, item in enumerate(data):
+                item_id, payload = self._row(item)
+                conn.execute(f"INSERT INTO {self.table} (id, position, payload) VALUES (?, ?, ?)",
+                             (item_id, position, payload))
+                self._write_tokens(conn, item_id, item)
+
+    def compact(self):
+        """整理数据库文件，清除已删除的行在空闲页中的残留（如改用新密钥重新加密之后）"""
+        with self._locked():
+            self.conn.execute("VACUUM")
+
+    def write(self, changed: Iterable[Dict] = (), deleted: Iterable[str] = ()):
+        """在一个事务内写入变化的条目和删除的条目
+
+        新条目排在最前面，已有条目保持原位置。
+        """
+        with self._locked(), self.conn as conn:
+            for item_id in deleted:
+                conn.execute(f"DELETE FROM {self.table} WHERE id = ?", (item_id,))
+            for item in changed:
+                item_id, payload = self._row(item)
+                conn.execute(
+                    f"INSERT INTO {self.table} (id, position, payload) "
+                    f"VALUES (?, (SELECT COALESCE(MIN(position), 0) - 1 FROM {self.table}), ?) "
+                    f"ON CONFLICT(id) DO UPDATE SET payload = excluded.payload",
+                    (item_id, payload))
+                conn.execute(f"DELETE FROM {self.table}_tokens WHERE item_id = ?", (item_id,))
+                self._write_tokens(conn, item_id, item)
+
+    def _write_tokens(self, conn: sqlite3.Connection, item_id: str, item: Dict):
+        if self.search_fields:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {self.table}_tokens (token, item_id) VALUES (?, ?)",
+                [(token, item_id) for token in self._tokens(item)])
+
+    def search_ids(self, query: str) -> Set[str]:
+        """按盲索引查找可能包含查询内容的条目ID
+
+        返回的是候选集合（片段都命中），调用方仍需对明文做一次确认。
+        盲索引不含单字，少于两个字的查询抛出 ValueError（调用方应直接在内存中搜索）。
+        """
+        grams = self.grams(query)
+        if not grams:
+            raise ValueError("少于两个字的查询不能使用盲索引")
+        tokens = [self.blind(gram) for gram in grams]
+        placeholders = ",".join("?" * len(tokens))
+        with self._locked():
+            rows = self.conn.execute(
+                f"SELECT item_id FROM {self.table}_tokens WHERE token IN ({placeholders}) "
+                f"GROUP BY item_id HAVING COUNT(*) = ?",
+                (*tokens, len(tokens))).fetchall()
+        return {item_id for (item_id,) in rows}
+
+    def _locked(self):
+        if self._lock is None:
+            self._open()
+        return self._lock
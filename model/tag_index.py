@@ -0,0 +1,152 @@
+"""标签索引
+
+每个条目分配一个序号，每个标签用一个整数位图记录带有该标签的条目序号。
+多标签筛选（全部包含 / 任一包含 / 排除）直接对位图做与、或、非运算，
+各标签的条目数即位图中 1 的个数，不需要遍历条目。
+删除条目空出的序号留给之后新增的条目，位图保持紧凑。
+索引在第一次使用时建立，之后随增删改增量维护。
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+
+def normalize_tags(tags: Iterable[str]) -> List[str]:
+    """整理标签：去掉首尾空白和空标签，去重并保持原有顺序"""
+    result = []
+    for tag in tags or ():
+        tag = str(tag).strip()
+        if tag and tag not in result:
+            result.append(tag)
+    return result
+
+
+def parse_tags(text: str) -> List[str]:
+    """解析输入框中的标签（逗号、中文逗号或空格分隔）"""
+    return normalize_tags((text or '').replace('，', ',').replace(' ', ',').split(','))
+
+
+class TagIndex:
+    """条目的标签位图索引，标签不区分大小写"""
+
+    def __init__(self, items_getter: Callable[[], list]):
+        self.items_getter = items_getter
+        # 标签（小写） -> 位图
+        self._bitmaps: Optional[Dict[str, int]] = None
+        # 标签（小写） -> 显示用的标签名（第一次出现时的写法）
+        self._names: Dict[str, str] = {}
+        # 条目ID -> 序号，序号 -> 条目ID（空出的序号为 None）
+        self._ordinals: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []
+        self._free: List[int] = []
+        # 条目ID -> 条目当前的标签（小写）
+        self._item_tags: Dict[str, tuple] = {}
+
+    def _build(self):
+        self._bitmaps = {}
+        self._names = {}
+        self._ordinals = {}
+        self._ids = []
+        self._free = []
+        self._item_tags = {}
+        for item in self.items_getter():
+            self._add(item)
+        logger.debug("已建立标签索引: %d 个标签", len(self._bitmaps))
+
+    def _add(self, item):
+        if self._free:
+            ordinal = self._free.pop()
+            self._ids[ordinal] = item.id
+        else:
+            ordinal = len(self._ids)
+            self._ids.append(item.id)
+        self._ordinals[item.id] = ordinal
+        keys = []
+        for tag in item.tags:
+            key = tag.casefold()
+            if key in keys:
+                continue
+            keys.append(key)
+            self._names.setdefault(key, tag)
+            self._bitmaps[key] = self._bitmaps.get(key, 0) | (1 << ordinal)
+        self._item_tags[item.id] = tuple(keys)
+
+    def reset(self):
+        """数据整体变化后丢弃索引，下次使用时重建"""
+        self._bitmaps = None
+
+    def added(self, item):
+        if self._bitmaps is not None:
+            self._add(item)
+
+    def updated(self, item):
+        if self._bitmaps is not None:
+            self.removed(item.id)
+            self._add(item)
+
+    def removed(self, item_id: str):
+        if self._bitmaps is None:
+            return
+        ordinal = self._ordinals.pop(item_id, None)
+        if ordinal is None:
+            return
+        mask = ~(1 << ordinal)
+        for key in self._item_tags.pop(item_id, ()):
+            bitmap = self._bitmaps[key] & mask
+            if bitmap:
+                self._bitmaps[key] = bitmap
+            else:
+                del self._bitmaps[key]
+                self._names.pop(key, None)
+        self._ids[ordinal] = None
+        self._free.append(ordinal)
+
+    def _bitmap(self, tag: str) -> int:
+        return self._bitmaps.get(tag.strip().casefold(), 0)
+
+    def _all_bits(self) -> int:
+        bits = (1 << len(self._ids)) - 1
+        for ordinal in self._free:
+            bits &= ~(1 << ordinal)
+        return bits
+
+    def select(self, all_of: Iterable = (), none_of: Iterable[str] = ()) -> Set[str]:
+        """按标签筛选，返回条目ID集合
+
+        all_of 的每一项为一个标签或一组标签（组内任一包含即可），各项都要满足；
+        none_of 中的标签都不能包含。两者都为空时返回全部条目。
+        """
+        if self._bitmaps is None:
+            self._build()
+        bits = None
+        for group in all_of:
+            group_bits = 0
+            for tag in ([group] if isinstance(group, str) else group):
+                group_bits |= self._bitmap(tag)
+            bits = group_bits if bits is None else bits & group_bits
+            if not bits:
+                return set()
+        if bits is None:
+            bits = self._all_bits()
+        for tag in none_of:
+            bits &= ~self._bitmap(tag)
+        return self._decode(bits)
+
+    def _decode(self, bits: int) -> Set[str]:
+        """位图 -> 条目ID集合"""
+        ids = set()
+        while bits:
+            low = bits & -bits
+            ids.add(self._ids[low.bit_length() - 1])
+            bits ^= low
+        return ids
+
+    def counts(self) -> Dict[str, int]:
+        """各标签的条目数"""
+        if self._bitmaps is None:
+            self._build()
+        return {self._names[key]: bitmap.bit_count() for key, bitmap in self._bitmaps.items()}
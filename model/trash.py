@@ -0,0 +1,156 @@
+"""回收站
+
+删除的条目不立即从存储中移除：条目记录删除时间（deleted_time）后移入回收站，
+从列表和各索引中消失，可以恢复。删除标记先积累在内存中，积累一定数量或经过一段时间后
+在后台一次写入；彻底删除和超过保留期限的条目也在后台分批清除，每批只写入一次。
+程序异常退出时尚未写入的删除标记会丢失，条目会重新出现，但不会丢失数据。
+"""
+
+import atexit
+import threading
+import weakref
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+# 回收站中的条目保留的天数
+RETENTION_DAYS = 30
+# 积累多少个删除标记后尽快写入（不再等待 FLUSH_DELAY）
+FLUSH_EVENTS = 50
+# 有未写入的删除标记时，最多等待多少秒写入
+FLUSH_DELAY = 10.0
+# 每批彻底清除的条目数，以及还有剩余时下一批的间隔（秒）
+PURGE_BATCH = 200
+PURGE_DELAY = 2.0
+
+# 尚未回收的回收站实例，退出时写入它们未完成的工作（有待写入工作时计时器持有实例）
+_instances: "weakref.WeakSet[Trash]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for trash in list(_instances):
+        trash.flush(None)
+
+
+class Trash:
+    """管理器的回收站
+
+    write(changed, deleted) 由管理器提供：保存修改了删除标记的条目，彻底清除给定ID的条目。
+    write 在后台计时器线程中调用，管理器需保证它与界面线程的保存操作互斥。
+    """
+
+    def __init__(self, write: Callable[[list, List[str]], None]):
+        self.write = write
+        # 条目ID -> 回收站中的条目
+        self._items: Dict[str, object] = {}
+        # 删除标记有变化、尚未写入的条目
+        self._pending: Dict[str, object] = {}
+        # 等待彻底清除的条目ID
+        self._purge: List[str] = []
+        self._timer = None
+        self._lock = threading.RLock()
+        # 退出时写入全部未完成的工作
+        _instances.add(self)
+
+    def reset(self, items: Iterable):
+        """加载数据后设置回收站中的条目，超过保留期限的安排清除"""
+        with self._lock:
+            self._items = {item.id: item for item in items}
+            self._pending = {}
+            self._purge = []
+            cutoff = (datetime.now() - timedelta(days=RETENTION_DAYS)).isoformat()
+            expired = [item_id for item_id, item in self._items.items() if item.deleted_time < cutoff]
+            if expired:
+                logger.info("回收站中有 %d 个条目已超过保留期限", len(expired))
+                self.discard(expired)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, item_id: str) -> Optional[object]:
+        return self._items.get(item_id)
+
+    def items(self) -> list:
+        """回收站中的条目，最近删除的在前"""
+        with self._lock:
+            items = list(self._items.values())
+        return sorted(items, key=lambda item: item.deleted_time, reverse=True)
+
+    def put(self, items: list):
+        """标记删除并移入回收站（删除标记稍后批量写入）"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            for item in items:
+                item.deleted_time = now
+                self._items[item.id] = item
+                self._pending[item.id] = item
+            self._schedule(len(self._pending) >= FLUSH_EVENTS)
+
+    def take(self, item_ids: Iterable[str]) -> list:
+        """从回收站取出条目并清除删除标记（由调用方保存），返回取出的条目"""
+        items = []
+        with self._lock:
+            for item_id in item_ids:
+                item = self._items.pop(item_id, None)
+                if item is not None:
+                    self._pending.pop(item_id, None)
+                    item.deleted_time = ""
+                    items.append(item)
+        return items
+
+    def discard(self, item_ids: Iterable[str]) -> int:
+        """彻底删除回收站中的条目（后台分批清除），返回条数"""
+        count = 0
+        with self._lock:
+            for item_id in item_ids:
+                if self._items.pop(item_id, None) is not None:
+                    self._pending.pop(item_id, None)
+                    self._purge.append(item_id)
+                    count += 1
+            if count:
+                self._schedule(True)
+        return count
+
+    def _schedule(self, soon: bool):
+        """安排后台写入：soon 为 True 时很快写入，否则在 FLUSH_DELAY 秒后"""
+        if self._timer is not None:
+            if not soon:
+                return
+            self._timer.cancel()
+        self._timer = threading.Timer(PURGE_DELAY if soon else FLUSH_DELAY, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self, batch: Optional[int] = PURGE_BATCH):
+        """写入删除标记并清除一批条目（batch 为 None 时全部清除），剩余的安排下一批"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            changed = list(self._pending.values())
+            purge = self._purge[:batch] if batch else list(self._purge)
+            if not changed and not purge:
+                return
+            self._pending = {}
+            del self._purge[:len(purge)]
+        # 保存时不持有回收站的锁，避免与管理器的保存互相等待
+        try:
+            self.write(changed, purge)
+            logger.debug("回收站已写入 %d 个删除标记，清除 %d 个条目", len(changed), len(purge))
+        except Exception as e:
+            logger.warning("回收站写入失败: %s", e)
+            with self._lock:
+                for item in changed:
+                    if item.id in self._items:
+                        self._pending.setdefault(item.id, item)
+                self._purge[:0] = purge
+                self._schedule(False)
+            return
+        with self._lock:
+            if self._purge and self._timer is None:
+                self._schedule(True)
@@ -0,0 +1,198 @@
+"""使用记录与常用度（frecency）
+
+复制密码、打开书签时记录一次使用。使用记录先保存在内存中，
+积累一定数量或经过一段时间后一次写入单独的小文件（如 config/passwords_usage.json），
+不触发数据文件的整体保存。文件中只有条目ID、使用次数和最近几次使用的时间，
+设置了加密密钥时整个文件加密保存。
+
+常用度参照 Firefox 的 frecency：取最近几次使用，按距今时间给出权重，
+平均权重乘以总使用次数。常用度决定默认排序，并在搜索排序时适当加分。
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+
+from utils.crypto_utils import CryptoAesUtils
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+# 参与计算的最近使用次数
+RECENT_VISITS = 10
+# 距今天数上限 -> 权重
+AGE_WEIGHTS = ((4, 100), (14, 70), (31, 50), (90, 30))
+OLD_WEIGHT = 10
+# 积累多少次使用后立即写入
+FLUSH_EVENTS = 20
+# 有未写入的使用记录时，最多等待多少秒写入
+FLUSH_DELAY = 30.0
+# 搜索排序的最大加分比例，以及加分达到一半时的常用度
+SEARCH_BOOST = 0.3
+SEARCH_BOOST_HALF = 200.0
+
+_DAY = 86400
+
+# 尚未回收的使用记录实例，退出时写入未保存的记录（有待写入记录时计时器持有实例）
+_instances: "weakref.WeakSet[UsageStats]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for usage in list(_instances):
+        usage.flush()
+
+
+def usage_file_for(data_file: str) -> str:
+    """数据文件对应的使用记录文件：config/passwords.json -> config/passwords_usage.json"""
+    return os.path.splitext(data_file)[0] + "_usage.json"
+
+
+def visit_weight(age_seconds: float) -> int:
+    """单次使用按距今时间的权重"""
+    days = age_seconds / _DAY
+    for max_days, weight in AGE_WEIGHTS:
+        if days <= max_days:
+            return weight
+    return OLD_WEIGHT
+
+
+class UsageStats:
+    """条目的使用记录"""
+
+    def __init__(self, usage_file: str):
+        self.usage_file = usage_file
+        # 条目ID -> {"count": 使用次数, "visits": 最近使用的时间戳（升序）}
+        self._entries: Optional[Dict[str, dict]] = None
+        self.encryption_key = None
+        self._pending = 0
+        self._timer = None
+        self._lock = threading.RLock()
+        _instances.add(self)
+
+    def set_encryption_key(self, key: str):
+        """设置加密密钥（已读取的记录没有未写入的修改时，按新密钥重新读取）"""
+        with self._lock:
+            self.encryption_key = key
+            if not self._pending:
+                self._entries = None
+
+    def reencrypt(self, new_key: str, old_key: str):
+        """改用新密钥重新加密保存（旧版数据迁移使用），文件按新密钥或原密钥读取"""
+        with self._lock:
+            if not os.path.exists(self.usage_file):
+                self.set_encryption_key(new_key)
+                return
+            self._entries = self._read((new_key, old_key))
+            self.encryption_key = new_key
+            self._pending += 1
+            self.flush()
+            if self._pending:
+                raise Exception("保存使用记录失败")
+
+    def _read(self, keys) -> Dict[str, dict]:
+        """读取使用记录文件，已加密时依次尝试 keys 中的密钥"""
+        if not os.path.exists(self.usage_file):
+            return {}
+        with open(self.usage_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if 'iv' not in data:
+            return data
+        keys = [key for key in keys if key]
+        if not keys:
+            raise Exception("使用记录已加密，需要访问密码")
+        for key in keys[:-1]:
+            try:
+                return CryptoAesUtils.decrypt_json_data(data, key)
+            except Exception:
+                pass
+        return CryptoAesUtils.decrypt_json_data(data, keys[-1])
+
+    def _load(self) -> Dict[str, dict]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = {}
+                try:
+                    self._entries = self._read((self.encryption_key,))
+                except Exception as e:
+                    logger.warning("加载使用记录失败: %s", e)
+            return self._entries
+
+    def record(self, item_id: str, timestamp: float = None):
+        """记录一次使用（只更新内存，稍后批量写入）"""
+        with self._lock:
+            entry = self._load().setdefault(item_id, {"count": 0, "visits": []})
+            entry["count"] += 1
+            entry["visits"] = (entry["visits"] + [timestamp or time.time()])[-RECENT_VISITS:]
+            self._changed()
+
+    def forget(self, item_id: str):
+        """条目删除后丢弃其使用记录"""
+        with self._lock:
+            if self._load().pop(item_id, None) is not None:
+                self._changed()
+
+    def _changed(self):
+        """积累到一定数量时立即写入，否则在 FLUSH_DELAY 秒后写入"""
+        self._pending += 1
+        if self._pending >= FLUSH_EVENTS:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(FLUSH_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """写入未保存的使用记录"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.usage_file) or '.', exist_ok=True)
+                data = self._entries
+                if self.encryption_key:
+                    data = CryptoAesUtils.encrypt_json_data(data, self.encryption_key, use_simple_key=True)
+                temp_file = self.usage_file + ".tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, separators=(',', ':'))
+                os.replace(temp_file, self.usage_file)
+                logger.debug("已写入 %d 次使用记录", self._pending)
+                self._pending = 0
+            except Exception as e:
+                logger.warning("保存使用记录失败: %s", e)
+
+    def frecency(self, item_id: str, now: float = None) -> float:
+        """常用度：最近几次使用的平均权重乘以总使用次数，未使用过为 0"""
+        entry = self._load().get(item_id)
+        if not entry or not entry["visits"]:
+            return 0.0
+        now = now or time.time()
+        weights = [visit_weight(now - visit) for visit in entry["visits"]]
+        return entry["count"] * sum(weights) / len(weights)
+
+    def search_boost(self, item_id: str) -> float:
+        """搜索得分的加权系数（1 到 1 + SEARCH_BOOST）"""
+        frecency = self.frecency(item_id)
+        if not frecency:
+            return 1.0
+        return 1.0 + SEARCH_BOOST * frecency / (frecency + SEARCH_BOOST_HALF)
+
+    def ranked(self, items) -> list:
+        """使用过的条目按常用度从高到低排列（默认顺序中排在最前面，其余条目保持原有顺序）
+
+        items 为管理器的条目集合（OrderedItems），按使用记录中的ID查找，不遍历全部条目。
+        """
+        with self._lock:
+            item_ids = list(self._load())
+        now = time.time()
+        used = [item for item in map(items.get, item_ids) if item is not None]
+        used.sort(key=lambda item: (-self.frecency(item.id, now), item.order))
+        return used
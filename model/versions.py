@@ -0,0 +1,167 @@
+"""条目的历史版本
+
+修改条目时，把变化字段修改前的值作为一条记录追加到该条目自己的历史文件
+（如 config/passwords_versions/<条目ID>.log，每行一条记录），设置了加密密钥时每行单独加密。
+追加只写入一行，不触发数据文件的保存；加载数据时不读取历史文件。
+每个文件的记录数记在内存中（首次追加时数一次），超过 TRIM_AT 条时在追加后丢弃最早的记录，
+只保留 MAX_VERSIONS 条，这样重写文件分摊到多次追加中。
+
+查看历史时才读取该条目的文件：从当前内容开始逐条反向应用记录，得到各个旧版本。
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, List
+
+from utils.crypto_utils import CryptoAesUtils
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+# 每个条目最多保留的历史版本数
+MAX_VERSIONS = 50
+# 历史文件的记录数超过这个值时才裁剪回 MAX_VERSIONS 条
+TRIM_AT = 2 * MAX_VERSIONS
+
+
+def versions_dir_for(data_file: str) -> str:
+    """数据文件对应的历史版本目录：config/passwords.json -> config/passwords_versions"""
+    return os.path.splitext(data_file)[0] + "_versions"
+
+
+class VersionHistory:
+    """条目的历史版本，fields 为记录的字段"""
+
+    def __init__(self, directory: str, fields: Iterable[str]):
+        self.directory = directory
+        self.fields = tuple(fields)
+        self.encryption_key = None
+        # 条目ID -> 历史文件中的记录数（追加过的条目）
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def set_encryption_key(self, key: str):
+        """设置加密密钥"""
+        self.encryption_key = key
+
+    def _file(self, item_id: str) -> str:
+        name = item_id if re.fullmatch(r"[\w.-]+", item_id) else hashlib.sha1(item_id.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + ".log")
+
+    def _encode(self, record: Dict) -> str:
+        if self.encryption_key:
+            record = CryptoAesUtils.encrypt_json_data(record, self.encryption_key, use_simple_key=True)
+        return json.dumps(record, ensure_ascii=False)
+
+    def _decode(self, line: str, keys: Iterable[str] = None) -> Dict:
+        """解码一行记录，已加密时依次尝试 keys 中的密钥（默认为当前密钥）"""
+        record = json.loads(line)
+        if 'iv' in record:
+            keys = [key for key in (keys or (self.encryption_key,)) if key]
+            if not keys:
+                raise Exception("历史版本已加密，需要访问密码")
+            for key in keys[:-1]:
+                try:
+                    return CryptoAesUtils.decrypt_json_data(record, key)
+                except Exception:
+                    pass
+            record = CryptoAesUtils.decrypt_json_data(record, keys[-1])
+        return record
+
+    @staticmethod
+    def _read_lines(path: str) -> List[str]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return [line for line in f.read().splitlines() if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _rewrite(path: str, lines: List[str]):
+        """整体重写历史文件（先写临时文件再替换）"""
+        temp_file = path + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write("".join(line + "\n" for line in lines))
+        os.replace(temp_file, path)
+
+    def record(self, item_id: str, before: Dict, after: Dict) -> bool:
+        """修改后记录修改前的版本（只保存变化字段的旧值），没有变化时返回 False
+
+        before / after 为修改前后的字段值，before 中的 updated_time 为旧版本的时间。
+        """
+        changed = {field: before[field] for field in self.fields
+                   if field in before and field in after and before[field] != after[field]}
+        if not changed:
+            return False
+        line = self._encode({'time': before.get('updated_time', ''), 'fields': changed})
+        try:
+            with self._lock:
+                os.makedirs(self.directory, exist_ok=True)
+                path = self._file(item_id)
+                count = self._counts.get(item_id)
+                if count is None:
+                    count = len(self._read_lines(path))
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(line + "\n")
+                count += 1
+                if count > TRIM_AT:
+                    # 丢弃最早的记录（逐行加密，不需要重新加密）
+                    self._rewrite(path, self._read_lines(path)[-MAX_VERSIONS:])
+                    count = MAX_VERSIONS
+                self._counts[item_id] = count
+        except Exception as e:
+            # 历史版本写入失败不影响修改本身
+            logger.warning("保存历史版本失败: %s", e)
+            return False
+        return True
+
+    def versions(self, item) -> List[Dict]:
+        """条目的各个版本，最新的（当前内容）在前
+
+        每个版本包含记录的字段、time（成为当前内容的时间）和 changed（与更早一个版本相比变化的字段）。
+        """
+        with self._lock:
+            # 追加时超过 TRIM_AT 条才裁剪，文件中可能多于 MAX_VERSIONS 条，只取最近的
+            lines = self._read_lines(self._file(item.id))[-MAX_VERSIONS:]
+        state = {field: getattr(item, field) for field in self.fields}
+        versions = [dict(state, time=item.updated_time, changed=[])]
+        for line in reversed(lines):
+            try:
+                record = self._decode(line)
+            except Exception as e:
+                logger.warning("读取历史版本失败: %s", e)
+                continue
+            versions[-1]['changed'] = [field for field in record['fields'] if field in state]
+            state = dict(state, **record['fields'])
+            versions.append(dict(state, time=record.get('time', ''), changed=[]))
+        return versions
+
+    def reencrypt(self, new_key: str, old_key: str):
+        """改用新密钥重新加密全部历史版本（旧版数据迁移使用），每行按新密钥或原密钥读取"""
+        with self._lock:
+            self.encryption_key = new_key
+            self._counts = {}
+            if not os.path.isdir(self.directory):
+                return
+            for name in os.listdir(self.directory):
+                if not name.endswith(".log"):
+                    continue
+                path = os.path.join(self.directory, name)
+                lines = self._read_lines(path)[-MAX_VERSIONS:]
+                self._rewrite(path, [self._encode(self._decode(line, (new_key, old_key))) for line in lines])
+
+    def forget(self, item_ids: Iterable[str]):
+        """条目彻底删除后删除其历史版本"""
+        with self._lock:
+            for item_id in item_ids:
+                self._counts.pop(item_id, None)
+                try:
+                    os.remove(self._file(item_id))
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning("删除历史版本失败: %s", e)
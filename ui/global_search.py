@@ -0,0 +1,130 @@
+"""全局搜索对话框
+
+Ctrl+K 打开，同时搜索密码、书签和书签分类，结果按相关度合并显示。
+回车或双击执行结果对应的操作：复制密码、打开网址、跳转到分类。
+"""
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel, QApplication
+)
+from PyQt5.QtGui import QDesktopServices
+from PyQt5.QtCore import Qt, QUrl, pyqtSignal
+
+from utils.messagebox import NMessageBox
+from utils.style import StyleQLineEditManager
+from model import ManagerRegistry
+from model.global_search import GlobalSearch, KIND_PASSWORD, KIND_BOOKMARK, KIND_CATEGORY
+
+
+# 结果类型的显示名称
+KIND_LABELS = {KIND_PASSWORD: "密码", KIND_BOOKMARK: "书签", KIND_CATEGORY: "分类"}
+
+
+class GlobalSearchDialog(QDialog):
+    """全局搜索对话框"""
+
+    # 选择了分类结果，参数为分类名称
+    category_requested = pyqtSignal(str)
+
+    def __init__(self, parent=None, encryption_key: str = None):
+        super().__init__(parent)
+        self.encryption_key = encryption_key
+        self.searcher = None
+        self.hits = []
+        self.setWindowTitle("全局搜索")
+        self.setMinimumSize(520, 380)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(8)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("搜索密码、书签和分类（支持拼音和首字母）...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setFixedHeight(34)
+        StyleQLineEditManager.set_style_search_default(self.search_edit)
+        self.search_edit.textChanged.connect(self.run_search)
+        self.search_edit.returnPressed.connect(self.activate_current)
+        # 在输入框中也可以用上下键选择结果
+        self.search_edit.installEventFilter(self)
+        layout.addWidget(self.search_edit)
+
+        self.result_list = QListWidget()
+        self.result_list.itemActivated.connect(lambda _: self.activate_current())
+        layout.addWidget(self.result_list)
+
+        self.status_label = QLabel("回车：复制密码 / 打开网址 / 跳转到分类")
+        self.status_label.setStyleSheet("color: #888888; font-size: 12px;")
+        layout.addWidget(self.status_label)
+
+    def eventFilter(self, obj, event):
+        if obj is self.search_edit and event.type() == event.KeyPress and \
+                event.key() in (Qt.Key_Up, Qt.Key_Down) and self.result_list.count():
+            step = -1 if event.key() == Qt.Key_Up else 1
+            row = max(0, min(self.result_list.count() - 1, self.result_list.currentRow() + step))
+            self.result_list.setCurrentRow(row)
+            return True
+        return super().eventFilter(obj, event)
+
+    def prepare(self) -> bool:
+        """加载共享的管理器（已加载过的不再加载），失败时返回 False"""
+        password_manager = ManagerRegistry.password_manager(self.encryption_key)
+        bookmark_manager = ManagerRegistry.bookmark_manager(self.encryption_key)
+        category_manager = ManagerRegistry.category_manager(self.encryption_key)
+        try:
+            ManagerRegistry.ensure_loaded(password_manager, category_manager, bookmark_manager)
+        except Exception as e:
+            NMessageBox.critical(self.parentWidget(), "加载失败", f"加载数据时发生错误：\n{str(e)}")
+            return False
+        self.searcher = GlobalSearch(password_manager, bookmark_manager, category_manager)
+        return True
+
+    def open_search(self):
+        """显示对话框并选中上次的输入，结果按当前数据重新搜索"""
+        if not self.prepare():
+            return
+        self.run_search()
+        self.search_edit.selectAll()
+        self.search_edit.setFocus()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def run_search(self):
+        """按输入内容搜索并显示结果"""
+        if self.searcher is None:
+            return
+        self.hits = self.searcher.search(self.search_edit.text())
+        self.result_list.clear()
+        for hit in self.hits:
+            text = f"[{KIND_LABELS[hit.kind]}] {hit.title}"
+            if hit.detail:
+                text += f"    {hit.detail}"
+            self.result_list.addItem(QListWidgetItem(text))
+        if self.hits:
+            self.result_list.setCurrentRow(0)
+        elif self.search_edit.text().strip():
+            self.status_label.setText("没有找到匹配的结果")
+            return
+        self.status_label.setText("回车：复制密码 / 打开网址 / 跳转到分类")
+
+    def activate_current(self):
+        """执行当前选中结果的操作"""
+        row = self.result_list.currentRow()
+        if not 0 <= row < len(self.hits):
+            return
+        hit = self.hits[row]
+        if hit.kind == KIND_PASSWORD:
+            QApplication.clipboard().setText(hit.item.password)
+            self.searcher.password_manager.record_use(hit.item.id)
+        elif hit.kind == KIND_BOOKMARK:
+            url = hit.item.url
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+            QDesktopServices.openUrl(QUrl(url))
+            self.searcher.bookmark_manager.record_use(hit.item.id)
+        elif hit.kind == KIND_CATEGORY:
+            self.category_requested.emit(hit.title)
+        self.accept()
@@ -3,12 +3,12 @@ import os
 import sys
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton,
-    QHBoxLayout, QStackedWidget, QFrame, QSpacerItem, QSizePolicy
+    QHBoxLayout, QStackedWidget, QFrame, QSpacerItem, QSizePolicy, QShortcut
 )
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtGui import QIcon, QFont, QKeySequence
 from PyQt5.QtCore import QSize, Qt
 
-from .pages import HomePage, PasswordManagerPage, BookmarkManagerPage, BookmarkCategoryManagerPage, SettingsPage, GenericPage
+from .pages import load_page_class
 from utils.menu_utils import load_menu_config
 
 
@@ -49,6 +49,10 @@ class NavBar(QWidget):
         self.stack = QStackedWidget()
         stack_layout.addWidget(self.stack)
 
+        # 页面按需创建：堆叠窗口里先放占位控件，首次切换到该页时再创建真实页面
+        self.page_names = []
+        self.pages = {}
+
         # 从配置文件读取菜单项并动态生成按钮
         self.buttons = []
         menu_items = self.config.get("menu_items", [])
@@ -66,9 +70,6 @@ class NavBar(QWidget):
             text = item.get("text", "未命名")
             icon_path = item.get("icon", "")
             
-            # 创建对应的页面
-            page = self.create_page_by_name(text)
-            
             # 创建按钮
             btn = QPushButton(text)
             if icon_path and os.path.exists(icon_path):
@@ -76,12 +77,12 @@ class NavBar(QWidget):
             btn.setIconSize(QSize(24, 24))
             btn.setFixedHeight(button_height)
             btn.setFont(QFont(font_family, font_size))
-            btn.setStyleSheet(self.get_btn_style(False))
+            btn.setStyleSheet(self.get_btn_style())
             btn.setCursor(Qt.PointingHandCursor)
 
             nav_layout.addWidget(btn)
             self.buttons.append(btn)
-            self.stack.addWidget(page)
+            self.add_page_placeholder(text)
 
             btn.clicked.connect(lambda _, i=idx: self.switch_page(i))
 
@@ -102,12 +103,12 @@ class NavBar(QWidget):
             setting_btn.setIconSize(QSize(24, 24))
             setting_btn.setFixedHeight(button_height)
             setting_btn.setFont(QFont(font_family, font_size))
-            setting_btn.setStyleSheet(self.get_btn_style(False))
+            setting_btn.setStyleSheet(self.get_btn_style())
             setting_btn.setCursor(Qt.PointingHandCursor)
             nav_layout.addWidget(setting_btn)
 
             self.buttons.append(setting_btn)
-            self.stack.addWidget(self.create_page_by_name(text))
+            self.add_page_placeholder(text)
 
             setting_btn.clicked.connect(lambda _, i=self.setting_index: self.switch_page(i))
 
@@ -118,59 +119,103 @@ class NavBar(QWidget):
         main_layout.addWidget(nav_widget, 0)  # 左侧固定宽度，不拉伸
         main_layout.addWidget(stack_container, 1)  # 右侧自适应剩余空间
 
-    def get_btn_style(self, active=False):
-        """按钮样式（圆角+高亮）"""
-        if active:
-            return """
-                QPushButton {
-                    background-color: #d6eaff;
-                    border-radius: 2px;
-                    text-align: left;
-                    padding-left: 8px;
-                    font-weight: bold;
-                }
-            """
-        else:
-            return """
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 2px;
-                    text-align: left;
-                    padding-left: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #e6f0ff;
-                }
-            """
+        # 全局搜索（Ctrl+K），对话框在第一次使用时创建
+        self.global_search = None
+        QShortcut(QKeySequence("Ctrl+K"), self, self.open_global_search)
+        # 撤销 / 重做当前页面的修改（输入框获得焦点时仍是撤销输入）
+        QShortcut(QKeySequence.Undo, self, lambda: self.page_history('undo'))
+        QShortcut(QKeySequence.Redo, self, lambda: self.page_history('redo'))
+
+    def get_btn_style(self):
+        """按钮样式（圆角+高亮），选中状态由 active 属性切换"""
+        return """
+            QPushButton {
+                background-color: transparent;
+                border: none;
+                border-radius: 2px;
+                text-align: left;
+                padding-left: 12px;
+            }
+            QPushButton:hover {
+                background-color: #e6f0ff;
+            }
+            QPushButton[active="true"] {
+                background-color: #d6eaff;
+                padding-left: 8px;
+                font-weight: bold;
+            }
+        """
+
+    def add_page_placeholder(self, page_name):
+        """添加页面占位控件"""
+        self.page_names.append(page_name)
+        self.stack.addWidget(QWidget())
+
+    def ensure_page(self, index):
+        """确保指定位置的页面已创建"""
+        page = self.pages.get(index)
+        if page is None:
+            page = self.create_page_by_name(self.page_names[index])
+            placeholder = self.stack.widget(index)
+            self.stack.insertWidget(index, page)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.pages[index] = page
+        return page
 
     def switch_page(self, index):
         """切换页面"""
+        self.ensure_page(index)
         self.stack.setCurrentIndex(index)
+        # 只重新应用状态发生变化的按钮的样式
         for i, btn in enumerate(self.buttons):
-            if i == index:
-                btn.setStyleSheet(self.get_btn_style(True))
-            else:
-                btn.setStyleSheet(self.get_btn_style(False))
+            active = i == index
+            if bool(btn.property("active")) != active:
+                btn.setProperty("active", active)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+
+    def page_history(self, action):
+        """在当前页面执行撤销（undo）或重做（redo），页面不支持时忽略"""
+        page = self.pages.get(self.stack.currentIndex())
+        if hasattr(page, action):
+            getattr(page, action)()
+
+    def open_global_search(self):
+        """打开全局搜索对话框"""
+        if self.global_search is None:
+            from .global_search import GlobalSearchDialog
+            self.global_search = GlobalSearchDialog(self, encryption_key=self.encryption_key)
+            self.global_search.category_requested.connect(self.show_bookmark_category)
+        self.global_search.open_search()
+
+    def show_bookmark_category(self, name):
+        """切换到书签管理页面并显示指定分类"""
+        for index, page_name in enumerate(self.page_names):
+            if page_name.endswith("书签管理"):
+                self.switch_page(index)
+                self.pages[index].show_category(name)
+                return
 
     def create_page_by_name(self, page_name):
         """根据页面名称创建对应的页面实例"""
+        # 页面模块在这里才导入，未打开的页面不占用启动时间
         if page_name.endswith("主页"):
-            return HomePage()
+            return load_page_class("HomePage")()
         elif page_name.endswith("密码管理"):
-            return PasswordManagerPage(encryption_key=self.encryption_key)
+            return load_page_class("PasswordManagerPage")(encryption_key=self.encryption_key)
         elif page_name.endswith("书签管理"):
-            return BookmarkManagerPage(encryption_key=self.encryption_key)
+            return load_page_class("BookmarkManagerPage")(encryption_key=self.encryption_key)
         elif page_name.endswith("书签分类"):
-            return BookmarkCategoryManagerPage(encryption_key=self.encryption_key)
+            return load_page_class("BookmarkCategoryManagerPage")(encryption_key=self.encryption_key)
         elif page_name == "设置":
-            settings_page = SettingsPage(key=self.encryption_key)
+            settings_page = load_page_class("SettingsPage")(key=self.encryption_key)
             # 连接主题切换信号
             if self.theme_manager:
                 settings_page.theme_changed.connect(self.on_theme_changed)
             return settings_page
         else:
-            return GenericPage(page_name)
+            return load_page_class("GenericPage")(page_name)
     
     def on_theme_changed(self, theme_name):
         """处理主题切换"""
@@ -180,6 +225,9 @@ class NavBar(QWidget):
             from PyQt5.QtWidgets import QApplication
             app = QApplication.instance()
             if app:
-                app.setStyleSheet(self.theme_manager.generate_main_window_style())
+                # 样式表按主题缓存，主题未变化时不重新设置，避免全局重新应用样式
+                style = self.theme_manager.generate_main_window_style()
+                if app.styleSheet() != style:
+                    app.setStyleSheet(style)
 
 
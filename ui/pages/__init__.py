@@ -1,12 +1,21 @@
-"""页面模块 - 包含所有页面类的定义"""
+"""页面模块 - 包含所有页面类的定义
 
-from .base_page import BasePage
-from .home_page import HomePage  
-from .password_page import PasswordManagerPage
-from .bookmark_page import BookmarkManagerPage
-from .bookmark_category_page import BookmarkCategoryManagerPage
-from .settings_page import SettingsPage
-from .generic_page import GenericPage
+页面类按需导入：首次访问某个类时才导入对应模块，
+未打开的页面不会在启动时加载 PyQt 控件和数据模型。
+"""
+
+import importlib
+
+# 页面类名 -> 所在模块
+_PAGE_MODULES = {
+    'BasePage': 'base_page',
+    'HomePage': 'home_page',
+    'PasswordManagerPage': 'password_page',
+    'BookmarkManagerPage': 'bookmark_page',
+    'BookmarkCategoryManagerPage': 'bookmark_category_page',
+    'SettingsPage': 'settings_page',
+    'GenericPage': 'generic_page',
+}
 
 __all__ = [
     'BasePage',
@@ -17,3 +26,19 @@ __all__ = [
     'SettingsPage',
     'GenericPage'
 ]
+
+
+def load_page_class(class_name: str):
+    """按类名导入页面类"""
+    module_name = _PAGE_MODULES.get(class_name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {class_name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    page_class = getattr(module, class_name)
+    # 缓存到包命名空间，后续访问不再经过 __getattr__
+    globals()[class_name] = page_class
+    return page_class
+
+
+def __getattr__(name):
+    return load_page_class(name)
@@ -1,8 +1,81 @@
 """基础页面类模块"""
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QFrame, QLabel
-from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QFrame, QLabel, QApplication
+from PyQt5.QtGui import QFont, QDrag
+from PyQt5.QtCore import Qt, QMimeData, QTimer
+
+
+
+# 列表页每次显示的卡片数，更多结果通过“加载更多”按游标继续获取
+PAGE_SIZE = 100
+
+# 默认排序下搜索时按相关度显示的条数
+SEARCH_LIMIT = 50
+
+# 排序选项：显示名称 -> 排序字段（None 为默认顺序）
+SORT_OPTIONS = [
+    ("默认排序", None),
+    ("手动排序", "order"),
+    ("按标题", "title"),
+    ("最近创建", "-created_time"),
+    ("最近更新", "-updated_time"),
+]
+
+
+# 拖动卡片调整顺序时传递条目ID的数据类型
+ITEM_MIME_TYPE = "application/x-nuoqin-item-id"
+
+
+class ReorderableCard:
+    """可拖动调整手动排序的卡片（与 QFrame 一起继承）
+
+    子类提供 item_id 和 parent_page，页面提供 can_reorder() 和 move_item(item_id, target_id)。
+    """
+
+    _drag_start = None
+
+    def enable_reorder(self):
+        """接受其他卡片拖放到本卡片上"""
+        self.setAcceptDrops(True)
+
+    def _reorder_enabled(self) -> bool:
+        return self.parent_page is not None and self.parent_page.can_reorder()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_start = event.pos()
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton and self._drag_start is not None and self._reorder_enabled() \
+                and (event.pos() - self._drag_start).manhattanLength() >= QApplication.startDragDistance():
+            self._drag_start = None
+            mime = QMimeData()
+            mime.setData(ITEM_MIME_TYPE, self.item_id.encode('utf-8'))
+            drag = QDrag(self)
+            drag.setMimeData(mime)
+            drag.setPixmap(self.grab())
+            drag.setHotSpot(event.pos())
+            drag.exec_(Qt.MoveAction)
+            return
+        super().mouseMoveEvent(event)
+
+    def _dragged_id(self, event) -> str:
+        return bytes(event.mimeData().data(ITEM_MIME_TYPE)).decode('utf-8')
+
+    def dragEnterEvent(self, event):
+        if self._reorder_enabled() and event.mimeData().hasFormat(ITEM_MIME_TYPE) \
+                and self._dragged_id(event) != self.item_id:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dropEvent(self, event):
+        item_id, target_id = self._dragged_id(event), self.item_id
+        event.acceptProposedAction()
+        # 拖放结束后再移动，移动后列表会重建，不能在卡片自身的事件中进行
+        page = self.parent_page
+        QTimer.singleShot(0, lambda: page.move_item(item_id, target_id))
 
 
 class BasePage(QWidget):
@@ -23,7 +96,7 @@ class BasePage(QWidget):
     def init_ui(self):
         """子类需要重写此方法来实现具体的界面内容"""
         pass
-    
+
     def create_card(self, text, bold=False, size=14):
         """创建单个圆角卡片"""
         card = QFrame()
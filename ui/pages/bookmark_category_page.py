@@ -3,17 +3,21 @@
 from PyQt5.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QLineEdit, QScrollArea, QWidget, QDialog, QTextEdit, 
-    QFormLayout, QMessageBox, QGridLayout, QSizePolicy, QApplication,
+    QFormLayout, QMessageBox, QGridLayout, QSizePolicy,
     QComboBox, QColorDialog, QTableWidget, QTableWidgetItem, QHeaderView,
     QAbstractItemView
 )
 from PyQt5.QtGui import QFont, QIcon, QColor
 from PyQt5.QtCore import Qt, QTimer
 
+from utils.log_utils import get_logger
 from utils.messagebox import NMessageBox
 from utils.style import StyleButtonManager
 from .base_page import BasePage
-from model import BookmarkCategoryManager, BookmarkCategory
+from model import BookmarkCategory, ManagerRegistry
+
+
+logger = get_logger("ui")
 
 
 class CategoryEditDialog(QDialog):
@@ -28,7 +32,7 @@ class CategoryEditDialog(QDialog):
         try:
             self.selected_color = category_item.color if category_item else "#007acc"
         except Exception as e:
-            print(f"获取分类颜色时出错: {e}")
+            logger.warning("获取分类颜色时出错: %s", e)
             self.selected_color = "#007acc"
         
         # 初始化UI组件引用
@@ -44,9 +48,7 @@ class CategoryEditDialog(QDialog):
             try:
                 self.load_data()
             except Exception as e:
-                print(f"加载分类数据时出错: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("加载分类数据时出错: %s", e)
     
     def init_ui(self):
         """初始化对话框UI"""
@@ -200,11 +202,9 @@ class CategoryEditDialog(QDialog):
                 self.selected_color = getattr(self.category_item, 'color', '#007acc')
                 self.update_color_button()
             else:
-                print("警告: category_item 为 None")
+                logger.warning("category_item 为 None")
         except Exception as e:
-            print(f"加载分类数据时发生异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("加载分类数据时发生异常: %s", e)
             # 设置默认值
             if self.name_edit is not None:
                 self.name_edit.setText('')
@@ -224,7 +224,7 @@ class CategoryEditDialog(QDialog):
             
             self.accept()
         except Exception as e:
-            print(f"确认数据时发生异常: {e}")
+            logger.warning("确认数据时发生异常: %s", e)
             NMessageBox.critical(self, "错误", f"数据验证失败：{str(e)}")
     
     def get_data(self) -> dict:
@@ -236,7 +236,7 @@ class CategoryEditDialog(QDialog):
                 'color': self.selected_color
             }
         except Exception as e:
-            print(f"获取数据时发生异常: {e}")
+            logger.warning("获取数据时发生异常: %s", e)
             return {
                 'name': "",
                 'description': "",
@@ -249,71 +249,14 @@ class BookmarkCategoryManagerPage(BasePage):
 
     def __init__(self, encryption_key: str = None):
         super().__init__("书签分类管理")
-        self.category_manager = BookmarkCategoryManager()
-
-        # 如果提供了加密密钥，设置加密模式
-        if encryption_key:
-            self.category_manager.set_encryption_key(encryption_key)
+        # 与书签页面、全局搜索共用同一组管理器
+        self.category_manager = ManagerRegistry.category_manager(encryption_key)
+        self.encryption_key = encryption_key
 
-        # 设置QMessageBox的全局样式
-        self.setup_messagebox_style()
+        # 设置QMessageBox的全局样式（整个应用只设置一次）
 
-        # 初始化完成后加载数据
-        QTimer.singleShot(0, self.load_categories)
-    
-    def setup_messagebox_style(self):
-        """设置QMessageBox的全局样式"""
-        app = QApplication.instance()
-        if app:
-            # 获取当前应用的样式表
-            current_style = app.styleSheet()
-            
-            # 添加或更新QMessageBox样式
-            messagebox_style = """
-            /* QMessageBox 全局样式 */
-            QMessageBox {
-                background-color: #ffffff;
-                color: #333333;
-                border-radius: 8px;
-                font-family: "Microsoft YaHei";
-            }
-            
-            /* QMessageBox 按钮样式 */
-            QMessageBox QPushButton {
-                background-color: #007acc;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 13px;
-                min-width: 80px;
-                font-family: "Microsoft YaHei";
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #005a9e;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #004080;
-            }
-            
-            /* QMessageBox 文本样式 */
-            QMessageBox QLabel {
-                color: #333333;
-                font-size: 14px;
-                font-family: "Microsoft YaHei";
-            }
-            
-            /* QMessageBox 图标区域 */
-            QMessageBox QLabel[objectName="qt_msgbox_label"] {
-                color: #333333;
-            }
-            """
-            
-            # 合并样式表
-            if "QMessageBox" not in current_style:
-                app.setStyleSheet(current_style + messagebox_style)
+        # 初始化完成后显示数据
+        QTimer.singleShot(0, self.show_categories)
     
     def init_ui(self):
         """初始化分类管理界面"""
@@ -456,6 +399,17 @@ class BookmarkCategoryManagerPage(BasePage):
         
         self.main_layout.addWidget(display_container)
     
+    def link_bookmarks(self):
+        """确保共享的书签管理器已加载，改名和删除分类时同步更新受影响的书签"""
+        ManagerRegistry.ensure_loaded(ManagerRegistry.bookmark_manager(self.encryption_key))
+
+    def show_categories(self):
+        """显示分类：共享的管理器已加载过时直接显示，否则加载"""
+        if self.category_manager.loaded:
+            self.update_category_display(self.category_manager.get_all_categories())
+        else:
+            self.load_categories()
+
     def load_categories(self):
         """加载所有分类"""
         try:
@@ -596,7 +550,9 @@ class BookmarkCategoryManagerPage(BasePage):
                 data = dialog.get_data()
                 try:
                     # 添加调试信息
-                    print(f"正在更新分类: {category.name} -> {data['name']}")
+                    logger.debug("正在更新分类: %s -> %s", category.name, data['name'])
+                    if data['name'] != category.name:
+                        self.link_bookmarks()
                     result = self.category_manager.update_category(
                         item_id=category.id,
                         name=data['name'],
@@ -611,14 +567,10 @@ class BookmarkCategoryManagerPage(BasePage):
                 except ValueError as e:
                     NMessageBox.warning(self, "更新失败", str(e))
                 except Exception as e:
-                    print(f"更新分类时发生异常: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception("更新分类时发生异常: %s", e)
                     NMessageBox.critical(self, "错误", f"更新分类时发生错误：\n{str(e)}")
         except Exception as e:
-            print(f"编辑分类对话框异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("编辑分类对话框异常: %s", e)
             NMessageBox.critical(self, "错误", f"打开编辑对话框时发生错误：\n{str(e)}")
     
     def delete_category(self, category: BookmarkCategory):
@@ -633,6 +585,7 @@ class BookmarkCategoryManagerPage(BasePage):
         
         if reply == QMessageBox.Yes:
             try:
+                self.link_bookmarks()
                 self.category_manager.delete_category(category.id)
                 self.load_categories()
                 NMessageBox.information(self, "成功", "分类删除成功！")
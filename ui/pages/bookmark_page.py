@@ -3,15 +3,22 @@
 from PyQt5.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QLineEdit, QScrollArea, QWidget, QDialog, QTextEdit, 
-    QFormLayout, QMessageBox, QGridLayout, QLayout, QSizePolicy, QApplication,
-    QComboBox, QTabWidget, QColorDialog
+    QFormLayout, QMessageBox, QGridLayout, QLayout, QSizePolicy,
+    QComboBox, QTabWidget, QColorDialog, QInputDialog
 )
 from PyQt5.QtGui import QFont, QIcon, QDesktopServices
 from PyQt5.QtCore import Qt, QTimer, QRect, QSize, QUrl
 
+from utils.log_utils import get_logger
 from utils.messagebox import NMessageBox
-from .base_page import BasePage
-from model import BookmarkManager, BookmarkItem, BookmarkCategoryManager
+from utils.style import StyleCardManager, StyleQComboBoxManager
+from ui.trash_dialog import TrashDialog
+from .base_page import BasePage, ReorderableCard, PAGE_SIZE, SEARCH_LIMIT, SORT_OPTIONS
+from model import BookmarkItem, ManagerRegistry
+from model.tag_index import parse_tags
+
+
+logger = get_logger("ui")
 
 
 class FlowLayout(QLayout):
@@ -117,9 +124,7 @@ class BookmarkEditDialog(QDialog):
             if self.is_edit_mode:
                 self.load_data()
         except Exception as e:
-            print(f"初始化书签编辑对话框时发生异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("初始化书签编辑对话框时发生异常: %s", e)
     
     def init_ui(self):
         """初始化对话框UI"""
@@ -190,6 +195,11 @@ class BookmarkEditDialog(QDialog):
         self.category_combo.setEditable(False)  # 允许输入新分类
         self.load_categories()
         form_layout.addRow("分类:", self.category_combo)
+
+        # 标签输入
+        self.tags_edit = QLineEdit()
+        self.tags_edit.setPlaceholderText("多个标签用逗号或空格分隔...")
+        form_layout.addRow("标签:", self.tags_edit)
         
         # 描述输入（放到最后）
         self.description_edit = QTextEdit()
@@ -246,6 +256,7 @@ class BookmarkEditDialog(QDialog):
         try:
             self.title_edit.setText(self.bookmark_item.title)
             self.url_edit.setText(self.bookmark_item.url)
+            self.tags_edit.setText(", ".join(self.bookmark_item.tags))
             self.description_edit.setPlainText(self.bookmark_item.description)
             
             # 设置分类
@@ -254,9 +265,7 @@ class BookmarkEditDialog(QDialog):
             if index >= 0:
                 self.category_combo.setCurrentIndex(index)
         except Exception as e:
-            print(f"加载书签数据时发生异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("加载书签数据时发生异常: %s", e)
     
     def accept_data(self):
         """确认数据"""
@@ -275,11 +284,12 @@ class BookmarkEditDialog(QDialog):
             'title': self.title_edit.text().strip(),
             'url': self.url_edit.text().strip(),
             'description': self.description_edit.toPlainText().strip(),
-            'category': self.category_combo.currentText().strip() or "默认分类"
+            'category': self.category_combo.currentText().strip() or "默认分类",
+            'tags': parse_tags(self.tags_edit.text())
         }
 
 
-class BookmarkCard(QFrame):
+class BookmarkCard(ReorderableCard, QFrame):
     """书签卡片组件"""
     
     def __init__(self, bookmark_item: BookmarkItem, parent=None):
@@ -287,18 +297,15 @@ class BookmarkCard(QFrame):
         self.bookmark_item = bookmark_item
         self.parent_page = parent
         self.init_ui()
+        self.enable_reorder()
+
+    @property
+    def item_id(self) -> str:
+        return self.bookmark_item.id
     
     def init_ui(self):
         """初始化卡片UI"""
-        self.setStyleSheet("""
-            QFrame {
-                border-radius: 2px;
-                border: 1px solid #e4e7ed;
-            }
-            QFrame:hover {
-                border-color: #1e9fff;
-            }
-        """)
+        self.setObjectName("itemCard")
         # 设置固定宽度和高度
         self.setFixedSize(300, 170)
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -310,7 +317,7 @@ class BookmarkCard(QFrame):
         # 标题标签 - 独占一行，确保完全显示
         title_label = QLabel(self.bookmark_item.title)
         title_label.setFont(QFont("Microsoft YaHei", 14, QFont.Bold))
-        title_label.setStyleSheet("color: black; border:none;")
+        title_label.setObjectName("cardTitle")
         title_label.setMaximumHeight(26)  # 设置最小高度
 
         layout.addWidget(title_label)  # 添加标题标签
@@ -322,12 +329,14 @@ class BookmarkCard(QFrame):
         
         category_label = QLabel("分类:")
         category_label.setFont(QFont("Microsoft YaHei", 10))
-        category_label.setStyleSheet("color: #666666; border:none;")
+        category_label.setObjectName("cardFieldLabel")
         category_label.setFixedWidth(35)
         
-        category_value = QLabel(getattr(self.bookmark_item, 'category', '默认分类'))
+        # 有标签时显示在分类后面
+        tags = "  ".join(f"#{tag}" for tag in self.bookmark_item.tags)
+        category_value = QLabel("  ".join(part for part in (getattr(self.bookmark_item, 'category', '默认分类'), tags) if part))
         category_value.setFont(QFont("Microsoft YaHei", 10))
-        category_value.setStyleSheet("color: #28a745; border:none; font-weight: bold;")
+        category_value.setObjectName("cardFieldValue")
         category_layout.addWidget(category_label)
         category_layout.addWidget(category_value, 1)
         layout.addLayout(category_layout)
@@ -338,12 +347,12 @@ class BookmarkCard(QFrame):
         desc_layout.setContentsMargins(0, 4, 0, 4)
         desc_label = QLabel("描述:")
         desc_label.setFont(QFont("Microsoft YaHei", 10))
-        desc_label.setStyleSheet("color: #666666; border:none;")
+        desc_label.setObjectName("cardFieldLabel")
         desc_label.setFixedWidth(35)
         desc_label.setAlignment(Qt.AlignTop)  # 顶部对齐
         desc_value = QLabel(getattr(self.bookmark_item, 'description', '无描述'))
         desc_value.setFont(QFont("Microsoft YaHei", 9))
-        desc_value.setStyleSheet("color: #999999; border:none;")
+        desc_value.setObjectName("cardDescription")
         desc_value.setWordWrap(True)
         desc_value.setAlignment(Qt.AlignTop)
         desc_value.setMinimumHeight(36)
@@ -362,53 +371,17 @@ class BookmarkCard(QFrame):
         
         # 访问按钮
         visit_btn = QPushButton("访问")
-        visit_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #1e9fff;
-                    color: white;
-                    border: none;
-                    padding: 8px 12px;
-                    border-radius: 2px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #005a9e;
-                }
-         """)
+        visit_btn.setObjectName("cardPrimaryBtn")
         visit_btn.clicked.connect(self.visit_url)
         
         # 编辑按钮
         edit_btn = QPushButton("编辑")
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 8px 12px;
-                border-radius: 2px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        edit_btn.setObjectName("cardEditBtn")
         edit_btn.clicked.connect(self.edit_bookmark)
         
         # 删除按钮
         delete_btn = QPushButton("删除")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                padding: 8px 12px;
-                border-radius: 2px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
+        delete_btn.setObjectName("cardDeleteBtn")
         delete_btn.clicked.connect(self.delete_bookmark)
         
         button_layout.addWidget(visit_btn)
@@ -427,6 +400,10 @@ class BookmarkCard(QFrame):
             QDesktopServices.openUrl(QUrl(url))
         except Exception as e:
             NMessageBox.warning(self.parent_page, "打开失败", f"无法打开网址：{str(e)}")
+            return
+        if self.parent_page:
+            # 记录使用，常用的书签在默认顺序中靠前
+            self.parent_page.bookmark_manager.record_use(self.bookmark_item.id)
     
     def edit_bookmark(self):
         """编辑书签"""
@@ -444,75 +421,22 @@ class BookmarkManagerPage(BasePage):
 
     def __init__(self, encryption_key: str = None):
         super().__init__("书签管理")
-        self.bookmark_manager = BookmarkManager()
-        self.category_manager = BookmarkCategoryManager()
+        # 与分类页面、全局搜索共用同一组管理器（书签按分类ID引用分类）
+        self.bookmark_manager = ManagerRegistry.bookmark_manager(encryption_key)
+        self.category_manager = ManagerRegistry.category_manager(encryption_key)
         self.current_bookmarks = []
         self.current_category = "全部"  # 当前选择的分类
+        self.current_sort = None  # 当前排序字段
+        self.current_predicate = None  # 当前筛选条件
+        self.current_total = 0  # 符合条件的总数
+        self.next_cursor = None  # 下一页游标
+        self.load_more_btn = None
+        self._loaded_once = False
 
-        # 如果提供了加密密钥，设置加密模式
-        if encryption_key:
-            self.bookmark_manager.set_encryption_key(encryption_key)
-            self.category_manager.set_encryption_key(encryption_key)
-
-        # 设置QMessageBox的全局样式
-        self.setup_messagebox_style()
+        # 设置QMessageBox的全局样式（整个应用只设置一次）
 
-        # 初始化完成后加载数据
-        QTimer.singleShot(0, self.load_data)
-    
-    def setup_messagebox_style(self):
-        """设置QMessageBox的全局样式"""
-        app = QApplication.instance()
-        if app:
-            # 获取当前应用的样式表
-            current_style = app.styleSheet()
-            
-            # 添加或更新QMessageBox样式
-            messagebox_style = """
-            /* QMessageBox 全局样式 */
-            QMessageBox {
-                background-color: #ffffff;
-                color: #333333;
-                border-radius: 8px;
-                font-family: "Microsoft YaHei";
-            }
-            
-            /* QMessageBox 按钮样式 */
-            QMessageBox QPushButton {
-                background-color: #007acc;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 13px;
-                min-width: 80px;
-                font-family: "Microsoft YaHei";
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #005a9e;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #004080;
-            }
-            
-            /* QMessageBox 文本样式 */
-            QMessageBox QLabel {
-                color: #333333;
-                font-size: 14px;
-                font-family: "Microsoft YaHei";
-            }
-            
-            /* QMessageBox 图标区域 */
-            QMessageBox QLabel[objectName="qt_msgbox_label"] {
-                color: #333333;
-            }
-            """
-            
-            # 合并样式表
-            if "QMessageBox" not in current_style:
-                app.setStyleSheet(current_style + messagebox_style)
+        # 初始化完成后显示数据
+        QTimer.singleShot(0, self.show_data)
     
     def init_ui(self):
         """初始化书签管理界面"""
@@ -539,7 +463,7 @@ class BookmarkManagerPage(BasePage):
         # 分类筛选下拉框
         self.category_filter = QComboBox()
         self.category_filter.setFixedHeight(34)
-        self.category_filter.setFixedWidth(120)
+        self.category_filter.setFixedWidth(150)
         self.category_filter.setStyleSheet("""
             QComboBox {
                 padding: 8px 10px;
@@ -560,12 +484,16 @@ class BookmarkManagerPage(BasePage):
                 height: 12px;
             }
         """)
-        self.category_filter.currentTextChanged.connect(self.filter_by_category)
+        self.category_filter.currentIndexChanged.connect(self.filter_by_category)
         
         # 搜索框
         self.search_edit = QLineEdit()
         self.search_edit.setClearButtonEnabled(True)
-        self.search_edit.setPlaceholderText("搜索书签（标题、地址、描述、分类）...")
+        self.search_edit.setPlaceholderText("搜索书签（标题、地址、描述、分类，支持拼音和首字母）...")
+        self.search_edit.setToolTip("支持拼音和首字母搜索，也可以按字段筛选：\n"
+                                    "category:工作学习  url:github  title:\"技术 文档\"\n"
+                                    "tag:常用,文档  -tag:过期\n"
+                                    "updated:>2025-01-01  created:<30d  -category:娱乐休闲")
         self.search_edit.setStyleSheet("""
             QLineEdit {
                 padding: 5px 10px;
@@ -620,10 +548,32 @@ class BookmarkManagerPage(BasePage):
         refresh_btn.setFixedHeight(34)  # 与搜索框保持一致的高度
         refresh_btn.clicked.connect(self.load_data)
         
+        # 排序下拉框
+        self.sort_combo = QComboBox()
+        self.sort_combo.setFixedWidth(100)
+        StyleQComboBoxManager.set_style_filter_default(self.sort_combo)
+        for label, sort in SORT_OPTIONS:
+            self.sort_combo.addItem(label, sort)
+        self.sort_combo.currentIndexChanged.connect(self.change_sort)
+
+        # 保存搜索按钮（选中智能文件夹时为删除）
+        self.folder_btn = QPushButton("保存搜索")
+        self.folder_btn.setStyleSheet(refresh_btn.styleSheet())
+        self.folder_btn.setFixedHeight(34)
+        self.folder_btn.clicked.connect(self.save_or_delete_folder)
+        # 回收站按钮
+        trash_btn = QPushButton("回收站")
+        trash_btn.setStyleSheet(refresh_btn.styleSheet())
+        trash_btn.setFixedHeight(34)
+        trash_btn.clicked.connect(self.open_trash)
+
         layout.addWidget(self.category_filter)
         layout.addWidget(self.search_edit, 1)
+        layout.addWidget(self.sort_combo)
+        layout.addWidget(self.folder_btn)
         layout.addWidget(add_btn)
         layout.addWidget(refresh_btn)
+        layout.addWidget(trash_btn)
         
         self.main_layout.addWidget(function_frame)
     
@@ -669,7 +619,8 @@ class BookmarkManagerPage(BasePage):
         
         # 内容区域
         self.content_widget = QWidget()
-        self.content_widget.setStyleSheet("background-color: transparent;")
+        # 卡片样式统一设置在容器上，创建卡片时无需单独设置样式
+        StyleCardManager.set_style_card_container(self.content_widget)
         
         # 使用流式布局
         self.content_layout = FlowLayout(self.content_widget, margin=10, spacing=15)
@@ -709,16 +660,24 @@ class BookmarkManagerPage(BasePage):
         
         self.main_layout.addWidget(display_container)
     
+    def show_data(self):
+        """显示数据：共享的管理器已加载过（如使用过全局搜索）时直接刷新，否则加载"""
+        if self.category_manager.loaded and self.bookmark_manager.loaded:
+            self._loaded_once = True
+            self.refresh_view()
+        else:
+            self.load_data()
+
     def load_data(self):
         """加载所有数据"""
         try:
             # 加载分类数据
             self.category_manager.load_data()
-            self.load_category_filter()
-            
+
             # 加载书签数据
             self.bookmark_manager.load_data()
-            self.filter_bookmarks()
+            self._loaded_once = True
+            self.refresh_view()
         except Exception as e:
             if "访问密码错误" in str(e):
                 # 显示密码错误提示，但不清空现有数据
@@ -735,48 +694,203 @@ class BookmarkManagerPage(BasePage):
                 self.current_bookmarks = []
                 self.update_bookmark_display()
     
+    def showEvent(self, event):
+        """重新显示时刷新列表（分类管理页面可能已通过共享的管理器改名或删除分类）"""
+        super().showEvent(event)
+        if self._loaded_once:
+            self.refresh_view()
+
+    def refresh_view(self):
+        """数据变化后刷新分类筛选和列表（使用管理器维护的计数和索引，不重新加载数据）"""
+        self.load_category_filter()
+        self.filter_bookmarks()
+
     def load_category_filter(self):
-        """加载分类筛选选项"""
+        """加载分类筛选选项，显示各分类的书签数，智能文件夹排在分类之后"""
+        counts = self.bookmark_manager.facet_counts('category')
+        self.category_filter.blockSignals(True)
         self.category_filter.clear()
-        self.category_filter.addItem("全部")
+        self.category_filter.addItem(f"全部 ({sum(counts.values())})", "全部")
         
         try:
             categories = self.category_manager.get_category_names()
-            self.category_filter.addItems(categories)
         except:
             # 如果获取分类失败，添加默认分类
-            self.category_filter.addItem("默认分类")
+            categories = ["默认分类"]
+        for name in categories:
+            self.category_filter.addItem(f"{name} ({counts.get(name, 0)})", name)
+        folders = self.bookmark_manager.smart_folders
+        folder_counts = folders.counts()
+        if folder_counts:
+            self.category_filter.insertSeparator(self.category_filter.count())
+        for folder in folders.all():
+            self.category_filter.addItem(f"★ {folder.name} ({folder_counts[folder.id]})", ('folder', folder.id))
+
+        # 智能文件夹的数据为元组，findData 无法比较，逐项查找
+        index = next((i for i in range(self.category_filter.count())
+                      if self.category_filter.itemData(i) == self.current_category), -1)
+        if index < 0:
+            # 当前分类或智能文件夹已被删除
+            self.current_category = "全部"
+            index = 0
+        self.category_filter.setCurrentIndex(index)
+        self.category_filter.blockSignals(False)
+        self.update_folder_button()
     
-    def filter_by_category(self, category_name):
-        """根据分类筛选书签"""
-        self.current_category = category_name
+    def show_category(self, name):
+        """显示某个分类的全部书签（全局搜索跳转到分类时调用）"""
+        self.current_category = name
+        self.search_edit.blockSignals(True)
+        self.search_edit.clear()
+        self.search_edit.blockSignals(False)
+        self.refresh_view()
+
+    def filter_by_category(self, index):
+        """根据分类或智能文件夹筛选书签"""
+        self.current_category = self.category_filter.itemData(index) or "全部"
+        self.update_folder_button()
         self.filter_bookmarks()
+
+    def update_folder_button(self):
+        """选中智能文件夹时按钮用于删除该文件夹，否则用于保存当前搜索"""
+        self.folder_btn.setText("删除文件夹" if isinstance(self.current_category, tuple) else "保存搜索")
+
+    def save_or_delete_folder(self):
+        """把当前分类和搜索条件保存为智能文件夹；选中智能文件夹时删除它"""
+        folders = self.bookmark_manager.smart_folders
+        if isinstance(self.current_category, tuple):
+            folder = folders.get(self.current_category[1])
+            reply = NMessageBox.question(self, "删除智能文件夹", f"确定要删除智能文件夹“{folder.name}”吗？")
+            if reply == QMessageBox.Yes:
+                folders.delete(folder.id)
+                self.current_category = "全部"
+                self.refresh_view()
+            return
+
+        query = self.search_edit.text().strip()
+        if self.current_category != "全部":
+            query = f'category:"{self.current_category}" {query}'.strip()
+        if not query:
+            NMessageBox.warning(self, "保存搜索", "请先选择分类或输入搜索条件！")
+            return
+        name, ok = QInputDialog.getText(self, "保存搜索", "智能文件夹名称：")
+        if not ok:
+            return
+        try:
+            folder = folders.add(name, query)
+        except ValueError as e:
+            NMessageBox.warning(self, "保存失败", str(e))
+            return
+        # 切换到新建的文件夹，搜索条件已包含在文件夹中
+        self.current_category = ('folder', folder.id)
+        self.search_edit.blockSignals(True)
+        self.search_edit.clear()
+        self.search_edit.blockSignals(False)
+        self.refresh_view()
     
     def filter_bookmarks(self):
-        """筛选书签（结合分类和搜索）"""
-        all_bookmarks = self.bookmark_manager.get_all_bookmarks()
-        
-        # 先按分类筛选
-        if self.current_category == "全部":
-            filtered_bookmarks = all_bookmarks
-        else:
-            filtered_bookmarks = [b for b in all_bookmarks if getattr(b, 'category', '默认分类') == self.current_category]
-        
-        # 再按搜索关键词筛选
+        """筛选书签（结合分类和搜索），只取第一页
+
+        搜索框支持查询语法，如 category:工作学习 url:github（见 model.query_language）。
+        默认排序下有关键词时按相关度显示最相关的结果，其余情况按游标分页。
+        """
+        category = self.current_category
         search_query = self.search_edit.text().strip()
-        if search_query:
-            search_query = search_query.lower()
-            self.current_bookmarks = []
-            for item in filtered_bookmarks:
-                if (search_query in item.title.lower() or 
-                    search_query in item.url.lower() or
-                    search_query in item.description.lower() or
-                    search_query in getattr(item, 'category', '默认分类').lower()):
-                    self.current_bookmarks.append(item)
+        folders = self.bookmark_manager.smart_folders
+        try:
+            plan = self.bookmark_manager.plan_query(search_query)
+            # 智能文件夹的成员集合（随增删改自动维护）
+            members = folders.members(category[1]) if isinstance(category, tuple) else None
+        except ValueError as e:
+            self.show_query_error(str(e))
+            return
+
+        if plan.text and self.current_sort is None:
+            # 搜索结果会被缓存，分类条件按书签当前的分类判断
+            if members is not None:
+                scope = lambda item: item.id in members
+            else:
+                scope = (lambda item: item.category == category) if category != "全部" else None
+            checks = [check for check in (scope, plan.matches if plan.terms else None) if check]
+            predicate = (lambda item: all(check(item) for check in checks)) if checks else None
+            # 成员会随时间变化的智能文件夹不缓存搜索结果
+            cacheable = members is None or folders.is_live(category[1])
+            page = self.bookmark_manager.rank_bookmarks(plan.text, predicate, SEARCH_LIMIT,
+                                                        filter_key=(category, plan.key) if cacheable else None)
+            self.current_predicate = None
         else:
-            self.current_bookmarks = filtered_bookmarks
+            # 字段条件先走索引，关键词部分走搜索，最后按分类索引或智能文件夹筛选
+            matched = plan.execute(self.bookmark_manager.search_bookmarks)
+            if members is not None:
+                matched = set(members) if matched is None else matched & members
+            elif category != "全部":
+                category_ids = {item.id for item in self.bookmark_manager.get_bookmarks_by_category(category)}
+                matched = category_ids if matched is None else matched & category_ids
+
+            self.current_predicate = (lambda item: item.id in matched) if matched is not None else None
+            page = self.bookmark_manager.query(self.current_predicate, self.current_sort, None, PAGE_SIZE)
+        self.current_bookmarks = list(page.items)
+        self.current_total = page.total
+        self.next_cursor = page.next_cursor
         
         self.update_bookmark_display()
+
+    def show_query_error(self, message):
+        """查询语法有误时清空结果并提示"""
+        self.current_bookmarks = []
+        self.current_total = 0
+        self.current_predicate = None
+        self.next_cursor = None
+        self.update_bookmark_display()
+        self.search_status_label.setText(f"查询语法有误：{message}")
+
+    def can_reorder(self) -> bool:
+        """手动排序时可以拖动卡片调整顺序"""
+        return self.current_sort == 'order'
+
+    def move_item(self, item_id: str, target_id: str):
+        """把拖动的卡片放到目标卡片的位置：向后拖时放在目标之后，向前拖时放在目标之前"""
+        ids = [item.id for item in self.current_bookmarks]
+        after = item_id in ids and target_id in ids and ids.index(item_id) < ids.index(target_id)
+        if self.bookmark_manager.move_bookmark(item_id, target_id, after):
+            self.filter_bookmarks()
+
+    def change_sort(self, index):
+        """切换排序方式"""
+        self.current_sort = self.sort_combo.itemData(index)
+        self.filter_bookmarks()
+
+    def load_more_bookmarks(self):
+        """按游标加载下一页"""
+        if not self.next_cursor:
+            return
+        page = self.bookmark_manager.query(self.current_predicate, self.current_sort, self.next_cursor, PAGE_SIZE)
+        start = len(self.current_bookmarks)
+        self.current_bookmarks.extend(page.items)
+        self.next_cursor = page.next_cursor
+        self.remove_load_more_button()
+        self.append_bookmark_cards(page.items, start)
+        self.content_widget.update()
+
+    def append_bookmark_cards(self, items, start=0):
+        """追加书签卡片，还有更多结果时在末尾放置“加载更多”按钮"""
+        for i, bookmark_item in enumerate(items, start):
+            card = BookmarkCard(bookmark_item, self)
+            card.setProperty("cardIndex", i)
+            self.content_layout.addWidget(card)
+        if self.next_cursor:
+            remaining = self.current_total - len(self.current_bookmarks)
+            self.load_more_btn = QPushButton(f"加载更多（还有 {remaining} 条）")
+            self.load_more_btn.setObjectName("cardEditBtn")
+            self.load_more_btn.setFixedHeight(34)
+            self.load_more_btn.clicked.connect(self.load_more_bookmarks)
+            self.content_layout.addWidget(self.load_more_btn)
+
+    def remove_load_more_button(self):
+        if self.load_more_btn is not None:
+            self.content_layout.removeWidget(self.load_more_btn)
+            self.load_more_btn.setParent(None)
+            self.load_more_btn = None
     
     def update_bookmark_display(self):
         """更新书签显示"""
@@ -785,6 +899,7 @@ class BookmarkManagerPage(BasePage):
             child = self.content_layout.takeAt(0)
             if child.widget():
                 child.widget().setParent(None)
+        self.load_more_btn = None
         
         # 获取搜索关键词
         search_query = self.search_edit.text().strip()
@@ -795,7 +910,10 @@ class BookmarkManagerPage(BasePage):
             # 显示搜索状态
             self.search_status_label.show()
             if self.current_bookmarks:
-                self.search_status_label.setText(f"搜索 \"{search_query}\" 找到 {len(self.current_bookmarks)} 条记录")
+                status = f"搜索 \"{search_query}\" 找到 {self.current_total} 条记录"
+                if self.current_sort is None and self.current_total > len(self.current_bookmarks):
+                    status += f"，显示最相关的 {len(self.current_bookmarks)} 条"
+                self.search_status_label.setText(status)
                 self.search_status_label.setStyleSheet("""
                     QLabel {
                         color: #28a745;
@@ -837,10 +955,7 @@ class BookmarkManagerPage(BasePage):
             self.no_results_label.hide()
             
             # 显示书签卡片（流式布局会自动换行）
-            for i, bookmark_item in enumerate(self.current_bookmarks):
-                card = BookmarkCard(bookmark_item, self)
-                card.setProperty("cardIndex", i)
-                self.content_layout.addWidget(card)
+            self.append_bookmark_cards(self.current_bookmarks)
         
         # 更新布局
         self.content_widget.update()
@@ -858,9 +973,10 @@ class BookmarkManagerPage(BasePage):
                 title=data['title'],
                 url=data['url'],
                 description=data['description'],
-                category=data['category']
+                category=data['category'],
+                tags=data['tags']
             )
-            self.load_data()
+            self.refresh_view()
             NMessageBox.information(self, "成功", "书签添加成功！")
     
     def edit_bookmark(self, bookmark_item: BookmarkItem):
@@ -869,35 +985,59 @@ class BookmarkManagerPage(BasePage):
             dialog = BookmarkEditDialog(self, bookmark_item, self.category_manager)
             if dialog.exec_() == QDialog.Accepted:
                 data = dialog.get_data()
-                print(f"准备更新书签: {data['title']}")
+                logger.debug("准备更新书签: %s", data['title'])
                 
                 success = self.bookmark_manager.update_bookmark(
                     item_id=bookmark_item.id,
                     title=data['title'],
                     url=data['url'],
                     description=data['description'],
-                    category=data['category']
+                    category=data['category'],
+                    tags=data['tags']
                 )
                 
                 if success:
-                    print("书签更新成功，重新加载数据...")
-                    self.load_data()
+                    logger.debug("书签更新成功，重新加载数据...")
+                    self.refresh_view()
                     NMessageBox.information(self, "成功", "书签更新成功！")
                 else:
-                    print("书签更新失败")
+                    logger.warning("书签更新失败")
                     NMessageBox.warning(self, "错误", "书签更新失败！")
         except Exception as e:
-            print(f"编辑书签时发生异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("编辑书签时发生异常: %s", e)
             NMessageBox.critical(self, "错误", f"编辑书签时发生错误：{str(e)}")
     
+    def open_trash(self):
+        """打开回收站，恢复过条目时刷新列表"""
+        dialog = TrashDialog(self.bookmark_manager, lambda item: f"{item.title}（{item.category}）", self)
+        dialog.exec_()
+        if dialog.changed:
+            self.refresh_view()
+
+    def undo(self):
+        """撤销最近一次对书签的修改（Ctrl+Z）"""
+        self.step_history(self.bookmark_manager.history.undo)
+
+    def redo(self):
+        """重做最近一次撤销的修改（Ctrl+Y）"""
+        self.step_history(self.bookmark_manager.history.redo)
+
+    def step_history(self, step):
+        """执行撤销或重做，有变化时刷新列表"""
+        try:
+            label = step()
+        except Exception as e:
+            NMessageBox.critical(self, "操作失败", str(e))
+            return
+        if label:
+            self.refresh_view()
+
     def delete_bookmark(self, bookmark_item: BookmarkItem):
         """删除书签"""
         reply = NMessageBox.question(
             self,
             "确认删除",
-            f"确定要删除书签{bookmark_item.title}吗？\n此操作不可撤销！",
+            f"确定要删除书签{bookmark_item.title}吗？\n删除的书签会移入回收站，可按 Ctrl+Z 撤销或在回收站中恢复。",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
@@ -906,7 +1046,7 @@ class BookmarkManagerPage(BasePage):
         
         if reply == QMessageBox.Yes:
             if self.bookmark_manager.delete_bookmark(bookmark_item.id):
-                self.load_data()
-                NMessageBox.information(self, "成功", "书签删除成功！")
+                self.refresh_view()
+                NMessageBox.information(self, "成功", "书签已移入回收站！")
             else:
                 NMessageBox.critical(self, "错误", "删除失败！")
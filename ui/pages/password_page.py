@@ -4,17 +4,21 @@ from PyQt5.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QLineEdit, QScrollArea, QWidget, QDialog, QTextEdit, 
     QFormLayout, QMessageBox, QGridLayout, QLayout, QSizePolicy, QApplication,
-    QComboBox
+    QComboBox, QInputDialog, QListWidget, QListWidgetItem
 )
 from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtCore import Qt, QTimer, QRect, QSize
 
+from utils.log_utils import get_logger
 from utils.messagebox import NMessageBox
-from utils.style import StyleQLineEditManager
-from .base_page import BasePage
-from model import PasswordManager, PasswordItem
+from utils.style import StyleQLineEditManager, StyleCardManager, StyleQComboBoxManager
+from ui.trash_dialog import TrashDialog, format_time
+from .base_page import BasePage, ReorderableCard, PAGE_SIZE, SEARCH_LIMIT, SORT_OPTIONS
+from model import PasswordItem, ManagerRegistry
+from model.tag_index import parse_tags
 
 
+logger = get_logger("ui")
 
 
 class FlowLayout(QLayout):
@@ -104,13 +108,100 @@ class FlowLayout(QLayout):
         return y + line_height - rect.y()
 
 
+# 历史版本中各字段的显示名称
+VERSION_FIELD_LABELS = {'title': "标题", 'source': "来源", 'account': "账号", 'password': "密码",
+                        'tags': "标签", 'description': "描述"}
+
+
+class PasswordVersionsDialog(QDialog):
+    """密码的历史版本对话框
+
+    versions 为管理器 password_versions 的结果（第一个为当前内容）。
+    选择旧版本后点击“使用此版本”，selected_version 为该版本。
+    """
+
+    def __init__(self, versions: list, parent=None):
+        super().__init__(parent)
+        self.versions = versions
+        self.selected_version = None
+        self.setWindowTitle("历史版本")
+        self.setMinimumSize(520, 380)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(8)
+
+        self.version_list = QListWidget()
+        for index, version in enumerate(self.versions):
+            notes = ["当前版本"] if index == 0 else []
+            if version['changed']:
+                notes.append("修改了" + "、".join(VERSION_FIELD_LABELS.get(field, field) for field in version['changed']))
+            elif index == len(self.versions) - 1:
+                notes.append("最早记录的版本")
+            self.version_list.addItem(QListWidgetItem(f"{format_time(version['time'])}    {'，'.join(notes)}"))
+        self.version_list.currentRowChanged.connect(self.show_version)
+        layout.addWidget(self.version_list)
+
+        self.detail_label = QLabel()
+        self.detail_label.setWordWrap(True)
+        self.detail_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.detail_label)
+
+        button_layout = QHBoxLayout()
+        self.toggle_password_btn = QPushButton("显示密码")
+        self.toggle_password_btn.setCheckable(True)
+        self.toggle_password_btn.toggled.connect(lambda _: self.show_version(self.version_list.currentRow()))
+        self.use_btn = QPushButton("使用此版本")
+        self.use_btn.clicked.connect(self.use_version)
+        close_btn = QPushButton("关闭")
+        close_btn.clicked.connect(self.reject)
+        button_layout.addWidget(self.toggle_password_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(self.use_btn)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+        self.version_list.setCurrentRow(0)
+        self.show_version(0)
+
+    def show_version(self, row: int):
+        """显示选中版本的内容（密码默认隐藏）"""
+        self.use_btn.setEnabled(row > 0)
+        if not 0 <= row < len(self.versions):
+            self.detail_label.clear()
+            return
+        version = self.versions[row]
+        lines = []
+        for field, label in VERSION_FIELD_LABELS.items():
+            value = version.get(field, "")
+            if field == 'tags':
+                value = ", ".join(value)
+            elif field == 'password' and not self.toggle_password_btn.isChecked():
+                value = "●" * 8
+            lines.append(f"{label}：{value}")
+        self.detail_label.setText("\n".join(lines))
+
+    def use_version(self):
+        row = self.version_list.currentRow()
+        if row > 0:
+            self.selected_version = self.versions[row]
+            self.accept()
+
+
 class PasswordEditDialog(QDialog):
-    """密码编辑对话框"""
+    """密码编辑对话框
+
+    编辑已有密码时，给出 load_versions（返回历史版本）则显示“历史版本”按钮，
+    选择的旧版本填入表单，确认后作为一次修改保存。
+    """
     
-    def __init__(self, parent=None, password_item: PasswordItem = None):
+    def __init__(self, parent=None, password_item: PasswordItem = None, load_versions=None):
         super().__init__(parent)
         self.password_item = password_item
         self.is_edit_mode = password_item is not None
+        self.load_versions = load_versions
         
         try:
             self.init_ui()
@@ -119,9 +210,7 @@ class PasswordEditDialog(QDialog):
             if self.is_edit_mode:
                 self.load_data()
         except Exception as e:
-            print(f"初始化密码编辑对话框时发生异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("初始化密码编辑对话框时发生异常: %s", e)
     
     def init_ui(self):
         """初始化对话框UI"""
@@ -180,6 +269,11 @@ class PasswordEditDialog(QDialog):
         self.password_edit.setPlaceholderText("请输入密码...")
         self.password_edit.setEchoMode(QLineEdit.Password)
         form_layout.addRow("密码 *:", self.password_edit)
+
+        # 标签输入
+        self.tags_edit = QLineEdit()
+        self.tags_edit.setPlaceholderText("多个标签用逗号或空格分隔...")
+        form_layout.addRow("标签:", self.tags_edit)
         
         # 描述输入
         self.description_edit = QTextEdit()
@@ -228,10 +322,35 @@ class PasswordEditDialog(QDialog):
         """)
         
         button_layout.addWidget(self.toggle_password_btn)
+        if self.is_edit_mode and self.load_versions is not None:
+            # 历史版本按钮
+            history_btn = QPushButton("历史版本")
+            history_btn.clicked.connect(self.show_versions)
+            button_layout.addWidget(history_btn)
         button_layout.addStretch()
         button_layout.addWidget(cancel_btn)
         button_layout.addWidget(confirm_btn)
         layout.addLayout(button_layout)
+
+    def show_versions(self):
+        """打开历史版本，选择的版本填入表单"""
+        try:
+            versions = self.load_versions()
+        except Exception as e:
+            NMessageBox.critical(self, "错误", f"读取历史版本失败：{str(e)}")
+            return
+        if len(versions) < 2:
+            NMessageBox.information(self, "历史版本", "该密码还没有修改记录。")
+            return
+        dialog = PasswordVersionsDialog(versions, self)
+        if dialog.exec_() == QDialog.Accepted and dialog.selected_version is not None:
+            version = dialog.selected_version
+            self.title_edit.setText(version['title'])
+            self.source_edit.setText(version['source'])
+            self.account_edit.setText(version['account'])
+            self.password_edit.setText(version['password'])
+            self.tags_edit.setText(", ".join(version['tags']))
+            self.description_edit.setPlainText(version['description'])
     
     def toggle_password_visibility(self):
         """切换密码显示/隐藏"""
@@ -249,11 +368,10 @@ class PasswordEditDialog(QDialog):
             self.source_edit.setText(getattr(self.password_item, 'source', ''))  # 兼容旧数据
             self.account_edit.setText(self.password_item.account)
             self.password_edit.setText(self.password_item.password)
+            self.tags_edit.setText(", ".join(self.password_item.tags))
             self.description_edit.setPlainText(self.password_item.description)
         except Exception as e:
-            print(f"加载密码数据时发生异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("加载密码数据时发生异常: %s", e)
     
     def accept_data(self):
         """确认数据"""
@@ -274,11 +392,12 @@ class PasswordEditDialog(QDialog):
             'source': self.source_edit.text().strip(),
             'description': self.description_edit.toPlainText().strip(),
             'account': self.account_edit.text().strip(),
-            'password': self.password_edit.text().strip()
+            'password': self.password_edit.text().strip(),
+            'tags': parse_tags(self.tags_edit.text())
         }
 
 
-class PasswordCard(QFrame):
+class PasswordCard(ReorderableCard, QFrame):
     """密码卡片组件"""
     
     def __init__(self, password_item: PasswordItem, parent=None):
@@ -286,18 +405,15 @@ class PasswordCard(QFrame):
         self.password_item = password_item
         self.parent_page = parent
         self.init_ui()
+        self.enable_reorder()
+
+    @property
+    def item_id(self) -> str:
+        return self.password_item.id
     
     def init_ui(self):
         """初始化卡片UI"""
-        self.setStyleSheet("""
-            QFrame {
-                border-radius: 2px;
-                border: 1px solid #e4e7ed;
-            }
-            QFrame:hover {
-                border-color: #1e9fff;
-            }
-        """)
+        self.setObjectName("itemCard")
         # 设置固定宽度和高度
         self.setFixedSize(300, 180)  # 增加高度以容纳更多描述文本
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -309,7 +425,7 @@ class PasswordCard(QFrame):
         # 标题标签 - 独占一行，确保完全显示
         title_label = QLabel(self.password_item.title)
         title_label.setFont(QFont("Microsoft YaHei", 14, QFont.Bold))
-        title_label.setStyleSheet("color: black; border:none;")
+        title_label.setObjectName("cardTitle")
         title_label.setMaximumHeight(26)  # 设置最小高度
         layout.addWidget(title_label)  # 添加标题标签
 
@@ -319,11 +435,13 @@ class PasswordCard(QFrame):
         url_layout.setContentsMargins(0, 4, 0, 4)
         url_label = QLabel("地址:")
         url_label.setFont(QFont("Microsoft YaHei", 10))
-        url_label.setStyleSheet("color: #666666; border:none;")
+        url_label.setObjectName("cardFieldLabel")
         url_label.setFixedWidth(35)
-        url_value = QLabel(getattr(self.password_item, 'source', ''))
+        # 有标签时显示在来源后面
+        tags = "  ".join(f"#{tag}" for tag in self.password_item.tags)
+        url_value = QLabel("  ".join(part for part in (getattr(self.password_item, 'source', ''), tags) if part))
         url_value.setFont(QFont("Microsoft YaHei", 10))
-        url_value.setStyleSheet("color: #28a745; border:none; font-weight: bold;")
+        url_value.setObjectName("cardFieldValue")
         url_layout.addWidget(url_label)
         url_layout.addWidget(url_value, 1)
         layout.addLayout(url_layout)
@@ -336,13 +454,13 @@ class PasswordCard(QFrame):
 
         description_label = QLabel("描述:")
         description_label.setFont(QFont("Microsoft YaHei", 10))
-        description_label.setStyleSheet("color: #666666; border:none;")
+        description_label.setObjectName("cardFieldLabel")
         description_label.setFixedWidth(35)
         description_label.setAlignment(Qt.AlignTop)  # 顶部对齐
 
         description_value = QLabel(getattr(self.password_item, 'description', '无描述'))
         description_value.setFont(QFont("Microsoft YaHei", 9))
-        description_value.setStyleSheet("color: #999999; border:none;")
+        description_value.setObjectName("cardDescription")
         description_value.setWordWrap(True)
         description_value.setAlignment(Qt.AlignTop)
         description_value.setMinimumHeight(34)
@@ -360,53 +478,17 @@ class PasswordCard(QFrame):
 
         # 复制按钮
         copy_btn = QPushButton("复制")
-        copy_btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #1e9fff;
-                            color: white;
-                            border: none;
-                            padding: 8px 12px;
-                            border-radius: 2px;
-                            font-size: 12px;
-                        }
-                        QPushButton:hover {
-                            background-color: #005a9e;
-                        }
-                 """)
+        copy_btn.setObjectName("cardPrimaryBtn")
         copy_btn.clicked.connect(self.copy_password)
 
         # 编辑按钮
         edit_btn = QPushButton("编辑")
-        edit_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #28a745;
-                        color: white;
-                        border: none;
-                        padding: 8px 12px;
-                        border-radius: 2px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #218838;
-                    }
-                """)
+        edit_btn.setObjectName("cardEditBtn")
         edit_btn.clicked.connect(self.edit_password)
 
         # 删除按钮
         delete_btn = QPushButton("删除")
-        delete_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #dc3545;
-                        color: white;
-                        border: none;
-                        padding: 8px 12px;
-                        border-radius: 2px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #c82333;
-                    }
-                """)
+        delete_btn.setObjectName("cardDeleteBtn")
         delete_btn.clicked.connect(self.delete_password)
         button_layout.addWidget(copy_btn)
         button_layout.addWidget(edit_btn)
@@ -419,6 +501,8 @@ class PasswordCard(QFrame):
         clipboard.setText(self.password_item.password)
         # 显示复制成功提示
         if self.parent_page:
+            # 记录使用，常用的密码在默认顺序中靠前
+            self.parent_page.password_manager.record_use(self.password_item.id)
             msg = QMessageBox(self.parent_page)
             msg.setWindowTitle("复制成功")
             msg.setText(f"{self.password_item.title}  的密码已复制到剪贴板")
@@ -457,74 +541,20 @@ class PasswordManagerPage(BasePage):
 
     def __init__(self, encryption_key: str = None):
         super().__init__("密码管理")
-        self.password_manager = PasswordManager()
+        # 与全局搜索共用同一个管理器，数据只加载一次
+        self.password_manager = ManagerRegistry.password_manager(encryption_key)
         self.current_passwords = []
         self.current_source = "全部"  # 当前选择的来源筛选
+        self.current_sort = None  # 当前排序字段
+        self.current_predicate = None  # 当前筛选条件
+        self.current_total = 0  # 符合条件的总数
+        self.next_cursor = None  # 下一页游标
+        self.load_more_btn = None
 
-        # 如果提供了加密密钥，设置加密模式
-        if encryption_key:
-            self.password_manager.set_encryption_key(encryption_key)
-
-        # 设置QMessageBox的全局样式
-        self.setup_messagebox_style()
+        # 设置QMessageBox的全局样式（整个应用只设置一次）
 
-        # 初始化完成后加载数据
-        QTimer.singleShot(0, self.load_data)
-    
-    def setup_messagebox_style(self):
-        """设置QMessageBox的全局样式"""
-        app = QApplication.instance()
-        if app:
-            # 获取当前应用的样式表
-            current_style = app.styleSheet()
-            
-            # 添加或更新QMessageBox样式
-            messagebox_style = """
-            /* QMessageBox 全局样式 */
-            QMessageBox {
-                background-color: #ffffff;
-                color: #333333;
-                border-radius: 8px;
-                font-family: "Microsoft YaHei";
-            }
-            
-            /* QMessageBox 按钮样式 */
-            QMessageBox QPushButton {
-                background-color: #007acc;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 13px;
-                min-width: 80px;
-                font-family: "Microsoft YaHei";
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #005a9e;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #004080;
-            }
-            
-            /* QMessageBox 文本样式 */
-            QMessageBox QLabel {
-                color: #333333;
-                font-size: 14px;
-                font-family: "Microsoft YaHei";
-            }
-            
-            /* QMessageBox 图标区域 */
-            QMessageBox QLabel[objectName="qt_msgbox_label"] {
-                color: #333333;
-                font-size: 12px;
-            }
-            """
-            
-            # 合并样式表
-            if "QMessageBox" not in current_style:
-                app.setStyleSheet(current_style + messagebox_style)
+        # 初始化完成后显示数据
+        QTimer.singleShot(0, self.show_data)
     
     def init_ui(self):
         """初始化密码管理界面"""
@@ -551,11 +581,30 @@ class PasswordManagerPage(BasePage):
         # 搜索框
         self.search_edit = QLineEdit()
         self.search_edit.setClearButtonEnabled(True)
-        self.search_edit.setPlaceholderText("搜索密码（标题、来源、账号、描述）...")
+        self.search_edit.setPlaceholderText("搜索密码（标题、来源、账号、描述，支持拼音和首字母）...")
+        self.search_edit.setToolTip("支持拼音和首字母搜索，也可以按字段筛选：\n"
+                                    "source:微信  account:foo  title:\"工作 邮箱\"\n"
+                                    "tag:工作,个人  -tag:停用\n"
+                                    "updated:>2025-01-01  created:<30d  -source:QQ")
         StyleQLineEditManager.set_style_search_default(self.search_edit)
         # 设置搜索框的固定高度
         self.search_edit.setFixedHeight(34)
         self.search_edit.textChanged.connect(self.search_passwords)
+
+        # 来源筛选下拉框（显示各来源的密码数）
+        self.source_filter = QComboBox()
+        self.source_filter.setFixedWidth(140)
+        StyleQComboBoxManager.set_style_filter_default(self.source_filter)
+        self.source_filter.addItem("全部", "全部")
+        self.source_filter.currentIndexChanged.connect(self.filter_by_source)
+
+        # 排序下拉框
+        self.sort_combo = QComboBox()
+        self.sort_combo.setFixedWidth(100)
+        StyleQComboBoxManager.set_style_filter_default(self.sort_combo)
+        for label, sort in SORT_OPTIONS:
+            self.sort_combo.addItem(label, sort)
+        self.sort_combo.currentIndexChanged.connect(self.change_sort)
         
         # 新增按钮
         add_btn = QPushButton("新增")
@@ -591,10 +640,24 @@ class PasswordManagerPage(BasePage):
         """)
         refresh_btn.setFixedHeight(34)  # 与搜索框保持一致的高度
         refresh_btn.clicked.connect(self.load_data)
+        # 保存搜索按钮（选中智能文件夹时为删除）
+        self.folder_btn = QPushButton("保存搜索")
+        self.folder_btn.setStyleSheet(refresh_btn.styleSheet())
+        self.folder_btn.setFixedHeight(34)
+        self.folder_btn.clicked.connect(self.save_or_delete_folder)
+        # 回收站按钮
+        trash_btn = QPushButton("回收站")
+        trash_btn.setStyleSheet(refresh_btn.styleSheet())
+        trash_btn.setFixedHeight(34)
+        trash_btn.clicked.connect(self.open_trash)
         
+        layout.addWidget(self.source_filter)
         layout.addWidget(self.search_edit)
+        layout.addWidget(self.sort_combo)
+        layout.addWidget(self.folder_btn)
         layout.addWidget(add_btn)
         layout.addWidget(refresh_btn)
+        layout.addWidget(trash_btn)
         
         self.main_layout.addWidget(function_frame)
     
@@ -657,7 +720,8 @@ class PasswordManagerPage(BasePage):
 
         # 内容widget
         self.content_widget = QWidget()
-        self.content_widget.setStyleSheet("background-color: transparent;")
+        # 卡片样式统一设置在容器上，创建卡片时无需单独设置样式
+        StyleCardManager.set_style_card_container(self.content_widget)
         # 使用流式布局实现flex效果
         self.content_layout = FlowLayout(self.content_widget, margin=4, spacing=12)
 
@@ -710,8 +774,7 @@ class PasswordManagerPage(BasePage):
         """加载所有密码"""
         try:
             self.password_manager.load_data()
-            self.current_passwords = self.password_manager.get_all_passwords()
-            self.update_password_display()
+            self.refresh_view()
         except Exception as e:
             if "访问密码错误" in str(e):
                 # 显示密码错误提示，但不清空现有数据
@@ -728,12 +791,19 @@ class PasswordManagerPage(BasePage):
                 self.current_passwords = []
                 self.update_password_display()
     
+    def show_data(self):
+        """显示数据：共享的管理器已加载过（如使用过全局搜索）时直接刷新，否则加载"""
+        if self.password_manager.loaded:
+            self.refresh_view()
+        else:
+            self.load_data()
+
     def load_data(self):
         """加载所有数据"""
         try:
             # 加载密码数据
             self.password_manager.load_data()
-            self.filter_passwords()
+            self.refresh_view()
         except Exception as e:
             if "访问密码错误" in str(e):
                 # 显示密码错误提示，但不清空现有数据
@@ -751,31 +821,184 @@ class PasswordManagerPage(BasePage):
                 self.update_password_display()
     
 
+    def refresh_view(self):
+        """数据变化后刷新来源筛选和列表（使用管理器维护的计数和索引，不重新加载数据）"""
+        self.load_source_filter()
+        self.filter_passwords()
+
+    def load_source_filter(self):
+        """加载来源筛选选项，显示各来源的密码数，智能文件夹排在来源之后"""
+        counts = self.password_manager.facet_counts('source')
+        self.source_filter.blockSignals(True)
+        self.source_filter.clear()
+        self.source_filter.addItem(f"全部 ({sum(counts.values())})", "全部")
+        for source, count in sorted(counts.items(), key=lambda entry: (-entry[1], entry[0])):
+            self.source_filter.addItem(f"{source or '未填写'} ({count})", source)
+        folders = self.password_manager.smart_folders
+        folder_counts = folders.counts()
+        if folder_counts:
+            self.source_filter.insertSeparator(self.source_filter.count())
+        for folder in folders.all():
+            self.source_filter.addItem(f"★ {folder.name} ({folder_counts[folder.id]})", ('folder', folder.id))
+        # 智能文件夹的数据为元组，findData 无法比较，逐项查找
+        index = next((i for i in range(self.source_filter.count())
+                      if self.source_filter.itemData(i) == self.current_source), -1)
+        if index < 0:
+            # 当前来源已没有密码，或智能文件夹已删除
+            self.current_source = "全部"
+            index = 0
+        self.source_filter.setCurrentIndex(index)
+        self.source_filter.blockSignals(False)
+        self.update_folder_button()
+
+    def filter_by_source(self, index):
+        """根据来源或智能文件夹筛选密码"""
+        self.current_source = self.source_filter.itemData(index) or "全部"
+        self.update_folder_button()
+        self.filter_passwords()
+
+    def update_folder_button(self):
+        """选中智能文件夹时按钮用于删除该文件夹，否则用于保存当前搜索"""
+        self.folder_btn.setText("删除文件夹" if isinstance(self.current_source, tuple) else "保存搜索")
+
+    def current_scope(self):
+        """当前来源或智能文件夹的筛选条件和缓存标识，选择全部时为 (None, None)"""
+        source = self.current_source
+        if isinstance(source, tuple):
+            folders = self.password_manager.smart_folders
+            members = folders.members(source[1])
+            # 成员集合随增删改自动维护时才能缓存搜索结果
+            return (lambda item: item.id in members), (source if folders.is_live(source[1]) else None)
+        if source != "全部":
+            return (lambda item: item.source == source), source
+        return None, "全部"
+
+    def save_or_delete_folder(self):
+        """把当前来源和搜索条件保存为智能文件夹；选中智能文件夹时删除它"""
+        folders = self.password_manager.smart_folders
+        if isinstance(self.current_source, tuple):
+            folder = folders.get(self.current_source[1])
+            reply = NMessageBox.question(self, "删除智能文件夹", f"确定要删除智能文件夹“{folder.name}”吗？")
+            if reply == QMessageBox.Yes:
+                folders.delete(folder.id)
+                self.current_source = "全部"
+                self.refresh_view()
+            return
+
+        query = self.search_edit.text().strip()
+        if self.current_source != "全部":
+            query = f'source:"{self.current_source}" {query}'.strip()
+        if not query:
+            NMessageBox.warning(self, "保存搜索", "请先选择来源或输入搜索条件！")
+            return
+        name, ok = QInputDialog.getText(self, "保存搜索", "智能文件夹名称：")
+        if not ok:
+            return
+        try:
+            folder = folders.add(name, query)
+        except ValueError as e:
+            NMessageBox.warning(self, "保存失败", str(e))
+            return
+        # 切换到新建的文件夹，搜索条件已包含在文件夹中
+        self.current_source = ('folder', folder.id)
+        self.search_edit.blockSignals(True)
+        self.search_edit.clear()
+        self.search_edit.blockSignals(False)
+        self.refresh_view()
+
     def filter_passwords(self):
-        """筛选密码（结合来源和搜索）"""
-        all_passwords = self.password_manager.get_all_passwords()
-        
-        # 先按来源筛选
-        if self.current_source == "全部":
-            filtered_passwords = all_passwords
-        else:
-            filtered_passwords = [p for p in all_passwords if p.source == self.current_source]
-        
-        # 再按搜索关键词筛选
+        """筛选密码（结合来源和搜索），只取第一页
+
+        搜索框支持查询语法，如 source:微信 updated:>2025-01-01（见 model.query_language）。
+        默认排序下有关键词时按相关度显示最相关的结果，其余情况按游标分页。
+        """
         search_query = self.search_edit.text().strip()
-        if search_query:
-            search_query = search_query.lower()
-            self.current_passwords = []
-            for item in filtered_passwords:
-                if (search_query in item.title.lower() or 
-                    search_query in item.source.lower() or
-                    search_query in item.account.lower() or
-                    search_query in item.description.lower()):
-                    self.current_passwords.append(item)
+        try:
+            plan = self.password_manager.plan_query(search_query)
+            scope, scope_key = self.current_scope()
+        except ValueError as e:
+            self.show_query_error(str(e))
+            return
+
+        if plan.text and self.current_sort is None:
+            checks = [check for check in (scope, plan.matches if plan.terms else None) if check]
+            predicate = (lambda item: all(check(item) for check in checks)) if checks else None
+            page = self.password_manager.rank_passwords(plan.text, predicate, SEARCH_LIMIT,
+                                                        filter_key=(scope_key, plan.key) if scope_key else None)
+            self.current_predicate = None
         else:
-            self.current_passwords = filtered_passwords
+            # 字段条件先走索引，关键词部分走搜索，最后按来源或智能文件夹筛选
+            matched = plan.execute(self.password_manager.search_passwords)
+
+            def predicate(item):
+                if scope is not None and not scope(item):
+                    return False
+                return matched is None or item.id in matched
+
+            self.current_predicate = predicate if (scope is not None or matched is not None) else None
+            page = self.password_manager.query(self.current_predicate, self.current_sort, None, PAGE_SIZE)
+        self.current_passwords = list(page.items)
+        self.current_total = page.total
+        self.next_cursor = page.next_cursor
         
         self.update_password_display()
+
+    def show_query_error(self, message):
+        """查询语法有误时清空结果并提示"""
+        self.current_passwords = []
+        self.current_total = 0
+        self.current_predicate = None
+        self.next_cursor = None
+        self.update_password_display()
+        self.search_status_label.setText(f"查询语法有误：{message}")
+
+    def can_reorder(self) -> bool:
+        """手动排序时可以拖动卡片调整顺序"""
+        return self.current_sort == 'order'
+
+    def move_item(self, item_id: str, target_id: str):
+        """把拖动的卡片放到目标卡片的位置：向后拖时放在目标之后，向前拖时放在目标之前"""
+        ids = [item.id for item in self.current_passwords]
+        after = item_id in ids and target_id in ids and ids.index(item_id) < ids.index(target_id)
+        if self.password_manager.move_password(item_id, target_id, after):
+            self.filter_passwords()
+
+    def change_sort(self, index):
+        """切换排序方式"""
+        self.current_sort = self.sort_combo.itemData(index)
+        self.filter_passwords()
+
+    def load_more_passwords(self):
+        """按游标加载下一页"""
+        if not self.next_cursor:
+            return
+        page = self.password_manager.query(self.current_predicate, self.current_sort, self.next_cursor, PAGE_SIZE)
+        start = len(self.current_passwords)
+        self.current_passwords.extend(page.items)
+        self.next_cursor = page.next_cursor
+        self.remove_load_more_button()
+        self.append_password_cards(page.items, start)
+        self.content_widget.update()
+
+    def append_password_cards(self, items, start=0):
+        """追加密码卡片，还有更多结果时在末尾放置“加载更多”按钮"""
+        for i, password_item in enumerate(items, start):
+            card = PasswordCard(password_item, self)
+            card.setProperty("cardIndex", i)
+            self.content_layout.addWidget(card)
+        if self.next_cursor:
+            remaining = self.current_total - len(self.current_passwords)
+            self.load_more_btn = QPushButton(f"加载更多（还有 {remaining} 条）")
+            self.load_more_btn.setObjectName("cardEditBtn")
+            self.load_more_btn.setFixedHeight(34)
+            self.load_more_btn.clicked.connect(self.load_more_passwords)
+            self.content_layout.addWidget(self.load_more_btn)
+
+    def remove_load_more_button(self):
+        if self.load_more_btn is not None:
+            self.content_layout.removeWidget(self.load_more_btn)
+            self.load_more_btn.setParent(None)
+            self.load_more_btn = None
     
     def update_password_display(self):
         """更新密码显示"""
@@ -784,6 +1007,7 @@ class PasswordManagerPage(BasePage):
             child = self.content_layout.takeAt(0)
             if child.widget():
                 child.widget().setParent(None)
+        self.load_more_btn = None
         
         # 获取搜索关键词
         search_query = self.search_edit.text().strip()
@@ -794,7 +1018,10 @@ class PasswordManagerPage(BasePage):
             # 显示搜索状态
             self.search_status_label.show()
             if self.current_passwords:
-                self.search_status_label.setText(f"搜索 \"{search_query}\" 找到 {len(self.current_passwords)} 条记录")
+                status = f"搜索 \"{search_query}\" 找到 {self.current_total} 条记录"
+                if self.current_sort is None and self.current_total > len(self.current_passwords):
+                    status += f"，显示最相关的 {len(self.current_passwords)} 条"
+                self.search_status_label.setText(status)
                 self.search_status_label.setStyleSheet("""
                     QLabel {
                         color: #28a745;
@@ -836,10 +1063,7 @@ class PasswordManagerPage(BasePage):
             self.no_results_label.hide()
             
             # 显示密码卡片（流式布局会自动换行）
-            for i, password_item in enumerate(self.current_passwords):
-                card = PasswordCard(password_item, self)
-                card.setProperty("cardIndex", i)
-                self.content_layout.addWidget(card)
+            self.append_password_cards(self.current_passwords)
         
         # 更新布局
         self.content_widget.update()
@@ -858,18 +1082,20 @@ class PasswordManagerPage(BasePage):
                 source=data['source'],
                 description=data['description'],
                 account=data['account'],
-                password=data['password']
+                password=data['password'],
+                tags=data['tags']
             )
-            self.load_data()
+            self.refresh_view()
             NMessageBox.information(self, "成功", "密码添加成功！")
     
     def edit_password(self, password_item: PasswordItem):
         """编辑密码"""
         try:
-            dialog = PasswordEditDialog(self, password_item)
+            dialog = PasswordEditDialog(self, password_item,
+                                        lambda: self.password_manager.password_versions(password_item.id))
             if dialog.exec_() == QDialog.Accepted:
                 data = dialog.get_data()
-                print(f"准备更新密码: {data['title']}")
+                logger.debug("准备更新密码: %s", data['title'])
                 
                 success = self.password_manager.update_password(
                     item_id=password_item.id,
@@ -877,28 +1103,52 @@ class PasswordManagerPage(BasePage):
                     source=data['source'],
                     description=data['description'],
                     account=data['account'],
-                    password=data['password']
+                    password=data['password'],
+                    tags=data['tags']
                 )
                 
                 if success:
-                    print("密码更新成功，重新加载数据...")
-                    self.load_data()
+                    logger.debug("密码更新成功，重新加载数据...")
+                    self.refresh_view()
                     NMessageBox.information(self, "成功", "密码更新成功！")
                 else:
-                    print("密码更新失败")
+                    logger.warning("密码更新失败")
                     NMessageBox.warning(self, "错误", "密码更新失败！")
         except Exception as e:
-            print(f"编辑密码时发生异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("编辑密码时发生异常: %s", e)
             NMessageBox.critical(self, "错误", f"编辑密码时发生错误：{str(e)}")
     
+    def open_trash(self):
+        """打开回收站，恢复过条目时刷新列表"""
+        dialog = TrashDialog(self.password_manager, lambda item: f"{item.title}（{item.account}）" if item.account else item.title, self)
+        dialog.exec_()
+        if dialog.changed:
+            self.refresh_view()
+
+    def undo(self):
+        """撤销最近一次对密码的修改（Ctrl+Z）"""
+        self.step_history(self.password_manager.history.undo)
+
+    def redo(self):
+        """重做最近一次撤销的修改（Ctrl+Y）"""
+        self.step_history(self.password_manager.history.redo)
+
+    def step_history(self, step):
+        """执行撤销或重做，有变化时刷新列表"""
+        try:
+            label = step()
+        except Exception as e:
+            NMessageBox.critical(self, "操作失败", str(e))
+            return
+        if label:
+            self.refresh_view()
+
     def delete_password(self, password_item: PasswordItem):
         """删除密码"""
         reply = NMessageBox.question(
             self,
             "确认删除",
-            f"确定要删除密码{password_item.title}吗？\n此操作不可撤销！",
+            f"确定要删除密码{password_item.title}吗？\n删除的密码会移入回收站，可按 Ctrl+Z 撤销或在回收站中恢复。",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
@@ -907,7 +1157,7 @@ class PasswordManagerPage(BasePage):
         
         if reply == QMessageBox.Yes:
             if self.password_manager.delete_password(password_item.id):
-                self.load_data()
-                NMessageBox.information(self, "成功", "密码删除成功！")
+                self.refresh_view()
+                NMessageBox.information(self, "成功", "密码已移入回收站！")
             else:
                 NMessageBox.critical(self, "错误", "删除失败！")
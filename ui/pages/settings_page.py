@@ -8,6 +8,7 @@ from PyQt5.QtGui import QFont
 from PyQt5.QtCore import pyqtSignal
 
 from utils import ThemeManager
+from utils.log_utils import get_logger
 from utils.messagebox import NMessageBox
 from utils.pwd_utils import PasswordOperate
 from utils.style import StyleButtonManager, StyleQComboBoxManager, StyleQLineEditManager
@@ -16,6 +17,9 @@ import json
 import os
 
 
+logger = get_logger("ui")
+
+
 class SettingsPage(BasePage):
     """设置页面"""
     
@@ -243,7 +247,7 @@ class SettingsPage(BasePage):
                     settings = json.load(f)
                     self.current_theme = settings.get('current_theme', '默认主题')
         except Exception as e:
-            print(f"加载主题设置失败: {e}")
+            logger.warning("加载主题设置失败: %s", e)
             self.current_theme = "默认主题"
     
     def save_theme_settings(self):
@@ -258,7 +262,7 @@ class SettingsPage(BasePage):
             with open('config/theme_settings.json', 'w', encoding='utf-8') as f:
                 json.dump(settings, f, ensure_ascii=False, indent=2)
         except Exception as e:
-            print(f"保存主题设置失败: {e}")
+            logger.warning("保存主题设置失败: %s", e)
     
     def get_current_theme_colors(self):
         """获取当前主题的颜色配置"""
@@ -267,8 +271,11 @@ class SettingsPage(BasePage):
 
     def change_passwd_key(self):
         pwd_operate=PasswordOperate(self.encryption_key)
-        pwd_operate.changePwd(
+        if pwd_operate.changePwd(
             self.passwd_input.text(),
             self.new_passwd_input.text(),
             self.reset_passwd_input.text()
-        )
+        ):
+            self.passwd_input.clear()
+            self.new_passwd_input.clear()
+            self.reset_passwd_input.clear()
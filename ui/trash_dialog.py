@@ -0,0 +1,119 @@
+"""回收站对话框
+
+列出密码或书签管理器回收站中的条目（最近删除的在前），
+可以恢复选中的条目、彻底删除选中的条目或清空回收站。
+"""
+
+from datetime import datetime
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem, QLabel, QPushButton, QAbstractItemView,
+    QMessageBox
+)
+from PyQt5.QtCore import Qt
+
+from utils.messagebox import NMessageBox
+from model.trash import RETENTION_DAYS
+
+
+def format_time(value: str) -> str:
+    """ISO 时间的显示文本（精确到分钟）"""
+    try:
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        return value
+
+
+class TrashDialog(QDialog):
+    """回收站对话框
+
+    manager 为密码或书签管理器（提供 trash_items / restore_from_trash / purge_trash / empty_trash），
+    describe(item) 返回条目在列表中的说明文字。关闭后 changed 表示是否恢复过条目。
+    """
+
+    def __init__(self, manager, describe, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.describe = describe
+        self.changed = False
+        self.setWindowTitle("回收站")
+        self.setMinimumSize(520, 380)
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(8)
+
+        self.item_list = QListWidget()
+        self.item_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.item_list.itemSelectionChanged.connect(self.update_buttons)
+        layout.addWidget(self.item_list)
+
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: #888888; font-size: 12px;")
+        layout.addWidget(self.status_label)
+
+        button_layout = QHBoxLayout()
+        self.restore_btn = QPushButton("恢复")
+        self.restore_btn.clicked.connect(self.restore_selected)
+        self.purge_btn = QPushButton("彻底删除")
+        self.purge_btn.clicked.connect(self.purge_selected)
+        self.empty_btn = QPushButton("清空回收站")
+        self.empty_btn.clicked.connect(self.empty)
+        close_btn = QPushButton("关闭")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(self.restore_btn)
+        button_layout.addWidget(self.purge_btn)
+        button_layout.addWidget(self.empty_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        self.item_list.clear()
+        items = self.manager.trash_items()
+        for item in items:
+            entry = QListWidgetItem(f"{self.describe(item)}    删除于 {format_time(item.deleted_time)}")
+            entry.setData(Qt.UserRole, item.id)
+            self.item_list.addItem(entry)
+        self.status_label.setText(f"共 {len(items)} 个条目，删除超过 {RETENTION_DAYS} 天的条目会被自动清除")
+        self.update_buttons()
+
+    def update_buttons(self):
+        selected = bool(self.item_list.selectedItems())
+        self.restore_btn.setEnabled(selected)
+        self.purge_btn.setEnabled(selected)
+        self.empty_btn.setEnabled(self.item_list.count() > 0)
+
+    def selected_ids(self) -> list:
+        return [entry.data(Qt.UserRole) for entry in self.item_list.selectedItems()]
+
+    def restore_selected(self):
+        try:
+            count = self.manager.restore_from_trash(self.selected_ids())
+        except Exception as e:
+            NMessageBox.critical(self, "恢复失败", str(e))
+            return
+        self.changed = self.changed or count > 0
+        self.refresh()
+
+    def purge_selected(self):
+        ids = self.selected_ids()
+        reply = NMessageBox.question(
+            self, "彻底删除", f"确定要彻底删除选中的 {len(ids)} 个条目吗？\n彻底删除后无法恢复。",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            self.manager.purge_trash(ids)
+            self.refresh()
+
+    def empty(self):
+        reply = NMessageBox.question(
+            self, "清空回收站", "确定要清空回收站吗？\n彻底删除后无法恢复。",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            self.manager.empty_trash()
+            self.refresh()
@@ -1,14 +1,30 @@
-"""工具模块包"""
+"""工具模块包
 
-from .crypto_utils import CryptoAesUtils, SecurePasswordManager
-from .theme_manager import ThemeManager
-from .verification_dialog import VerificationDialog
-from .messagebox import NMessageBox
-from .file_utils import (
-    FileReader, FileDialog, FileImporter,
-    read_csv_file, read_excel_file,
-    select_and_read_csv, select_and_read_excel
-)
+包内名称按需导入：导入 utils.xxx 子模块时不再连带加载 cryptography、
+openpyxl 等较重的依赖，只有真正用到对应名称时才导入其所在模块。
+"""
+
+import importlib
+
+# 导出名称 -> 所在子模块
+_EXPORTS = {
+    'CryptoAesUtils': 'crypto_utils',
+    'SecurePasswordManager': 'crypto_utils',
+    'VaultKeyManager': 'crypto_utils',
+    'PinyinUtils': 'pinyin_utils',
+    'ThemeManager': 'theme_manager',
+    'VerificationDialog': 'verification_dialog',
+    'NMessageBox': 'messagebox',
+    'LogManager': 'log_utils',
+    'get_logger': 'log_utils',
+    'FileReader': 'file_utils',
+    'FileDialog': 'file_utils',
+    'FileImporter': 'file_utils',
+    'read_csv_file': 'file_utils',
+    'read_excel_file': 'file_utils',
+    'select_and_read_csv': 'file_utils',
+    'select_and_read_excel': 'file_utils',
+}
 
 __all__ = [
     'CryptoAesUtils',
@@ -16,6 +32,8 @@ __all__ = [
     'ThemeManager',
     'VerificationDialog',
     'NMessageBox',
+    'LogManager',
+    'get_logger',
     'FileReader',
     'FileDialog',
     'FileImporter',
@@ -24,3 +42,12 @@ __all__ = [
     'select_and_read_csv',
     'select_and_read_excel',
 ]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
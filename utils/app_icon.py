@@ -0,0 +1,62 @@
+"""应用图标加载模块
+
+加载顺序：
+1. 已编译的 Qt 资源（resources_rc，存在时使用 :/icons/app.png）
+2. 图标缓存文件 config/cache/app_icon.png
+3. 内置 base64 数据，解码后写入缓存文件，下次启动直接读文件
+"""
+
+import base64
+import os
+
+from PyQt5.QtGui import QIcon, QPixmap
+
+from utils.log_utils import get_logger
+
+
+logger = get_logger("startup")
+
+RESOURCE_ICON_PATH = ":/icons/app.png"
+ICON_CACHE_FILE = "config/cache/app_icon.png"
+
+
+def _load_resource_icon():
+    """尝试从编译好的 Qt 资源加载图标"""
+    try:
+        import resources_rc  # noqa: F401  由 pyrcc5 生成，可选
+    except ImportError:
+        return None
+    icon = QIcon(RESOURCE_ICON_PATH)
+    return None if icon.isNull() else icon
+
+
+def _write_icon_cache(image_data: bytes):
+    """写入图标缓存文件"""
+    try:
+        os.makedirs(os.path.dirname(ICON_CACHE_FILE), exist_ok=True)
+        tmp_file = ICON_CACHE_FILE + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(image_data)
+        os.replace(tmp_file, ICON_CACHE_FILE)
+    except OSError as e:
+        logger.warning("写入图标缓存失败: %s", e)
+
+
+def load_app_icon() -> QIcon:
+    """加载应用图标"""
+    icon = _load_resource_icon()
+    if icon is not None:
+        return icon
+
+    if os.path.exists(ICON_CACHE_FILE):
+        icon = QIcon(ICON_CACHE_FILE)
+        if not icon.isNull():
+            return icon
+
+    # 缓存不存在时才导入并解码内置图标数据
+    from utils.icon_data import APP_ICON_BASE64
+    image_data = base64.b64decode(APP_ICON_BASE64)
+    icon_pixmap = QPixmap()
+    icon_pixmap.loadFromData(image_data)
+    _write_icon_cache(image_data)
+    return QIcon(icon_pixmap)
@@ -1,18 +1,154 @@
 """AES加密解密工具模块"""
 
 import base64
+import binascii
+import ctypes
 import hashlib
 import json
-from typing import Dict, List, Any
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
+import lzma
+import mmap
+import re
+import threading
+import zlib
+from concurrent.futures import Future
+from typing import Dict, List, Any, Optional
 import os
 
+from utils.log_utils import get_logger
+
+
+logger = get_logger("crypto")
+
+
+def _aes_cbc_cipher(key_bytes: bytes, iv: bytes):
+    """创建AES-CBC加解密器
+
+    cryptography 的导入耗时明显，放到第一次真正加解密时再导入，
+    验证码对话框等只需要 SHA256 的地方不必等待它。
+    """
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from cryptography.hazmat.backends import default_backend
+    return Cipher(algorithms.AES(key_bytes), modes.CBC(iv), backend=default_backend())
+
+
+# 加密文件中的字段，值都是不含引号和转义的字符串（base64 或 True/False）
+_CONTAINER_FIELD = re.compile(rb'"(salt|iv|data|use_simple_key|compression)"\s*:\s*"([^"\\]*)"')
+
+# 加密前可选的压缩算法：名称 -> (压缩函数(数据, 级别), 解压函数)
+COMPRESSORS = {
+    'zlib': (lambda data, level: zlib.compress(data, 6 if level is None else level), zlib.decompress),
+    'lzma': (lambda data, level: lzma.compress(data, preset=6 if level is None else level), lzma.decompress),
+}
+
+
+def parse_compression(spec: Optional[str]) -> tuple:
+    """解析压缩设置，如 "zlib"、"zlib:9"、"lzma:3"，返回 (算法, 级别)，不压缩时算法为空"""
+    if not spec or str(spec).lower() in ('none', 'off'):
+        return '', None
+    name, _, level = str(spec).lower().partition(':')
+    if name not in COMPRESSORS:
+        raise ValueError(f"不支持的压缩算法: {name}")
+    return name, int(level) if level else None
+
+
+class _PlainBuffer(threading.local):
+    """每个线程复用的解密缓冲区"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def get(self, size: int) -> bytearray:
+        """取得至少 size 字节的缓冲区"""
+        if len(self.buffer) < size:
+            self.wipe(len(self.buffer))
+            self.buffer = bytearray(size)
+        return self.buffer
+
+    def wipe(self, size: int):
+        """清零缓冲区前 size 字节，明文不在内存中残留"""
+        if size > 0:
+            ctypes.memset((ctypes.c_char * size).from_buffer(self.buffer), 0, size)
+
+
+_plain_buffer = _PlainBuffer()
+
+
+class EncryptedContainer:
+    """解析后的加密文件容器
+
+    base64 已解码为原始字节，拿到密钥后只剩解密这一步。
+    """
+
+    def __init__(self, iv: bytes, data: bytes, salt: bytes = b'', use_simple_key: bool = False,
+                 mtime: Optional[int] = None, compression: str = ''):
+        self.iv = iv
+        self.data = data
+        self.salt = salt
+        self.use_simple_key = use_simple_key
+        # 明文加密前使用的压缩算法，空表示未压缩
+        self.compression = compression
+        # 读取文件前的修改时间，用于判断容器是否过期
+        self.mtime = mtime
+
+    @classmethod
+    def from_dict(cls, encrypted_dict: Dict[str, str], mtime: Optional[int] = None) -> 'EncryptedContainer':
+        """从加密字典创建容器"""
+        return cls(
+            iv=base64.b64decode(encrypted_dict['iv']),
+            data=base64.b64decode(encrypted_dict['data']),
+            salt=base64.b64decode(encrypted_dict['salt']) if encrypted_dict.get('salt') else b'',
+            use_simple_key=encrypted_dict.get('use_simple_key', 'False') == 'True',
+            mtime=mtime,
+            compression=encrypted_dict.get('compression', '')
+        )
+
+    @classmethod
+    def read(cls, encrypted_file: str) -> 'EncryptedContainer':
+        """读取并解析加密文件"""
+        mtime = SecurePasswordManager.file_mtime(encrypted_file)
+        try:
+            return cls.map(encrypted_file, mtime)
+        except ValueError:
+            # 空文件或非标准格式，按普通JSON解析
+            with open(encrypted_file, 'r', encoding='utf-8') as f:
+                encrypted_dict = json.load(f)
+            return cls.from_dict(encrypted_dict, mtime)
+
+    @classmethod
+    def map(cls, encrypted_file: str, mtime: Optional[int] = None) -> 'EncryptedContainer':
+        """通过内存映射解析加密文件
+
+        直接在映射的文件内容上定位各字段，密文由 base64 一次解码为字节，
+        不再生成整个文件的文本、JSON字典和 base64 字符串等中间副本。
+        """
+        with open(encrypted_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            fields = {match.group(1): match.span(2) for match in _CONTAINER_FIELD.finditer(mm)}
+            if b'iv' not in fields or b'data' not in fields:
+                raise ValueError("不是加密文件格式")
+
+            def field(name: bytes):
+                start, end = fields.get(name, (0, 0))
+                return view[start:end]
+
+            return cls(
+                iv=binascii.a2b_base64(field(b'iv')),
+                data=binascii.a2b_base64(field(b'data')),
+                salt=binascii.a2b_base64(field(b'salt')),
+                use_simple_key=field(b'use_simple_key') == b'True',
+                mtime=mtime,
+                compression=bytes(field(b'compression')).decode('ascii')
+            )
+
 
 class CryptoAesUtils:
 
+    @staticmethod
+    def warm_up():
+        """预先导入加密后端（可在后台线程调用）"""
+        _aes_cbc_cipher(bytes(32), bytes(16))
+
     @staticmethod
     def generate_key_from_password(password: str) -> str:
         """根据用户输入的密码生成AES密钥"""
@@ -25,6 +161,10 @@ class CryptoAesUtils:
     @staticmethod
     def derive_key(password: str, salt: bytes = None) -> tuple:
         """从密码派生AES密钥"""
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+        from cryptography.hazmat.backends import default_backend
+
         if salt is None:
             salt = os.urandom(16)
 
@@ -45,9 +185,15 @@ class CryptoAesUtils:
         return key_hash
 
     @staticmethod
-    def encrypt_data(data: str, key: str, use_simple_key: bool = False) -> Dict[str, str]:
-        """加密数据"""
+    def encrypt_data(data: str, key: str, use_simple_key: bool = False,
+                     compression: str = None) -> Dict[str, str]:
+        """加密数据
+
+        compression 为 "zlib"、"lzma" 等（可带级别，如 "zlib:9"）时先压缩再加密，
+        所用算法记录在结果的 compression 字段中。
+        """
         try:
+            algorithm, level = parse_compression(compression)
             if use_simple_key:
                 key_bytes = CryptoAesUtils.derive_key_simple(key)
                 salt = b''
@@ -57,22 +203,28 @@ class CryptoAesUtils:
             # 生成随机IV
             iv = os.urandom(16)
             # 创建AES加密器
-            cipher = Cipher(algorithms.AES(key_bytes), modes.CBC(iv), backend=default_backend())
+            cipher = _aes_cbc_cipher(key_bytes, iv)
             encryptor = cipher.encryptor()
             # 准备数据进行加密
             data_bytes = data.encode('utf-8')
+            if algorithm:
+                data_bytes = COMPRESSORS[algorithm][0](data_bytes, level)
             block_size = 16
             padding_length = block_size - (len(data_bytes) % block_size)
             padded_data = data_bytes + bytes([padding_length]) * padding_length
             # 加密数据
             encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
             # 返回包含salt、iv和加密数据的字典
-            return {
+            result = {
                 'salt': base64.b64encode(salt).decode('utf-8') if salt else '',
                 'iv': base64.b64encode(iv).decode('utf-8'),
                 'data': base64.b64encode(encrypted_data).decode('utf-8'),
                 'use_simple_key': str(use_simple_key)
             }
+            if algorithm:
+                # 未压缩时不写该字段，旧版本仍能读取
+                result['compression'] = algorithm
+            return result
         except Exception as e:
             raise Exception(f"加密失败: {str(e)}")
 
@@ -81,40 +233,64 @@ class CryptoAesUtils:
         """解密数据"""
         try:
             # 解码base64数据
-            salt = base64.b64decode(encrypted_dict.get('salt', '')) if encrypted_dict.get('salt') else b''
-            iv = base64.b64decode(encrypted_dict['iv'])
-            encrypted_data = base64.b64decode(encrypted_dict['data'])
-            use_simple_key = encrypted_dict.get('use_simple_key', 'False') == 'True'
+            container = EncryptedContainer.from_dict(encrypted_dict)
+        except Exception as e:
+            raise Exception(f"解密失败: {str(e)}")
+        return CryptoAesUtils.decrypt_container(container, key)
 
-            if use_simple_key:
+    @staticmethod
+    def decrypt_container(container: EncryptedContainer, key: str, consume: bool = False) -> str:
+        """解密已解析的容器
+
+        consume 为 True 时解密后立即释放容器中的密文，解码明文时内存中不再同时保留密文。
+        """
+        try:
+            if container.use_simple_key:
                 # 使用简单的密钥派生
                 key_bytes = CryptoAesUtils.derive_key_simple(key)
             else:
                 # 使用PBKDF2派生
-                key_bytes, _ = CryptoAesUtils.derive_key(key, salt) if salt else CryptoUtils.derive_key(key)
+                key_bytes, _ = CryptoAesUtils.derive_key(key, container.salt or None)
 
             # 创建AES解密器
-            cipher = Cipher(algorithms.AES(key_bytes), modes.CBC(iv), backend=default_backend())
+            cipher = _aes_cbc_cipher(key_bytes, container.iv)
             decrypt = cipher.decryptor()
 
-            # 解密数据
-            decrypted_padded = decrypt.update(encrypted_data) + decrypt.finalize()
-
-            # 移除填充
-            padding_length = decrypted_padded[-1]
-            if padding_length > 16:
-                raise Exception("无效的填充")
-            decrypted_data = decrypted_padded[:-padding_length]
-
-            return decrypted_data.decode('utf-8')
+            # 解密到线程复用的缓冲区（update_into 要求多留一个分组的空间）
+            size = len(container.data)
+            buffer = _plain_buffer.get(size + 15)
+            with memoryview(buffer) as view:
+                try:
+                    length = decrypt.update_into(container.data, view)
+                    decrypt.finalize()
+                    if consume:
+                        container.data = b''
+
+                    # 移除填充（只截取视图，不复制）
+                    padding_length = buffer[length - 1] if length else 0
+                    if not 0 < padding_length <= 16:
+                        raise Exception("无效的填充")
+
+                    plain = view[:length - padding_length]
+                    if container.compression:
+                        decompress = COMPRESSORS.get(container.compression)
+                        if decompress is None:
+                            raise Exception(f"不支持的压缩算法: {container.compression}")
+                        plain = decompress[1](plain)
+
+                    # 直接从缓冲区解码为字符串
+                    return str(plain, 'utf-8')
+                finally:
+                    _plain_buffer.wipe(size)
         except Exception as e:
             raise Exception(f"解密失败: {str(e)}")
 
     @staticmethod
-    def encrypt_json_data(data: Any, key: str, use_simple_key: bool = False) -> Dict[str, str]:
+    def encrypt_json_data(data: Any, key: str, use_simple_key: bool = False,
+                          compression: str = None) -> Dict[str, str]:
         """加密JSON数据"""
         json_str = json.dumps(data, ensure_ascii=False, indent=2)
-        return CryptoAesUtils.encrypt_data(json_str, key, use_simple_key)
+        return CryptoAesUtils.encrypt_data(json_str, key, use_simple_key, compression)
 
     @staticmethod
     def decrypt_json_data(encrypted_dict: Dict[str, str], key: str) -> Any:
@@ -122,32 +298,60 @@ class CryptoAesUtils:
         json_str = CryptoAesUtils.decrypt_data(encrypted_dict, key)
         return json.loads(json_str)
 
+    @staticmethod
+    def decrypt_json_container(container: EncryptedContainer, key: str) -> Any:
+        """解密已解析容器中的JSON数据"""
+        json_str = CryptoAesUtils.decrypt_container(container, key)
+        return json.loads(json_str)
+
 
 class SecurePasswordManager:
     """安全的密码管理器"""
+
+    # 启动阶段预先解密好的数据：(加密文件, 密钥) -> (文件修改时间, 数据)
+    _preloaded: Dict[tuple, tuple] = {}
+    # 后台预读的加密容器：加密文件 -> Future[EncryptedContainer]
+    _prefetched: Dict[str, Future] = {}
+    _preload_lock = threading.Lock()
+
     def __init__(self, data_file: str = "config/passwords.json", encrypted_file: str = "config/passwords.enc"):
         self.data_file = data_file
         self.encrypted_file = encrypted_file
         self.encryption_key = None
         self.is_encrypted = False
         self.use_simple_key = False
+        self.compression = None
 
     def set_encryption_key(self, key: str, use_simple_key: bool = False):
         """设置加密密钥"""
         self.encryption_key = key
         self.use_simple_key = use_simple_key
 
+    def set_compression(self, compression: Optional[str]):
+        """设置保存时的压缩算法（如 "zlib"、"lzma:9"），None 表示不压缩
+
+        读取时按文件中记录的算法解压，与此设置无关。
+        """
+        parse_compression(compression)
+        self.compression = compression
+
     def load_encrypted_data(self) -> List[Dict]:
         """加载加密的数据"""
         if not self.encryption_key:
             raise Exception("未设置加密密钥")
 
+        preloaded = self.take_preloaded(self.encrypted_file, self.encryption_key)
+        if preloaded is not None:
+            return preloaded
+
         try:
             if os.path.exists(self.encrypted_file):
-                with open(self.encrypted_file, 'r', encoding='utf-8') as f:
-                    encrypted_dict = json.load(f)
+                container = self.take_prefetched(self.encrypted_file)
+                if container is None:
+                    container = EncryptedContainer.read(self.encrypted_file)
 
-                return CryptoAesUtils.decrypt_json_data(encrypted_dict, self.encryption_key)
+                json_str = CryptoAesUtils.decrypt_container(container, self.encryption_key, consume=True)
+                return json.loads(json_str)
             else:
                 return []
         except Exception as e:
@@ -159,28 +363,48 @@ class SecurePasswordManager:
             raise Exception("未设置加密密钥")
 
         try:
-            print(f"开始加密数据，共 {len(data)} 个条目")
-            encrypted_dict = CryptoAesUtils.encrypt_json_data(data, self.encryption_key, self.use_simple_key)
-            print("数据加密完成")
+            logger.debug("开始加密数据，共 %d 个条目", len(data))
+            encrypted_dict = CryptoAesUtils.encrypt_json_data(data, self.encryption_key, self.use_simple_key,
+                                                              self.compression)
 
             # 确保config目录存在
             config_dir = os.path.dirname(self.encrypted_file)
             if config_dir:
                 os.makedirs(config_dir, exist_ok=True)
-                print(f"确保目录存在: {config_dir}")
 
-            print(f"准备写入文件: {self.encrypted_file}")
-            with open(self.encrypted_file, 'w', encoding='utf-8') as f:
+            # 先写临时文件再替换，写到一半崩溃时原文件保持完好
+            tmp_file = self.encrypted_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(encrypted_dict, f, ensure_ascii=False, indent=2)
-            print("加密文件写入完成")
+            os.replace(tmp_file, self.encrypted_file)
+            logger.debug("加密文件写入完成: %s", self.encrypted_file)
+            self.discard_preloaded(self.encrypted_file)
 
             self.is_encrypted = True
         except Exception as e:
-            print(f"保存加密数据时发生异常: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("保存加密数据时发生异常: %s", e)
             raise Exception(f"保存加密数据失败: {str(e)}")
 
+    def reencrypt_file(self, new_key: str, old_key: str):
+        """把加密文件改用新密钥保存（使用简单密钥派生）
+
+        文件已经是新密钥加密时不做修改，因此中断后可以重新执行。
+        """
+        if not os.path.exists(self.encrypted_file):
+            self.set_encryption_key(new_key, use_simple_key=True)
+            return
+        try:
+            self.set_encryption_key(new_key, use_simple_key=True)
+            self.load_encrypted_data()
+            return
+        except Exception:
+            pass
+        self.set_encryption_key(old_key, use_simple_key=True)
+        data = self.load_encrypted_data()
+        self.set_encryption_key(new_key, use_simple_key=True)
+        self.save_encrypted_data(data)
+        logger.info("已使用新密钥重新加密: %s", self.encrypted_file)
+
     def migrate_to_encrypted(self, data: List[Dict]):
         """从明文迁移到加密存储"""
         if not self.encryption_key:
@@ -205,3 +429,165 @@ class SecurePasswordManager:
             self.is_encrypted = False
         except Exception as e:
             raise Exception(f"迁移到明文失败: {str(e)}")
+
+    @staticmethod
+    def file_mtime(encrypted_file: str) -> Optional[int]:
+        """获取文件修改时间，文件不存在时返回None"""
+        try:
+            return os.stat(encrypted_file).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def preload(cls, encrypted_file: str, key: str, data: List[Dict], mtime: Optional[int] = None):
+        """登记预先解密好的数据，下次加载同一文件时直接使用
+
+        mtime 应为读取文件之前取得的修改时间，加载时文件已被改写则丢弃这份数据。
+        """
+        if mtime is None:
+            mtime = cls.file_mtime(encrypted_file)
+        with cls._preload_lock:
+            cls._preloaded[(os.path.abspath(encrypted_file), key)] = (mtime, data)
+
+    @classmethod
+    def take_preloaded(cls, encrypted_file: str, key: str) -> Optional[List[Dict]]:
+        """取出预先解密好的数据（只能取一次）"""
+        with cls._preload_lock:
+            entry = cls._preloaded.pop((os.path.abspath(encrypted_file), key), None)
+        if entry is None:
+            return None
+        mtime, data = entry
+        if mtime is None or mtime != cls.file_mtime(encrypted_file):
+            return None
+        return data
+
+    @classmethod
+    def has_preloaded(cls, encrypted_file: str, key: str) -> bool:
+        """是否已有预先解密好的数据"""
+        with cls._preload_lock:
+            return (os.path.abspath(encrypted_file), key) in cls._preloaded
+
+    @classmethod
+    def discard_preloaded(cls, encrypted_file: str):
+        """丢弃某个文件的预加载数据"""
+        path = os.path.abspath(encrypted_file)
+        with cls._preload_lock:
+            for cache_key in [k for k in cls._preloaded if k[0] == path]:
+                del cls._preloaded[cache_key]
+            cls._prefetched.pop(path, None)
+
+    @classmethod
+    def register_prefetch(cls, encrypted_file: str, future: Future):
+        """登记正在后台预读的加密容器"""
+        with cls._preload_lock:
+            cls._prefetched[os.path.abspath(encrypted_file)] = future
+
+    @classmethod
+    def take_prefetched(cls, encrypted_file: str) -> Optional[EncryptedContainer]:
+        """取出后台预读的加密容器（只能取一次）
+
+        预读尚未完成时等待其完成，预读失败或文件已被改写时返回None。
+        """
+        with cls._preload_lock:
+            future = cls._prefetched.pop(os.path.abspath(encrypted_file), None)
+        if future is None:
+            return None
+        try:
+            container = future.result()
+        except Exception as e:
+            logger.debug("预读加密文件失败，改为直接读取: %s", e)
+            return None
+        if container.mtime is None or container.mtime != cls.file_mtime(encrypted_file):
+            return None
+        return container
+
+
+class VaultKeyManager:
+    """数据密钥管理器（信封加密）
+
+    各数据文件使用一个随机生成的数据密钥加密，数据密钥再用访问码加密后
+    保存在很小的密钥文件中。修改访问码时只需重写这个密钥文件，
+    与数据量无关。
+
+    旧版数据直接用访问码派生的密钥加密，迁移时先把新生成的数据密钥写入临时密钥文件，
+    全部数据用它重新加密后再替换为正式的密钥文件；迁移中断时下次启动沿用临时文件中的数据密钥继续。
+    """
+
+    KEY_FILE_VERSION = 1
+    MAGIC = "nuoqin-vault"
+
+    def __init__(self, key_file: str = "config/vault_key.enc"):
+        self.key_file = key_file
+        self.migrating_file = key_file + ".migrating"
+
+    def exists(self) -> bool:
+        """密钥文件是否存在"""
+        return os.path.exists(self.key_file)
+
+    def migrating(self) -> bool:
+        """是否有未完成的旧版数据迁移"""
+        return os.path.exists(self.migrating_file)
+
+    @staticmethod
+    def generate_data_key() -> str:
+        """生成随机数据密钥"""
+        return os.urandom(32).hex()
+
+    def create(self, access_key: str) -> str:
+        """生成随机数据密钥并创建密钥文件（还没有任何数据时使用）"""
+        data_key = self.generate_data_key()
+        self._write(access_key, data_key)
+        logger.info("已创建数据密钥文件: %s", self.key_file)
+        return data_key
+
+    def begin_migration(self, access_key: str) -> str:
+        """开始迁移旧版数据：生成随机数据密钥并写入临时密钥文件，返回数据密钥"""
+        data_key = self.generate_data_key()
+        self._write(access_key, data_key, self.migrating_file)
+        logger.info("开始迁移旧版数据，已写入临时密钥文件: %s", self.migrating_file)
+        return data_key
+
+    def migrating_key(self, access_key: str) -> str:
+        """未完成的迁移所用的数据密钥，访问码错误时抛出异常"""
+        return self.unwrap(access_key, self.migrating_file)
+
+    def finish_migration(self):
+        """全部数据已用新数据密钥加密，临时密钥文件成为正式的密钥文件"""
+        os.replace(self.migrating_file, self.key_file)
+        logger.info("旧版数据迁移完成: %s", self.key_file)
+
+    def unwrap(self, access_key: str, key_file: str = None) -> str:
+        """用访问码解开数据密钥，访问码错误时抛出异常"""
+        try:
+            with open(key_file or self.key_file, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            payload = CryptoAesUtils.decrypt_json_data(record['wrapped'], access_key)
+            if not isinstance(payload, dict) or payload.get('magic') != self.MAGIC:
+                raise Exception("密钥校验失败")
+            return payload['data_key']
+        except Exception as e:
+            raise Exception(f"访问密码错误，无法解开数据密钥: {str(e)}")
+
+    def rewrap(self, old_access_key: str, new_access_key: str) -> str:
+        """更换访问码：解开数据密钥后用新访问码重新加密"""
+        data_key = self.unwrap(old_access_key)
+        self._write(new_access_key, data_key)
+        logger.info("已使用新访问码重写数据密钥文件")
+        return data_key
+
+    def _write(self, access_key: str, data_key: str, key_file: str = None):
+        """写入密钥文件（先写临时文件再替换，避免写一半损坏）"""
+        key_file = key_file or self.key_file
+        payload = {'magic': self.MAGIC, 'data_key': data_key}
+        record = {
+            'version': self.KEY_FILE_VERSION,
+            # 密钥文件很小，使用带盐的PBKDF2派生，增加暴力破解访问码的成本
+            'wrapped': CryptoAesUtils.encrypt_json_data(payload, access_key, use_simple_key=False)
+        }
+        key_dir = os.path.dirname(key_file)
+        if key_dir:
+            os.makedirs(key_dir, exist_ok=True)
+        tmp_file = key_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, key_file)
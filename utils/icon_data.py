@@ -0,0 +1,291 @@
+"""应用图标数据（PNG，base64 编码）
+
+只在图标缓存文件不存在时才会导入本模块。
+"""
+
+APP_ICON_BASE64 = (
+    'iVBORw0KGgoAAAANSUhEUgAAAlgAAAJYCAYAAAHJYahKAAAACXBIWXMAAC4jAAAuIwF4pT92AAAL2GlUWHRYTUw6Y29tLmFkb2Jl'
+    'LnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4gPHg6eG1wbWV0YSB4'
+    'bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iQWRvYmUgWE1QIENvcmUgNS42LWMxNDIgNzkuMTYwOTI0LCAyMDE3LzA3'
+    'LzEzLTAxOjA2OjM5ICAgICAgICAiPiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRm'
+    'LXN5bnRheC1ucyMiPiA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIiB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20v'
+    'eGFwLzEuMC8iIHhtbG5zOmRjPSJodHRwOi8vcHVybC5vcmcvZGMvZWxlbWVudHMvMS4xLyIgeG1sbnM6eG1wTU09Imh0dHA6Ly9u'
+    'cy5hZG9iZS5jb20veGFwLzEuMC9tbS8iIHhtbG5zOnN0RXZ0PSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVz'
+    'b3VyY2VFdmVudCMiIHhtbG5zOnN0UmVmPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVzb3VyY2VSZWYjIiB4'
+    'bWxuczpwaG90b3Nob3A9Imh0dHA6Ly9ucy5hZG9iZS5jb20vcGhvdG9zaG9wLzEuMC8iIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5h'
+    'ZG9iZS5jb20vdGlmZi8xLjAvIiB4bWxuczpleGlmPSJodHRwOi8vbnMuYWRvYmUuY29tL2V4aWYvMS4wLyIgeG1wOkNyZWF0b3JU'
+    'b29sPSJBZG9iZSBQaG90b3Nob3AgQ0MgKFdpbmRvd3MpIiB4bXA6Q3JlYXRlRGF0ZT0iMjAyNC0wNi0yMFQxNDozMzoxOCswODow'
+    'MCIgeG1wOk1ldGFkYXRhRGF0ZT0iMjAyNC0wNy0yNVQxNjoyMzo1MyswODowMCIgeG1wOk1vZGlmeURhdGU9IjIwMjQtMDctMjVU'
+    'MTY6MjM6NTMrMDg6MDAiIGRjOmZvcm1hdD0iaW1hZ2UvcG5nIiB4bXBNTTpJbnN0YW5jZUlEPSJ4bXAuaWlkOjIxMjRmMjIwLThl'
+    'YzQtYjg0Ni04NzkyLWVhYjNmZjdjNWE0YyIgeG1wTU06RG9jdW1lbnRJRD0iYWRvYmU6ZG9jaWQ6cGhvdG9zaG9wOmVlY2FiMzZj'
+    'LWY2MTItYTA0MC1iMWNlLTBjNjk4ZWJlNGE2YyIgeG1wTU06T3JpZ2luYWxEb2N1bWVudElEPSJ4bXAuZGlkOmQ5Y2IwZGE3LTJh'
+    'NmMtZDg0OC1hNjA4LTJjZjIyYmY0N2ZkYyIgcGhvdG9zaG9wOkNvbG9yTW9kZT0iMyIgcGhvdG9zaG9wOklDQ1Byb2ZpbGU9InNS'
+    'R0IgSUVDNjE5NjYtMi4xIiB0aWZmOk9yaWVudGF0aW9uPSIxIiB0aWZmOlhSZXNvbHV0aW9uPSIzMDAwMDAwLzEwMDAwIiB0aWZm'
+    'OllSZXNvbHV0aW9uPSIzMDAwMDAwLzEwMDAwIiB0aWZmOlJlc29sdXRpb25Vbml0PSIyIiBleGlmOkNvbG9yU3BhY2U9IjEiIGV4'
+    'aWY6UGl4ZWxYRGltZW5zaW9uPSI2MDAiIGV4aWY6UGl4ZWxZRGltZW5zaW9uPSI2MDAiPiA8eG1wTU06SGlzdG9yeT4gPHJkZjpT'
+    'ZXE+IDxyZGY6bGkgc3RFdnQ6YWN0aW9uPSJjcmVhdGVkIiBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOmQ5Y2IwZGE3LTJhNmMt'
+    'ZDg0OC1hNjA4LTJjZjIyYmY0N2ZkYyIgc3RFdnQ6d2hlbj0iMjAyNC0wNi0yMFQxNDozMzoxOCswODowMCIgc3RFdnQ6c29mdHdh'
+    'cmVBZ2VudD0iQWRvYmUgUGhvdG9zaG9wIENDIChXaW5kb3dzKSIvPiA8cmRmOmxpIHN0RXZ0OmFjdGlvbj0ic2F2ZWQiIHN0RXZ0'
+    'Omluc3RhbmNlSUQ9InhtcC5paWQ6ODdiOWMzNTMtOGM2OC1mOTQ0LWFhOTYtYmY2MWJkOWUxYWFjIiBzdEV2dDp3aGVuPSIyMDI0'
+    'LTA2LTIwVDE0OjM2OjMxKzA4OjAwIiBzdEV2dDpzb2Z0d2FyZUFnZW50PSJBZG9iZSBQaG90b3Nob3AgQ0MgKFdpbmRvd3MpIiBz'
+    'dEV2dDpjaGFuZ2VkPSIvIi8+IDxyZGY6bGkgc3RFdnQ6YWN0aW9uPSJzYXZlZCIgc3RFdnQ6aW5zdGFuY2VJRD0ieG1wLmlpZDoy'
+    'YTBkZWI5MS1jNWRkLWNkNDItYTgyMi04YTU0NDdjNWU0YWUiIHN0RXZ0OndoZW49IjIwMjQtMDctMjVUMTY6MjM6NTMrMDg6MDAi'
+    'IHN0RXZ0OnNvZnR3YXJlQWdlbnQ9IkFkb2JlIFBob3Rvc2hvcCBDQyAoV2luZG93cykiIHN0RXZ0OmNoYW5nZWQ9Ii8iLz4gPHJk'
+    'ZjpsaSBzdEV2dDphY3Rpb249ImNvbnZlcnRlZCIgc3RFdnQ6cGFyYW1ldGVycz0iZnJvbSBhcHBsaWNhdGlvbi92bmQuYWRvYmUu'
+    'cGhvdG9zaG9wIHRvIGltYWdlL3BuZyIvPiA8cmRmOmxpIHN0RXZ0OmFjdGlvbj0iZGVyaXZlZCIgc3RFdnQ6cGFyYW1ldGVycz0i'
+    'Y29udmVydGVkIGZyb20gYXBwbGljYXRpb24vdm5kLmFkb2JlLnBob3Rvc2hvcCB0byBpbWFnZS9wbmciLz4gPHJkZjpsaSBzdEV2'
+    'dDphY3Rpb249InNhdmVkIiBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOjIxMjRmMjIwLThlYzQtYjg0Ni04NzkyLWVhYjNmZjdj'
+    'NWE0YyIgc3RFdnQ6d2hlbj0iMjAyNC0wNy0yNVQxNjoyMzo1MyswODowMCIgc3RFdnQ6c29mdHdhcmVBZ2VudD0iQWRvYmUgUGhv'
+    'dG9zaG9wIENDIChXaW5kb3dzKSIgc3RFdnQ6Y2hhbmdlZD0iLyIvPiA8L3JkZjpTZXE+IDwveG1wTU06SGlzdG9yeT4gPHhtcE1N'
+    'OkRlcml2ZWRGcm9tIHN0UmVmOmluc3RhbmNlSUQ9InhtcC5paWQ6MmEwZGViOTEtYzVkZC1jZDQyLWE4MjItOGE1NDQ3YzVlNGFl'
+    'IiBzdFJlZjpkb2N1bWVudElEPSJ4bXAuZGlkOmQ5Y2IwZGE3LTJhNmMtZDg0OC1hNjA4LTJjZjIyYmY0N2ZkYyIgc3RSZWY6b3Jp'
+    'Z2luYWxEb2N1bWVudElEPSJ4bXAuZGlkOmQ5Y2IwZGE3LTJhNmMtZDg0OC1hNjA4LTJjZjIyYmY0N2ZkYyIvPiA8cGhvdG9zaG9w'
+    'OlRleHRMYXllcnM+IDxyZGY6QmFnPiA8cmRmOmxpIHBob3Rvc2hvcDpMYXllck5hbWU9IkciIHBob3Rvc2hvcDpMYXllclRleHQ9'
+    'IkciLz4gPHJkZjpsaSBwaG90b3Nob3A6TGF5ZXJOYW1lPSJDIiBwaG90b3Nob3A6TGF5ZXJUZXh0PSJDIi8+IDwvcmRmOkJhZz4g'
+    'PC9waG90b3Nob3A6VGV4dExheWVycz4gPHBob3Rvc2hvcDpEb2N1bWVudEFuY2VzdG9ycz4gPHJkZjpCYWc+IDxyZGY6bGk+YWRv'
+    'YmU6ZG9jaWQ6cGhvdG9zaG9wOjE5Y2UzNzRjLTRlNDQtZDk0My05M2JjLTZmMzQ5OGE3ZmJkZTwvcmRmOmxpPiA8L3JkZjpCYWc+'
+    'IDwvcGhvdG9zaG9wOkRvY3VtZW50QW5jZXN0b3JzPiA8L3JkZjpEZXNjcmlwdGlvbj4gPC9yZGY6UkRGPiA8L3g6eG1wbWV0YT4g'
+    'PD94cGFja2V0IGVuZD0iciI/PlLVI0IAAEbOSURBVHic7d17lBXlne//T+3dP8ItCnHU7sEJovYRZYVb+I2XoR1iHIIMZDgYPGIS'
+    'EzGs+ak/LxwzcjCNvzVCdOkvHryMyZwfETMagwcj8USChmgkNgfjHIYGXIgu1LYjTrd6CK1yi6v3rt8fxZaLfdlVu5566ql6v9Zi'
+    'oUDvevZT3/rWt5566inP932hOgXbDXAJnRUCnRUCnRUCnRVCXV9/2dTcfeT/bpE0zmRjLBsiaX/lf1qWfrprqomsjZJ8ZbujJGmf'
+    'gu/Zq/46a6Sk82Jrjht67bD+OuuteNvhjB47jAQfAp0VAp0VAp0VAp0VAp0VAp0VAp0VAp0VAp0VAp0VAp0VQp/jWXHraYyoL03N'
+    '3aF/5trlJW1rN3PHyuvrVlhTc3fNWx04QPrNrYnuk08cM3gZSsvSOu/YPzN6GLYsrbPWUZXtTzr9U985MmOdFfbwMWXZlcXY2mKk'
+    's9LSUUeKI8Ji/1bVdNTG13wtfKTU4981neXp9q8XP/XnT7f6uv2Jnn9m/kUFXTGl7/2+7MpiTTlMMpDg++qsMI0deaKn9vfDn1/6'
+    '21nVtsF4go+royRF6qgo2wkjkaLU5BcIu701t0TPPLF11uxz0nUx0FuHHT84+mfG9g0XzOz5o5KOKpPSFQ4pl+nOeui35R7/fMKo'
+    'aDVXpjtrRS+ddd9Vn67jqpHpzoqb0euS1rZotVKYy6UkTyBGI2tLxM4KY96FyR0cRrdUyNhBbvTrjB0Z31hSGhjtrKin6DB++kLP'
+    'ZzwT0jfw1AfbVwMZyypHqx/ec2Rv2BHtxJPpznr8pp6Lz0WP9jyI2J9Md1bcjHfWU4ucSot9iq2zeku+w4bEtYVwTNw0SeQwTNPd'
+    'nlrOqInlrKQ67LODzG0r1k/tb25C5e+uf7DU60V21C9azc8te6q2Ajb2W2GnnOBp5YJo40WmhTkEE5nrsGt3Op+5jqP6N5Kzmpq7'
+    '1bEnPZ0W12WSsQR/6d0l69dyu3b7sbbB+Cmq0tiVC4o65YTqRyGamrt14nHS6pvDN9HUTjI+mc1ViU9myxo6KwQ6KwQ6KwQ6KwQ6'
+    'KwQ6KwQ6KwQ6KwQ6q2ftPf1hf52Vrfvv1Tu1pz+sJrIGxtuO1Os1QKrprD8d+gBPwUpAWfSsDn/HXvU56oCjkeBDoLNCoLNCoLNC'
+    'IMGHQGSFQGeFQGeFQGeFQGeF0Ovt3h7u6mb5tOnrmMDpaQpTNffGs9xJFZ4Of8/Iow556KhjfdDbX/TVWV8x0BAXHNfbX/TVWc8Y'
+    'aIjTOBuGQGeFQGeFQGeFQGeFQGeFQGeFQGeFQGeFQGeFQGeFkNhTk2Gflph9V7fmnF/Q3Mnh9qfJR2B6vRUW19MVtp5ivfTuUi0P'
+    'W3lRB/8iuWxyQddOs3eUrzq0TEGckWZsBVybHXWkOCM79m+04tr0PcUaV4fFfhg2NvQ/s7KvQ6O3L3bx0m7tPRjuZ479N7UekrF2'
+    'VhxL9Vb+TZjlgo/8XJMnlEQSy6JHwz/VamK54Fo7MrbO6qshUVcVispUrWU8smw/Jx2ndJzfDbh2ec/LPtVyKMbSWUN7mSm/fru9'
+    'e7Qm3pASS2c93dzz3lq8MtqiXmmV2cPQBDorhPQsbHWEXC4XHMX9EVfUTkLqOivN6KwQ6KwQUpnge5KGyyYiK4RYOqull1GFagYC'
+    'XRJLZ93Sy1rFaRxirkVmD8PeCts7n4y+/Kbxzlo4K137Y82mFHRWb8MxMyYl31mmxuFj+yZ9DcckeVe6r20tf7a2FXAT+xZHfone'
+    'aqaLJxY0vpf3XjQ2eNrZ0XP01g/3el0o/0gPrze0XHDUuQ5pWqH7SCGL2h7nOsSeUNJQaZtibLngtFi7uRxbe4wdM03N3XpqUZ21'
+    'Nw1U2hAnowlm5h3Rbqt37Qt+Nkr++2C/NON2M5GdWDaOspfTdDhLGb7cMYHOCoHOCoHOCoHOCoHOCoHOCoHOCoHOCqGvzsrW3YYY'
+    '9NVZyb0ZNl2u6O0vWFv5aP8k6ZHe/rKanFVZRveBuFqUQicp+I7X9fWPWE0yBM6GIdBZIdBZIdBZIZDgYQRHIYwgsGAEgQUjCCwY'
+    'QWDBiEiTjXqZBMTlZbbMlfTYsX9Y7Wy5WjPWTgUBRVBlz0rVsG9rmR5JMOWHr5C3Q6NmLIIqf0Ltc4p3GEFgwQgCC0YQWDCCwIIR'
+    'BBaMILBgBIEFIwgsGEFgwQgCC0akc8U0Ay6eWND10wu9vlqjJzs7fP3wmbI2vVH9bbJ5FxZ05YXRjtctbb5ufKikUgYeF470lE5c'
+    'bzmMW1pXFoxLChbD6nHVw544vSeyHkjHOvb7piDQeuXcnslbMPWl0hc7O3zNeyBdL35yZi8RUL1rbPDUsrQuVQHmxFUhQVWdSoCl'
+    'QTpa0Yvn/7FOdTWsPlVZLjcuPe20qbd168DHsW2iz22F+dkbVpS0+U1711ipvSqM2rEPPlfWT57PwPX6EaL2hYHgqvqqMJWnwmum'
+    'hW9Wxx5fTc3dmQsqKbj6i3IFeO88e4sNpjKw5k4O16ym5m5denc6ilaTogSXrZordYEVtiOWPZW9DNWXKME1dVzyC1mmLrDCWv1S'
+    'vgJLCh9ci+ckf0pMVWA9MD9cB6R55DnvUhVYY0fmbe3h6MIeVEm/qjxVgQVzenvPoSmpHiBNk4bhnlZV8TLJMC69u6SOPamcKFIz'
+    'ZzNWa1tyO+T+q4qxB5UkrbqpqHkR526lnbPfakuCgYXwnA2spGsGhONsYE0gsFLN2cDKihW/zeYAL1eFBjBwS8ZyVtgBzzkJ36RP'
+    'VWCFPdLTMlvShrAXL50Jj5elKrBQnYWz0r/bUtfCsNNg8pi1ZkwKP18taakLrCjTYPISXGl6WKI/qWxlU3N36A6s/PusXpFFDShb'
+    '/ZHKwJKiBZd09A5wPchqzU42v39qn9KpcCX1p42hoHL7KZ0jNTV3a/dHtlvhjgefK6ciUzuRDmbdGXQU2atvaQioCqf2VKXjBg2Q'
+    '1t3qVNONSVMwHcnJvXPg46M7dPnVRY0ekY/ZDuu3+1q8Mv3PUDoZWMea/6PeO/riiQXdMjt8Kbn3oLR4ZSnUan5DB0rfu6SoyWfV'
+    'FuQP/bbs/KyH1F8VIlWyc1UINxFYMILAghEEFowgsGAEgQUjCCwYQWDBCAILRkQNrHzcmMORQu3zWjKWJ6mxhp+HG95RhERS603o'
+    '14/Y6PuS/qzGz0N61HRWinQTGugPxTuMILBgBIEFIwgsGEFgwQiuCmEEGQtGEFgwgsCCEQQWjCCwYASBBSMILBhBYMEIAgtGEFgw'
+    'gsCCEaGnJvezgtxMSb+M3BrYdo+kBb39ZZilOuPKWO2SfBFUrrtRwX6seWZCHCv6MT0im3xJJ0t6L8oP15qxCKpse1fSiVF+sJbA'
+    'IqjyIdGMdXPEn4ObQieRqIF1Z8SfQ04wjoVq/XOYfxwlsP5LhJ+B+/4+zD+OEli9DqABFVEC66TYW4HMocaCEQQWjCCwYASBBSMI'
+    'LBhBYMEIAgtGEFgwgsCCEQQWjCCwYASBBSMILBhBYMEIAgtGEFgwgsCCEQQWjCCwYASBBSPiWBQk9YoFacncoprOCvfS0FUby7p/'
+    'bbnqf9/Y4On66QWNHxXt5aS3ry7r6c3Vby/NQr9Lp6m5O/VrNiycVdCMSWaS8frtvhavLGnQAGndrWaPy1ff8TX/RyWj2wijZWld'
+    '1UdMZgJrydyipoyp6TXGqbbpDV8LHrIbZGECy/lTYZhV5lw26XTvk+/az6qKqeBs8X7jjEJugupYLUvrjJ3q45Lu1vWiZWmdLjnX'
+    'yabHZuGsdB9Yzu2dNHemDWntD6cCK62daFsa+8WZwEpj56VJ2vrHicBKW6elVZr6KfWBlabOckFa+isdrejFNdPii/sFD5W06Y3w'
+    'Y7v3XVXUhBC3aG55tKSWHeG209jg6f6rihoyMGzr0ivVI++1Hn1/c1u3Dn4cU2P06fZUbu/EbdmVRU06vba7CCYGUTMx8l5LUM24'
+    'vVsf7I+xMYc0NXfrlkuKuv0Js7dWKrdu1txSp+MHR/uMC8729MIr9u6+pb7GCqup2UxQVZgOqiPNuL07cub5/uXFmFsTTioD66lF'
+    '0bKVC/fQooj6vTyL9+RTGVjDhoT/mawGVUWUmQ0vLLFX6aQysMJK05wlU6Jc0dqUusCKUrS/+o5bnR5VlKw8dqSd82HqAiusv7kt'
+    '26fAWj0w304R73xgxTlO5QJXaslUBdbf/Z/hmtO1z1BDULNUBdZ3/y5cc2be4cbRa9voEcnXWakKLFRnyq3hDqjlVydfZxFYDio5'
+    '8OghgQUjnA2sh37rwGGbY6kJrEvPD9eUFQRWqqUmsCaHXFcB6ZaawAozSxPS063pvo2V2ol+afPPf1/UmL+IL/i3v+3r//pv0W+e'
+    't7b5unhC9e1pbPC0syO5YExNxkqzlqV1sQaVJI35C6+mWbKde8IFydCE59MTWI7a8la4wEq61CCwYASBBSMILBhBYMEIAstRZ9SH'
+    'K8aTHGqQCCxnhR0+2HvQTDt6Q2A5KuzwQdjhiVoRWBZd8v9GnwEbNrBCLtFRs9Tc0nl6c1kXT3Q/zpN62CHqSwqSkpo9Gfamaq2r'
+    'scCs1ARWa1u4wIpz7SzEz9m909hAxkozZwML6UZgOeicxnDZurPLTDv64nRgnXic7RbY8YNvhXtO8LoHk1+NJ1WBdfvqcA9IrL45'
+    'NaMlqRZ2UmAcUhVYWXkJpEk2V+kLI1WBFcXCWc5/hVBsrtIXhvN7Je2vV7Nt4SN2VjtM3V6ZfVf4WyJpeRuDaVG+58bX7DwmlrrA'
+    'ev/DaD9XPyzWZqTO2u+5dfCkLrCievy7dZkNru9fXtRnB4X/uXkP2Fv0N5WBFXWGwOPfrbOyFpRJLUvrdMHZ0S4Fk541eqRUBlYt'
+    'Ro8IHgSdfY7bX23J3GJNtePKDXaHbjL9kqaKVRvLun9tuI4uFoKd2xRysZKH15e1/NloO3X+RQVdMSWeA8L2S5pSHVjLry5aWT/T'
+    'dfMeKBk5DYYJrFSfL/LwxgkTbNZWFakOLMmddc3TIi39lfrAktLTWWmXpn5yIrCkdHVaGqWtf5wJLCl9nZcWaewXpwJLSmcn2pTW'
+    '/nDrBtQhlc7My83nnqQ1oCqc3jN5DLC0B1RFJvZIpbPPO9PTXd80d69wyeMlrdsajBHd9NWCZv1lMpXEkdt1RapH3msV9baMFEyT'
+    'DjsH/+KJBd0wvaAhNSwk+3qnr9ufKKdikPNYmbmlg3TJzC0duIvAghEEFowgsGAEgQUjCCwYQWDBCAILRhBYMILAghEEFowgsGAE'
+    'gQUjCCwYQWDBCAILRkQJrJdjbwUyJ0pg3Rx7K5A5UQLrmdhbARf8xzD/mBoL1XoyzD+OGlhDIv4c3PSHsD8QNbD2R/w5uGlk2B+o'
+    '5VTIUnv5EGk/11pjEVzZFnn/xlG8e5IGx/A5SI//ohqTRlxXhQcONcST9BVJO2L6XCTjPUnX6fA+vLPWDwz9iD1QDcaxYASBBSMI'
+    'LBhBYMEIAgtGEFgwgsCCEQQWjCCwYASBBSO4pQPAGZwJATiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwSFgBnkLAAOIOEBcAZ'
+    'dUlspKm5O4nNAEiRlqXxp5dEElZIQxW8/OlUy+0AcNgCSffYbkRaLgm/Ick/9OsjkayAtFmmw8foB7YaYbvCekfSn1tuA4BwjlOQ'
+    'uCTpbCX4JgdbFdaPFXxhkhXgtld0OHkZZ6PCYgEuIHt8SZdLWmlyI0lXWCQrILt+puClccYkmbD2JrgtAHbcJ2mIqQ9PKmGdJINf'
+    'AkCqGCtOkkpYRq9rAeRDUgnrwoS2AyDD0jJxFAD6RcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM0hYAJxBwgLgDBIWAGeQ'
+    'sAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADjDxpufkSITRnlH/X9rmzvvuvU86eRhnhqGSfXDg98lqViQxo70'
+    'PvXvj/xu29p9lcrSlrd8+e585dwjYTnqc0Olr19Q0KXnp69I/ukLZT22oawP9lf/MxdPLGjmFz19oYdEE5fxo2r77O1v+3psQ1nr'
+    't5PhbPH8BE4vTc3d7OEIRp3k6favF3TKCeYOYsSjVJZuebSkja8R6od4LUvjr4eosFLixOOk1TezO1xVLEh3frP4qT+/9O6SOvaQ'
+    'xOLCEWLR8/9Yp7pPxzgyZNVNh3fwrt2+5i4rWWyN+0hYCTNRJsMNp5zgHbX/m5q7LbbGTRw9CVh1U1ENwxmHwtEqyWvVxrLuX1u2'
+    '3Bo3kLAMoppCNS49//DdXqquvnFEGUCiQlSV2CFx9YwjK0YkKsSlZWkdl4o9SN+sQwfN+GKBZIXYXXo+cXUseqNGrgRUa5uvbe2+'
+    'yuXDj6hUHk85VmODp6EDg/+eMMpT4dCjLsc+xpMWWw59n70HpZ0dvc95qnyvoYOkM+rT+V160rK0Tj9+tqx/WU+1xUz3GqQlWS1/'
+    'tqyHUxLMAwdIC2YUNH1iuOL9wMfSYxvK+ukLZX2couGbK6YUNP+idFyIHPhYmnpbijqnb0ZmupOwIjh+sLTmFjvJqmufNPOO9Adt'
+    'sSCtv+3TffTav/v6zg/dnjy5ZG5RU8bYq9AcGZAnYaXBqJM8PXx9stPTN7/p64YVbh/kWTV1vKfFX0v+cQUHkhYJy7aBA6Tf3Jpc'
+    'ZbXo0ZI27MhE1+VC0kMEKU9aRhJWOi7OHZFUslq1saym5m6SlWOamrsTTSIrF+TvQVQSVpWSOns2NXcz98ZxTc3dejGBZWZOOcHr'
+    'caHCLCNhVWHJ3GTOZCkv8RHCzY+U9L2fmR93fGB+vqosElYVTN8R6tpHssqiF15J5mbJ8qvzk7RIWP14apH5S0EXpikgms1v+lr2'
+    'lNlL/NEj8nNZSMLqx7AhZj+fyir7Vr8Ubn37KPIyAE/C6sPjN5kNgiWPM7cqL2bcbvbElJd1/0lYfag3vOjeuq1MW8iT5c+avTS8'
+    '/m+zfzhn/xtGNO9Cs11z/YNUV3lj+nnPOedl/3DO/jeM6ErDCculF5YiPq93mt3vXsavDElYFmxrJ1nl1e1PmK2yrvxStg/pbH+7'
+    'iEyv+/Rjw2MZSK++1uuKg+krA9uy/e0imnyW2YTF5SAQDQmrB5U3mAAmbOGEFRlHJpAw0xV2lgfe07HGLzJh0ezwSyPbtOTnJa3b'
+    'kny109rm60qDnz/+VC+zww7uRFdGZDWQ5k52K1lJ0uKvFTXAwil7y1tmYyCtLwuJg1sRhtQ6/0w3D5JvXMAh4BL2VsIYcAWiI2EB'
+    'cAYJK2HjMzy+AJhGwgLgDBJWwrJ8BwfVGX8qT1JERcICEmb6pNXRZfTjrSJhIddW/Db5B9FNJ6zOPdmtsJjp3oPWNp9Ltwx79IWy'
+    '/nmdvRUzuPESHQmrB1sMJ6xiQSqxwkzVeFEHKrgk7IHpy4Ssr1kEezq7bLfALI4cC741hW7PK9NLFz2+MdulO0cOkKDrpps95FaR'
+    'sPLplkfNvtXmxhl0PRAWR00vWnaYvTV8ybl0fd4sv9rsi3lNv0YsDThq+mD6hQHLrszH68URGD3C7HQG0y9qTQMSVh/mPWD2snDS'
+    '6Z5OPM7oJpASLUvNziBqfz+7k0WPRMLqR9c+s5+/+mamwmXdygXmK+lv3JuPN4mTsPox8w7zkxZNn31hz5K5RZ1ygtlLwV2781Fd'
+    'SSSsqqzfbj4gSFrZs3JBUVPGmH8MZ+6yfFRXEgmrKotXJhMQLUvr9J2L2CVZ0LK0znhlJUnLnsr+QPuRODqqlNTzbN+aUlDL0jrV'
+    'D0tkc4jZimuLiVXLpbK0+iUSFnpxzfLkSu/Hv1unlqV1mjqOJ/tdsOqmIFE1NiS3v6bcmr+Hwhk4CeHldl/Lniprwczk8vziOUUt'
+    'nhP897Knyrk7o6bZXd8s6jxLrzfL6woWJKyQVr9U1t6DvhbPSX7S54KZhaOS5a7dvm55tKy29/Jzl8iWsSM93XdVUcUUXJPkNVlJ'
+    'kuf75oO9qbk7c0fUwAHSb251J9+3tvnq3OMftfzIkWt/1w/31DDs8N9VFplL80KGr3f62nsg+B7b2n2VytK2dl/lfqLt5GHBd618'
+    '5wmjPGcW1XMoWXkmxvJIWDViOgKS8OJrvm5+xKnpC0YSVgoKXLc1NXdr7WbGlWDO9O93u5asjCFhxeCO1WWXSnU4YvObvpqau/XR'
+    'AdstSQ+uZ2JUSVpcJqJWnAB7xpFlAIkLUbz5rq9v3c+lX184ogyqJK7vXFRgHXf0auEjJW18LbP3pWJFwkrAj58t68eHFle7cUaB'
+    '1UahO58sa80mbtaERcJK2D1ryrpnzeFAfWpRnYYNsdggJGLXbj9XqyqYQsKy7Nj1tqaO87RodlF1rJ7srFJZuv2JktZt5TIvbiSs'
+    'lFm31de6rT3fIbp4YkFzzvMSfcC2Wtvf9rVyQ1m/i7B2WNNZni49v+DMbHNJ2ndQ+ukLZf30BS7rksRM94wbOlCfJLhqHrPp6JI6'
+    '9/jae9D8Szhq4XmHH7FpbPA0dKA0dJDUWH/0dzw2CW5pO/o7VR5P2tkRfOctb/lK4JDIAyMz3amwMm7vwcMHZWtbdo5E3w8Sa+ee'
+    'bH0v9I3bVQCcQcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM0hYAJxBwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcEZSCWt3'
+    'QtsBkGFJJawnE9oOgAxLKmF9J6HtALBvp6kPTnIM678nuC0A9vwHUx+cZMK6TIxlAVn3WZMfnvRdwj+T9OuEtwkgGZ6kvSY3YGNa'
+    'wzRJAy1sF4AZLylIVsbZmof1JwVf8POWtg+gdq8oOI7PTWqDtieOvq3gC3viUhFwxSgFx+yYpDdsO2EdaZoOJ6+ipMfsNgeApH06'
+    '+tj0JL1lqzGJvKoeAOKQpgoLAPpEwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ/AsIQBnUGEBcAYJ'
+    'C4AzSFgAnEHCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM0hY'
+    'AJxBwgLgDBIWAGeQsAA4o870Bpqau01vAkDKtCw1k1rSXGENlrRMUlmSzy9+8SvRX1skzVTKpDFh3aigw/Yd+m/PZmOAnBon6ZcK'
+    'jsU2SUPtNieQpoR1mYLOWWa7IQCOcqqkjyS1W25HahLWB5JW2m4EgD59XkFR8Q1bDbCdsE5S0AHHWW4HgOo9ImmjjQ3bTFhnSXrX'
+    '4vYBRHeepHeS3qithHWipFcsbRtAPP5c0s4kN2grYb1nabsA4nWGpB8ntTEbCesDC9sEYM5VkkYmsaGkE9ZlYoAdyKK3kthI0gmL'
+    'qQtAdt1segNJJqzrEtwWgOTdaXoDSSas+xLcFgA7ppn88KQS1uCEtgPArp+b/PCkEtZ/TWg7AOwaYvLDk0pYf5/QdgDYd5KpD7b9'
+    'LCGA7Jln6oNJWADiNtXUB5OwAMRtjKkPJmEBiBtjWABAwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYA'
+    'Z5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM0hYAJxBwgLgDBIWAGeQsAA4'
+    'g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcUWe7AbCnscHT0IGH/7+jS+rc'
+    '41trT1ieJ40/1ZMkTRjlffLnR/53xbHfrbXN196D0uudvnx3vnLukbAyZMIoTxNGeRp/6HeTWtt8bWnz1bLD186O+I94z5O+eJqn'
+    '80cH3+WM+tq+z/jgUz/5/yv7+Levd/ra+KqvTW/4am0jm6WJ5xs+vTQ1d0sSez1mfz3G06XnFzR2pNnEFNa2dl+PbSirZUf1u7yx'
+    'wdPFEz3NOS/dIxSPv1jWT39X1h/32m5J+rUsrTMSmCQsR0wd5+m66UUNG2K7JeF07ZMe+m1Zq18qf/Jn55/p6coLCxo9Il3JNqyV'
+    'G8r64TPl/v9hDpGwcuiKKQXNvyjdVQcC67f7WryyZLsZqWEqYTGGlTJTx3laPKdouxkIacoYTy1Lg8NpyeMlrdvKOdoEKqyUuGZa'
+    'QXMnU01lSZ4vGamwMmrhrIJmTCJRZdHcycFJKM+JK24cKZbMPqeglqV1JKscmDs52NcXnO32TYY0oMKyoDLWgXz5/uVFlcrSlFu7'
+    'bTfFWZzeE3TTVwskq5wrFoIT1iXncuhFQa8lpGVpnWb9Jd2NwI0zClq5gLvBYXEEGVY/jEtA9OyUEzxiIyQSlkHf/lJBj3+XgETf'
+    'WpbWafBnbLfCDSQsQ+6dV9RVX6Z7UZ1fL65L3XOhacQRZcC984qaeBrBh3AemF8kafWDhBUzkhVqQdLqGwkrRtdNL5CsULMH5hdV'
+    '5MjsEd0Sk8lnBetTAXFYfxs3a3rCERaTO77OnBrEiykPn0bCigGBBVMWzeYQPRK9UaN751FZwZzpEwtqbGBctILSoAZTx3lODLJ3'
+    '7vHV0SVtaQteGLH3YPDnvb1gofICi/rhnhqGSeNHBW/XSeOB09l1+G04/b0wovK9xht+QUfcVlxbrKwrl3skrBqkbWXQ7pL0yO/K'
+    'WrWx/ElSiuKTA7+fBNDY4Omvx3i65NzCUa8Li8vL7YffXLPlLbOv4/I8afLo4MZJGhPaXd8s6uZHWIKZhBXR8qvTkax27fZ1y6Nl'
+    'tb2X/KKuOzuCiu3Hzx5enC7qEs8v7QzetrPpDTuL0/q+1LLDV8uOw0lh7EhPi2YXdMoJ9hPYeWd6ahjuqcOh90aaQMKKyPYbX5Y9'
+    'dfSbaNJi3VZfdcVyv4PFHx2Q7lmT7rXPt7X7mrssSGBpWGt/1U1cGpKwIrB5VzCtiepIazeX9YXPq8fVVH/4TEkrN6Q3SfVm3VZf'
+    '67Z2a+JpntUbLRec7emFV9zrv7jwEoqQRp3k6eHrkw9YV18jVUlaazalO8mGNWWMpyVz7SQuF6osXkKREjaS1ZwfdKuzK/HNxiJr'
+    'iapi/XZfTc3d+t2SOhUSHh3Ic5XFPKwQRp2U/LhVU7O7ySoP/npxt9ZuTjYpf//ydNzwsYGEFUKS1dVHB9wo/SHdsbqsB59LNmmd'
+    'drL9O5c2kLBSavr3SVYu+cnzZT22Ibmkdd9V+ayySFhVWnZlcgFCZeWmB54pJza2dPzgRDaTOiSsKk06PZkSfOptJCuXfe9nyd3J'
+    'vWZa/g7f/H3jCL6Q0AqQ/7K+rAMfJ7IpGJRUhTx3cv4O3/x94wjuS2ii4JGPuMBtP3yGfWkCCasKdQnkq7/hUjBTViY0AL9wVr4O'
+    '4Xx92wiSuBzs2icd5FIwc25YYX48q6fHn7IsX982glsSWPFx5h1UV1m0+c18zkY3iYTVjzQsLQJ3JXHXcOq4/MQoCcuyK+5z74Fm'
+    'VC+JeVlXXpifwzg/3zSCK6aY7x4bC+8hWeu3m93HeboKIGH14RsXmO0e04GMdHBxWaC0ImH1YdAAs59PICMuU8bko8oiYQEJML0u'
+    'WF7eOp6PbxlB01lmz1i2XrYAO+5bazZhJfX4mG0krF7MMXzGuu9XPLqRJzwjGg8SVi8mGH43HXcHETcvB0UWCQtIyOMvmq2qJ4/O'
+    'fsYiYVmws4PqKo+e3mx2v0+fmP3DOfvfMIL64WbPVBt2kLDyyPSJarLhG0VpQMLqwQWGd/zaVhIWEAUJqwemz1Sde0hYQBQkrB6Y'
+    'vkOI/OIdk7UhYQEJam0zW11nfWoDCQtIkOmENf7UbGcsElbCTAcs0s30+GXWhzNIWAljDla+bXnL7P4fOsjox1tHwkrYvoO2WwCb'
+    'fMPnq8Z6KqxcKRruES4JYVJjAwkrV8YaXqajo8voxyPnhgy03QKz6mw3IG+yPmn0mmmF1L9CfeWGMm9mdlS6I8uCrN9lMallaV3q'
+    'k5UkzZ1cUMtSztUuSn90wQnrb3MvAVwzjfB3DXsMsTB9s8IEF6pBHI09dozxXBICqUXCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFw'
+    'BgkLgDNIWACcQcIC4AwS1jG2sF4VkFokLADOIGEBcAYJ6ximlzB2cVUDIC04fBJmeglmIMtIWMfY1m74NUwZX3PbJXeszt4yyVl/'
+    'KxMJ6xglwzGc9beauOKjA9LazdlLWFl/76V769o6jgUC7Xq53ddPXyhr42t2DmzP8O7f2UnCQowahtlugVsuWNxt/OWjSRp/qtmM'
+    'tfeA0Y+3jkvChNUPp8LKM9P7P+sv6iVhAQlqbDD7+aZvGtlGwgISZPq9l6ZvGtlGwupB1stq2HNGPUMCtSBh9cB0Wc04FhANCasH'
+    '//aG2YQ1fQIJC4iChNUD05eEXzydhJVHpp9y6Owy+/lpQMKygOcJ82n6RLOH27otGR9xFwkLSMzfftHsiWqT4aGMNCBhWTJwgO0W'
+    'IGmnncyk0VqRsHrxtOEHY+ddSNcDYXHU9OLpVrNnq7mT6fo8mTqOccs4cNT0Ig/lNZJz/d8WjX5+Xl6eQsKyaPY5dH9eHD/Y7Oev'
+    '2pj9O4QSCatPf9xr9vMXzKT782DiaeYvB1t2UGHl3r88n4+zFsz6r982ezmYJySsPqx+yXzCWjKXYM46029K+mC/2c9PExKWZVPG'
+    'cPcoy5I4Ia14Lj9XAiSsfuzabX5s4Jpp7IasSuKElMSVQFpwpPTjvrXmg4E5WdnE5X78OFL68WJCb1dZfjXBnTVJVFfrt+fj7mAF'
+    'CSslRo/wjM/VQXJalibzQqr7flVKZDtpQcKqwpLHkwmKNbfw1rUs+PaXkjus3v8wsU2lAgmrCuu2Jld2r/0eSctlJx0vXfXlZA6r'
+    'vF0OSiSsqnXtS2Y7nx0krbqJ8SxXPfEPyZ1wFq/M1+WgRMKq2rwHuhPbVsNwj6TlmGIhuXGrPCNhVSnpsYKG4R6Xh44YO9LT+tuS'
+    '3VdJjaumDQkrhKSD5LODgrP26BHMhk+rBTMLemB+8tVwkuOqaULCCsFWkCy/uqjn/5FqK00mnuapZWmdlSWCVm7Iz8z2Y5GwQlr2'
+    'lJ1gqSsG1dZTi+pYD96iSqK6d569McYfPpPfhMVpO6TVL5WtrmM1bIj0m1uD3bb82bIeXp/f4E3SwlkFzZhk//ye5+pKkjzfN3uZ'
+    '09TcLUmZuuCeOs7T4jnpuou3/W1f/+N/+Vq3payS4ZieMMrThFGeLp7gqX642fG1LW2+1rb6eqa1LMOhepSmszxden5B40ela/zw'
+    '0PGUei1L64x0HAkrIpduYW9r91UqH73u984OX3sPHv43E444MIcMlBobPA099HtabWnzP/lulTX4t7zVf6iNPzX4ThNGeRo6SBr9'
+    '556+4MDLbb/3s5JeeMWNQ4mElUIuJS24z5XqSjKXsOxflDvsXxg/QkJcSlYmkbBq8ONny+rO5/w9JOieNZwYK0hYNfrS/8OZD+a8'
+    '/6H0xO9JWBUkrBjM+QFJC2bMvovYOhIJKwadXdJ9v+IsiHgxbvVpJKyYPP5i2Zlbzki/a5czONoTElaMvvezkja/SdJCba5dXtK2'
+    'duKoJySsmN2wgqSF6EhWfSNhGXDDipJWbWRMC+GQrPpHwjLk/rVlXfcg4xCoTlNzN8mqCiQsg7a0+dzpQZ/e/5C7gWGQsBLQ1Nyt'
+    'dVs4e+Jo96wpM88qJBJWQpb8vMSZFJKkUjk4iTGDPTwSVsKamrutrVoK+xY8VNKUWzlxRcX6KBasfqms1S+VdcWUguZfxDkjD+5Y'
+    'XdbazZyoakXCsujh9cESx2lcwRTxWPhISRtfY/wyLiSsFFi31de6rcFlwpK5RU0Zk/7VL8PoLgUv0ciL9dv9XL6VOQkkrJQ5MtDT'
+    '8uKDKNZsKmvFb8ufegHt1HGevn5BQaednK2kTJJKBkskO+KUEzx97TxPl5ybzgS2amNZj75Q1h/3hvu5+uGeZn4x+F5DBpppmwkv'
+    'vubrpy+UmezZC9Z0x6dU3l7zxdM9jU3oJQqtbf4nb7Lp3GNut1a+24RRnvU312zY4Wvt5rI2vOon+uYel5GwEEnlbTj1wz01DOv/'
+    '31fePtPalu5d5nlHv/3myN8rGhu8o6q2fQeDtwVV7D3i/1vbfHV0Se92kZTiYCphMYaVcZ8knpQnoLB8353kivikc0AEAHpAwgLg'
+    'DBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNIWACcQcIC4AwSFgBn'
+    'kLAAOIOEBcAZJCwAziBhAXAGCQuAM0hYAJxBwgLgDBIWAGeQsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgA4rbX1AeTsADEbZepDyZh'
+    'AYjb/zT1wSQsAHFbbeqDk0pYrye0HQD2rTX1wUklrH9IaDsAMiyphPVkQtsBYNd/N/nhSY5hvZXgtgDYcbnJD08yYX0hwW0BSN5u'
+    'SWWTG0gyYe2V9IcEtwcgWZ83vYGkpzWMTHh7AJKxTtJ+0xuxMQ/rCgvbBGDWV5LYiI2E9YiklyxsF4AZg5LakK2Z7udKesfStgHE'
+    'p1HSwaQ2ZvPRnFMkvWJx+wBq83kl/BSL7WcJx0j6J8ttABDeQElvJ71R2wlLkq6TdKrtRgCoyq8leZL+ZGPjaUhYktSuoBMW2m4I'
+    'gB79b0mDJU2z2Yi0JKyKuxQkrmmS9lluCwDpMUlFSSdKOmC5Laqz3YBe/FrS0EP/faKk/yTp7ySNlXSSrUYBGbZPwZMov5X0SwUT'
+    'QVPH833fdhsAoCppuyQEgF6RsAA4g4QFwBkkLADOIGEBcAYJC4AzSFgAnEHCAuAMEhYAZ5CwADiDhAXAGSQsAM4gYQFwBgkLgDNI'
+    'WACcQcIC4AwSFgBnkLAAOIOEBcAZJCwAziBhAXAGCQuAM3jNFwAAQMy4IgQAAIgZBRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFg'
+    'AQAAxIwCCwAAIGYUWAAAADGjwAIAAIgZBRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFgAQAAxIwCCwAAIGYUWAAAADGjwAIAAIgZ'
+    'BRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFgAQAAxKzOdgPi0NTcbbsJfyZpgqQzJY0+9PsISSdIGixpqL2mAQBQlY8l7ZXUdej3'
+    '9yS9JunVQ7+3SvrfthonSS1L3Slb3GmpfQVJfyPp25JmShpitTUAAMRrgKTPHfpVcVEf/36fpKck/UTSbySVjbXMQdwi7N0gSf8g'
+    '6X1JvqSSpGckXSaKKwAAhig4Jz6j4BzpKzhn3qzgHJprFFhHGynpaQVBsl/SXQpu/wEAgP79maQ7FZxDfQXF10irLbKEAksaKOlB'
+    'BYHwlqRpVlsDAEB2fEXBudWXtELBOTcX8lxgjZL0uqQDkuZZbgsAAFl3pYJz7usKzsGZlscC6wxJb0t6U9LpltsCAEDenK7gHPy2'
+    'gnNyJuWpwBog6feSdko6xXJbAADIu1MUnJN/L+kzltsSu7wUWN+Q9CdJ59huCAAAOMo5kg4qOFdnRh4KrGckPWK7EQAAoE+PKDhn'
+    'Z0KWC6zBktoVPMEAAADS7ysKzt2DbTekVlktsIYq2EGft90QAAAQyucl/UGOv2YuiwVWQdI2sUAoAACuOkHSy3K4TnG24X14VDlY'
+    'XwMAgIw7VdLPbDciqqwVWLMUvBcJAAC47z8pOLc7J2sF1l22GwAAAGLl5Lk9SwXWNEmNthsBAABi1SjpYtuNCCtLBdbXbDcAAAAY'
+    'cYntBoSVpQLrr2w3AAAAGOHcOT5LBdYI2w0AAABGOPcO4SwVWJ+13QAAAGCEc4uOZqnAAgAASAUKLAAAgJhRYAEAAMSMAgsAACBm'
+    'FFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAA'
+    'YkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsA'
+    'ACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiw'
+    'AAAAYkaBBQAAELM62w0AEF79cE8Nw6RiQRo70pMkFY74b+novzOhc4+vjq6j/2xbu69yOfjvnR2+9h6U9h4M/jsPPE8a8hmpscE7'
+    'qv8r+0sK/m7IQHtt7Mm+I/bRzk5few9IHV2H9/G7Xb78fOxCIDYUWIBljQ2ezmjwNOJzwQm5scHT0JSdgHtSP9xT/fCj/2zCqOgF'
+    'XeVkvq3d12vv+OrssluYeZ50Rr2n+mHBPmpsCL7vGfXmilZbhgyUxh/ad+ND7sPXO33t7JBe7/C1s8PXtnZfpbKJVgJuocACDBp1'
+    'kqexIyu/gqIEPasUbP0VaZ17fG1rDwqxbe2+2t4LX4QNGqAj9ounM0d4GjQgasvz7Yx6T2fUS5rQ+37btdvXljZfrYd+vf9hcu0D'
+    'bPH8DIz7NjV3S5L7XwROGnWSp6azPTWd5Wn0CAoo2yon8y1vSScPCwq2SaezX9Lqg/1Sa5uvllfKWreVNI4+eS1L3RkXosACqnTi'
+    'cdLFEwu6eIKnU07ghA2Y9MF+ae3msp5p9fXmu6R3SHKswHKnpUCCBg6Qpk8o6MoLCxo2xHZrgPw5frA0d3JBcycf/rMP9ksrnivr'
+    '6dayDnxsr21ANRjBAhTc5pv35YKmjGFkCnDJyg1l/eIlXx17OAXkACNYgAuumVbQ3MksBQe47MhRrgMfS//867J+8a9llpWAdYxg'
+    'ITdGj/B001cLTEQHcmLdVl8/frbM6FZ2MIIFpMXUcZ6uvLDApHQgh6aO8zR1XFGS9OJrvpY/W87NorewjwILmTN6hKebZxXU2EBR'
+    'BSBw3pmezjszKLZWv1TWPWu4jQizKLCQCYMGSM1fK+qCsymqAPRt9jkFzT4nmH/54HNl/eR5lp5H/Ciw4LTJZ3m6ZXZRnx1kuyUA'
+    'XHTVlwu66ssFrd1c1l1PlnnND2JDgQUnXTe9oEvP5wlAAPGYPrGg6RML6tjja+nPy9rWzv1D1IYCC065d15RE0/jNiAAMxqGe3pg'
+    'fjBX69rlJQotREaBBSdQWAFIGoUWakGBhVT7/uVMXAdg1wPzi+rY4+vb/1TS/j/Zbg1cQYGFVJpzXkHX/y1zrACkQ8NwT79eXKcX'
+    'XvH1vZ+VbDcHDuAMhlSpHyY9ubCO4gpAKl1wtqeWpXX69pfIUegbEYLUWDS7oMe/W6cTPmu7JQDQt6u+XNDKBUV5zGBALyiwYN0p'
+    'J3h6/h/rNH0i4QjAHaec4OmFJXW65FxyFz6NqIBVN301uAqsK9puCQBEc+OMwidPHAIVTHKHNSsXFHkJc0ide3x1dEnb2n19uF/a'
+    '2RH8f+ee9D1CXixIY0d6n/xeOPT70IHK/HsiX+/0tfeAjto329p9lcrS3oPB31ck9T68yq2sghfsB0mqH+6pYZg0dJDUWO+pfrin'
+    '+mHJtCdrxo4M5mbdsKKkzW+m73hE8jw/A2+7bGruliT3v0hOjB7hafnVXO31ZNduXy07gl8v53DdnfrhnhrrpS+M9DRhlKfRI+wX'
+    'Yq93+urcExSz29p97fqj9G6Xn7sXBdcP9zT289KEUZ6azi7o+MG2W5Red6wua+1m3rljgNey1J1xIQosJGr2OQUtmMmdaUlav93X'
+    'qo3lXBZSUSy/umik4Nr0hq/WNl9b2nwWk4zotJM9TZvgafpECq+KlRvK+uEzFFkxo8BKGgWWG66ZVtDcyfksrl59x9fTm32tfomE'
+    'W4uFswqaMSlaDL32jq/71vKOuaRMPM3TfzynoClj7I9C2rJ+u6/FK1kzK0YUWEmjwEq/JXOLuUu0y58t6+H1FFQmTJ9Y0DXTeh4t'
+    '+WC/tOK5slp2lPX+h8m3DT2beJqny/6qoPPOzFce2LXb19xlFFkxocBKGgVWuuWluOouSXf/sqw1/0ZRBfTls4Okb3+poEvPz8eI'
+    'NkVWbCiwkkaBlV55KK7Wbi7rjtUUVUAUp53sqflrhcw/WUqRFQsKrKRRYKVTlourjw5It68uacMOwg6Iy6LZhUwvOMycrJo5VWBl'
+    'N5Jh1RVTsjm59aMD0qJHS5r+/W6KKyBmd6wuq6m5Ww8+l80R4SljPF0zjdNuXrCnEbup4zzNvyh7oXXfr8oUVkACfvJ8UGhlcS2p'
+    'uZMLmn1O9vIjPo29jFiNOsnT4jnZWkR085u+mpq79fiL2Uv2QJrdsbqsryzpVkcK31RQiwUzCzrt5OyN8ONoFFiI1X1XZau4mv+j'
+    'km5YwZwJwJb9f5IuvbuUuduGWcuV+DQKLMRm4ayChg2x3Yp4vPpOMGr16jvZunIGXPWT58ua90B2LnaOHxzkTGQXexexmDrOi7zC'
+    'dto88fuy5v8oO4kcyIqdHcGFz67d2bjwmTGp8MmLt5E92TgjwrrrpmdjuHv5s2XdsyZbtyKArJm7rKQXX8tGkXX717ORO/FpFFio'
+    'WVZuDS57ilfbAK64+ZGS1m93v8g6fnCwrA2yh72Kmow6KRu3Bpc/W+ZFzIBjFq8sadMb7hdZ8y8q6MTjbLcCcXP/zAir5n3Z/RBa'
+    's4mRK8BVCx4q6YP9tltRu3kXup9LcTT2KCL7wkjP+dXaN73h684nKa4Al835QbftJtRsxiRGsbKGAguRfcvxeQPdpeDqF4DbDnws'
+    'LXzE/WOZUaxsYW8iksYGT+c0uj16dT0LiAKZsfE1X2s2uT0aPWNSQZ8barsViAsFFiK57K/cDp01m8p6ud39ybEADrvzybLz87G+'
+    '8ddu51Ycxp5EaMcPlqaOd3f0qrsk5l0BGXXfr9wemZ5zXkGeu+kVR6DAQmhzznc7bO5fS3EFZNW6rb7zSzfMOc/tHIsAexGhXXKu'
+    'u2HTtU+sdwVknOvLrrj+dDYC7p4pYcWk0z0NHWi7FdE98ju3Ey+A/rW2+dr+trujWF8Y6amxgSLLdRRYCGXqOLcP+id+T4EF5MH/'
+    '+F/uFliS1HSW27kWFFgI6eKJ7obM05vLKlFfAbnwTKvbB3vT2RRYrnP3bInETRjl9gG/bqvbV7QAquf70tOt7h7zZ9R7qh/uds7N'
+    'OwosVO2Lp7t9sLv+ZBGAcFpecXsU6wJuEzqNAgtVc3kEq2UHxRWQNxtedfu4dznnggILVSoWpLEj3T3YKbCA/PF9aUubu8c+BZbb'
+    'KLBQFZeLKyl4bBtA/rh87A8ZKOZhOYwCC1Vx+Upq70Gpc4+7SRZAdC4XWJJ0yudstwBRUWChKuMdLrB2dridYAFEt83xl7q7fvcg'
+    'zyiwUBWXV293eQ4GgNqUylJnl+1WROfy3YO8o8BCVVx+bYPrV7AAasMUAdhAgYV+uX4FxertQL65PA9r/ChPntspOLfqbDcAMM3l'
+    '5IrDXF8qxJZt7T4XGYAFFFjol8u3B+GuGZMK+u5XCyoyzh6bAx9LP/hlSeu25Ouio7XN15W2G1GD8ad6XCg6iNSFfrk8wZ0nCN0z'
+    'Y1JBLUvrtHAWxVXcBg2QFn+tqHW31qmB9ZUAo0hfyLS9B223AGGM+QtPC2eRlkwbNEC67bL89LPrecDli9w8y88RhsjO4BYhEvKN'
+    'C0hJSRk9wtMkx1/gXq3XO90eyWaahpvIZugXV09ICrGWLB4aAMyhwEKmsf4NAMAGCixkmssrOAMA3EWBBQAAEDMKLAAAgJhRYAEA'
+    'AMSMAguZNt7x9ygCANxEgQUAABAzCiwAAICYUWChX9vaWUsKAIAwKLDQr3LZdgui42XBAMaf6vZczNY2LnJdxOkHmcarQAAANlBg'
+    'oV8dXbZbAADRMZINGwg79Mv19/lNYKkGoEd5mV/p+kj2lrfysZ+yhgILAHLo1Xd8bXojHyduRrBgA2GHfrk+wZIRLOBoL77ma/6P'
+    'SrabkRiXR7C2tPny3U7BuVVnuwFwQ+ceX/XD3UxSQwbabgGQDi++5usHvyzpvQ9styRZjQ1u5i64jQILVenokuqH225FNCRXmHTB'
+    '4m7bTehT3kc/igW3L7Jcv4OQZ9wiRFW2OHyQc4sQpvl+en/lncu3ByWe4nYZBRaqsrPD7UxNkQXkk+vHvutPcecZBRaq0tlluwW1'
+    'cT3JAojG9WOfJRrcRYGFquzs8LX3oO1WRDfe8SQLIDzPc/vY5wlCt1FgoWou3yZ0/SoWQHi8gxA2UWChaht2uH2wTzrd7WQLIBzX'
+    'j3kKLLdRYKFqLzheYE0d53ayBRDO1PFun+KYf+U2t6MPierc4zt9m/DiiYQ7kBcTRnmqH2a7FdEx/8p9nHEQiuu3CSmygHxw/Vhv'
+    'cTzXggILIbl+0M85j9uEQNYNHShdPMHtY33t5rLtJqBGFFgIZWeH27cJGxs8nXem24kXQN/mTnb71Lalze1lcRBwOwphxTOt7hZY'
+    'knT9dMIeyKpBA6Qrprh9jK/ayOhVFrgdhbDiid+7ffCfcoKn2ecQ+kAWuX4Bte+g+1MxEHA7EmFFqex+kbVgZkEnHme7FQDiNHak'
+    'pxmT3D6tuZ5bcZjbkQhrfv6i+1dYt1xStN0EADG6/evuH9PcHswOCixEsmu3r/Xb3S6yJp3uOT9XA0Bgydyijh9suxW1ebrV1wf7'
+    'bbcCceHsgshWPOf+ldb8iwqs8A44bvY5BU0Z4/5x/OgL7udUHEaBhcja3nN/FEuSFs8patRJ7idnII8mnuZpwUz3T2Xrt/tqf9/9'
+    'fIrD3I9KWJWFUSxJevj6ogYOsN0KAGFMPM3TvfPcn3clSff9qmS7CYgZBRZq0vaerzWbslFk/ebWOooswBFZKq7WbCrr/Q9ttwJx'
+    'o8BCze58sqzujFx8/ebWOo0ewe1CIM0uODs7xVWpHORQZA8FFmJxx+qMVFiSll9d1GWOv2oDyKpLzi3o+5dno7iSpPt+RXGVVZxF'
+    'EIt1W31teiM7EzSvnVbIzBUykBV3fbOoG2dk57S16Q1fq1+iwMqq7EQqrFvwUCkztwqlYI5Hy9I6TT6LW4aATeefGRyLWXtR++1P'
+    'ZChh4lMosBCrLN0qrLjj60Wtuqmo+mG2WwLkS7Egrbi2qDu/mb3R5CWPl5jYnnF1thuAbFm31Vf98LLmX5St2r1huKfHv1unjj2+'
+    'rn+wpM4u2y0Csm3R7IKmT8xWHqlYs6msdVuzM6UCPaPAQuweXl9WY4OXiZWVj3VkoXXLo2W93kmSBOIy+DPSP32nqMaG7OWOil27'
+    'fZ4azAkKLBixeGVJy68uZnbJg4bhnh76v4PbFk/+a1l3/5KECUR1ybmFTE1e780H+6W5y7I3jQI9o8CCMfN/VNJTi+o0bIjtlpg1'
+    '6y8LmvWXwclh5YayfvgMxRbQnyljPH3379x/QXMYc5d1224CEkSBBaNm3tGdiyKrYu7kguYeWkOra5/00G/LPIYNKBj1vWyyp9nn'
+    'ZH+kqieX3l3SRwdstwJJosCCcXkrsiqGDZEWzCwc9SLa9dt9rdpY1svtzN1Ctk0d5+niiQVNOj2b0wTCuPTukjr2cMznDQUWEjHz'
+    'ju5Mz8mq1pQxnqaMOfqR8127fW1p8/XCDl//utNXKUcDXsWCNHakp8YGT2fUK/fx4ZpBA6QJozw1neWp6exCrm73VaNUDuZcUVzl'
+    'k+f77u/4puZuSXL/i+TAwlkFzZiUz1sEtejc46ujS9rZ4WvfQWlbe1CI7ezwtfeg7dZJ9cM9NQw7XDBJ0hkNnoYOlBoP/Z4nnV3B'
+    'PtvZ6WvvgcP7a1u7r7IvpTXteofq2zPqPR0/ONiXQwdJjfVBETwkZ/uxFrt2+7r8nlJq97WjvJal7owLUWAhcZdNLujaaRRZALJp'
+    '3VZfSx7naUEDnCqwOMshcY9tKGv+j0g+ALLnnjVliitIosCCJa++46upuVub32TgEUA2zHugpCd+n6NJlOgTBRasumFFSXf+goQE'
+    'wF3rtgYXjDs7uGDEYRRYsG7Nv5VJTgCctPCRErcE0SMKLKTGvAdKWvQoiQpA+q3dHFwYbnyNC0P0zJ3p+MiFDTuCofbrphd06fnU'
+    '/wDS5c13fc17oJSr9eoQDWcwpNL9a8tMggeQKtcuL+lb91NcoTqMYCHVblgR3DK8d15RE09jlW8Aybt2eUnbeL0VQqLAghMqhdai'
+    '2QVNn8jAKwDzKKxQC1Zyh5MunuDppq8W9Zn/w3ZLAGTJ5jd9/eefcBswpZxayd2dlgJHeLrV19Ot3RoyULr9cm4fAqjNg8+V9ZPn'
+    'qaoQHwosOG3fwcO3D794uqeFswpqGE6xBaB/67b6umdNSR8dsN0SZBEFFjLj397wdendQbE1dZyn66YXNWyI5UYBSJUXX/O1/Nky'
+    'CxvDOAosZNK6rb7Wbe2WJI0e4emmrxY0egQjW0AerX6prMc2+OrYQ1GF5FBgIfNefcfX/B8dXiF+9jkFXTe9oLqixUYBMGbXbl8/'
+    '+nVZL7xCQQV7KLCQO6tfKmv1S4cns84+p6ArLyxwOxFwFAUV0ogCC7l3bME16iRPl57vafJZFF1A2nywP3gP4DOtvt58l4IK6cU6'
+    'WECVpo7z1HR2QZNHe9xeTIlX3/HVssNXyyu+2t7zdeJx0oRRniaM8jR+lKdTTmDenatKZam1Ldi3v/jXsjJwqkLtnFoHiwILqNGJ'
+    'x0lNZxU04TRPY0d6+txQ2y3Kjs49vra1S9vafW1rD4qoWgwdKI35i2A/jR3pqbHB05CBMTUWoVWKqNY2Xxt2MCKFflFgJY0CC2k2'
+    'oE6fnNDPaPBUP0xqbGBkZVu7r1ff8fVul7SzIyig0rJ69tCBwT5qbAj2WcMwUYxF8HK7r1f/3dfOjuC/d+0mTaMmThVY7rQUcNTH'
+    '3dKmN3xteqO6k0uxEBRkld8lqX6YVH9oAdXGBk9DU3KirxRFnXt8dXZJew/qk/WF0lQwhbX34OGRlWp5nnRGfbBv6ocHRdnQQVJj'
+    '/aF9ODworl308qF92dEV7Osjf3+3y+f2HdADCiwgZSq3TSRVXZTBPt8/XFwqRGFWC6+PgVCKHsAuCiwAcBRFFJBeBdsNAAAAyBoK'
+    'LAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAx'
+    'o8ACAACIGQUWAABAzCiwAAAAYkaBBQAAEDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzCiwAAAAYkaBBQAA'
+    'EDMKLAAAgJhRYAEAAMSMAgsAACBmFFgAAAAxo8ACAACIGQUWAABAzLJUYH1suwEAAABStgqsf7fdAAAAYMR7thsQVpYKrDdtNwAA'
+    'ABjxiu0GhJWlAus3thsAAACM+LXtBoSVpQJrhe0GAAAAI5w7x2epwHpP0v9nuxEAACBW/03MwbLuP0vaZ7sRAAAgFvsk3WS7EVFk'
+    'rcDaJ+lrthsBAABi8TU5OnCStQJLkp6RdL3tRgAAgJrcqOCc7qQsFliSdL+khbYbAQAAIlko6V7bjahFVgssSbpL0uW2GwEAAEL5'
+    'uoJzuNOyXGBJ0kpJoyR9aLshAACgTx9KOk3Sz2w3JA5ZL7Ak6S1Jx0t60HI7AABAz1YoOFe32W5IXPJQYFV8R9JJkl633RAAACAp'
+    'OCefJOkq2w2JW54KLEl6X1KjpLMlvW25LQAA5NXbCs7FjQrOzZmTtwKrYoekz0s6QdJGy20BACAvNio4935ewbk4s/JaYFX8UdJf'
+    'SfIkzZbUZbU1AABkT5ekSxSca/9Kwbk38/JeYB3pF5KGKwiAyyX9wW5zAABw1h8UnEs9BefW1XabkzwKrJ6tlDRSQWAcJ2mBgqcR'
+    'AQDAp72l4Fx5nIJz50gF59LcqrPdAAd8JOmeQ78qBkv68qFfX5L0BQUBBQBAVvmSXpb0vKTnDv3ab7VFKUaBFc1+SU8d+gUAAHAU'
+    'z/d9220AAADIFOZgAQAAxIwCCwAAIGYUWAAAADGjwAIAAIgZBRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFgAQAAxIwCCwAAIGYU'
+    'WAAAADGjwAIAAIgZBRYAAEDMKLAAAABiRoEFAAAQMwosAACAmFFgAQAAxIwCCwAAIGYUWAAAADGjwAIAAIgZBRYAAEDMKLAAAABi'
+    '9v8DGqe0pykglvsAAAAASUVORK5CYII='
+)
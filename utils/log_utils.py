@@ -0,0 +1,192 @@
+"""日志工具模块
+
+统一的分级日志入口：
+- 每个子系统使用独立的 logger（nuoqin.model / nuoqin.crypto ...），可单独开关
+- 调用方使用 %s 占位符延迟格式化，级别未开启时不做任何字符串拼接
+- 可选的滚动文件输出，打包后的窗口程序也能保留日志
+- 同一调用位置的日志按时间窗口限流，避免热路径刷屏
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterable
+
+
+LOGGER_ROOT = "nuoqin"
+
+# 已知子系统，未在此列出的名称同样可以使用
+SUBSYSTEMS = ("model", "crypto", "theme", "ui", "startup")
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+
+class RateLimitFilter(logging.Filter):
+    """按调用位置限流的过滤器（令牌桶）
+
+    所有输出目标共用一个实例：同一条日志只判断一次，结果记在 record 上，
+    被省略的条数记在 record.suppressed 上（由 RateLimitFormatter 输出），不修改 record.msg。
+    """
+
+    def __init__(self, burst: int = 20, interval: float = 1.0):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self._buckets: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # 已由其他输出目标判断过
+        decided = getattr(record, "rate_limit_passed", None)
+        if decided is not None:
+            return decided
+        record.rate_limit_passed = self._decide(record)
+        return record.rate_limit_passed
+
+    def _decide(self, record: logging.LogRecord) -> bool:
+        # 警告及以上级别不限流
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                # [剩余令牌, 上次补充时间, 被丢弃条数]
+                bucket = [float(self.burst), now, 0]
+                self._buckets[key] = bucket
+
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.burst / self.interval)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                bucket[2] += 1
+                return False
+
+            bucket[0] = tokens - 1
+            suppressed = bucket[2]
+            bucket[2] = 0
+
+        record.suppressed = suppressed
+        return True
+
+
+class RateLimitFormatter(logging.Formatter):
+    """在消息后注明限流时省略的条数"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            text = f"{text} (已省略 {suppressed} 条相同位置的日志)"
+        return text
+
+
+class LogManager:
+    """日志管理器"""
+
+    settings_file = "config/log_settings.json"
+    _lock = threading.Lock()
+    _configured = False
+
+    @staticmethod
+    def get_logger(subsystem: str) -> logging.Logger:
+        """获取子系统 logger"""
+        return logging.getLogger(f"{LOGGER_ROOT}.{subsystem}")
+
+    @staticmethod
+    def load_settings() -> Dict:
+        """加载日志设置"""
+        try:
+            if os.path.exists(LogManager.settings_file):
+                with open(LogManager.settings_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception:
+            pass
+        return {}
+
+    @staticmethod
+    def configure(level: str = None, log_file: str = None, max_bytes: int = 1024 * 1024,
+                  backup_count: int = 3, disabled_subsystems: Iterable[str] = None,
+                  console: bool = None, burst: int = 20, interval: float = 1.0):
+        """配置日志系统
+
+        未显式传入的参数依次取自环境变量 NUOQIN_LOG_LEVEL / NUOQIN_LOG_FILE
+        和 config/log_settings.json，默认只输出 WARNING 及以上级别。
+        """
+        settings = LogManager.load_settings()
+        level = level or os.environ.get("NUOQIN_LOG_LEVEL") or settings.get("level", "WARNING")
+        log_file = log_file or os.environ.get("NUOQIN_LOG_FILE") or settings.get("log_file")
+        if disabled_subsystems is None:
+            disabled_subsystems = settings.get("disabled_subsystems", [])
+        if console is None:
+            # 打包后的窗口程序没有 stderr，输出到控制台只是白白浪费
+            console = sys.stderr is not None
+
+        with LogManager._lock:
+            root = logging.getLogger(LOGGER_ROOT)
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+                handler.close()
+
+            root.setLevel(getattr(logging, str(level).upper(), logging.WARNING))
+            root.propagate = False
+
+            formatter = RateLimitFormatter(LOG_FORMAT)
+            # 各输出目标共用一个限流器，同一条日志只计一次
+            rate_limit = RateLimitFilter(burst, interval)
+
+            if console:
+                stream_handler = logging.StreamHandler()
+                stream_handler.setFormatter(formatter)
+                stream_handler.addFilter(rate_limit)
+                root.addHandler(stream_handler)
+
+            if log_file:
+                log_dir = os.path.dirname(log_file)
+                if log_dir:
+                    os.makedirs(log_dir, exist_ok=True)
+                file_handler = logging.handlers.RotatingFileHandler(
+                    log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+                )
+                file_handler.setFormatter(formatter)
+                file_handler.addFilter(rate_limit)
+                root.addHandler(file_handler)
+
+            if not root.handlers:
+                # 没有任何输出目标时丢弃日志，避免落到 logging 的 lastResort
+                root.addHandler(logging.NullHandler())
+
+            for name in SUBSYSTEMS:
+                LogManager.set_subsystem_enabled(name, True)
+            for name in disabled_subsystems:
+                LogManager.set_subsystem_enabled(name, False)
+
+            LogManager._configured = True
+
+    @staticmethod
+    def set_subsystem_enabled(subsystem: str, enabled: bool):
+        """开启或关闭某个子系统的日志"""
+        logger = LogManager.get_logger(subsystem)
+        # 关闭时把级别调到最高，isEnabledFor 直接返回 False，调用几乎零开销
+        logger.setLevel(logging.NOTSET if enabled else logging.CRITICAL + 1)
+
+    @staticmethod
+    def set_level(level: str):
+        """调整全局日志级别"""
+        logging.getLogger(LOGGER_ROOT).setLevel(getattr(logging, str(level).upper(), logging.WARNING))
+
+    @staticmethod
+    def is_configured() -> bool:
+        """是否已完成配置"""
+        return LogManager._configured
+
+
+def get_logger(subsystem: str) -> logging.Logger:
+    """获取子系统 logger"""
+    return LogManager.get_logger(subsystem)
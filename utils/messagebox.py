@@ -6,6 +6,9 @@ from utils.style import StyleButtonManager
 class NMessageBox:
     """自定义样式的消息框工具类"""
 
+    # 样式表缓存：主题颜色 -> 样式表
+    _style_cache = {}
+
     @staticmethod
     def get_theme_colors():
         """获取当前主题颜色"""
@@ -29,7 +32,17 @@ class NMessageBox:
     def apply_style(msgbox):
         """为消息框应用自定义样式"""
         colors = NMessageBox.get_theme_colors()
-        msgbox.setStyleSheet(f"""
+        cache_key = tuple(sorted(colors.items()))
+        style = NMessageBox._style_cache.get(cache_key)
+        if style is None:
+            style = NMessageBox.build_style(colors)
+            NMessageBox._style_cache[cache_key] = style
+        msgbox.setStyleSheet(style)
+
+    @staticmethod
+    def build_style(colors):
+        """构建消息框样式表"""
+        return f"""
             QMessageBox {{
                 background-color: {colors['card_background']};
                 color: {colors['text_color']};
@@ -65,7 +78,7 @@ class NMessageBox:
                 font-family: "Microsoft YaHei";
                 padding: 10px;
             }}
-        """)
+        """
 
     @staticmethod
     def information(parent, title, text):
@@ -0,0 +1,87 @@
+"""拼音工具模块
+
+排序和搜索用到的拼音转换。pypinyin 为可选依赖：
+未安装时中文按 Unicode 码位排序、不支持拼音搜索，其余功能不受影响。
+"""
+
+import unicodedata
+from functools import lru_cache
+
+from utils.log_utils import get_logger
+
+
+logger = get_logger("model")
+
+_pinyin_module = None
+_pinyin_checked = False
+
+
+def _load_pinyin():
+    """按需导入 pypinyin，只尝试一次"""
+    global _pinyin_module, _pinyin_checked
+    if not _pinyin_checked:
+        _pinyin_checked = True
+        try:
+            import pypinyin
+            _pinyin_module = pypinyin
+        except ImportError:
+            logger.info("未安装 pypinyin，中文按码位排序，不支持拼音搜索")
+    return _pinyin_module
+
+
+def _is_cjk(char: str) -> bool:
+    return '一' <= char <= '鿿' or '㐀' <= char <= '䶿'
+
+
+class PinyinUtils:
+    """拼音转换工具"""
+
+    @staticmethod
+    def available() -> bool:
+        """是否可以进行拼音转换"""
+        return _load_pinyin() is not None
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def syllables(text: str) -> tuple:
+        """转换为拼音音节（中文逐字转换，其余字符原样保留并转为小写）"""
+        pinyin = _load_pinyin()
+        if pinyin is None or not any(_is_cjk(char) for char in text):
+            return tuple(text.casefold())
+        return tuple(part.casefold() for part in pinyin.lazy_pinyin(text))
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def collation_key(text: str) -> str:
+        """排序键：中文按拼音、字母不区分大小写、全角半角统一
+
+        同音字之间再按原文排序，保证顺序稳定。
+        """
+        normalized = unicodedata.normalize('NFKC', text or '')
+        return "".join(PinyinUtils.syllables(normalized)) + "\x00" + normalized
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def search_keys(text: str) -> tuple:
+        """拼音搜索键：(全拼, 首字母)
+
+        "微信 Pay" -> ("weixinpay", "wxpay")，非中文部分原样保留（去掉空格）。
+        不含中文或未安装 pypinyin 时返回空元组。
+        """
+        pinyin = _load_pinyin()
+        if not text or pinyin is None or not any(_is_cjk(char) for char in text):
+            return ()
+        text = unicodedata.normalize('NFKC', text)
+        full = "".join(pinyin.lazy_pinyin(text))
+        initials = "".join(pinyin.lazy_pinyin(text, style=pinyin.Style.FIRST_LETTER))
+        return PinyinUtils.normalize_query(full), PinyinUtils.normalize_query(initials)
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """拼音查询的规范形式：小写并去掉空格和隔音符号"""
+        return "".join(query.casefold().replace("'", " ").split())
+
+    @staticmethod
+    def is_pinyin_query(query: str) -> bool:
+        """查询内容是否可能是拼音（只含字母、数字、空格和隔音符号）"""
+        return bool(query) and query.isascii() and PinyinUtils.normalize_query(query).isalnum()
@@ -0,0 +1,54 @@
+"""启动耗时统计模块
+
+使用 --profile-startup 启动时记录各阶段耗时，窗口首次绘制后输出报告。
+未开启时 mark() 直接返回，不产生任何开销。
+"""
+
+import sys
+import threading
+import time
+from typing import List, Tuple
+
+
+class StartupProfiler:
+    """启动耗时统计器"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.start_time = time.perf_counter()
+        self.marks: List[Tuple[str, float, str]] = []
+        self._lock = threading.Lock()
+
+    def mark(self, name: str):
+        """记录一个阶段结束的时间点"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.marks.append((name, time.perf_counter(), threading.current_thread().name))
+
+    def report(self) -> str:
+        """生成耗时报告"""
+        lines = ["启动耗时报告", f"{'阶段':<24}{'线程':<16}{'耗时(ms)':>10}{'累计(ms)':>10}"]
+        last_by_thread = {}
+        with self._lock:
+            marks = sorted(self.marks, key=lambda m: m[1])
+        for name, timestamp, thread_name in marks:
+            previous = last_by_thread.get(thread_name, self.start_time)
+            last_by_thread[thread_name] = timestamp
+            lines.append(
+                f"{name:<24}{thread_name:<16}"
+                f"{(timestamp - previous) * 1000:>10.1f}{(timestamp - self.start_time) * 1000:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def print_report(self):
+        """输出耗时报告"""
+        if not self.enabled:
+            return
+        text = self.report()
+        if sys.stderr is not None:
+            print(text, file=sys.stderr)
+        else:
+            from utils.log_utils import get_logger
+            get_logger("startup").warning("%s", text)
+
@@ -1,4 +1,4 @@
-from PyQt5.QtWidgets import QAbstractButton, QComboBox, QLineEdit
+from PyQt5.QtWidgets import QAbstractButton, QComboBox, QLineEdit, QWidget
 
 
 class StyleButtonManager:
@@ -86,6 +86,32 @@ class StyleQComboBoxManager:
             """)
 
 
+    @staticmethod
+    def set_style_filter_default(qComboBox: QComboBox):
+        """筛选/排序下拉框样式（与搜索框同高）"""
+        qComboBox.setFixedHeight(34)
+        qComboBox.setStyleSheet("""
+            QComboBox {
+                padding: 8px 10px;
+                border: 1px solid #e0e0e0;
+                border-radius: 2px;
+                font-size: 12px;
+                background-color: #ffffff;
+                color: #333333;
+            }
+            QComboBox:focus {
+                border-color: #007acc;
+            }
+            QComboBox::drop-down {
+                border: none;
+            }
+            QComboBox::down-arrow {
+                width: 12px;
+                height: 12px;
+            }
+        """)
+
+
 class StyleQLineEditManager:
 
     def __init__(self):
@@ -125,4 +151,74 @@ class StyleQLineEditManager:
                 border-color: #007acc;
                 outline: none;
             }
-        """)
\ No newline at end of file
+        """)
+
+class StyleCardManager:
+    """卡片样式管理器
+
+    卡片及其内部控件只设置 objectName，样式统一写在卡片容器上，
+    创建卡片时不再逐个调用 setStyleSheet 触发样式重新解析。
+    """
+
+    CARD_CONTAINER_STYLE = """
+        QWidget {
+            background-color: transparent;
+        }
+        QFrame#itemCard {
+            border-radius: 2px;
+            border: 1px solid #e4e7ed;
+        }
+        QFrame#itemCard:hover {
+            border-color: #1e9fff;
+        }
+        QLabel#cardTitle {
+            color: black;
+            border: none;
+        }
+        QLabel#cardFieldLabel {
+            color: #666666;
+            border: none;
+        }
+        QLabel#cardFieldValue {
+            color: #28a745;
+            border: none;
+            font-weight: bold;
+        }
+        QLabel#cardDescription {
+            color: #999999;
+            border: none;
+        }
+        QPushButton#cardPrimaryBtn, QPushButton#cardEditBtn, QPushButton#cardDeleteBtn {
+            color: white;
+            border: none;
+            padding: 8px 12px;
+            border-radius: 2px;
+            font-size: 12px;
+        }
+        QPushButton#cardPrimaryBtn {
+            background-color: #1e9fff;
+        }
+        QPushButton#cardPrimaryBtn:hover {
+            background-color: #005a9e;
+        }
+        QPushButton#cardEditBtn {
+            background-color: #28a745;
+        }
+        QPushButton#cardEditBtn:hover {
+            background-color: #218838;
+        }
+        QPushButton#cardDeleteBtn {
+            background-color: #dc3545;
+        }
+        QPushButton#cardDeleteBtn:hover {
+            background-color: #c82333;
+        }
+    """
+
+    def __init__(self):
+        """初始化样式管理器"""
+
+    @staticmethod
+    def set_style_card_container(container: QWidget):
+        """为卡片容器应用共享样式（只需调用一次）"""
+        container.setStyleSheet(StyleCardManager.CARD_CONTAINER_STYLE)
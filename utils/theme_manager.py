@@ -4,10 +4,18 @@ import json
 import os
 from typing import Dict, Any
 
+from utils.log_utils import get_logger
+
+
+logger = get_logger("theme")
+
 
 class ThemeManager:
     """主题管理器"""
-    
+
+    # 样式表缓存：(主题名, 样式类型) -> 样式表，所有实例共享
+    _style_cache: Dict[tuple, str] = {}
+
     def __init__(self):
         self.themes = {
             "默认主题": {
@@ -107,7 +115,7 @@ class ThemeManager:
                     if theme_name in self.themes:
                         self.current_theme = theme_name
         except Exception as e:
-            print(f"加载主题设置失败: {e}")
+            logger.warning("加载主题设置失败: %s", e)
             self.current_theme = "默认主题"
     
     def save_settings(self):
@@ -122,12 +130,40 @@ class ThemeManager:
             with open(self.settings_file, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, ensure_ascii=False, indent=2)
         except Exception as e:
-            print(f"保存主题设置失败: {e}")
+            logger.warning("保存主题设置失败: %s", e)
     
+    def get_cached_style(self, kind: str, builder) -> str:
+        """按当前主题缓存样式表，同一主题只生成一次"""
+        key = (self.current_theme, kind)
+        style = ThemeManager._style_cache.get(key)
+        if style is None:
+            style = builder(self.get_theme_colors())
+            ThemeManager._style_cache[key] = style
+        return style
+
     def generate_main_window_style(self) -> str:
-        """生成主窗口样式表"""
-        colors = self.get_theme_colors()
-        
+        """生成主窗口样式表（应用样式表，包含消息框样式，切换主题时整体替换）"""
+        return self.get_cached_style(
+            "main_window", lambda colors: self._build_main_window_style(colors) + self._build_messagebox_style(colors)
+        )
+
+    def generate_card_style(self) -> str:
+        """生成卡片样式"""
+        return self.get_cached_style("card", self._build_card_style)
+
+    def generate_button_style(self, button_type: str = "primary") -> str:
+        """生成按钮样式"""
+        return self.get_cached_style(
+            f"button:{button_type}", lambda colors: self._build_button_style(colors, button_type)
+        )
+
+    def generate_messagebox_style(self) -> str:
+        """生成消息框样式"""
+        return self.get_cached_style("messagebox", self._build_messagebox_style)
+
+    @staticmethod
+    def _build_main_window_style(colors: Dict[str, str]) -> str:
+        """构建主窗口样式表"""
         return f"""
         /* 主窗口样式 */
         QMainWindow, QWidget {{
@@ -235,10 +271,9 @@ class ThemeManager:
         }}
         """
     
-    def generate_card_style(self) -> str:
-        """生成卡片样式"""
-        colors = self.get_theme_colors()
-        
+    @staticmethod
+    def _build_card_style(colors: Dict[str, str]) -> str:
+        """构建卡片样式"""
         return f"""
         QFrame {{
             background-color: {colors['card_background']};
@@ -247,10 +282,9 @@ class ThemeManager:
         }}
         """
     
-    def generate_button_style(self, button_type: str = "primary") -> str:
-        """生成按钮样式"""
-        colors = self.get_theme_colors()
-        
+    @staticmethod
+    def _build_button_style(colors: Dict[str, str], button_type: str) -> str:
+        """构建按钮样式"""
         if button_type == "primary":
             return f"""
             QPushButton {{
@@ -283,3 +317,43 @@ class ThemeManager:
             }}
             """
         return ""
+
+    @staticmethod
+    def _build_messagebox_style(colors: Dict[str, str]) -> str:
+        """构建消息框样式"""
+        return f"""
+        /* QMessageBox 全局样式 */
+        QMessageBox {{
+            background-color: {colors['card_background']};
+            color: {colors['text_color']};
+            border-radius: 8px;
+            font-family: "Microsoft YaHei";
+        }}
+
+        /* QMessageBox 按钮样式 */
+        QMessageBox QPushButton {{
+            background-color: {colors['accent_color']};
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-size: 13px;
+            min-width: 80px;
+            font-family: "Microsoft YaHei";
+        }}
+
+        QMessageBox QPushButton:hover {{
+            background-color: {colors['hover_color']};
+        }}
+
+        QMessageBox QPushButton:pressed {{
+            background-color: {colors['pressed_color']};
+        }}
+
+        /* QMessageBox 文本样式 */
+        QMessageBox QLabel {{
+            color: {colors['text_color']};
+            font-size: 14px;
+            font-family: "Microsoft YaHei";
+        }}
+        """
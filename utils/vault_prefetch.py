@@ -0,0 +1,61 @@
+"""加密数据预读模块
+
+访问码对话框显示期间，在后台读取加密文件、解码 base64 并解析成
+EncryptedContainer。用户确认访问码后只剩解密一步，冷启动时磁盘
+读取的等待不再计入解锁耗时。
+"""
+
+import os
+import threading
+from concurrent.futures import Future
+from typing import Iterable, List
+
+from utils.crypto_utils import EncryptedContainer, SecurePasswordManager
+from utils.log_utils import get_logger
+
+
+logger = get_logger("startup")
+
+# 默认预读的加密文件
+VAULT_FILES = [
+    "config/passwords.enc",
+    "config/bookmarks.enc",
+    "config/bookmark_categories.enc",
+]
+
+
+class VaultPrefetcher:
+    """加密文件后台预读器"""
+
+    def __init__(self, encrypted_files: Iterable[str] = None):
+        self.encrypted_files: List[str] = list(encrypted_files if encrypted_files is not None else VAULT_FILES)
+        self.thread = None
+
+    def start(self):
+        """登记并启动后台预读"""
+        if self.thread is not None:
+            return
+        jobs = []
+        for encrypted_file in self.encrypted_files:
+            if not os.path.exists(encrypted_file):
+                continue
+            future = Future()
+            # 先登记再读取，加载方在预读完成前调用时会等待这次读取而不是重复读取
+            SecurePasswordManager.register_prefetch(encrypted_file, future)
+            jobs.append((encrypted_file, future))
+        if not jobs:
+            return
+        self.thread = threading.Thread(target=self._run, args=(jobs,), name="vault-prefetch", daemon=True)
+        self.thread.start()
+
+    @staticmethod
+    def _run(jobs):
+        """依次读取并解析加密文件"""
+        for encrypted_file, future in jobs:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(EncryptedContainer.read(encrypted_file))
+                logger.debug("已预读加密文件: %s", encrypted_file)
+            except Exception as e:
+                future.set_exception(e)
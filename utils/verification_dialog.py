@@ -9,6 +9,7 @@ from PyQt5.QtCore import Qt
 
 from utils.crypto_utils import CryptoAesUtils
 from utils.style import StyleButtonManager
+from utils.vault_prefetch import VaultPrefetcher
 
 
 
@@ -16,11 +17,19 @@ from utils.style import StyleButtonManager
 
 class VerificationDialog(QDialog):
     """验证码输入对话框"""
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, prefetch_files=None):
         super().__init__(parent)
         self.encryption_key = None
+        # 对话框显示期间在后台预读加密文件
+        self.prefetcher = VaultPrefetcher(prefetch_files) if prefetch_files else None
         self.init_ui()
 
+    def showEvent(self, event):
+        """对话框显示时开始预读"""
+        super().showEvent(event)
+        if self.prefetcher:
+            self.prefetcher.start()
+
     def init_ui(self):
         """初始化UI"""
         self.setWindowTitle("访问码")